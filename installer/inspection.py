@@ -374,6 +374,7 @@ def inspect_workspace_state(workspace_root: Path | None) -> dict[str, object]:
             "quarantined_items": [],
             "state_conflicts": [],
             "runtime_notes": [],
+            "replay": None,
         }
     runtime_state = _inspect_runtime_workspace_state(workspace_root)
     return {
@@ -388,6 +389,7 @@ def inspect_workspace_state(workspace_root: Path | None) -> dict[str, object]:
         "quarantined_items": runtime_state["quarantined_items"],
         "state_conflicts": runtime_state["state_conflicts"],
         "runtime_notes": runtime_state["runtime_notes"],
+        "replay": runtime_state["replay"],
     }
 
 
@@ -492,6 +494,19 @@ def render_status_text(payload: dict[str, object]) -> str:
             explanation = str(first_conflict.get("explanation") or "").strip()
             if explanation:
                 lines.append(f"  state_conflict_explanation: {explanation}")
+        replay = workspace_state.get("replay")
+        if replay and replay["sessions"]:
+            pending = replay["pending"]
+            lines.append(
+                "  replay: {sessions} sessions, {total_bytes} bytes, compacted={compacted}, pending remove={remove} compact={compact} rotate={rotate}".format(
+                    sessions=replay["sessions"],
+                    total_bytes=replay["total_bytes"],
+                    compacted=replay["compacted_sessions"],
+                    remove=pending["remove"],
+                    compact=pending["compact"],
+                    rotate=pending["rotate"],
+                )
+            )
     return "\n".join(lines)
 
 
@@ -559,6 +574,7 @@ def _inspect_runtime_workspace_state(workspace_root: Path) -> dict[str, object]:
         "quarantined_items": [],
         "state_conflicts": [],
         "runtime_notes": [],
+        "replay": None,
     }
     try:
         config = load_runtime_config(workspace_root)
@@ -617,6 +633,8 @@ def _inspect_runtime_workspace_state(workspace_root: Path) -> dict[str, object]:
     elif current_plan is not None:
         active_plan = str(current_plan.path or current_plan.plan_id or "") or None
 
+    from runtime.replay_retention import inspect_replay_retention
+
     return {
         "active_plan": active_plan,
         "current_run_stage": current_run.stage if current_run is not None else None,
@@ -625,6 +643,7 @@ def _inspect_runtime_workspace_state(workspace_root: Path) -> dict[str, object]:
         "quarantined_items": list(quarantined_items.values()),
         "state_conflicts": list(state_conflicts.values()),
         "runtime_notes": runtime_notes,
+        "replay": inspect_replay_retention(config),
     }
 
 
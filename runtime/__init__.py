@@ -1,37 +1,63 @@
-"""Sopify runtime package."""
-
-from .engine import run_runtime
-from .models import (
-    DailySummaryArtifact,
-    PlanArtifact,
-    RecoveredContext,
-    ReplayEvent,
-    RouteDecision,
-    RunState,
-    RuntimeConfig,
-    RuntimeResult,
-    SkillActivation,
-    SkillMeta,
-)
-from .output import render_runtime_error, render_runtime_output
-from .preferences import PreferencesPreloadResult, preload_preferences, preload_preferences_for_workspace, resolve_preferences_path
-
-__all__ = [
-    "DailySummaryArtifact",
-    "PlanArtifact",
-    "PreferencesPreloadResult",
-    "RecoveredContext",
-    "ReplayEvent",
-    "RouteDecision",
-    "RunState",
-    "RuntimeConfig",
-    "RuntimeResult",
-    "SkillActivation",
-    "SkillMeta",
-    "preload_preferences",
-    "preload_preferences_for_workspace",
-    "render_runtime_error",
-    "render_runtime_output",
-    "resolve_preferences_path",
-    "run_runtime",
-]
+"""Sopify runtime package.
+
+Public names are resolved on first attribute access so that importing a
+single submodule (for example `runtime.gate` or `runtime.router`) does not
+pull in the whole engine.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .engine import run_runtime
+    from .models import (
+        DailySummaryArtifact,
+        PlanArtifact,
+        RecoveredContext,
+        ReplayEvent,
+        RouteDecision,
+        RunState,
+        RuntimeConfig,
+        RuntimeResult,
+        SkillActivation,
+        SkillMeta,
+    )
+    from .output import render_runtime_error, render_runtime_output
+    from .preferences import PreferencesPreloadResult, preload_preferences, preload_preferences_for_workspace, resolve_preferences_path
+
+_LAZY_EXPORTS = {
+    "DailySummaryArtifact": ".models",
+    "PlanArtifact": ".models",
+    "PreferencesPreloadResult": ".preferences",
+    "RecoveredContext": ".models",
+    "ReplayEvent": ".models",
+    "RouteDecision": ".models",
+    "RunState": ".models",
+    "RuntimeConfig": ".models",
+    "RuntimeResult": ".models",
+    "SkillActivation": ".models",
+    "SkillMeta": ".models",
+    "preload_preferences": ".preferences",
+    "preload_preferences_for_workspace": ".preferences",
+    "render_runtime_error": ".output",
+    "render_runtime_output": ".output",
+    "resolve_preferences_path": ".preferences",
+    "run_runtime": ".engine",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
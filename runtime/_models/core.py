@@ -38,6 +38,13 @@ class RuntimeConfig:
     ehrb_level: str
     kb_init: str
     cache_project: bool
+    state_backend: str = "json"
+    state_json_export: bool = True
+    replay_max_age_days: int = 30
+    replay_max_sessions: int = 200
+    replay_max_total_mb: int = 256
+    replay_compact_after_days: int = 3
+    replay_rotate_mb: int = 16
 
     @property
     def runtime_root(self) -> Path:
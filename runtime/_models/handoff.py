@@ -209,6 +209,7 @@ class RuntimeResult:
     activation: Optional[SkillActivation] = None
     generated_files: tuple[str, ...] = ()
     notes: tuple[str, ...] = ()
+    timings: tuple[Mapping[str, Any], ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -223,4 +224,5 @@ class RuntimeResult:
             "activation": self.activation.to_dict() if self.activation else None,
             "generated_files": list(self.generated_files),
             "notes": list(self.notes),
+            "timings": [dict(timing) for timing in self.timings],
         }
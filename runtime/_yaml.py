@@ -2,14 +2,15 @@
 
 This fallback parser intentionally supports only the subset used by
 `sopify.config.yaml` and simple skill front matter: nested mappings,
-lists, booleans, integers, strings, and comments.
+lists, booleans, integers, strings, and comments. Plan and skill documents
+share `split_front_matter` / `load_front_matter` for their `---` header.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 import re
-from typing import Any, List, Sequence, Tuple
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
 
 
 class YamlParseError(ValueError):
@@ -25,6 +26,7 @@ class _Line:
 
 _INT_RE = re.compile(r"^-?\d+$")
 _FLOAT_RE = re.compile(r"^-?\d+\.\d+$")
+FRONT_MATTER_RE = re.compile(r"\A---[^\S\n]*\n(?P<front>.*?)\n---[^\S\n]*\n(?P<body>.*)\Z", re.DOTALL)
 
 
 def load_yaml(text: str) -> Any:
@@ -46,6 +48,43 @@ def load_yaml(text: str) -> Any:
     return value
 
 
+def split_front_matter(text: str) -> Optional[Tuple[str, str]]:
+    """Split a `---` delimited header off a markdown document.
+
+    Returns:
+        `(front_matter, body)`, or None when the document has no header.
+    """
+    match = FRONT_MATTER_RE.match(text)
+    if match is None:
+        return None
+    return match.group("front"), match.group("body")
+
+
+def load_front_matter(text: str) -> Optional[Tuple[Mapping[str, Any], str]]:
+    """Parse a document header into `(metadata, body)`.
+
+    Returns None when the header is missing, is not valid YAML, or is not a
+    mapping.
+    """
+    parts = split_front_matter(text)
+    if parts is None:
+        return None
+    front_matter, body = parts
+    metadata = load_yaml_mapping(front_matter)
+    if metadata is None:
+        return None
+    return metadata, body
+
+
+def load_yaml_mapping(text: str) -> Optional[Mapping[str, Any]]:
+    """Parse *text* as a mapping, or return None when it is invalid or not one."""
+    try:
+        value = load_yaml(text)
+    except YamlParseError:
+        return None
+    return value if isinstance(value, Mapping) else None
+
+
 def _prepare_lines(text: str) -> List[_Line]:
     prepared: List[_Line] = []
     for line_number, raw_line in enumerate(text.splitlines(), start=1):
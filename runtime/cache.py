@@ -0,0 +1,83 @@
+"""Stat-validated JSON caches under `.sopify-skills/state/cache/`.
+
+Caches are an optimization only: every reader must tolerate a missing,
+corrupted, or schema-mismatched payload by rebuilding from the source files,
+and writers never fail the runtime turn when the cache cannot be persisted.
+Persisted caches honor `advanced.cache_project`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Mapping, Optional
+
+from .models import RuntimeConfig
+
+RUNTIME_CACHE_DIRNAME = "cache"
+
+
+def runtime_cache_dir(config: RuntimeConfig) -> Path:
+    return config.state_dir / RUNTIME_CACHE_DIRNAME
+
+
+def runtime_cache_path(config: RuntimeConfig, filename: str) -> Optional[Path]:
+    """Return the cache file path, or None when project caching is disabled."""
+
+    if not config.cache_project:
+        return None
+    return runtime_cache_dir(config) / filename
+
+
+def path_signature(path: str | Path) -> Optional[list[int]]:
+    """Return a JSON-friendly `[mtime_ns, size, inode]` stat signature."""
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def read_cache_payload(path: Optional[Path], *, schema_version: str) -> Optional[dict[str, Any]]:
+    if path is None:
+        return None
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(payload, dict) or str(payload.get("schema_version") or "") != schema_version:
+        return None
+    return payload
+
+
+def write_cache_payload(path: Optional[Path], payload: Mapping[str, Any]) -> bool:
+    """Atomically persist a cache payload; return False instead of raising."""
+
+    if path is None:
+        return False
+    try:
+        text = json.dumps(dict(payload), ensure_ascii=False, sort_keys=True)
+    except (TypeError, ValueError):
+        return False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("w", delete=False, dir=path.parent, encoding="utf-8") as handle:
+            handle.write(text + "\n")
+            temp_path = Path(handle.name)
+        temp_path.replace(path)
+    except OSError:
+        return False
+    return True
+
+
+__all__ = [
+    "RUNTIME_CACHE_DIRNAME",
+    "path_signature",
+    "read_cache_payload",
+    "runtime_cache_dir",
+    "runtime_cache_path",
+    "write_cache_payload",
+]
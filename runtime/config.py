@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import lru_cache
 import json
 from pathlib import Path
 import re
@@ -11,11 +12,6 @@ from typing import Any, Mapping, Optional
 from ._yaml import YamlParseError, load_yaml
 from .models import RuntimeConfig
 
-try:  # pragma: no cover - optional dependency
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover - optional dependency
-    yaml = None
-
 
 class ConfigError(ValueError):
     """Raised when a config file is malformed or unsupported."""
@@ -47,15 +43,25 @@ DEFAULT_CONFIG: dict[str, Any] = {
         "ehrb_level": "normal",
         "kb_init": "progressive",
         "cache_project": True,
+        "state_backend": "json",
+        "state_json_export": True,
+    },
+    "replay": {
+        "max_age_days": 30,
+        "max_sessions": 200,
+        "max_total_mb": 256,
+        "compact_after_days": 3,
+        "rotate_mb": 16,
     },
 }
 
-_ALLOWED_TOP_LEVEL = {"brand", "language", "output_style", "title_color", "workflow", "plan", "multi_model", "advanced"}
+_ALLOWED_TOP_LEVEL = {"brand", "language", "output_style", "title_color", "workflow", "plan", "multi_model", "advanced", "replay"}
 _ALLOWED_WORKFLOW = {"mode", "require_score", "auto_decide", "learning"}
 _ALLOWED_LEARNING = {"auto_capture"}
 _ALLOWED_PLAN = {"level", "directory"}
 _ALLOWED_MULTI_MODEL = {"enabled", "trigger", "timeout_sec", "max_parallel", "include_default_model", "context_bridge", "candidates"}
-_ALLOWED_ADVANCED = {"ehrb_level", "kb_init", "cache_project"}
+_ALLOWED_ADVANCED = {"ehrb_level", "kb_init", "cache_project", "state_backend", "state_json_export"}
+_ALLOWED_REPLAY = {"max_age_days", "max_sessions", "max_total_mb", "compact_after_days", "rotate_mb"}
 
 _ALLOWED_LANGUAGES = {"zh-CN", "en-US"}
 _ALLOWED_OUTPUT_STYLES = {"minimal", "classic"}
@@ -66,6 +72,14 @@ _ALLOWED_PLAN_LEVELS = {"auto", "light", "standard", "full"}
 _ALLOWED_MULTI_MODEL_TRIGGER = {"manual"}
 _ALLOWED_EHRB_LEVELS = {"strict", "normal", "relaxed"}
 _ALLOWED_KB_INIT = {"full", "progressive"}
+_ALLOWED_STATE_BACKENDS = {"json", "sqlite"}
+
+# Stat signature of one input file: (mtime_ns, size, inode), or None when absent.
+_FileSignature = Optional[tuple[int, int, int]]
+# Keyed by (workspace, global config path). Entries are revalidated against the
+# stat signatures of every file that feeds the normalized config, so an edited
+# `sopify.config.yaml`, `.git/config` or `package.json` invalidates the entry.
+_CONFIG_CACHE: dict[tuple[Path, Path], tuple[tuple[_FileSignature, ...], RuntimeConfig]] = {}
 
 
 def load_runtime_config(
@@ -80,7 +94,8 @@ def load_runtime_config(
         global_config_path: Optional explicit global config path.
 
     Returns:
-        A normalized runtime config.
+        A normalized runtime config. Repeated loads return the same frozen
+        instance until one of the underlying files changes on disk.
     """
     workspace = Path(workspace_root).resolve()
     project_path = workspace / "sopify.config.yaml"
@@ -90,6 +105,41 @@ def load_runtime_config(
         else (Path.home() / ".codex" / "sopify.config.yaml")
     )
 
+    cache_key = (workspace, global_path)
+    signature = _config_input_signature(workspace, project_path=project_path, global_path=global_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    config = _build_runtime_config(workspace, project_path=project_path, global_path=global_path)
+    _CONFIG_CACHE[cache_key] = (signature, config)
+    return config
+
+
+def clear_runtime_config_cache() -> None:
+    """Drop every memoized runtime config; the next load re-reads from disk."""
+
+    _CONFIG_CACHE.clear()
+
+
+def _config_input_signature(workspace: Path, *, project_path: Path, global_path: Path) -> tuple[_FileSignature, ...]:
+    return (
+        _file_signature(project_path),
+        _file_signature(global_path),
+        _file_signature(workspace / ".git" / "config"),
+        _file_signature(workspace / "package.json"),
+    )
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _build_runtime_config(workspace: Path, *, project_path: Path, global_path: Path) -> RuntimeConfig:
     merged = deepcopy(DEFAULT_CONFIG)
     project_data = _load_config_file(project_path)
     global_data = _load_config_file(global_path)
@@ -123,6 +173,13 @@ def load_runtime_config(
         ehrb_level=str(merged["advanced"]["ehrb_level"]),
         kb_init=str(merged["advanced"]["kb_init"]),
         cache_project=bool(merged["advanced"]["cache_project"]),
+        state_backend=str(merged["advanced"]["state_backend"]),
+        state_json_export=bool(merged["advanced"]["state_json_export"]),
+        replay_max_age_days=int(merged["replay"]["max_age_days"]),
+        replay_max_sessions=int(merged["replay"]["max_sessions"]),
+        replay_max_total_mb=int(merged["replay"]["max_total_mb"]),
+        replay_compact_after_days=int(merged["replay"]["compact_after_days"]),
+        replay_rotate_mb=int(merged["replay"]["rotate_mb"]),
     )
 
 
@@ -141,6 +198,7 @@ def _load_config_file(path: Path) -> dict[str, Any]:
 
 
 def _parse_yaml(text: str) -> Any:
+    yaml = _optional_yaml()
     if yaml is not None:  # pragma: no branch
         try:
             return yaml.safe_load(text)
@@ -152,6 +210,17 @@ def _parse_yaml(text: str) -> Any:
         raise ConfigError(str(exc)) from exc
 
 
+@lru_cache(maxsize=1)
+def _optional_yaml() -> Any:
+    """Import PyYAML on first parse; config reads are cached, so most turns never need it."""
+
+    try:  # pragma: no cover - optional dependency
+        import yaml  # type: ignore
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return yaml
+
+
 def _deep_merge(base: dict[str, Any], override: Mapping[str, Any]) -> None:
     for key, value in override.items():
         if key in base and isinstance(base[key], dict) and isinstance(value, Mapping):
@@ -211,6 +280,18 @@ def _validate_config(config: Mapping[str, Any], *, source_paths: tuple[Optional[
         raise ConfigError(f"Unsupported advanced.kb_init: {advanced['kb_init']}")
     if not isinstance(advanced["cache_project"], bool):
         raise ConfigError("advanced.cache_project must be boolean")
+    if advanced["state_backend"] not in _ALLOWED_STATE_BACKENDS:
+        raise ConfigError(f"Unsupported advanced.state_backend: {advanced['state_backend']}")
+    if not isinstance(advanced["state_json_export"], bool):
+        raise ConfigError("advanced.state_json_export must be boolean")
+
+    replay = _expect_mapping(config.get("replay"), path="replay")
+    _assert_allowed_keys(replay, _ALLOWED_REPLAY, path="replay")
+    for key in sorted(_ALLOWED_REPLAY):
+        value = replay[key]
+        # 0 disables the budget; bool is an int subclass, so reject it explicitly.
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ConfigError(f"replay.{key} must be a non-negative integer")
 
     del source_paths  # keep signature explicit for future diagnostics
 
@@ -0,0 +1,266 @@
+"""Persistent inverted index for `~compare` keyword context retrieval.
+
+`extract_context_pack` used to `rglob` the whole workspace, sniff every file
+and read every candidate twice. `WorkspaceContextIndex` keeps, per text file,
+the first line numbers of each lowercased keyword token, keyed by the file's
+stat signature, in `state/cache/context_index.json`:
+
+- `refresh()` walks the tree with `os.scandir`, pruning default noise
+  directories and anything matched by `.gitignore` files at directory level,
+  and re-tokenizes only files whose signature changed;
+- `search()` matches query keywords against the token vocabulary instead of
+  the file contents, so retrieval is a lookup.
+
+Query keywords match as substrings of tokens. Because tokens are the same
+maximal `[A-Za-z_][A-Za-z0-9_-]+` / CJK runs the keywords are made of, this
+finds the same lines as the previous `keyword in line.lower()` scan.
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+import os
+from pathlib import Path
+import re
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+from .cache import read_cache_payload, runtime_cache_path, write_cache_payload
+from .config import ConfigError, load_runtime_config
+
+CONTEXT_INDEX_FILENAME = "context_index.json"
+CONTEXT_INDEX_SCHEMA_VERSION = "1"
+DEFAULT_IGNORED_DIRS = frozenset({".git", "node_modules", ".venv", "dist", "build", "coverage", "__pycache__"})
+MAX_INDEXED_FILE_BYTES = 512 * 1024
+# Snippet extraction keeps at most two hits per file, so postings keep two lines.
+POSTING_LINES_PER_FILE = 2
+TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_\-]{1,}|[\u4e00-\u9fff]{2,}")
+_TEXT_SNIFF_BYTES = 2048
+
+
+class WorkspaceContextIndex:
+    """Token -> file/line postings for the text files of one workspace."""
+
+    def __init__(self, workspace_root: Path, *, cache_path: Optional[Path]) -> None:
+        self.workspace_root = workspace_root.resolve()
+        self.cache_path = cache_path
+        payload = read_cache_payload(cache_path, schema_version=CONTEXT_INDEX_SCHEMA_VERSION) or {}
+        files = payload.get("files") if payload.get("root") == str(self.workspace_root) else None
+        self._files: dict[str, dict[str, Any]] = dict(files) if isinstance(files, Mapping) else {}
+        self._postings: Optional[dict[str, dict[str, list[int]]]] = None
+        self._dirty = False
+        # Never index the index itself.
+        cache_dir = _relative_dir(cache_path.parent, self.workspace_root) if cache_path is not None else None
+        self._skip_dirs = frozenset({cache_dir} if cache_dir else ())
+
+    @classmethod
+    def for_workspace(cls, workspace_root: Path) -> Optional["WorkspaceContextIndex"]:
+        """Open the persisted index, or return None when project caching is unavailable."""
+        try:
+            config = load_runtime_config(workspace_root)
+        except (ConfigError, OSError, ValueError):
+            return None
+        cache_path = runtime_cache_path(config, CONTEXT_INDEX_FILENAME)
+        # Only persist into workspaces the runtime has already bootstrapped.
+        if cache_path is None or not config.runtime_root.is_dir():
+            return None
+        return cls(workspace_root, cache_path=cache_path)
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the index up to date with the work tree and return walk counters."""
+        stats = {"dirs": 0, "files": 0, "indexed": 0, "removed": 0}
+        seen: set[str] = set()
+        for rel_path, signature in walk_workspace_files(self.workspace_root, skip_dirs=self._skip_dirs, stats=stats):
+            seen.add(rel_path)
+            cached = self._files.get(rel_path)
+            if isinstance(cached, Mapping) and cached.get("signature") == signature:
+                continue
+            self._files[rel_path] = {"signature": signature, "tokens": _index_file(self.workspace_root / rel_path)}
+            stats["indexed"] += 1
+        for rel_path in [path for path in self._files if path not in seen]:
+            del self._files[rel_path]
+            stats["removed"] += 1
+        if stats["indexed"] or stats["removed"]:
+            self._dirty = True
+            self._postings = None
+        return stats
+
+    def search(self, keywords: Sequence[str], *, limit: int, exclude: Iterable[Path] = ()) -> list[tuple[Path, list[int]]]:
+        """Return up to `limit` files (path order) with their first keyword hit lines."""
+        lowered = [keyword.lower() for keyword in keywords if keyword]
+        if not lowered or limit <= 0:
+            return []
+        postings = self._inverted()
+        hits: dict[str, set[int]] = {}
+        for token, files in postings.items():
+            if not any(keyword in token for keyword in lowered):
+                continue
+            for rel_path, lines in files.items():
+                hits.setdefault(rel_path, set()).update(lines)
+        excluded = {Path(path) for path in exclude}
+        results: list[tuple[Path, list[int]]] = []
+        for rel_path in sorted(hits):
+            path = self.workspace_root / rel_path
+            if path in excluded:
+                continue
+            results.append((path, sorted(hits[rel_path])[:POSTING_LINES_PER_FILE]))
+            if len(results) >= limit:
+                break
+        return results
+
+    def save(self) -> bool:
+        if not self._dirty:
+            return False
+        saved = write_cache_payload(
+            self.cache_path,
+            {
+                "schema_version": CONTEXT_INDEX_SCHEMA_VERSION,
+                "root": str(self.workspace_root),
+                "files": self._files,
+            },
+        )
+        self._dirty = not saved
+        return saved
+
+    def _inverted(self) -> dict[str, dict[str, list[int]]]:
+        if self._postings is None:
+            postings: dict[str, dict[str, list[int]]] = {}
+            for rel_path, entry in self._files.items():
+                tokens = entry.get("tokens") if isinstance(entry, Mapping) else None
+                if not isinstance(tokens, Mapping):
+                    continue
+                for token, lines in tokens.items():
+                    postings.setdefault(token, {})[rel_path] = lines
+            self._postings = postings
+        return self._postings
+
+
+class _IgnoreRules:
+    """`.gitignore` patterns collected on the way down, last match wins."""
+
+    def __init__(self, rules: tuple[tuple[str, str, bool, bool, bool], ...] = ()) -> None:
+        # (base dir, pattern, negated, dir_only, anchored)
+        self._rules = rules
+
+    def extended(self, base: str, text: str) -> "_IgnoreRules":
+        rules = list(self._rules)
+        for raw_line in text.splitlines():
+            line = raw_line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            anchored = line.startswith("/")
+            line = line.strip("/")
+            anchored = anchored or "/" in line
+            if line:
+                rules.append((base, line, negated, dir_only, anchored))
+        return _IgnoreRules(tuple(rules))
+
+    def ignored(self, rel_path: str, *, is_dir: bool) -> bool:
+        ignored = False
+        name = rel_path.rsplit("/", 1)[-1]
+        for base, pattern, negated, dir_only, anchored in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel_path.startswith(base + "/"):
+                    continue
+                relative = rel_path[len(base) + 1:]
+            else:
+                relative = rel_path
+            if anchored:
+                matched = fnmatchcase(relative, pattern) or (
+                    pattern.startswith("**/") and fnmatchcase(relative, pattern[3:])
+                )
+            else:
+                matched = fnmatchcase(name, pattern)
+            if matched:
+                ignored = not negated
+        return ignored
+
+
+def walk_workspace_files(
+    root: Path,
+    *,
+    skip_dirs: frozenset[str] = frozenset(),
+    stats: Optional[dict[str, int]] = None,
+) -> Iterator[tuple[str, list[int]]]:
+    """Yield `(relative path, stat signature)` for files small enough to index.
+
+    Directories are visited in name order; noise and `.gitignore`d directories
+    are pruned before descending. `stats["dirs"]`/`stats["files"]` count the
+    walk when a mapping is given.
+    """
+    if stats is None:
+        stats = {"dirs": 0, "files": 0}
+    stack: list[tuple[Path, str, _IgnoreRules]] = [(root, "", _IgnoreRules())]
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        stats["dirs"] += 1
+        if any(entry.name == ".gitignore" for entry in entries):
+            try:
+                rules = rules.extended(rel_dir, (directory / ".gitignore").read_text(encoding="utf-8", errors="ignore"))
+            except OSError:
+                pass
+        subdirs: list[tuple[Path, str, _IgnoreRules]] = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        entry.name not in DEFAULT_IGNORED_DIRS
+                        and rel_path not in skip_dirs
+                        and not rules.ignored(rel_path, is_dir=True)
+                    ):
+                        subdirs.append((Path(entry.path), rel_path, rules))
+                    continue
+                if not entry.is_file() or rules.ignored(rel_path, is_dir=False):
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            if stat.st_size > MAX_INDEXED_FILE_BYTES:
+                continue
+            stats["files"] += 1
+            yield (rel_path, [stat.st_mtime_ns, stat.st_size, stat.st_ino])
+        # Reversed so the stack visits subdirectories in name order.
+        stack.extend(reversed(subdirs))
+
+
+def _relative_dir(path: Path, root: Path) -> Optional[str]:
+    try:
+        return path.resolve().relative_to(root).as_posix()
+    except (OSError, ValueError):
+        return None
+
+
+def _index_file(path: Path) -> Optional[dict[str, list[int]]]:
+    """First hit lines per lowercased token, or None for binary/unreadable files."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if b"\x00" in data[:_TEXT_SNIFF_BYTES]:
+        return None
+    tokens: dict[str, list[int]] = {}
+    for line_number, line in enumerate(data.decode("utf-8", errors="ignore").splitlines(), start=1):
+        for token in TOKEN_RE.findall(line):
+            lines = tokens.setdefault(token.lower(), [])
+            if len(lines) < POSTING_LINES_PER_FILE and (not lines or lines[-1] != line_number):
+                lines.append(line_number)
+    return tokens
+
+
+__all__ = [
+    "CONTEXT_INDEX_FILENAME",
+    "DEFAULT_IGNORED_DIRS",
+    "MAX_INDEXED_FILE_BYTES",
+    "WorkspaceContextIndex",
+    "walk_workspace_files",
+]
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-import json
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any, Mapping
@@ -111,6 +110,9 @@ def resolve_context_snapshot(
         and review_store.session_id == global_store.session_id
     )
     review_scope = _PRIMARY_SCOPE if same_scope_store else "session"
+    review_store.prefetch()
+    if not same_scope_store:
+        global_store.prefetch()
     review_run = review_store.get_current_run()
     review_plan = review_store.get_current_plan()
     review_handoff = review_store.get_current_handoff()
@@ -358,7 +360,7 @@ def _load_plan_proposal(
     scope: str,
     quarantined: list[QuarantinedStateItem],
 ) -> PlanProposalState | None:
-    payload, payload_error = _read_json_payload(store.current_plan_proposal_path)
+    payload, payload_error = store.read_state_payload(store.current_plan_proposal_path)
     if payload_error is not None:
         quarantined.append(
             _quarantined_item(
@@ -405,7 +407,7 @@ def _load_clarification(
     active_run: RunState | None,
     quarantined: list[QuarantinedStateItem],
 ) -> ClarificationState | None:
-    payload, payload_error = _read_json_payload(store.current_clarification_path)
+    payload, payload_error = store.read_state_payload(store.current_clarification_path)
     if payload_error is not None:
         quarantined.append(
             _quarantined_item(
@@ -507,7 +509,7 @@ def _load_decision(
     active_run: RunState | None,
     quarantined: list[QuarantinedStateItem],
 ) -> DecisionState | None:
-    payload, payload_error = _read_json_payload(store.current_decision_path)
+    payload, payload_error = store.read_state_payload(store.current_decision_path)
     if payload_error is not None:
         quarantined.append(
             _quarantined_item(
@@ -1075,18 +1077,6 @@ def _quarantined_item(
     )
 
 
-def _read_json_payload(path: Path) -> tuple[dict[str, Any] | None, str | None]:
-    if not path.exists():
-        return (None, None)
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, ValueError):
-        return (None, "invalid_json")
-    if not isinstance(payload, dict):
-        return (None, "invalid_payload_shape")
-    return (payload, None)
-
-
 def _proposal_contract_missing(proposal: PlanProposalState) -> bool:
     return not all(
         (
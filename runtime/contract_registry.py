@@ -0,0 +1,110 @@
+"""Process-wide read-only views of the default decision-table contracts.
+
+The handoff guardrails, the resolution planner, the sidecar boundary and host
+message rendering all consult the same frozen tables. `get_contract_registry`
+loads them once, freezes them into `MappingProxyType`/tuple views that can be
+shared without copying, and precomputes the lookup indexes those callers need.
+The registry is rebuilt only when `load_default_decision_tables` would return
+a different result, i.e. when a contract source file changed.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TypeVar
+
+from .decision_tables import default_decision_tables_view
+
+_T = TypeVar("_T")
+
+
+class ContractRegistry:
+    """Frozen decision tables plus the indexes derived from them."""
+
+    def __init__(self, tables: Mapping[str, Any]) -> None:
+        self.source = tables
+        self.decision_tables: Mapping[str, Any] = freeze_contract(tables)
+        self.failure_recovery_table: Mapping[str, Any] = self.decision_tables["failure_recovery_table"]
+        self.host_message_templates: Mapping[str, Any] = self.decision_tables["host_message_templates"]
+        # (primary_failure_type, required_host_action) -> failure recovery row.
+        self.failure_recovery_by_key: Mapping[tuple[str, str], Mapping[str, Any]] = self.failure_recovery_table[
+            "rows_by_key"
+        ]
+
+        signal_rows_by_action: dict[str, list[Mapping[str, Any]]] = {}
+        for row in self.decision_tables["signal_priority_table"]["rows"]:
+            for required_host_action in row["enabled_checkpoint_kinds"]:
+                signal_rows_by_action.setdefault(required_host_action, []).append(row)
+        # required_host_action -> signal-priority rows in table order.
+        self.signal_rows_by_action: Mapping[str, tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            {action: tuple(rows) for action, rows in signal_rows_by_action.items()}
+        )
+        # (checkpoint_kind, resolved_action) -> side-effect mapping row.
+        self.side_effect_rows_by_key: Mapping[tuple[str, str], Mapping[str, Any]] = MappingProxyType(
+            {
+                (row["checkpoint_kind"], row["resolved_action"]): row
+                for row in self.decision_tables["side_effect_mapping_table"]["rows"]
+            }
+        )
+
+        templates_by_reason_code: dict[str, list[Mapping[str, Any]]] = {}
+        for template in self.host_message_templates["templates"]:
+            if template["match_kind"] == "exact_reason_code":
+                templates_by_reason_code.setdefault(template["match_value"], []).append(template)
+        # reason_code -> `exact_reason_code` template rows in table order.
+        self.templates_by_reason_code: Mapping[str, tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            {reason_code: tuple(rows) for reason_code, rows in templates_by_reason_code.items()}
+        )
+        self._derived: dict[str, Any] = {}
+
+    def derived(self, name: str, build: Callable[["ContractRegistry"], _T]) -> _T:
+        """Memoize a caller-specific index for the lifetime of this registry."""
+
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = build(self)
+            return value
+
+
+_registry: ContractRegistry | None = None
+
+
+def get_contract_registry() -> ContractRegistry:
+    """Return the shared registry for the current default contract sources."""
+
+    global _registry
+
+    tables = default_decision_tables_view()
+    registry = _registry
+    if registry is None or registry.source is not tables:
+        registry = _registry = ContractRegistry(tables)
+    return registry
+
+
+def freeze_contract(value: Any) -> Any:
+    """Return a read-only view: mappings become `MappingProxyType`, lists tuples."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_contract(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_contract(item) for item in value)
+    return value
+
+
+def thaw_contract(value: Any) -> Any:
+    """Inverse of `freeze_contract`, for payloads that leave the runtime as JSON."""
+
+    if isinstance(value, Mapping):
+        return {key: thaw_contract(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_contract(item) for item in value]
+    return value
+
+
+__all__ = [
+    "ContractRegistry",
+    "freeze_contract",
+    "get_contract_registry",
+    "thaw_contract",
+]
@@ -1,4 +1,11 @@
-"""Deterministic daily summary generation for the `~summary` route."""
+"""Deterministic daily summary generation for the `~summary` route.
+
+Repeated summaries on the same day are incremental: per-source fingerprints
+(directory and file stat signatures, replay read offsets, git HEAD and index
+signatures) are persisted in `summary_sources.json` next to `summary.json`,
+and only sources whose fingerprint changed are re-listed, re-read or re-diffed.
+The sidecar is an optimization only and honors `advanced.cache_project`.
+"""
 
 from __future__ import annotations
 
@@ -8,9 +15,11 @@ import json
 import os
 from pathlib import Path
 import re
-import subprocess
 from tempfile import NamedTemporaryFile
-from typing import Iterable, Mapping, Sequence
+from typing import Any, Iterable, Mapping, Sequence
+
+from .cache import path_signature, read_cache_payload, write_cache_payload
+from .git_facade import GitFacade
 
 from .models import (
     DailySummaryArtifact,
@@ -32,9 +41,12 @@ from .models import (
     SummarySourceWindow,
 )
 from .state import StateStore, local_day_start_iso, local_timezone_name
+from .state_backend import STATE_FILENAMES
 
 SUMMARY_MD_FILENAME = "summary.md"
 SUMMARY_JSON_FILENAME = "summary.json"
+SUMMARY_SOURCES_FILENAME = "summary_sources.json"
+SUMMARY_SOURCES_SCHEMA_VERSION = "1"
 
 _HEADING_RE = re.compile(r"^(#{2,6})\s*(.+?)\s*$")
 _TASK_RE = re.compile(r"^\s*-\s*\[(?P<status>[^\]]+)\]\s*(?P<body>.+?)\s*$")
@@ -164,6 +176,176 @@ class _GitChange:
     path: str
     change_type: str
     commit_title: str = ""
+    # HEAD and index object ids from `git status`; empty when the path has no
+    # staged or unstaged diff (untracked, or only changed by today's commits).
+    diff_key: str = ""
+
+
+@dataclass(frozen=True)
+class _DocumentFacts:
+    title: str = ""
+    decisions: tuple[str, ...] = ()
+    lessons: tuple[str, ...] = ()
+    pending_tasks: tuple[str, ...] = ()
+
+    @classmethod
+    def from_text(cls, text: str) -> "_DocumentFacts":
+        return cls(
+            title=_first_title(text),
+            decisions=tuple(_extract_section_items(text, keywords=_DECISION_SECTION_KEYWORDS)),
+            lessons=tuple(_extract_section_items(text, keywords=_LESSON_SECTION_KEYWORDS)),
+            pending_tasks=tuple(_extract_pending_tasks(text)),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "title": self.title,
+            "decisions": list(self.decisions),
+            "lessons": list(self.lessons),
+            "pending_tasks": list(self.pending_tasks),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "_DocumentFacts":
+        return cls(
+            title=str(data.get("title") or ""),
+            decisions=tuple(str(item) for item in data.get("decisions") or ()),
+            lessons=tuple(str(item) for item in data.get("lessons") or ()),
+            pending_tasks=tuple(str(item) for item in data.get("pending_tasks") or ()),
+        )
+
+
+class _SummarySources:
+    """Fingerprinted per-source facts reused across same-day summary runs."""
+
+    def __init__(self, path: Path | None, payload: Mapping[str, Any] | None, *, summary_key: str) -> None:
+        self._path = path
+        self._summary_key = summary_key
+        payload = payload or {}
+        self._dirs = _mapping_section(payload, "dirs")
+        self._documents = _mapping_section(payload, "documents")
+        self._sessions = _mapping_section(payload, "sessions")
+        self._git_log = _mapping_section(payload, "git_log")
+        self._diffs = _mapping_section(payload, "diffs")
+        self.git_head = ""
+
+    @classmethod
+    def load(cls, config, *, summary_dir: Path, summary_key: str) -> "_SummarySources":
+        path = summary_dir / SUMMARY_SOURCES_FILENAME if config.cache_project else None
+        payload = read_cache_payload(path, schema_version=SUMMARY_SOURCES_SCHEMA_VERSION)
+        if payload is not None and str(payload.get("summary_key") or "") != summary_key:
+            payload = None
+        return cls(path, payload, summary_key=summary_key)
+
+    def save(self) -> None:
+        write_cache_payload(
+            self._path,
+            {
+                "schema_version": SUMMARY_SOURCES_SCHEMA_VERSION,
+                "summary_key": self._summary_key,
+                "dirs": self._dirs,
+                "documents": self._documents,
+                "sessions": self._sessions,
+                "git_log": self._git_log,
+                "diffs": self._diffs,
+            },
+        )
+
+    def markdown_files(self, root: Path) -> list[Path]:
+        """Same files as `root.rglob("*.md")`; unchanged directories are not re-listed."""
+        found: list[Path] = []
+        listed: dict[str, Any] = {}
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            signature = path_signature(directory)
+            if signature is None:
+                continue
+            key = str(directory)
+            cached = self._dirs.get(key)
+            if isinstance(cached, Mapping) and cached.get("signature") == signature:
+                listing = cached
+            else:
+                listing = _list_markdown_dir(directory, signature=signature)
+            listed[key] = listing
+            found.extend(directory / name for name in listing.get("files") or ())
+            pending.extend(directory / name for name in listing.get("subdirs") or ())
+        self._dirs = listed
+        return sorted(found)
+
+    def document(self, path: Path) -> _DocumentFacts:
+        """Title, decision, lesson and pending-task items of one plan document."""
+        signature = path_signature(path)
+        if signature is None:
+            return _DocumentFacts()
+        key = str(path)
+        cached = self._documents.get(key)
+        if isinstance(cached, Mapping) and cached.get("signature") == signature:
+            return _DocumentFacts.from_dict(cached)
+        facts = _DocumentFacts.from_text(_safe_read_text(path))
+        self._documents[key] = {"signature": signature, **facts.to_dict()}
+        return facts
+
+    def session_used_for(self, events_path: Path, *, local_day: str) -> bool:
+        """Scan only the events appended since the previous run of the day."""
+        try:
+            stat = os.stat(events_path)
+        except OSError:
+            return False
+        key = str(events_path)
+        cached = self._sessions.get(key)
+        offset = 0
+        if isinstance(cached, Mapping) and cached.get("ino") == stat.st_ino and int(cached.get("offset") or 0) <= stat.st_size:
+            if cached.get("used"):
+                return True
+            offset = int(cached.get("offset") or 0)
+        used, offset = _scan_session_events(events_path, local_day=local_day, offset=offset)
+        self._sessions[key] = {"ino": stat.st_ino, "offset": offset, "used": used}
+        return used
+
+    def day_commits(self, *, since_iso: str) -> list[tuple[SummaryGitCommitRef, list[str]]] | None:
+        """Cached day log, valid while HEAD has not moved."""
+        if not self.git_head or self._git_log.get("head") != self.git_head or self._git_log.get("since") != since_iso:
+            return None
+        return [
+            (SummaryGitCommitRef.from_dict(item), [str(path) for path in item.get("files") or ()])
+            for item in self._git_log.get("commits") or ()
+            if isinstance(item, Mapping)
+        ]
+
+    def store_day_commits(self, *, since_iso: str, file_refs: Sequence[tuple[SummaryGitCommitRef, list[str]]]) -> None:
+        if not self.git_head:
+            return
+        self._git_log = {
+            "head": self.git_head,
+            "since": since_iso,
+            "commits": [{**commit.to_dict(), "files": list(files)} for commit, files in file_refs],
+        }
+
+    def symbol_excerpts(self, git: GitFacade, changes: Sequence[_GitChange]) -> dict[str, str]:
+        """Changed Python symbols per path, keyed by blob ids and the worktree file.
+
+        Paths without a staged or unstaged diff have no symbols; the stale rest
+        is diffed in one batch.
+        """
+        excerpts: dict[str, str] = {}
+        stale: dict[str, list[Any]] = {}
+        for change in changes:
+            if not change.diff_key or not change.path.endswith(".py"):
+                continue
+            fingerprint = [change.diff_key, path_signature(git.workspace_root / change.path)]
+            cached = self._diffs.get(change.path)
+            if isinstance(cached, Mapping) and cached.get("fingerprint") == fingerprint:
+                excerpts[change.path] = str(cached.get("names") or "")
+            else:
+                stale[change.path] = fingerprint
+        if stale:
+            diff_texts = git.diff_texts(list(stale))
+            for path, fingerprint in stale.items():
+                names = _symbol_excerpt(diff_texts.get(path, ""))
+                self._diffs[path] = {"fingerprint": fingerprint, "names": names}
+                excerpts[path] = names
+        return excerpts
 
 
 def build_daily_summary(
@@ -183,16 +365,20 @@ def build_daily_summary(
 
     previous, existing_summary_fallback = _read_existing_summary(summary_json_path)
     revision = previous.revision + 1 if previous is not None and previous.summary_key == summary_key else 1
+    sources = _SummarySources.load(config, summary_dir=summary_dir, summary_key=summary_key)
+    git = GitFacade(config.workspace_root)
 
-    plan_files = _collect_plan_file_refs(config=config, local_day=local_day)
-    state_files = _collect_state_file_refs(config=config, local_day=local_day)
-    handoff_files = _collect_handoff_file_refs(config=config, local_day=local_day)
-    replay_sessions = _collect_replay_sessions(config=config, local_day=local_day)
+    plan_files = _collect_plan_file_refs(config=config, local_day=local_day, sources=sources)
+    state_files = _collect_state_file_refs(config=config, state_store=state_store, local_day=local_day)
+    handoff_files = _collect_handoff_file_refs(config=config, state_store=state_store, local_day=local_day)
+    replay_sessions = _collect_replay_sessions(config=config, local_day=local_day, sources=sources)
     git_refs, git_changes, git_fallbacks = _collect_git_refs(
         workspace_root=config.workspace_root,
         local_day=local_day,
         generated_summary_dir=summary_dir,
         generated_at=generated_at,
+        git=git,
+        sources=sources,
     )
 
     source_refs = SummarySourceRefs(
@@ -217,6 +403,7 @@ def build_daily_summary(
                 state_store=state_store,
                 plan_files=plan_files,
                 evidence=evidence,
+                sources=sources,
             )
         ),
         decisions=tuple(
@@ -226,14 +413,16 @@ def build_daily_summary(
                 plan_files=plan_files,
                 evidence=evidence,
                 language=config.language,
+                sources=sources,
             )
         ),
         code_changes=tuple(
             _build_code_change_facts(
-                workspace_root=config.workspace_root,
+                git=git,
                 git_changes=git_changes,
                 evidence=evidence,
                 language=config.language,
+                sources=sources,
             )
         ),
         issues=tuple(
@@ -249,6 +438,7 @@ def build_daily_summary(
                 config=config,
                 plan_files=plan_files,
                 evidence=evidence,
+                sources=sources,
             )
         ),
         next_steps=tuple(
@@ -258,6 +448,7 @@ def build_daily_summary(
                 plan_files=plan_files,
                 evidence=evidence,
                 language=config.language,
+                sources=sources,
             )
         ),
     )
@@ -302,6 +493,7 @@ def build_daily_summary(
 
     _write_json(summary_json_path, artifact.to_dict())
     _write_text(summary_md_path, markdown)
+    sources.save()
     generated_files = (
         str(summary_json_path.relative_to(config.workspace_root)),
         str(summary_md_path.relative_to(config.workspace_root)),
@@ -438,7 +630,14 @@ def _build_headline(
     return _summary_text(language, "headline_fallback")
 
 
-def _build_goal_facts(*, config, state_store: StateStore, plan_files: Sequence[SummarySourceRefFile], evidence: Mapping[str, str]) -> list[SummaryGoalFact]:
+def _build_goal_facts(
+    *,
+    config,
+    state_store: StateStore,
+    plan_files: Sequence[SummarySourceRefFile],
+    evidence: Mapping[str, str],
+    sources: _SummarySources,
+) -> list[SummaryGoalFact]:
     goals: list[SummaryGoalFact] = []
     current_plan = state_store.get_current_plan()
     if current_plan is not None and current_plan.summary.strip():
@@ -452,7 +651,7 @@ def _build_goal_facts(*, config, state_store: StateStore, plan_files: Sequence[S
         )
     if not goals:
         for ref in plan_files:
-            title = _extract_first_title(config.workspace_root / ref.path)
+            title = sources.document(config.workspace_root / ref.path).title
             if title:
                 goals.append(
                     SummaryGoalFact(
@@ -472,6 +671,7 @@ def _build_decision_facts(
     plan_files: Sequence[SummarySourceRefFile],
     evidence: Mapping[str, str],
     language: str,
+    sources: _SummarySources,
 ) -> list[SummaryDecisionFact]:
     decisions: list[SummaryDecisionFact] = []
     current_decision = state_store.get_current_decision()
@@ -494,8 +694,7 @@ def _build_decision_facts(
         return decisions[:5]
 
     for ref in plan_files:
-        text = _safe_read_text(config.workspace_root / ref.path)
-        for index, item in enumerate(_extract_section_items(text, keywords=_DECISION_SECTION_KEYWORDS), start=1):
+        for index, item in enumerate(sources.document(config.workspace_root / ref.path).decisions, start=1):
             evidence_ref = evidence.get(ref.path)
             decisions.append(
                 SummaryDecisionFact(
@@ -513,19 +712,22 @@ def _build_decision_facts(
 
 def _build_code_change_facts(
     *,
-    workspace_root: Path,
+    git: GitFacade,
     git_changes: Sequence[_GitChange],
     evidence: Mapping[str, str],
     language: str,
+    sources: _SummarySources,
 ) -> list[SummaryCodeChangeFact]:
     facts: list[SummaryCodeChangeFact] = []
-    for change in git_changes[:12]:
+    reported = git_changes[:12]
+    excerpts = sources.symbol_excerpts(git, reported)
+    for change in reported:
         summary = _summarize_changed_file(
-            workspace_root=workspace_root,
             path=change.path,
             change_type=change.change_type,
             commit_title=change.commit_title,
             language=language,
+            symbol_names=excerpts.get(change.path, ""),
         )
         reason = _reason_for_path(change.path, commit_title=change.commit_title, language=language)
         evidence_ref = evidence.get(change.path) or _git_changed_file_evidence(evidence, change.path)
@@ -594,11 +796,16 @@ def _build_issue_facts(
     return issues[:5]
 
 
-def _build_lesson_facts(*, config, plan_files: Sequence[SummarySourceRefFile], evidence: Mapping[str, str]) -> list[SummaryLessonFact]:
+def _build_lesson_facts(
+    *,
+    config,
+    plan_files: Sequence[SummarySourceRefFile],
+    evidence: Mapping[str, str],
+    sources: _SummarySources,
+) -> list[SummaryLessonFact]:
     lessons: list[SummaryLessonFact] = []
     for ref in plan_files:
-        text = _safe_read_text(config.workspace_root / ref.path)
-        candidates = _extract_section_items(text, keywords=_LESSON_SECTION_KEYWORDS)
+        candidates = sources.document(config.workspace_root / ref.path).lessons
         for index, item in enumerate(candidates, start=1):
             evidence_ref = evidence.get(ref.path)
             lessons.append(
@@ -621,6 +828,7 @@ def _build_next_step_facts(
     plan_files: Sequence[SummarySourceRefFile],
     evidence: Mapping[str, str],
     language: str,
+    sources: _SummarySources,
 ) -> list[SummaryNextStepFact]:
     next_steps: list[SummaryNextStepFact] = []
     current_run = state_store.get_current_run()
@@ -637,8 +845,7 @@ def _build_next_step_facts(
     for ref in plan_files:
         if not ref.path.endswith("tasks.md"):
             continue
-        text = _safe_read_text(config.workspace_root / ref.path)
-        for index, item in enumerate(_extract_pending_tasks(text), start=1):
+        for index, item in enumerate(sources.document(config.workspace_root / ref.path).pending_tasks, start=1):
             evidence_ref = evidence.get(ref.path)
             next_steps.append(
                 SummaryNextStepFact(
@@ -653,9 +860,9 @@ def _build_next_step_facts(
     return next_steps[:5]
 
 
-def _collect_plan_file_refs(*, config, local_day: str) -> list[SummarySourceRefFile]:
+def _collect_plan_file_refs(*, config, local_day: str, sources: _SummarySources) -> list[SummarySourceRefFile]:
     refs: list[SummarySourceRefFile] = []
-    for path in sorted(config.plan_root.rglob("*.md")):
+    for path in sources.markdown_files(config.plan_root):
         if not path.is_file():
             continue
         if _path_local_day(path) != local_day:
@@ -670,39 +877,47 @@ def _collect_plan_file_refs(*, config, local_day: str) -> list[SummarySourceRefF
     return refs[:20]
 
 
-def _collect_state_file_refs(*, config, local_day: str) -> list[SummarySourceRefFile]:
-    refs: list[SummarySourceRefFile] = []
-    for path in sorted(config.state_dir.glob("*.json")):
-        if not path.is_file():
-            continue
-        if _path_local_day(path) != local_day:
+def _collect_state_file_refs(*, config, state_store: StateStore, local_day: str) -> list[SummarySourceRefFile]:
+    # State documents come from the backend: with sqlite and no JSON export
+    # they have no file on disk. Other JSON files under state/ are still listed.
+    updated = {
+        path: updated_at
+        for path, updated_at in state_store.backend.updated_times(config.state_dir, STATE_FILENAMES).items()
+        if path.name != "current_handoff.json"
+    }
+    for path in config.state_dir.glob("*.json"):
+        if path.name in STATE_FILENAMES or not path.is_file():
             continue
-        if path.name == "current_handoff.json":
+        updated[path] = path.stat().st_mtime
+    refs: list[SummarySourceRefFile] = []
+    for path in sorted(updated):
+        if _timestamp_local_day(updated[path]) != local_day:
             continue
         refs.append(
             SummarySourceRefFile(
                 path=str(path.relative_to(config.workspace_root)),
                 kind="state",
-                updated_at=_path_updated_at(path),
+                updated_at=_timestamp_updated_at(updated[path]),
             )
         )
     return refs[:20]
 
 
-def _collect_handoff_file_refs(*, config, local_day: str) -> list[SummarySourceRefFile]:
+def _collect_handoff_file_refs(*, config, state_store: StateStore, local_day: str) -> list[SummarySourceRefFile]:
     path = config.state_dir / "current_handoff.json"
-    if not path.exists() or _path_local_day(path) != local_day:
+    updated_at = state_store.backend.updated_times(config.state_dir, (path.name,)).get(path)
+    if updated_at is None or _timestamp_local_day(updated_at) != local_day:
         return []
     return [
         SummarySourceRefFile(
             path=str(path.relative_to(config.workspace_root)),
             kind="handoff",
-            updated_at=_path_updated_at(path),
+            updated_at=_timestamp_updated_at(updated_at),
         )
     ]
 
 
-def _collect_replay_sessions(*, config, local_day: str) -> list[SummaryReplaySessionRef]:
+def _collect_replay_sessions(*, config, local_day: str, sources: _SummarySources) -> list[SummaryReplaySessionRef]:
     sessions: list[SummaryReplaySessionRef] = []
     if not config.replay_root.exists():
         return sessions
@@ -710,7 +925,7 @@ def _collect_replay_sessions(*, config, local_day: str) -> list[SummaryReplaySes
         events_path = session_dir / "events.jsonl"
         if not events_path.exists():
             continue
-        used = _session_used_for(events_path, local_day=local_day)
+        used = sources.session_used_for(events_path, local_day=local_day)
         if not used:
             continue
         sessions.append(
@@ -729,18 +944,25 @@ def _collect_git_refs(
     local_day: str,
     generated_summary_dir: Path,
     generated_at: str,
+    git: GitFacade,
+    sources: _SummarySources,
 ) -> tuple[SummaryGitRefs, list[_GitChange], list[str]]:
     fallbacks: list[str] = []
-    if not _is_git_workspace(workspace_root):
+    status = git.status()
+    if status is None:
         fallbacks.append("git_unavailable")
         return (SummaryGitRefs(base_ref="HEAD"), [], fallbacks)
-
-    status_map = _git_status_map(workspace_root)
-    commit_refs, committed_files = _git_commits_for_day(
-        workspace_root=workspace_root,
-        since_iso=local_day_start_iso(local_day),
-        until_iso=generated_at,
-    )
+    sources.git_head = status.head
+
+    since_iso = local_day_start_iso(local_day)
+    committed_files = sources.day_commits(since_iso=since_iso)
+    if committed_files is None:
+        committed_files = [
+            (SummaryGitCommitRef(sha=commit.sha, title=commit.title, authored_at=commit.authored_at), list(commit.files))
+            for commit in git.day_log(since_iso=since_iso, until_iso=generated_at)
+        ]
+        sources.store_day_commits(since_iso=since_iso, file_refs=committed_files)
+    commit_refs = [commit_ref for commit_ref, _ in committed_files][:10]
     changed_files: list[str] = []
     changes: list[_GitChange] = []
     commit_title_by_file: dict[str, str] = {}
@@ -757,11 +979,18 @@ def _collect_git_refs(
             return False
         return True
 
-    for path, change_type in status_map.items():
+    for path, entry in status.entries.items():
         if include(path) and path not in seen:
             seen.add(path)
             changed_files.append(path)
-            changes.append(_GitChange(path=path, change_type=change_type, commit_title=commit_title_by_file.get(path, "")))
+            changes.append(
+                _GitChange(
+                    path=path,
+                    change_type=entry.change_type,
+                    commit_title=commit_title_by_file.get(path, ""),
+                    diff_key=entry.diff_key,
+                )
+            )
     for path in commit_title_by_file:
         if include(path) and path not in seen:
             seen.add(path)
@@ -779,63 +1008,7 @@ def _collect_git_refs(
     )
 
 
-def _git_status_map(workspace_root: Path) -> dict[str, str]:
-    payload = _run_git(workspace_root, "status", "--porcelain=v1", "--untracked-files=all")
-    status_map: dict[str, str] = {}
-    for line in payload.splitlines():
-        if len(line) < 4:
-            continue
-        code = line[:2]
-        path = line[3:]
-        if " -> " in path:
-            path = path.split(" -> ", 1)[1]
-        status_map[path] = _normalize_change_type(code)
-    return status_map
-
-
-def _git_commits_for_day(*, workspace_root: Path, since_iso: str, until_iso: str) -> tuple[list[SummaryGitCommitRef], list[tuple[SummaryGitCommitRef, list[str]]]]:
-    output = _run_git(
-        workspace_root,
-        "log",
-        f"--since={since_iso}",
-        f"--until={until_iso}",
-        "--date=iso-strict",
-        "--pretty=format:__COMMIT__%x09%H%x09%s%x09%ad",
-        "--name-only",
-    )
-    commit_refs: list[SummaryGitCommitRef] = []
-    file_refs: list[tuple[SummaryGitCommitRef, list[str]]] = []
-    current_commit: SummaryGitCommitRef | None = None
-    current_files: list[str] = []
-    for line in output.splitlines():
-        if not line.strip():
-            continue
-        if line.startswith("__COMMIT__\t"):
-            if current_commit is not None:
-                file_refs.append((current_commit, current_files))
-            _, sha, title, authored_at = line.split("\t", 3)
-            current_commit = SummaryGitCommitRef(sha=sha, title=title, authored_at=authored_at)
-            commit_refs.append(current_commit)
-            current_files = []
-            continue
-        if current_commit is not None:
-            current_files.append(line.strip())
-    if current_commit is not None:
-        file_refs.append((current_commit, current_files))
-    return (commit_refs[:10], file_refs)
-
-
-def _normalize_change_type(code: str) -> str:
-    if code.startswith("??"):
-        return "untracked"
-    if "D" in code:
-        return "deleted"
-    if "A" in code:
-        return "added"
-    return "modified"
-
-
-def _summarize_changed_file(*, workspace_root: Path, path: str, change_type: str, commit_title: str, language: str) -> str:
+def _summarize_changed_file(*, path: str, change_type: str, commit_title: str, language: str, symbol_names: str) -> str:
     normalized = path.replace("\\", "/")
     if normalized.endswith("/design.md"):
         return _summary_text(language, "change_design_doc")
@@ -844,12 +1017,12 @@ def _summarize_changed_file(*, workspace_root: Path, path: str, change_type: str
     if normalized.startswith(".sopify-skills/blueprint/"):
         return _summary_text(language, "change_blueprint_doc")
     if normalized == "runtime/models.py":
-        names = _diff_symbol_excerpt(workspace_root=workspace_root, path=path)
+        names = symbol_names
         if names:
             return _summary_text(language, "change_runtime_models_facade_with_names", names=names)
         return _summary_text(language, "change_runtime_models_facade")
     if normalized.startswith("runtime/_models/"):
-        names = _diff_symbol_excerpt(workspace_root=workspace_root, path=path)
+        names = symbol_names
         if names:
             return _summary_text(language, "change_runtime_models_internal_with_names", names=names)
         return _summary_text(language, "change_runtime_models_internal")
@@ -864,7 +1037,7 @@ def _summarize_changed_file(*, workspace_root: Path, path: str, change_type: str
     if normalized.endswith("runtime/router.py"):
         return _summary_text(language, "change_runtime_router")
     if normalized.endswith(".py"):
-        names = _diff_symbol_excerpt(workspace_root=workspace_root, path=path)
+        names = symbol_names
         if names:
             return _summary_text(language, "change_python_with_names", names=names)
         return _summary_text(language, "change_python")
@@ -888,30 +1061,65 @@ def _reason_for_path(path: str, *, commit_title: str, language: str) -> str:
     return _summary_text(language, "reason_generic")
 
 
-def _diff_symbol_excerpt(*, workspace_root: Path, path: str) -> str:
-    diff_text = _run_git(workspace_root, "diff", "--cached", "--unified=0", "--", path)
-    diff_text += "\n" + _run_git(workspace_root, "diff", "--unified=0", "--", path)
+def _symbol_excerpt(diff_text: str) -> str:
     names = list(dict.fromkeys(_CLASS_RE.findall(diff_text) + _FUNC_RE.findall(diff_text)))
     if not names:
         return ""
     return ", ".join(names[:4])
 
 
-def _session_used_for(events_path: Path, *, local_day: str) -> bool:
-    for line in events_path.read_text(encoding="utf-8").splitlines():
+def _scan_session_events(events_path: Path, *, local_day: str, offset: int = 0) -> tuple[bool, int]:
+    """Scan events from `offset`; return whether one matches and the resume offset.
+
+    The resume offset stops before a trailing line without a newline, so an
+    event still being appended is re-read in full next time.
+    """
+    with events_path.open("rb") as handle:
+        handle.seek(offset)
+        chunk = handle.read()
+    for raw_line in chunk.splitlines(keepends=True):
+        if raw_line.endswith(b"\n"):
+            offset += len(raw_line)
+        line = raw_line.decode("utf-8")
         if not line.strip():
             continue
         try:
             payload = json.loads(line)
         except json.JSONDecodeError:
             continue
+        if not isinstance(payload, Mapping):
+            continue
         if str(payload.get("ts") or "").startswith(local_day):
-            return True
+            return (True, offset)
         metadata = payload.get("metadata")
         activation = metadata.get("activation") if isinstance(metadata, Mapping) else None
         if isinstance(activation, Mapping) and str(activation.get("activated_local_day") or "") == local_day:
-            return True
-    return False
+            return (True, offset)
+    return (False, offset)
+
+
+def _mapping_section(payload: Mapping[str, Any], key: str) -> dict[str, Any]:
+    section = payload.get(key)
+    return dict(section) if isinstance(section, Mapping) else {}
+
+
+def _list_markdown_dir(directory: Path, *, signature: list[int]) -> dict[str, Any]:
+    files: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as iterator:
+            for item in iterator:
+                try:
+                    # Mirrors `rglob`: recurse into real directories only.
+                    if item.is_dir() and not item.is_symlink():
+                        subdirs.append(item.name)
+                    elif item.name.endswith(".md"):
+                        files.append(item.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return {"signature": signature, "files": sorted(files), "subdirs": sorted(subdirs)}
 
 
 def _build_evidence_map(source_refs: SummarySourceRefs) -> dict[str, str]:
@@ -940,8 +1148,7 @@ def _first_plan_ref(evidence: Mapping[str, str]) -> str | None:
     return None
 
 
-def _extract_first_title(path: Path) -> str:
-    text = _safe_read_text(path)
+def _first_title(text: str) -> str:
     for line in text.splitlines():
         if line.startswith("# "):
             return line[2:].strip()
@@ -1013,83 +1220,20 @@ def _safe_read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _workspace_matches_current_git_env(workspace_root: Path) -> bool:
-    work_tree = (os.environ.get("GIT_WORK_TREE") or "").strip()
-    if work_tree:
-        try:
-            return Path(work_tree).resolve() == workspace_root.resolve()
-        except OSError:
-            return False
-
-    git_dir = (os.environ.get("GIT_DIR") or "").strip()
-    if git_dir:
-        try:
-            return Path(git_dir).resolve() == (workspace_root / ".git").resolve()
-        except OSError:
-            return False
-    return False
-
-
-def _git_command_env(workspace_root: Path) -> dict[str, str]:
-    env = os.environ.copy()
-    if _workspace_matches_current_git_env(workspace_root):
-        return env
-    # When Sopify runs under a Git hook, Git exports repo-local environment
-    # variables. Clear them so `git -C <workspace>` always targets the intended
-    # workspace, even if the current process was started from another repo.
-    for key in (
-        "GIT_ALTERNATE_OBJECT_DIRECTORIES",
-        "GIT_COMMON_DIR",
-        "GIT_DIR",
-        "GIT_GRAFT_FILE",
-        "GIT_IMPLICIT_WORK_TREE",
-        "GIT_INDEX_FILE",
-        "GIT_NAMESPACE",
-        "GIT_OBJECT_DIRECTORY",
-        "GIT_PREFIX",
-        "GIT_SUPER_PREFIX",
-        "GIT_WORK_TREE",
-    ):
-        env.pop(key, None)
-    return env
-
-
-def _is_git_workspace(workspace_root: Path) -> bool:
-    try:
-        completed = subprocess.run(
-            ["git", "-C", str(workspace_root), "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
-            text=True,
-            check=False,
-            env=_git_command_env(workspace_root),
-        )
-    except FileNotFoundError:
-        return False
-    return completed.returncode == 0 and completed.stdout.strip() == "true"
+def _path_updated_at(path: Path) -> str:
+    return _timestamp_updated_at(path.stat().st_mtime)
 
 
-def _run_git(workspace_root: Path, *args: str) -> str:
-    try:
-        completed = subprocess.run(
-            ["git", "-C", str(workspace_root), *args],
-            capture_output=True,
-            text=True,
-            check=False,
-            env=_git_command_env(workspace_root),
-        )
-    except FileNotFoundError:
-        return ""
-    if completed.returncode != 0:
-        return ""
-    return completed.stdout
+def _path_local_day(path: Path) -> str:
+    return _timestamp_local_day(path.stat().st_mtime)
 
 
-def _path_updated_at(path: Path) -> str:
-    return datetime.fromtimestamp(path.stat().st_mtime).astimezone().replace(microsecond=0).isoformat()
+def _timestamp_updated_at(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).astimezone().replace(microsecond=0).isoformat()
 
 
-def _path_local_day(path: Path) -> str:
-    return datetime.fromtimestamp(path.stat().st_mtime).astimezone().date().isoformat()
+def _timestamp_local_day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).astimezone().date().isoformat()
 
 
 def _read_existing_summary(path: Path) -> tuple[DailySummaryArtifact | None, str | None]:
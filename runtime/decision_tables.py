@@ -1,8 +1,17 @@
-"""Loader and validator for frozen fail-close decision table assets."""
+"""Loader and validator for frozen fail-close decision table assets.
+
+Validation runs at build time: `scripts/generate-decision-tables.py` writes the
+validated default asset to `runtime/decision_tables_compiled.py` together with
+a hash of its contract sources. `load_default_decision_tables` serves that
+artifact while the hash still matches and re-validates the sources otherwise;
+either result is memoized per process until a source file changes and is
+shared read-only through `default_decision_tables_view`.
+"""
 
 from __future__ import annotations
 
 from copy import deepcopy
+import hashlib
 import json
 from json import JSONDecodeError
 from pathlib import Path
@@ -11,6 +20,7 @@ from string import Formatter
 from typing import Any, Mapping
 
 from ._yaml import YamlParseError, load_yaml
+from .cache import path_signature
 
 
 class DecisionTableError(ValueError):
@@ -31,16 +41,110 @@ DEFAULT_HOST_MESSAGE_TEMPLATES_SCHEMA_PATH = (
     Path(__file__).resolve().parent / "contracts" / "host_message_templates.schema.json"
 )
 
+RUNTIME_PACKAGE_DIR = Path(__file__).resolve().parent
+# Every contract file that feeds the default tables, hashed into the compiled artifact.
+COMPILED_SOURCE_PATHS = (
+    DEFAULT_DECISION_TABLES_PATH,
+    DEFAULT_DECISION_TABLES_SCHEMA_PATH,
+    DEFAULT_SIGNAL_PRIORITY_SCHEMA_PATH,
+    DEFAULT_SIDE_EFFECT_MAPPING_SCHEMA_PATH,
+    DEFAULT_HOST_MESSAGE_TEMPLATES_SCHEMA_PATH,
+    RUNTIME_PACKAGE_DIR / "contracts" / "failure_recovery_table.schema.json",
+)
+COMPILED_SOURCE_PATH_KEYS = frozenset({"source_path", "schema_source_path", "decision_tables_source_path"})
+
 _REASON_CODE_RE = re.compile(r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*){2,3}$")
 _FORMATTER = Formatter()
+# (source stat signature, validated tables) of the default asset.
+_default_tables_memo: tuple[tuple[Any, ...], dict[str, Any]] | None = None
 
 
-def load_default_decision_tables(*, schema_path: str | Path | None = None) -> dict[str, Any]:
-    """Load the repository-default frozen decision table asset."""
+def load_default_decision_tables(
+    *,
+    schema_path: str | Path | None = None,
+    compiled: bool = True,
+) -> dict[str, Any]:
+    """Load the repository-default frozen decision table asset.
+
+    With the default schema and `compiled=True`, the pre-validated artifact is
+    used; pass `compiled=False` to force full validation (contract checks).
+    """
 
+    if schema_path is None and compiled:
+        return deepcopy(default_decision_tables_view())
     return load_decision_tables(DEFAULT_DECISION_TABLES_PATH, schema_path=schema_path)
 
 
+def decision_tables_source_hash() -> str:
+    """Hash the contract sources of the default tables, as stamped into the artifact."""
+
+    digest = hashlib.sha256()
+    for path in COMPILED_SOURCE_PATHS:
+        digest.update(path.relative_to(RUNTIME_PACKAGE_DIR).as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return f"sha256:{digest.hexdigest()}"
+
+
+def relativize_source_paths(tables: Any) -> Any:
+    """Rewrite absolute contract source paths relative to the runtime package."""
+
+    return _map_source_paths(
+        tables,
+        lambda value: Path(value).resolve().relative_to(RUNTIME_PACKAGE_DIR).as_posix(),
+    )
+
+
+def default_decision_tables_view() -> dict[str, Any]:
+    """Return the memoized default tables shared by every caller; never mutate it.
+
+    The same object is returned until a contract source file changes, so
+    callers can key their own derived views on its identity.
+    """
+
+    global _default_tables_memo
+
+    signature = tuple(path_signature(path) for path in COMPILED_SOURCE_PATHS)
+    if _default_tables_memo is not None and _default_tables_memo[0] == signature:
+        return _default_tables_memo[1]
+    tables = _load_compiled_decision_tables()
+    if tables is None:
+        tables = load_decision_tables(DEFAULT_DECISION_TABLES_PATH)
+    _default_tables_memo = (signature, tables)
+    return tables
+
+
+def _load_compiled_decision_tables() -> dict[str, Any] | None:
+    try:
+        from . import decision_tables_compiled
+    except ImportError:
+        return None
+    try:
+        source_hash = decision_tables_source_hash()
+    except OSError:
+        return None
+    if getattr(decision_tables_compiled, "SOURCE_HASH", None) != source_hash:
+        return None
+    return _map_source_paths(
+        decision_tables_compiled.TABLES,
+        lambda value: str(RUNTIME_PACKAGE_DIR / value),
+    )
+
+
+def _map_source_paths(value: Any, rewrite: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: (
+                rewrite(item)
+                if key in COMPILED_SOURCE_PATH_KEYS and isinstance(item, str)
+                else _map_source_paths(item, rewrite)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_map_source_paths(item, rewrite) for item in value]
+    return deepcopy(value)
+
+
 def load_default_decision_tables_schema() -> dict[str, Any]:
     """Load the repository-default decision table schema asset."""
 
@@ -570,7 +570,7 @@ def _record_develop_quality_replay(
     )
     run_state = run_state or context.current_run
     session_dir = writer.append_event(run_state.run_id, event)
-    writer.render_documents(
+    writer.render_timeline(
         run_state.run_id,
         run_state=run_state,
         route=RouteDecision(
@@ -583,7 +583,6 @@ def _record_develop_quality_replay(
             should_create_plan=False,
         ),
         plan_artifact=context.current_plan,
-        events=writer.load_events(run_state.run_id),
     )
     return str(session_dir.relative_to(config.workspace_root))
 
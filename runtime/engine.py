@@ -9,14 +9,11 @@ import re
 from typing import Any, Mapping, Optional
 from uuid import uuid4
 
-from .checkpoint_materializer import materialize_checkpoint_request
 from .checkpoint_request import checkpoint_request_from_clarification_state, checkpoint_request_from_decision_state
 from .clarification import build_clarification_state, has_submitted_clarification, merge_clarification_request, parse_clarification_response, stale_clarification
-from .compare_decision import build_compare_decision_contract
 from .config import load_runtime_config
 from .context_snapshot import ContextResolvedSnapshot, resolve_context_snapshot
 from .context_recovery import recover_context
-from .daily_summary import build_daily_summary
 from .decision import (
     ACTIVE_PLAN_ATTACH_OPTION_ID,
     ACTIVE_PLAN_BINDING_DECISION_TYPE,
@@ -31,10 +28,8 @@ from .decision import (
     response_from_submission,
     stale_decision,
 )
-from .develop_checkpoint import develop_resume_after, is_develop_checkpoint_state
 from .execution_confirm import parse_execution_confirm_response
 from .execution_gate import evaluate_execution_gate
-from .finalize import finalize_plan
 from .handoff import build_runtime_handoff
 from .kb import bootstrap_kb, ensure_blueprint_index, ensure_blueprint_scaffold
 from .models import ClarificationState, DecisionState, ExecutionGate, KbArtifact, PlanArtifact, PlanProposalState, RecoveredContext, ReplayEvent, RouteDecision, RunState, RuntimeConfig, RuntimeHandoff, RuntimeResult, SkillActivation, SkillMeta
@@ -57,13 +52,11 @@ from .plan_proposal import (
     merge_plan_proposal_request,
     refresh_plan_proposal_state,
 )
-from .replay import ReplayWriter, build_compare_replay_event, build_decision_replay_event
 from .router import (
     Router,
     detect_explain_only_consult_override,
 )
 from .skill_registry import SkillRegistry
-from .skill_runner import SkillExecutionError, run_runtime_skill
 from .state import (
     StateStore,
     iso_now,
@@ -74,7 +67,9 @@ from .state import (
     stable_request_sha1,
     summarize_request_text,
 )
+from .state_backend import close_state_backends
 from .state_invariants import stamp_handoff_resolution_id
+from .tracing import begin_span, current_timings, end_span, span, trace_session
 
 _CURRENT_PLAN_ANCHOR_PATTERNS = (
     re.compile(r"(当前|这个|该)\s*(plan|方案)", re.IGNORECASE),
@@ -608,6 +603,7 @@ def run_runtime(
     session_id: str | None = None,
     user_home: Path | None = None,
     runtime_payloads: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    config: RuntimeConfig | None = None,
 ) -> RuntimeResult:
     """Run the Sopify runtime pipeline for a single input.
 
@@ -617,25 +613,65 @@ def run_runtime(
         global_config_path: Optional global config override.
         user_home: Optional home override for tests.
         runtime_payloads: Optional runtime-skill payload map keyed by skill id.
+        config: Optional config already loaded by the caller for this turn.
 
     Returns:
-        Standardized runtime result.
+        Standardized runtime result. `timings` is populated only when stage
+        tracing is enabled (see `runtime.tracing`).
     """
-    config = load_runtime_config(workspace_root, global_config_path=global_config_path)
+    try:
+        with trace_session():
+            result = _run_runtime(
+                user_input,
+                workspace_root=workspace_root,
+                global_config_path=global_config_path,
+                session_id=session_id,
+                user_home=user_home,
+                runtime_payloads=runtime_payloads,
+                config=config,
+            )
+            timings = current_timings()
+    finally:
+        close_state_backends()
+    if timings:
+        result = replace(result, timings=timings)
+    return result
+
+
+def _run_runtime(
+    user_input: str,
+    *,
+    workspace_root: str | Path,
+    global_config_path: str | Path | None,
+    session_id: str | None,
+    user_home: Path | None,
+    runtime_payloads: Optional[Mapping[str, Mapping[str, Any]]],
+    config: RuntimeConfig | None,
+) -> RuntimeResult:
+    if config is None:
+        with span("config_load"):
+            config = load_runtime_config(workspace_root, global_config_path=global_config_path)
+    elif config.workspace_root != Path(workspace_root).resolve():
+        raise ValueError(f"Injected runtime config belongs to another workspace: {config.workspace_root}")
     review_store = StateStore(config, session_id=session_id)
     global_store = StateStore(config)
     review_store.ensure()
     global_store.ensure()
-    kb_artifact: KbArtifact | None = bootstrap_kb(config)
+    with span("kb_bootstrap"):
+        kb_artifact: KbArtifact | None = bootstrap_kb(config)
 
-    skills = SkillRegistry(config, user_home=user_home).discover()
+    with span("skill_discovery"):
+        skills = SkillRegistry(config, user_home=user_home).discover()
     router = Router(config, state_store=review_store, global_state_store=global_store)
-    snapshot = resolve_context_snapshot(
-        config=config,
-        review_store=review_store,
-        global_store=global_store,
-    )
-    classified_route = router.classify(user_input, skills=skills, snapshot=snapshot)
+    with span("snapshot_resolve"):
+        snapshot = resolve_context_snapshot(
+            config=config,
+            review_store=review_store,
+            global_store=global_store,
+        )
+    with span("route_classify"):
+        classified_route = router.classify(user_input, skills=skills, snapshot=snapshot)
+    handler_span = begin_span("handler")
     recovered = recover_context(
         classified_route,
         config=config,
@@ -711,6 +747,8 @@ def run_runtime(
         )
         notes.extend(cancel_notes)
     elif effective_route.route_name == "finalize_active":
+        from .finalize import finalize_plan
+
         finalized = finalize_plan(
             config=config,
             state_store=global_store,
@@ -957,6 +995,8 @@ def run_runtime(
         elif not payload:
             notes.append(f"Runtime payload missing for skill: {effective_route.runtime_skill_id}")
         else:
+            from .skill_runner import SkillExecutionError, run_runtime_skill
+
             try:
                 skill_result = run_runtime_skill(skill, payload=payload)
             except SkillExecutionError as exc:
@@ -970,6 +1010,8 @@ def run_runtime(
     )
 
     if effective_route.route_name == "summary" and activation is not None:
+        from .daily_summary import build_daily_summary
+
         # Keep `~summary` read-only so users can inspect the day without disturbing an active handoff.
         summary_result = build_daily_summary(
             config=config,
@@ -984,6 +1026,8 @@ def run_runtime(
         notes.extend(summary_result.notes)
 
     if effective_route.capture_mode != "off":
+        from .replay import ReplayWriter, build_compare_replay_event, build_decision_replay_event
+
         writer = ReplayWriter(config)
         run_state = resolved_result_context.current_run
         run_id = run_state.run_id if run_state is not None else _make_run_id(effective_route.request_text)
@@ -1017,6 +1061,8 @@ def run_runtime(
                 )
             )
         if effective_route.route_name == "compare" and skill_result:
+            from .compare_decision import build_compare_decision_contract
+
             compare_contract = build_compare_decision_contract(
                 question=effective_route.request_text,
                 skill_result=skill_result,
@@ -1042,7 +1088,9 @@ def run_runtime(
             events=replay_events,
         )
         replay_session_dir = str(session_dir.relative_to(config.workspace_root))
+    end_span(handler_span)
 
+    handoff_span = begin_span("handoff_build")
     if effective_route.route_name == "cancel_active":
         handoff = None
     elif effective_route.route_name == "summary":
@@ -1139,6 +1187,7 @@ def run_runtime(
         state_store=result_store,
         global_state_store=global_store,
     )
+    end_span(handoff_span)
     return RuntimeResult(
         route=effective_route,
         recovered_context=latest_context,
@@ -1455,6 +1504,9 @@ def _handle_clarification_resume(
             return (_clarification_pending_route(decision, reason="Clarification still requires factual details"), None, notes, kb_artifact)
 
         resumed_request = merge_clarification_request(current_clarification, response.text)
+
+    from .develop_checkpoint import is_develop_checkpoint_state
+
     if is_develop_checkpoint_state(current_clarification):
         return _resume_from_develop_clarification(
             state_store=state_store,
@@ -1579,6 +1631,8 @@ def _handle_decision_resume(
         notes.append("Decision checkpoint has not reached a confirmed state yet")
         return (_decision_pending_route(decision, reason="Decision checkpoint is still pending"), None, notes, kb_artifact, None)
 
+    from .develop_checkpoint import is_develop_checkpoint_state
+
     if is_develop_checkpoint_state(current_decision):
         return _resume_from_develop_decision(
             state_store=state_store,
@@ -1641,6 +1695,8 @@ def _resume_from_develop_clarification(
         notes.append("Develop clarification could not resume because the active run context is missing")
         return (_clarification_pending_route(RouteDecision(route_name="clarification_resume", request_text=resumed_request, reason="missing develop context"), reason="Develop clarification still requires an active plan context"), None, notes, kb_artifact)
 
+    from .develop_checkpoint import develop_resume_after
+
     resume_after = develop_resume_after(current_clarification.resume_context)
     state_store.clear_current_clarification()
     if resume_after == "review_or_execute_plan":
@@ -1857,6 +1913,8 @@ def _resume_from_develop_decision(
         notes.append("Develop decision could not resume because the active run context is missing")
         return (_decision_pending_route(RouteDecision(route_name="decision_resume", request_text=current_decision.request_text, reason="missing develop context"), reason="Develop decision still requires an active plan context"), None, notes, kb_artifact, None)
 
+    from .develop_checkpoint import develop_resume_after
+
     resume_after = develop_resume_after(current_decision.resume_context)
     _consume_current_decision(state_store, current_decision)
     if resume_after == "review_or_execute_plan":
@@ -2906,6 +2964,8 @@ def _build_route_native_clarification_state(
         config=config,
         source_route=decision.route_name,
     )
+    from .checkpoint_materializer import materialize_checkpoint_request
+
     materialized = materialize_checkpoint_request(request.to_dict(), config=config)
     return materialized.clarification_state
 
@@ -2923,6 +2983,8 @@ def _build_route_native_decision_state(
         decision_state,
         source_route=decision.route_name,
     )
+    from .checkpoint_materializer import materialize_checkpoint_request
+
     materialized = materialize_checkpoint_request(request.to_dict(), config=config)
     return materialized.decision_state
 
@@ -4,14 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-import re
 from typing import Any, Mapping
 
-from ._yaml import YamlParseError, load_yaml
+from ._yaml import load_front_matter
 from .knowledge_sync import parse_knowledge_sync
 from .models import ClarificationState, DecisionState, ExecutionGate, PlanArtifact, RouteDecision, RuntimeConfig
 
-_FRONT_MATTER_RE = re.compile(r"\A---\n(?P<front>.*?)\n---\n(?P<body>.*)\Z", re.DOTALL)
 _REQUIRED_METADATA_KEYS = (
     "plan_id",
     "feature_key",
@@ -151,16 +149,10 @@ def _load_managed_plan(*, plan_artifact: PlanArtifact, config: RuntimeConfig) ->
         return None
 
     raw_text = metadata_path.read_text(encoding="utf-8")
-    match = _FRONT_MATTER_RE.match(raw_text)
-    if match is None:
-        return None
-
-    try:
-        metadata = load_yaml(match.group("front"))
-    except YamlParseError:
-        return None
-    if not isinstance(metadata, Mapping):
+    plan_document = load_front_matter(raw_text)
+    if plan_document is None:
         return None
+    metadata, body = plan_document
     knowledge_sync = parse_knowledge_sync(metadata.get("knowledge_sync"))
     if knowledge_sync is None:
         return None
@@ -178,7 +170,7 @@ def _load_managed_plan(*, plan_artifact: PlanArtifact, config: RuntimeConfig) ->
         metadata_path=metadata_path,
         metadata=metadata,
         knowledge_sync=knowledge_sync,
-        body=match.group("body"),
+        body=body,
         documents=documents,
     )
 
@@ -13,6 +13,7 @@ from ._yaml import YamlParseError, load_yaml
 from .decision_tables import (
     DEFAULT_DECISION_TABLES_PATH,
     DecisionTableError,
+    default_decision_tables_view,
     load_decision_tables,
     load_default_decision_tables,
 )
@@ -47,9 +48,19 @@ def load_default_failure_recovery_table(
     *,
     schema_path: str | Path | None = None,
     decision_tables_path: str | Path | None = None,
+    compiled: bool = True,
 ) -> dict[str, Any]:
-    """Load the repository-default failure recovery table asset."""
+    """Load the repository-default failure recovery table asset.
 
+    Without path overrides the embedded table comes from the pre-validated
+    decision table artifact; pass `compiled=False` to re-validate the sources.
+    """
+
+    if compiled and schema_path is None and decision_tables_path is None:
+        try:
+            return deepcopy(default_decision_tables_view()["failure_recovery_table"])
+        except DecisionTableError as exc:
+            raise FailureRecoveryError(f"Failed to load embedded failure recovery asset: {exc}") from exc
     default_path = decision_tables_path or DEFAULT_FAILURE_RECOVERY_TABLE_PATH
     return load_failure_recovery_table(
         default_path,
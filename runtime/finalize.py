@@ -4,16 +4,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-import re
 import shutil
 from pathlib import Path
 from typing import Mapping
 
-from ._yaml import YamlParseError, load_yaml
+from ._yaml import load_yaml_mapping, split_front_matter
 from .kb import ensure_blueprint_index
 from .knowledge_layout import resolve_path
 from .knowledge_sync import KNOWLEDGE_SYNC_KEYS, knowledge_sync_targets, parse_knowledge_sync
 from .models import KbArtifact, PlanArtifact, RuntimeConfig
+from .plan_catalog import refresh_plan_catalog_entry
 from .plan_registry import PlanRegistryError, remove_plan_entry
 from .state import StateStore, iso_now
 
@@ -27,7 +27,6 @@ _REQUIRED_METADATA_KEYS = (
 )
 _SUPPORTED_LEVELS = {"light", "standard", "full"}
 _SUPPORTED_LIFECYCLE_STATES = {"active", "ready_for_verify"}
-_FRONT_MATTER_RE = re.compile(r"\A---\n(?P<front>.*?)\n---\n(?P<body>.*)\Z", re.DOTALL)
 @dataclass(frozen=True)
 class ManagedPlanDocument:
     """Normalized metadata view for a runtime-managed plan document."""
@@ -141,6 +140,7 @@ def finalize_plan(
 
     archive_dir.parent.mkdir(parents=True, exist_ok=True)
     shutil.move(str(plan_dir), str(archive_dir))
+    refresh_plan_catalog_entry(config, plan_dir)
 
     archived_metadata_path = archive_dir / managed_plan.metadata_path.name
     archived_text = _render_document(
@@ -205,17 +205,12 @@ def _load_managed_plan(plan_dir: Path, *, config: RuntimeConfig) -> ManagedPlanD
         return None
 
     raw_text = metadata_path.read_text(encoding="utf-8")
-    match = _FRONT_MATTER_RE.match(raw_text)
-    if match is None:
+    parts = split_front_matter(raw_text)
+    if parts is None:
         return None
-
-    front_matter = match.group("front")
-    body = match.group("body")
-    try:
-        metadata = load_yaml(front_matter)
-    except YamlParseError:
-        return None
-    if not isinstance(metadata, Mapping):
+    front_matter, body = parts
+    metadata = load_yaml_mapping(front_matter)
+    if metadata is None:
         return None
     if any(key not in metadata for key in _REQUIRED_METADATA_KEYS):
         return None
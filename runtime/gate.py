@@ -11,16 +11,18 @@ from uuid import uuid4
 from .config import ConfigError, load_runtime_config
 from .engine import run_runtime
 from .entry_guard import ENTRY_GUARD_PENDING_ACTIONS
+from .gate_contract import ERROR_VISIBLE_RETRY, GATE_SCHEMA_VERSION, base_gate_contract
+from .locking import REPLAY_LOCK, lock_metrics_snapshot, reset_lock_metrics, workspace_lock
 from .preferences import PreferencesPreloadResult, preload_preferences
 from .state import StateStore, cleanup_expired_session_state, iso_now, normalize_session_id, stable_request_sha1, summarize_request_text
+from .state_backend import close_state_backends
+from .tracing import active_recorder, span, trace_session
 from .workspace_preflight import WorkspacePreflightError, preflight_workspace_runtime
 
-GATE_SCHEMA_VERSION = "1"
 CURRENT_GATE_RECEIPT_FILENAME = "current_gate_receipt.json"
 CHECKPOINT_ONLY_ACTIONS = frozenset(ENTRY_GUARD_PENDING_ACTIONS)
 NORMAL_RUNTIME_FOLLOWUP = "normal_runtime_followup"
 CHECKPOINT_ONLY = "checkpoint_only"
-ERROR_VISIBLE_RETRY = "error_visible_retry"
 _RUNTIME_ONLY_STATE_CONFLICT_SOURCE_KIND = "current_request_runtime_only_state_conflict"
 _PREFLIGHT_BLOCKING_REASON_CODES = frozenset(
     {
@@ -53,28 +55,67 @@ def enter_runtime_gate(
 ) -> dict[str, Any]:
     """Run the prompt-level gate and return the compact host-facing contract."""
 
-    workspace = Path(workspace_root).resolve()
-    contract = _base_contract(workspace)
-    config = None
-    request = str(raw_request or "").strip()
-
     try:
-        if not request:
-            raise ValueError("Runtime gate request cannot be empty")
-
-        contract["preflight"] = dict(
-            preflight_workspace_runtime(
-                workspace,
-                request_text=request,
+        with trace_session():
+            return _enter_runtime_gate(
+                raw_request,
+                workspace_root=workspace_root,
+                global_config_path=global_config_path,
                 payload_manifest_path=payload_manifest_path,
                 activation_root=activation_root,
                 interaction_mode=interaction_mode,
                 payload_root=payload_root,
                 host_id=host_id,
                 requested_root=requested_root,
+                session_id=session_id,
                 user_home=user_home,
+                write_receipt=write_receipt,
+            )
+    finally:
+        close_state_backends()
+
+
+def _enter_runtime_gate(
+    raw_request: str,
+    *,
+    workspace_root: str | Path,
+    global_config_path: str | Path | None,
+    payload_manifest_path: str | Path | None,
+    activation_root: str | Path | None,
+    interaction_mode: str | None,
+    payload_root: str | Path | None,
+    host_id: str | None,
+    requested_root: str | Path | None,
+    session_id: str | None,
+    user_home: Path | None,
+    write_receipt: bool,
+) -> dict[str, Any]:
+    workspace = Path(workspace_root).resolve()
+    contract = base_gate_contract(workspace)
+    # Lock counters are per process; scope them to this turn so a warm daemon
+    # reports contention for the current request only.
+    reset_lock_metrics()
+    config = None
+    request = str(raw_request or "").strip()
+
+    try:
+        if not request:
+            raise ValueError("Runtime gate request cannot be empty")
+
+        with span("preflight"):
+            contract["preflight"] = dict(
+                preflight_workspace_runtime(
+                    workspace,
+                    request_text=request,
+                    payload_manifest_path=payload_manifest_path,
+                    activation_root=activation_root,
+                    interaction_mode=interaction_mode,
+                    payload_root=payload_root,
+                    host_id=host_id,
+                    requested_root=requested_root,
+                    user_home=user_home,
+                )
             )
-        )
         if _preflight_blocks_runtime(contract["preflight"]):
             preflight_mode = _preflight_allowed_response_mode(contract["preflight"])
             resolved_session_id = _resolve_session_id(session_id)
@@ -122,13 +163,15 @@ def enter_runtime_gate(
                 config=None,
                 write_receipt=write_receipt,
             )
-        config = load_runtime_config(workspace, global_config_path=global_config_path)
+        with span("config_load"):
+            config = load_runtime_config(workspace, global_config_path=global_config_path)
         resolved_session_id = _resolve_session_id(session_id)
         contract["session_id"] = resolved_session_id
         contract["preferences"] = _normalize_preferences(preload_preferences(config))
         cleaned_session_dirs = cleanup_expired_session_state(config)
         if cleaned_session_dirs:
             pass
+        housekeeping_notes = _apply_replay_retention(config)
 
         runtime_result = run_runtime(
             request,
@@ -136,6 +179,7 @@ def enter_runtime_gate(
             global_config_path=global_config_path,
             session_id=resolved_session_id,
             user_home=user_home,
+            config=config,
         )
         contract["runtime"] = {
             "route_name": runtime_result.route.route_name,
@@ -191,6 +235,7 @@ def enter_runtime_gate(
             ingress_mode="runtime_gate_enter",
             session_id=resolved_session_id,
             cleaned_session_dirs=cleaned_session_dirs,
+            housekeeping_notes=housekeeping_notes,
         )
         contract["state"] = _build_state_contract(store=store)
         contract.update(
@@ -233,35 +278,6 @@ def enter_runtime_gate(
     )
 
 
-def _base_contract(workspace_root: Path) -> dict[str, Any]:
-    return {
-        "schema_version": GATE_SCHEMA_VERSION,
-        "status": "error",
-        "gate_passed": False,
-        "workspace_root": str(workspace_root),
-        "session_id": None,
-        "preflight": {},
-        "preferences": {
-            "status": "missing",
-            "injected": False,
-        },
-        "runtime": {},
-        "handoff": {},
-        "state": {},
-        "trigger_evidence": {},
-        "observability": {},
-        "allowed_response_mode": ERROR_VISIBLE_RETRY,
-        "evidence": {
-            "manifest_found": False,
-            "handoff_found": False,
-            "strict_runtime_entry": False,
-            "handoff_source_kind": "missing",
-            "current_request_produced_handoff": False,
-            "persisted_handoff_matches_current_request": False,
-        },
-    }
-
-
 def _preflight_allowed_response_mode(preflight: Mapping[str, Any]) -> str:
     reason_code = str(preflight.get("reason_code") or "").strip()
     # Root selection is a recoverable pre-runtime checkpoint. Hosts should stop
@@ -460,6 +476,19 @@ def _is_runtime_only_state_conflict_handoff(handoff: Any) -> bool:
     )
 
 
+def _apply_replay_retention(config: Any) -> tuple[str, ...]:
+    # Housekeeping must never fail the turn: skip the pass when a replay
+    # writer holds the lock or the disk refuses, and retry on a later turn.
+    from .replay_retention import maybe_apply_replay_retention
+
+    try:
+        with workspace_lock(config, REPLAY_LOCK, timeout=0):
+            maybe_apply_replay_retention(config)
+    except OSError as exc:
+        return (f"Replay retention skipped: {exc}",)
+    return ()
+
+
 def _build_gate_observability(
     *,
     request: str,
@@ -470,6 +499,7 @@ def _build_gate_observability(
     ingress_mode: str,
     session_id: str,
     cleaned_session_dirs: tuple[str, ...],
+    housekeeping_notes: tuple[str, ...] = (),
 ) -> dict[str, Any]:
     payload: dict[str, Any] = {
         "receipt_kind": "runtime_gate",
@@ -483,6 +513,11 @@ def _build_gate_observability(
     }
     if cleaned_session_dirs:
         payload["cleaned_session_dirs"] = list(cleaned_session_dirs)
+    if housekeeping_notes:
+        payload["housekeeping_notes"] = list(housekeeping_notes)
+    lock_metrics = lock_metrics_snapshot()
+    if lock_metrics:
+        payload["locks"] = lock_metrics
     if current_run is not None:
         payload["current_run"] = {
             "run_id": getattr(current_run, "run_id", ""),
@@ -716,12 +751,20 @@ def _finalize_gate_contract(
         request_sha1=stable_request_sha1(request),
         runtime_route_name=runtime_route_name,
     )
+    recorder = active_recorder()
+    if recorder is not None:
+        # The receipt carries every span up to its own write; the write span
+        # itself is only visible in the returned contract and the trace dump.
+        observability["timings"] = list(recorder.timings())
     if write_receipt:
         contract["receipt_path"] = str(receipt_path)
         try:
-            write_gate_receipt(receipt_path, contract)
+            with span("receipt_write"):
+                write_gate_receipt(receipt_path, contract)
         except OSError as exc:
             contract["receipt_write_error"] = str(exc)
+        if recorder is not None:
+            observability["timings"] = list(recorder.timings())
     return contract
 
 
@@ -0,0 +1,50 @@
+"""Baseline shape of the runtime gate contract.
+
+Kept free of other runtime imports so the thin `scripts/runtime_gate.py`
+client can build a complete error contract without loading the gate.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+GATE_SCHEMA_VERSION = "1"
+ERROR_VISIBLE_RETRY = "error_visible_retry"
+
+
+def base_gate_contract(workspace_root: str | Path) -> dict[str, Any]:
+    """Return the fail-closed contract every gate result starts from."""
+    return {
+        "schema_version": GATE_SCHEMA_VERSION,
+        "status": "error",
+        "gate_passed": False,
+        "workspace_root": str(workspace_root),
+        "session_id": None,
+        "preflight": {},
+        "preferences": {
+            "status": "missing",
+            "injected": False,
+        },
+        "runtime": {},
+        "handoff": {},
+        "state": {},
+        "trigger_evidence": {},
+        "observability": {},
+        "allowed_response_mode": ERROR_VISIBLE_RETRY,
+        "evidence": {
+            "manifest_found": False,
+            "handoff_found": False,
+            "strict_runtime_entry": False,
+            "handoff_source_kind": "missing",
+            "current_request_produced_handoff": False,
+            "persisted_handoff_matches_current_request": False,
+        },
+    }
+
+
+__all__ = [
+    "ERROR_VISIBLE_RETRY",
+    "GATE_SCHEMA_VERSION",
+    "base_gate_contract",
+]
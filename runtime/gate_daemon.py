@@ -0,0 +1,301 @@
+"""Warm-process daemon for the prompt-level runtime gate.
+
+The daemon keeps `enter_runtime_gate` and every runtime module it pulls in
+resident, so host turns only pay for the actual routing work instead of a cold
+interpreter start plus a full package import. It speaks a JSON-lines protocol
+(one request object per line, one response object per line) over either a
+Unix socket or stdin/stdout.
+
+Requests are served strictly one at a time. The daemon never tries to be
+smarter than the in-process gate: whenever it cannot guarantee the same
+result (protocol skew, diverging `SOPIFY_*` environment, runtime sources
+changed on disk), it answers with `status=fallback` before touching the
+workspace and the thin client in `scripts/runtime_gate.py` runs the gate
+in-process instead. Once a turn has started it may already have written state,
+so a failure is answered with `status=error` and surfaced, never re-executed.
+
+The socket is created owner-only (0600) and an existing path is replaced only
+when it is a stale socket that no longer answers `ping`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import socket
+import socketserver
+import stat
+import sys
+from typing import Any, Callable, Iterable, Mapping, TextIO
+
+DAEMON_PROTOCOL_VERSION = "1"
+DAEMON_SOCKET_ENV = "SOPIFY_GATE_DAEMON_SOCKET"
+DAEMON_FORWARDED_ENV_PREFIX = "SOPIFY_"
+DAEMON_STATUS_OK = "ok"
+DAEMON_STATUS_FALLBACK = "fallback"
+DAEMON_STATUS_ERROR = "error"
+_ENTER_ARGUMENTS = frozenset(
+    {
+        "workspace_root",
+        "global_config_path",
+        "payload_manifest_path",
+        "activation_root",
+        "interaction_mode",
+        "payload_root",
+        "host_id",
+        "requested_root",
+        "session_id",
+        "write_receipt",
+    }
+)
+# The daemon's own socket location is transport detail, not gate input.
+_IGNORED_FORWARDED_ENV = frozenset({DAEMON_SOCKET_ENV})
+_STALE_SOCKET_PROBE_TIMEOUT_SECONDS = 0.5
+_RUNTIME_PACKAGE_ROOT = Path(__file__).resolve().parent
+
+
+def runtime_source_stamp(package_root: Path = _RUNTIME_PACKAGE_ROOT) -> tuple[tuple[str, int, int], ...]:
+    """Return a cheap stat signature of the runtime sources served by this process."""
+
+    entries: list[tuple[str, int, int]] = []
+    for directory in (package_root, package_root / "_models", package_root / "contracts"):
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    if not entry.is_file() or entry.name.endswith(".pyc"):
+                        continue
+                    stat = entry.stat()
+                    entries.append((f"{directory.name}/{entry.name}", stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            continue
+    return tuple(sorted(entries))
+
+
+def forwarded_environment(environ: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Collect the `SOPIFY_*` variables that influence gate behavior."""
+
+    source = os.environ if environ is None else environ
+    return {
+        key: value
+        for key, value in source.items()
+        if key.startswith(DAEMON_FORWARDED_ENV_PREFIX) and key not in _IGNORED_FORWARDED_ENV
+    }
+
+
+class GateDaemon:
+    """Serve runtime-gate requests from a single warm interpreter."""
+
+    def __init__(
+        self,
+        *,
+        enter_gate: Callable[..., dict[str, Any]] | None = None,
+        environ: Mapping[str, str] | None = None,
+    ) -> None:
+        if enter_gate is None:
+            from .gate import enter_runtime_gate
+
+            enter_gate = enter_runtime_gate
+        self._enter_gate = enter_gate
+        self._environment = forwarded_environment(environ)
+        self._source_stamp = runtime_source_stamp()
+        self.served_requests = 0
+        self.shutdown_requested = False
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        """Handle one decoded protocol request and return the response object."""
+
+        if not isinstance(request, Mapping):
+            return _error_response("Daemon request must be a JSON object")
+        if str(request.get("protocol_version") or "") != DAEMON_PROTOCOL_VERSION:
+            return _fallback_response("protocol_version_mismatch")
+
+        command = str(request.get("command") or "").strip()
+        if command == "ping":
+            return {
+                "protocol_version": DAEMON_PROTOCOL_VERSION,
+                "status": DAEMON_STATUS_OK,
+                "pid": os.getpid(),
+                "served_requests": self.served_requests,
+            }
+        if command == "shutdown":
+            self.shutdown_requested = True
+            return {"protocol_version": DAEMON_PROTOCOL_VERSION, "status": DAEMON_STATUS_OK}
+        if command != "enter":
+            return _error_response(f"Unsupported daemon command: {command or '<empty>'}")
+
+        if runtime_source_stamp() != self._source_stamp:
+            # Stale code must never answer a turn; let the client run the fresh
+            # sources in-process and stop serving.
+            self.shutdown_requested = True
+            return _fallback_response("runtime_sources_changed")
+        client_environment = request.get("env")
+        if not isinstance(client_environment, Mapping) or dict(client_environment) != self._environment:
+            return _fallback_response("environment_mismatch")
+
+        raw_request = request.get("request")
+        arguments = request.get("arguments")
+        if not isinstance(raw_request, str) or not isinstance(arguments, Mapping):
+            return _error_response("Daemon enter request requires `request` and `arguments`")
+        unknown = sorted(set(arguments) - _ENTER_ARGUMENTS)
+        if unknown:
+            return _error_response(f"Unsupported enter argument(s): {', '.join(unknown)}")
+        workspace_root = arguments.get("workspace_root")
+        if not isinstance(workspace_root, str) or not Path(workspace_root).is_absolute():
+            return _error_response("Daemon enter request requires an absolute workspace_root")
+
+        self.served_requests += 1
+        try:
+            contract = self._enter_gate(raw_request, **dict(arguments))
+        except Exception as exc:
+            # The turn may already have written state, handoff or replay
+            # events; re-running it in-process would apply it twice.
+            return _error_response(f"Runtime gate failed in daemon: {exc}")
+        return {
+            "protocol_version": DAEMON_PROTOCOL_VERSION,
+            "status": DAEMON_STATUS_OK,
+            "contract": contract,
+        }
+
+    def handle_line(self, line: str) -> dict[str, Any]:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            return _error_response(f"Invalid daemon request JSON: {exc}")
+        try:
+            return self.handle(request)
+        except Exception as exc:  # pragma: no cover - defensive guard for long-lived process
+            # Only reachable before a turn starts (`handle` catches gate
+            # failures), so the client can still run the gate in-process.
+            return _fallback_response(f"daemon_unexpected_error: {exc}")
+
+
+def serve_stdio(daemon: GateDaemon | None = None, *, stdin: TextIO | None = None, stdout: TextIO | None = None) -> int:
+    """Serve JSON-lines requests from stdin until EOF or a shutdown command."""
+
+    daemon = daemon or GateDaemon()
+    reader: Iterable[str] = stdin if stdin is not None else sys.stdin
+    writer = stdout if stdout is not None else sys.stdout
+    for line in reader:
+        if not line.strip():
+            continue
+        _write_response(writer, daemon.handle_line(line))
+        if daemon.shutdown_requested:
+            break
+    return 0
+
+
+def serve_unix_socket(
+    socket_path: str | Path,
+    daemon: GateDaemon | None = None,
+    *,
+    idle_timeout: float | None = None,
+) -> int:
+    """Serve JSON-lines requests on a Unix socket until shutdown or idle timeout."""
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        raise OSError("Unix sockets are not supported on this platform")
+    daemon = daemon or GateDaemon()
+    path = Path(socket_path).expanduser().resolve()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _remove_stale_socket(path)
+
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            for raw_line in self.rfile:
+                line = raw_line.decode("utf-8", errors="replace")
+                if not line.strip():
+                    continue
+                response = daemon.handle_line(line)
+                self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                self.wfile.flush()
+                if daemon.shutdown_requested:
+                    break
+
+    class _Server(socketserver.UnixStreamServer):
+        idle_expired = False
+
+        def handle_timeout(self) -> None:
+            self.idle_expired = True
+
+    # Any local user who can connect could drive gate turns against arbitrary
+    # workspaces, so the socket never exists with broader permissions.
+    previous_umask = os.umask(0o177)
+    try:
+        server_context = _Server(str(path), _Handler)
+    finally:
+        os.umask(previous_umask)
+    with server_context as server:
+        os.chmod(path, 0o600)
+        server.timeout = idle_timeout
+        try:
+            while not daemon.shutdown_requested and not server.idle_expired:
+                server.handle_request()
+        finally:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    return 0
+
+
+def _remove_stale_socket(path: Path) -> None:
+    try:
+        mode = path.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"Refusing to replace non-socket path: {path}")
+    if _socket_answers_ping(path):
+        raise OSError(f"A gate daemon is already serving {path}")
+    path.unlink()
+
+
+def _socket_answers_ping(path: Path) -> bool:
+    message = {"protocol_version": DAEMON_PROTOCOL_VERSION, "command": "ping"}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_STALE_SOCKET_PROBE_TIMEOUT_SECONDS)
+            client.connect(str(path))
+            client.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            with client.makefile("r", encoding="utf-8") as reader:
+                line = reader.readline()
+    except OSError:
+        return False
+    return bool(line.strip())
+
+
+def _write_response(writer: TextIO, response: Mapping[str, Any]) -> None:
+    writer.write(json.dumps(dict(response), ensure_ascii=False) + "\n")
+    writer.flush()
+
+
+def _fallback_response(reason: str) -> dict[str, Any]:
+    return {
+        "protocol_version": DAEMON_PROTOCOL_VERSION,
+        "status": DAEMON_STATUS_FALLBACK,
+        "reason": reason,
+    }
+
+
+def _error_response(message: str) -> dict[str, Any]:
+    return {
+        "protocol_version": DAEMON_PROTOCOL_VERSION,
+        "status": DAEMON_STATUS_ERROR,
+        "message": message,
+    }
+
+
+__all__ = [
+    "DAEMON_FORWARDED_ENV_PREFIX",
+    "DAEMON_PROTOCOL_VERSION",
+    "DAEMON_SOCKET_ENV",
+    "DAEMON_STATUS_ERROR",
+    "DAEMON_STATUS_FALLBACK",
+    "DAEMON_STATUS_OK",
+    "GateDaemon",
+    "forwarded_environment",
+    "runtime_source_stamp",
+    "serve_stdio",
+    "serve_unix_socket",
+]
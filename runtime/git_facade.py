@@ -0,0 +1,291 @@
+"""Batched, streaming git queries for one workspace.
+
+`~summary` used to fork git once for the work-tree check, once each for
+status and the day log, and twice per changed Python file for its diff.
+`GitFacade` answers the same questions with at most four processes per
+summary, independent of the number of changed files:
+
+- `status()`: `git status --porcelain=v2 --branch -z` gives the work-tree
+  check, HEAD and every change with its HEAD/index blob ids;
+- `day_log()`: one `git log -z --name-only` for the day window;
+- `diff_texts()`: one staged and one unstaged `git diff --unified=0` over all
+  requested paths, split back per file.
+
+Output is parsed while the process is still writing it. A missing git binary
+or a failing command degrades to "no facts", as the per-call helpers did.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import subprocess
+from typing import Iterator, Mapping, Sequence
+
+_READ_CHUNK_BYTES = 64 * 1024
+_COMMIT_MARKER = "__COMMIT__\t"
+_DIFF_HEADER_PREFIX = "diff --git "
+# Paths git would quote in a diff header even with `core.quotePath=false`.
+_QUOTED_PATH_CHARS = frozenset('"\\\t\n')
+
+
+@dataclass(frozen=True)
+class GitStatusEntry:
+    change_type: str
+    # HEAD and index blob ids; empty for untracked paths, which have no diff.
+    diff_key: str = ""
+
+
+@dataclass(frozen=True)
+class GitStatus:
+    head: str
+    entries: Mapping[str, GitStatusEntry]
+
+
+@dataclass(frozen=True)
+class GitLogCommit:
+    sha: str
+    title: str
+    authored_at: str
+    files: tuple[str, ...] = ()
+
+
+class GitFacade:
+    """Git queries against one work tree, each parsed from a single process."""
+
+    def __init__(self, workspace_root: Path) -> None:
+        self.workspace_root = workspace_root
+        self._env = git_command_env(workspace_root)
+
+    def status(self) -> GitStatus | None:
+        """Return HEAD and the changed paths, or None outside a git work tree."""
+        head = ""
+        entries: dict[str, GitStatusEntry] = {}
+        records = self._records("status", "--porcelain=v2", "--branch", "--untracked-files=all", "-z", separator=b"\0")
+        if records is None:
+            return None
+        try:
+            for record in records:
+                if record.startswith("# branch.oid "):
+                    oid = record[len("# branch.oid "):].strip()
+                    head = "" if oid == "(initial)" else oid
+                elif record.startswith("? "):
+                    entries[record[2:]] = GitStatusEntry(change_type=normalize_change_type("??"))
+                elif record.startswith("1 "):
+                    fields = record.split(" ", 8)
+                    if len(fields) == 9:
+                        entries[fields[8]] = _tracked_entry(fields[1], fields[6:8])
+                elif record.startswith("2 "):
+                    fields = record.split(" ", 9)
+                    if len(fields) == 10:
+                        entries[fields[9]] = _tracked_entry(fields[1], fields[6:8])
+                        # `-z` emits the rename source as its own record.
+                        next(records, None)
+                elif record.startswith("u "):
+                    fields = record.split(" ", 10)
+                    if len(fields) == 11:
+                        entries[fields[10]] = _tracked_entry(fields[1], fields[7:10])
+        except _GitCommandFailed:
+            return None
+        return GitStatus(head=head, entries=entries)
+
+    def day_log(self, *, since_iso: str, until_iso: str) -> list[GitLogCommit]:
+        """Commits authored in the window, newest first, with their file names."""
+        records = self._records(
+            "log",
+            f"--since={since_iso}",
+            f"--until={until_iso}",
+            "--date=iso-strict",
+            f"--pretty=format:{_COMMIT_MARKER}%H%x09%s%x09%ad",
+            "--name-only",
+            "-z",
+            separator=b"\0",
+        )
+        if records is None:
+            return []
+        commits: list[GitLogCommit] = []
+        header: tuple[str, str, str] | None = None
+        files: list[str] = []
+        in_files = False
+        try:
+            for record in records:
+                if in_files and record:
+                    files.append(record)
+                    continue
+                if in_files:
+                    # An empty record closes the file list of a commit.
+                    in_files = False
+                    continue
+                if not record.startswith(_COMMIT_MARKER):
+                    continue
+                if header is not None:
+                    commits.append(GitLogCommit(*header, files=tuple(files)))
+                header_line, _, first_file = record.partition("\n")
+                header = _parse_log_header(header_line[len(_COMMIT_MARKER):])
+                files = [first_file] if first_file else []
+                in_files = bool(first_file)
+        except _GitCommandFailed:
+            return []
+        if header is not None:
+            commits.append(GitLogCommit(*header, files=tuple(files)))
+        return commits
+
+    def diff_texts(self, paths: Sequence[str]) -> dict[str, str]:
+        """Return `staged + "\\n" + unstaged` zero-context diff text per path."""
+        batched = [path for path in dict.fromkeys(paths) if not _QUOTED_PATH_CHARS.intersection(path)]
+        texts: dict[str, str] = {}
+        if batched:
+            staged = self._split_diff(batched, cached=True)
+            unstaged = self._split_diff(batched, cached=False)
+            for path in batched:
+                texts[path] = staged.get(path, "") + "\n" + unstaged.get(path, "")
+        for path in dict.fromkeys(paths):
+            if path not in texts:
+                # Headers of such paths stay quoted; diff them one by one.
+                texts[path] = self.run("diff", "--cached", "--unified=0", "--", path) + "\n" + self.run(
+                    "diff", "--unified=0", "--", path
+                )
+        return texts
+
+    def run(self, *args: str) -> str:
+        """Run one git command and return stdout, or "" when it fails."""
+        records = self._records(*args, separator=None)
+        if records is None:
+            return ""
+        try:
+            return "".join(records)
+        except _GitCommandFailed:
+            return ""
+
+    def _split_diff(self, paths: Sequence[str], *, cached: bool) -> dict[str, str]:
+        headers = {f"{_DIFF_HEADER_PREFIX}a/{path} b/{path}": path for path in paths}
+        args = ["-c", "core.quotePath=false", "diff"]
+        if cached:
+            args.append("--cached")
+        records = self._records(*args, "--no-renames", "--unified=0", "--", *paths, separator=b"\n")
+        if records is None:
+            return {}
+        chunks: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        try:
+            for line in records:
+                if line.startswith(_DIFF_HEADER_PREFIX):
+                    path = headers.get(line)
+                    current = chunks.setdefault(path, []) if path is not None else None
+                if current is not None:
+                    current.append(line)
+        except _GitCommandFailed:
+            return {}
+        return {path: "\n".join(lines) + "\n" for path, lines in chunks.items()}
+
+    def _records(self, *args: str, separator: bytes | None) -> Iterator[str] | None:
+        """Start git and yield its stdout split on `separator` as it arrives."""
+        try:
+            process = subprocess.Popen(
+                ["git", "-C", str(self.workspace_root), *args],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._env,
+            )
+        except FileNotFoundError:
+            return None
+        return _stream_records(process, separator=separator)
+
+
+class _GitCommandFailed(RuntimeError):
+    """Raised at the end of a stream whose git process exited non-zero."""
+
+
+def _stream_records(process: subprocess.Popen[bytes], *, separator: bytes | None) -> Iterator[str]:
+    assert process.stdout is not None
+    pending = b""
+    try:
+        while True:
+            chunk = process.stdout.read(_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            pending += chunk
+            if separator is None:
+                continue
+            *complete, pending = pending.split(separator)
+            for record in complete:
+                yield record.decode("utf-8", errors="replace")
+        if pending:
+            yield pending.decode("utf-8", errors="replace")
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise _GitCommandFailed(f"git exited with {returncode}")
+
+
+def _tracked_entry(code: str, object_ids: Sequence[str]) -> GitStatusEntry:
+    return GitStatusEntry(change_type=normalize_change_type(code), diff_key=":".join(object_ids))
+
+
+def _parse_log_header(header: str) -> tuple[str, str, str]:
+    sha, _, rest = header.partition("\t")
+    title, _, authored_at = rest.rpartition("\t")
+    return (sha, title, authored_at)
+
+
+def normalize_change_type(code: str) -> str:
+    if code.startswith("??"):
+        return "untracked"
+    if "D" in code:
+        return "deleted"
+    if "A" in code:
+        return "added"
+    return "modified"
+
+
+def _workspace_matches_current_git_env(workspace_root: Path) -> bool:
+    work_tree = (os.environ.get("GIT_WORK_TREE") or "").strip()
+    if work_tree:
+        try:
+            return Path(work_tree).resolve() == workspace_root.resolve()
+        except OSError:
+            return False
+
+    git_dir = (os.environ.get("GIT_DIR") or "").strip()
+    if git_dir:
+        try:
+            return Path(git_dir).resolve() == (workspace_root / ".git").resolve()
+        except OSError:
+            return False
+    return False
+
+
+def git_command_env(workspace_root: Path) -> dict[str, str]:
+    env = os.environ.copy()
+    if _workspace_matches_current_git_env(workspace_root):
+        return env
+    # When Sopify runs under a Git hook, Git exports repo-local environment
+    # variables. Clear them so `git -C <workspace>` always targets the intended
+    # workspace, even if the current process was started from another repo.
+    for key in (
+        "GIT_ALTERNATE_OBJECT_DIRECTORIES",
+        "GIT_COMMON_DIR",
+        "GIT_DIR",
+        "GIT_GRAFT_FILE",
+        "GIT_IMPLICIT_WORK_TREE",
+        "GIT_INDEX_FILE",
+        "GIT_NAMESPACE",
+        "GIT_OBJECT_DIRECTORY",
+        "GIT_PREFIX",
+        "GIT_SUPER_PREFIX",
+        "GIT_WORK_TREE",
+    ):
+        env.pop(key, None)
+    return env
+
+
+__all__ = [
+    "GitFacade",
+    "GitLogCommit",
+    "GitStatus",
+    "GitStatusEntry",
+    "git_command_env",
+    "normalize_change_type",
+]
@@ -19,7 +19,6 @@ from .checkpoint_request import (
 )
 from .action_projection import ActionProjectionError, build_action_projection, supports_action_projection
 from .clarification import CURRENT_CLARIFICATION_RELATIVE_PATH, build_scope_clarification_form, clarification_submission_state_payload
-from .compare_decision import build_compare_decision_contract
 from .deterministic_guard import (
     evaluate_deterministic_guard,
     expected_allowed_response_mode,
@@ -341,6 +340,8 @@ def _collect_handoff_artifacts(
     if skill_result:
         artifacts["skill_result_keys"] = sorted(skill_result.keys())
         if decision.route_name == "compare":
+            from .compare_decision import build_compare_decision_contract
+
             compare_contract = build_compare_decision_contract(
                 question=decision.request_text,
                 skill_result=skill_result,
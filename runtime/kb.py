@@ -2,23 +2,37 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 import re
+from typing import Any, Optional
 
-from .knowledge_layout import materialization_stage
+from .cache import path_signature, read_cache_payload, runtime_cache_path, write_cache_payload
+from .knowledge_layout import KB_LAYOUT_VERSION, materialization_stage
 from .models import KbArtifact, RuntimeConfig
 from .preferences import preferences_have_confirmed_entries, resolve_feedback_path, resolve_preferences_path
 from .state import iso_now
+from .state_backend import open_state_backend
 
 _STANDARD_BLUEPRINT_FILENAMES = frozenset({"README.md", "background.md", "design.md", "tasks.md"})
+KB_BOOTSTRAP_STAMP_FILENAME = "kb_bootstrap.json"
+_KB_BOOTSTRAP_STAMP_SCHEMA_VERSION = "1"
 
 
 def bootstrap_kb(config: RuntimeConfig) -> KbArtifact:
     """Create the minimum knowledge-base skeleton for the current workspace.
 
     The bootstrap is idempotent: existing files are preserved and only missing
-    files are created.
+    files are created. After a full pass, a stamp under `state/cache/` records
+    the stat signatures of every input the pass depends on; while they are
+    unchanged, later turns return the steady-state artifact without touching
+    the KB tree.
     """
+    stamp_path = runtime_cache_path(config, KB_BOOTSTRAP_STAMP_FILENAME)
+    steady_files = _read_bootstrap_stamp(config, stamp_path)
+    if steady_files is not None:
+        return KbArtifact(mode=config.kb_init, files=steady_files, created_at=iso_now())
+
     root = config.runtime_root
     _ensure_directories(root)
 
@@ -35,9 +49,12 @@ def bootstrap_kb(config: RuntimeConfig) -> KbArtifact:
     if feedback_log is not None and feedback_log not in created_files:
         created_files.append(feedback_log)
 
+    steady_files: tuple[str, ...] = ()
     if _should_bootstrap_blueprint_index(config):
-        created_files.extend(ensure_blueprint_index(config))
+        steady_files = ensure_blueprint_index(config)
+        created_files.extend(steady_files)
 
+    _write_bootstrap_stamp(config, stamp_path, steady_files=steady_files)
     return KbArtifact(
         mode=config.kb_init,
         files=tuple(created_files),
@@ -49,6 +66,112 @@ def _ensure_directories(root: Path) -> None:
     root.mkdir(parents=True, exist_ok=True)
 
 
+def _bootstrap_stamp_key(config: RuntimeConfig) -> dict[str, Any]:
+    return {
+        "layout_version": KB_LAYOUT_VERSION,
+        "kb_init": config.kb_init,
+        "language": config.language,
+        "runtime_root": str(config.runtime_root),
+        "state_backend": config.state_backend,
+    }
+
+
+def _bootstrap_input_paths(config: RuntimeConfig) -> list[Path]:
+    """Return every path whose stat can change the bootstrap outcome.
+
+    Directory signatures cover entries appearing or disappearing (manifests at
+    the workspace root, plan directories, extra blueprint docs, archives);
+    file signatures cover edits to the documents the blueprint index reads.
+    """
+    root = config.runtime_root
+    blueprint_root = root / "blueprint"
+    history_root = root / "history"
+    paths = [
+        config.workspace_root,
+        root,
+        root / "user",
+        root / "project.md",
+        resolve_preferences_path(config),
+        resolve_feedback_path(config),
+        blueprint_root,
+        root / "plan",
+        history_root,
+        history_root / "index.md",
+    ]
+    paths.extend(_scan_paths(blueprint_root, files=True, suffix=".md"))
+    paths.extend(_scan_paths(history_root, files=False))
+    return paths
+
+
+def _scan_paths(directory: Path, *, files: bool, suffix: str = "") -> list[Path]:
+    try:
+        with os.scandir(directory) as iterator:
+            entries = [
+                Path(entry.path)
+                for entry in iterator
+                if entry.name.endswith(suffix) and (entry.is_file() if files else entry.is_dir())
+            ]
+    except OSError:
+        return []
+    return sorted(entries)
+
+
+def _current_plan_signature(config: RuntimeConfig) -> Optional[list[int]]:
+    # The blueprint stage depends on the global current plan, which may live in
+    # the sqlite backend rather than on disk.
+    backend = open_state_backend(config)
+    try:
+        signature = backend.signature(config.state_dir / "current_plan.json")
+    finally:
+        backend.close()
+    return list(signature) if signature is not None else None
+
+
+def _read_bootstrap_stamp(config: RuntimeConfig, stamp_path: Optional[Path]) -> Optional[tuple[str, ...]]:
+    payload = read_cache_payload(stamp_path, schema_version=_KB_BOOTSTRAP_STAMP_SCHEMA_VERSION)
+    if payload is None or payload.get("key") != _bootstrap_stamp_key(config):
+        return None
+    signatures = payload.get("signatures")
+    steady_files = payload.get("steady_files")
+    if not isinstance(signatures, dict) or not isinstance(steady_files, list):
+        return None
+    if payload.get("current_plan") != _current_plan_signature(config):
+        return None
+    for relative_path, signature in signatures.items():
+        if path_signature(config.workspace_root / relative_path) != signature:
+            return None
+    return tuple(str(item) for item in steady_files)
+
+
+def _write_bootstrap_stamp(config: RuntimeConfig, stamp_path: Optional[Path], *, steady_files: tuple[str, ...]) -> None:
+    if stamp_path is None:
+        return
+    try:
+        # Create the cache directory first so its own creation does not change
+        # the runtime root signature recorded below.
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return
+    signatures = {
+        _stamp_key_for_path(config, path): path_signature(path)
+        for path in _bootstrap_input_paths(config)
+    }
+    write_cache_payload(
+        stamp_path,
+        {
+            "schema_version": _KB_BOOTSTRAP_STAMP_SCHEMA_VERSION,
+            "key": _bootstrap_stamp_key(config),
+            "current_plan": _current_plan_signature(config),
+            "signatures": signatures,
+            "steady_files": list(steady_files),
+        },
+    )
+
+
+def _stamp_key_for_path(config: RuntimeConfig, path: Path) -> str:
+    return path.relative_to(config.workspace_root).as_posix()
+
+
 def ensure_blueprint_index(config: RuntimeConfig) -> tuple[str, ...]:
     """Create or refresh the lightweight blueprint index."""
     path = refresh_blueprint_index(config)
@@ -0,0 +1,187 @@
+"""Advisory cross-process locks for shared workspace state.
+
+Several host sessions may run the runtime against one workspace at the same
+time. Global-scope state files and `plan/_registry.yaml` are read-modify-write
+documents, and replay retention rewrites session logs that writers append to,
+so these mutations are serialized with `fcntl.flock` on lock files
+under `.sopify-skills/state/locks/`. Locks are re-entrant within one thread,
+waits are bounded, and every acquisition feeds per-process contention metrics
+that the runtime gate reports in its `observability` block.
+
+Platforms without `fcntl` skip the OS lock but still record hold timings.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
+from .models import RuntimeConfig
+
+LOCKS_DIRNAME = "locks"
+GLOBAL_STATE_LOCK = "global_state"
+PLAN_REGISTRY_LOCK = "plan_registry"
+REPLAY_LOCK = "replay"
+DEFAULT_LOCK_TIMEOUT_SEC = 10.0
+_POLL_INITIAL_SEC = 0.002
+_POLL_MAX_SEC = 0.05
+
+
+class StateLockTimeout(TimeoutError):
+    """Raised when a workspace lock cannot be acquired within its wait budget."""
+
+
+@dataclass
+class _LockStats:
+    acquired: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    hold_ms: float = 0.0
+    max_hold_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "timeouts": self.timeouts,
+            "wait_ms": round(self.wait_ms, 3),
+            "max_wait_ms": round(self.max_wait_ms, 3),
+            "hold_ms": round(self.hold_ms, 3),
+            "max_hold_ms": round(self.max_hold_ms, 3),
+        }
+
+
+_STATS: dict[str, _LockStats] = {}
+_STATS_GUARD = threading.Lock()
+_HELD = threading.local()
+
+
+def lock_path(config: RuntimeConfig, name: str) -> Path:
+    return config.state_dir / LOCKS_DIRNAME / f"{name}.lock"
+
+
+@contextmanager
+def workspace_lock(
+    config: RuntimeConfig,
+    name: str,
+    *,
+    timeout: float = DEFAULT_LOCK_TIMEOUT_SEC,
+) -> Iterator[None]:
+    """Hold the named exclusive workspace lock for the duration of the block."""
+
+    path = lock_path(config, name)
+    key = str(path)
+    held: dict[str, int] = _held_counts()
+    if held.get(key):
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    started = time.perf_counter()
+    handle, contended = _acquire(path, timeout=timeout, name=name)
+    acquired_at = time.perf_counter()
+    held[key] = 1
+    try:
+        yield
+    finally:
+        held.pop(key, None)
+        _release(handle)
+        _record(
+            name,
+            wait_ms=(acquired_at - started) * 1000,
+            hold_ms=(time.perf_counter() - acquired_at) * 1000,
+            contended=contended,
+        )
+
+
+def lock_metrics_snapshot() -> dict[str, dict[str, Any]]:
+    """Return contention counters per lock name since the last reset."""
+
+    with _STATS_GUARD:
+        return {name: stats.to_dict() for name, stats in sorted(_STATS.items())}
+
+
+def reset_lock_metrics() -> None:
+    with _STATS_GUARD:
+        _STATS.clear()
+
+
+def _held_counts() -> dict[str, int]:
+    counts = getattr(_HELD, "counts", None)
+    if counts is None:
+        counts = {}
+        _HELD.counts = counts
+    return counts
+
+
+def _acquire(path: Path, *, timeout: float, name: str) -> tuple[int, bool]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is None:
+        return handle, False
+    deadline = time.monotonic() + max(timeout, 0.0)
+    delay = _POLL_INITIAL_SEC
+    contended = False
+    while True:
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return handle, contended
+        except BlockingIOError:
+            contended = True
+        except OSError:
+            os.close(handle)
+            raise
+        if time.monotonic() >= deadline:
+            os.close(handle)
+            with _STATS_GUARD:
+                _STATS.setdefault(name, _LockStats()).timeouts += 1
+            raise StateLockTimeout(f"Timed out after {timeout:g}s waiting for workspace lock: {path}")
+        time.sleep(delay)
+        delay = min(delay * 2, _POLL_MAX_SEC)
+
+
+def _release(handle: int) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+    finally:
+        os.close(handle)
+
+
+def _record(name: str, *, wait_ms: float, hold_ms: float, contended: bool) -> None:
+    with _STATS_GUARD:
+        stats = _STATS.setdefault(name, _LockStats())
+        stats.acquired += 1
+        stats.contended += int(contended)
+        stats.wait_ms += wait_ms
+        stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+        stats.hold_ms += hold_ms
+        stats.max_hold_ms = max(stats.max_hold_ms, hold_ms)
+
+
+__all__ = [
+    "DEFAULT_LOCK_TIMEOUT_SEC",
+    "GLOBAL_STATE_LOCK",
+    "LOCKS_DIRNAME",
+    "PLAN_REGISTRY_LOCK",
+    "StateLockTimeout",
+    "lock_metrics_snapshot",
+    "lock_path",
+    "reset_lock_metrics",
+    "workspace_lock",
+]
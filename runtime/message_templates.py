@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from copy import deepcopy
 from string import Formatter
-from typing import Any, Mapping
+from typing import Any, Mapping, Sequence
 
 
 MESSAGE_TEMPLATE_RENDER_FAILED = "message_template_render_failed"
@@ -14,6 +14,8 @@ SAFE_FALLBACK_MESSAGES = {
 }
 
 _FORMATTER = Formatter()
+# Bounds the lazily memoized prefix/fallback selections of one resolver.
+_MAX_MEMOIZED_SELECTIONS = 4096
 
 
 class MessageTemplateError(ValueError):
@@ -27,8 +29,11 @@ def load_default_host_message_templates(
 ) -> dict[str, Any]:
     """Load the repository-default host-facing template contract."""
 
+    from .contract_registry import get_contract_registry, thaw_contract
     from .decision_tables import load_decision_tables, load_default_decision_tables
 
+    if decision_tables_path is None and schema_path is None:
+        return thaw_contract(get_contract_registry().host_message_templates)
     if decision_tables_path is not None:
         tables = load_decision_tables(decision_tables_path, schema_path=schema_path)
     else:
@@ -42,73 +47,45 @@ def render_host_message(
     prompt_mode: str,
     variables: Mapping[str, Any] | None = None,
     locale: str | None = None,
-    templates: Mapping[str, Any] | None = None,
+    templates: Mapping[str, Any] | HostMessageResolver | None = None,
 ) -> dict[str, Any]:
-    """Render a host-facing message with frozen lookup order and safe fallback."""
+    """Render a host-facing message with frozen lookup order and safe fallback.
+
+    `templates` may be a template contract or a `HostMessageResolver` compiled
+    from one; without it, the resolver of the shared contract registry is used.
+    """
 
     if templates is None:
-        templates = load_default_host_message_templates()
-    if not isinstance(templates, Mapping):
-        raise MessageTemplateError("templates must be a mapping")
+        from .contract_registry import get_contract_registry
 
-    template_contract = dict(templates)
-    template_rows = template_contract.get("templates")
-    fallback_map = template_contract.get("prompt_mode_fallbacks")
-    default_locale = template_contract.get("default_locale")
-    lookup_order = template_contract.get("lookup_order")
-    allowed_variables = template_contract.get("allowed_variables")
-    if not isinstance(template_rows, list) or not isinstance(fallback_map, Mapping):
-        raise MessageTemplateError("templates contract is missing templates or prompt_mode_fallbacks")
-    if not isinstance(default_locale, str) or not default_locale.strip():
-        raise MessageTemplateError("templates.default_locale must be a non-empty string")
-    if not isinstance(lookup_order, list) or not lookup_order:
-        raise MessageTemplateError("templates.lookup_order must be a non-empty list")
-    if not isinstance(allowed_variables, list):
-        raise MessageTemplateError("templates.allowed_variables must be a list")
+        resolver = get_contract_registry().derived("host_message_resolver", _compile_registry_templates)
+    elif isinstance(templates, HostMessageResolver):
+        resolver = templates
+    else:
+        resolver = compile_host_message_templates(templates)
 
-    render_variables = dict(variables or {})
-    resolved_locale = _resolve_locale(locale, templates=template_contract, default_locale=default_locale)
-    selected = _select_template(
-        reason_code=reason_code,
-        prompt_mode=prompt_mode,
-        locale=resolved_locale,
-        templates=template_rows,
-        fallback_map=fallback_map,
-        lookup_order=lookup_order,
-        default_locale=default_locale,
-    )
-    rendered = _render_template_text(
-        selected["text"],
-        variables=render_variables,
-        allowed_variables=allowed_variables,
-    )
+    render_variables = variables or {}
+    resolved_locale = resolver.resolve_locale(locale)
+    selected = resolver.select(reason_code=reason_code, prompt_mode=prompt_mode, locale=resolved_locale)
+    rendered = selected.render(render_variables)
     render_events: list[str] = []
-    source_kind = selected["source_kind"]
-    match_value = selected["match_value"]
+    source_kind = selected.source_kind
+    match_value = selected.match_value
 
     if rendered is None:
         render_events.append(MESSAGE_TEMPLATE_RENDER_FAILED)
-        fallback_selected = _select_prompt_mode_fallback(
-            prompt_mode=prompt_mode,
-            locale=resolved_locale,
-            fallback_map=fallback_map,
-            default_locale=default_locale,
-        )
-        fallback_rendered = _render_template_text(
-            fallback_selected["text"],
-            variables=render_variables,
-            allowed_variables=allowed_variables,
-        )
+        fallback_selected = resolver.prompt_mode_fallback(prompt_mode=prompt_mode, locale=resolved_locale)
+        fallback_rendered = fallback_selected.render(render_variables)
         if fallback_rendered is not None:
             rendered = fallback_rendered
-            source_kind = fallback_selected["source_kind"]
-            match_value = fallback_selected["match_value"]
+            source_kind = fallback_selected.source_kind
+            match_value = fallback_selected.match_value
         else:
             source_kind = "safe_fallback"
             match_value = prompt_mode
             rendered = SAFE_FALLBACK_MESSAGES.get(
                 resolved_locale,
-                SAFE_FALLBACK_MESSAGES.get(default_locale, next(iter(SAFE_FALLBACK_MESSAGES.values()))),
+                SAFE_FALLBACK_MESSAGES.get(resolver.default_locale, next(iter(SAFE_FALLBACK_MESSAGES.values()))),
             )
 
     return {
@@ -120,97 +97,174 @@ def render_host_message(
     }
 
 
-def _resolve_locale(
-    locale: str | None,
-    *,
-    templates: Mapping[str, Any],
-    default_locale: str,
-) -> str:
-    if locale is None:
-        return default_locale
-    prompt_mode_fallbacks = templates.get("prompt_mode_fallbacks")
-    if not isinstance(prompt_mode_fallbacks, Mapping):
-        return default_locale
-    for localized_text in prompt_mode_fallbacks.values():
-        if isinstance(localized_text, Mapping) and locale in localized_text:
-            return locale
-    return default_locale
-
-
-def _select_template(
-    *,
-    reason_code: str,
-    prompt_mode: str,
-    locale: str,
-    templates: list[Any],
-    fallback_map: Mapping[str, Any],
-    lookup_order: list[Any],
-    default_locale: str,
-) -> dict[str, str]:
-    for lookup_kind in lookup_order:
-        if lookup_kind == "exact_reason_code":
-            for template in templates:
-                if not isinstance(template, Mapping):
-                    continue
-                if (
-                    template.get("match_kind") == "exact_reason_code"
-                    and template.get("match_value") == reason_code
-                    and prompt_mode in template.get("prompt_modes", ())
-                ):
-                    return {
-                        "text": _select_locale_text(template.get("locales"), locale, default_locale),
-                        "source_kind": "exact_reason_code",
-                        "match_value": str(template.get("match_value")),
-                    }
-        elif lookup_kind == "reason_code_family_prefix":
-            prefix_matches: list[Mapping[str, Any]] = []
-            for template in templates:
-                if not isinstance(template, Mapping):
-                    continue
-                match_value = template.get("match_value")
-                if (
-                    template.get("match_kind") == "reason_code_family_prefix"
-                    and isinstance(match_value, str)
-                    and reason_code.startswith(match_value)
-                    and prompt_mode in template.get("prompt_modes", ())
-                ):
-                    prefix_matches.append(template)
-            if prefix_matches:
-                chosen = max(prefix_matches, key=lambda item: len(str(item.get("match_value", ""))))
-                return {
-                    "text": _select_locale_text(chosen.get("locales"), locale, default_locale),
-                    "source_kind": "reason_code_family_prefix",
-                    "match_value": str(chosen.get("match_value")),
-                }
-        elif lookup_kind == "prompt_mode_fallback":
-            return _select_prompt_mode_fallback(
-                prompt_mode=prompt_mode,
-                locale=locale,
-                fallback_map=fallback_map,
-                default_locale=default_locale,
-            )
+def compile_host_message_templates(templates: Mapping[str, Any]) -> HostMessageResolver:
+    """Validate a template contract and precompile its lookup and placeholders."""
 
-    return _select_prompt_mode_fallback(
-        prompt_mode=prompt_mode,
-        locale=locale,
+    if not isinstance(templates, Mapping):
+        raise MessageTemplateError("templates must be a mapping")
+    template_rows = templates.get("templates")
+    fallback_map = templates.get("prompt_mode_fallbacks")
+    default_locale = templates.get("default_locale")
+    lookup_order = templates.get("lookup_order")
+    allowed_variables = templates.get("allowed_variables")
+    if not isinstance(template_rows, (list, tuple)) or not isinstance(fallback_map, Mapping):
+        raise MessageTemplateError("templates contract is missing templates or prompt_mode_fallbacks")
+    if not isinstance(default_locale, str) or not default_locale.strip():
+        raise MessageTemplateError("templates.default_locale must be a non-empty string")
+    if not isinstance(lookup_order, (list, tuple)) or not lookup_order:
+        raise MessageTemplateError("templates.lookup_order must be a non-empty list")
+    if not isinstance(allowed_variables, (list, tuple)):
+        raise MessageTemplateError("templates.allowed_variables must be a list")
+    return HostMessageResolver(
+        template_rows=template_rows,
         fallback_map=fallback_map,
         default_locale=default_locale,
+        lookup_order=lookup_order,
+        allowed_variables=allowed_variables,
     )
 
 
-def _select_prompt_mode_fallback(
-    *,
-    prompt_mode: str,
-    locale: str,
-    fallback_map: Mapping[str, Any],
-    default_locale: str,
-) -> dict[str, str]:
-    localized = fallback_map.get(prompt_mode)
-    return {
-        "text": _select_locale_text(localized, locale, default_locale),
-        "source_kind": "prompt_mode_fallback",
-        "match_value": prompt_mode,
-    }
+class SelectedTemplate:
+    """One selected template text with its placeholders parsed ahead of time."""
+
+    __slots__ = ("text", "source_kind", "match_value", "_segments")
+
+    def __init__(self, text: str, *, source_kind: str, match_value: str, allowed: frozenset[str]) -> None:
+        self.text = text
+        self.source_kind = source_kind
+        self.match_value = match_value
+        self._segments = _compile_segments(text, allowed=allowed)
+
+    def render(self, variables: Mapping[str, Any]) -> str | None:
+        """Join literals and variables, or return None when the template cannot render safely."""
+
+        if self._segments is None:
+            return None
+        parts: list[str] = []
+        for literal, field_name in self._segments:
+            parts.append(literal)
+            if field_name is None:
+                continue
+            value = variables.get(field_name)
+            if value is None:
+                return None
+            try:
+                parts.append(format(value))
+            except ValueError:
+                return None
+        return "".join(parts)
+
+
+class HostMessageResolver:
+    """Template lookup keyed by (reason_code, prompt_mode, locale).
+
+    Exact reason codes and prompt-mode fallbacks are resolved at compile time
+    for every known locale; prefix-matched reason codes are resolved once and
+    memoized.
+    """
+
+    def __init__(
+        self,
+        *,
+        template_rows: Sequence[Any],
+        fallback_map: Mapping[str, Any],
+        default_locale: str,
+        lookup_order: Sequence[Any],
+        allowed_variables: Sequence[Any],
+    ) -> None:
+        self.default_locale = default_locale
+        self._fallback_map = fallback_map
+        self._lookup_order = tuple(lookup_order)
+        self._allowed = frozenset(item for item in allowed_variables if isinstance(item, str))
+        self._known_locales = frozenset(
+            locale
+            for localized_text in fallback_map.values()
+            if isinstance(localized_text, Mapping)
+            for locale in localized_text
+        )
+        # (reason_code, prompt_mode) -> first `exact_reason_code` row's locales.
+        self._exact: dict[tuple[str, str], Any] = {}
+        # prompt_mode -> `reason_code_family_prefix` rows, longest prefix first.
+        self._prefixes: dict[str, list[tuple[str, Any]]] = {}
+        for template in template_rows:
+            if not isinstance(template, Mapping):
+                continue
+            match_kind = template.get("match_kind")
+            match_value = template.get("match_value")
+            for prompt_mode in template.get("prompt_modes", ()):
+                if match_kind == "exact_reason_code":
+                    self._exact.setdefault((match_value, prompt_mode), template)
+                elif match_kind == "reason_code_family_prefix" and isinstance(match_value, str):
+                    self._prefixes.setdefault(prompt_mode, []).append((match_value, template))
+        for rows in self._prefixes.values():
+            # Stable sort: equal-length prefixes keep table order, like `max()`.
+            rows.sort(key=lambda item: -len(item[0]))
+
+        locales = self._known_locales | {default_locale}
+        self._fallbacks: dict[tuple[str, str], SelectedTemplate] = {
+            (prompt_mode, locale): self._compile_fallback(prompt_mode, locale)
+            for prompt_mode in fallback_map
+            for locale in locales
+        }
+        self._selections: dict[tuple[str, str, str], SelectedTemplate] = {}
+        for reason_code, prompt_mode in self._exact:
+            if isinstance(reason_code, str) and isinstance(prompt_mode, str):
+                for locale in locales:
+                    self.select(reason_code=reason_code, prompt_mode=prompt_mode, locale=locale)
+
+    def resolve_locale(self, locale: str | None) -> str:
+        if locale is None or locale not in self._known_locales:
+            return self.default_locale
+        return locale
+
+    def select(self, *, reason_code: str, prompt_mode: str, locale: str) -> SelectedTemplate:
+        key = (reason_code, prompt_mode, locale)
+        selected = self._selections.get(key)
+        if selected is None:
+            selected = self._resolve(reason_code, prompt_mode, locale)
+            if len(self._selections) < _MAX_MEMOIZED_SELECTIONS:
+                self._selections[key] = selected
+        return selected
+
+    def prompt_mode_fallback(self, *, prompt_mode: str, locale: str) -> SelectedTemplate:
+        selected = self._fallbacks.get((prompt_mode, locale))
+        if selected is None:
+            selected = self._compile_fallback(prompt_mode, locale)
+        return selected
+
+    def _resolve(self, reason_code: str, prompt_mode: str, locale: str) -> SelectedTemplate:
+        for lookup_kind in self._lookup_order:
+            if lookup_kind == "exact_reason_code":
+                template = self._exact.get((reason_code, prompt_mode))
+                if template is not None:
+                    return self._compile_row(template, locale, source_kind="exact_reason_code")
+            elif lookup_kind == "reason_code_family_prefix":
+                for prefix, template in self._prefixes.get(prompt_mode, ()):
+                    if reason_code.startswith(prefix):
+                        return self._compile_row(template, locale, source_kind="reason_code_family_prefix")
+            elif lookup_kind == "prompt_mode_fallback":
+                return self.prompt_mode_fallback(prompt_mode=prompt_mode, locale=locale)
+        return self.prompt_mode_fallback(prompt_mode=prompt_mode, locale=locale)
+
+    def _compile_row(self, template: Mapping[str, Any], locale: str, *, source_kind: str) -> SelectedTemplate:
+        return SelectedTemplate(
+            _select_locale_text(template.get("locales"), locale, self.default_locale),
+            source_kind=source_kind,
+            match_value=str(template.get("match_value")),
+            allowed=self._allowed,
+        )
+
+    def _compile_fallback(self, prompt_mode: str, locale: str) -> SelectedTemplate:
+        return SelectedTemplate(
+            _select_locale_text(self._fallback_map.get(prompt_mode), locale, self.default_locale),
+            source_kind="prompt_mode_fallback",
+            match_value=prompt_mode,
+            allowed=self._allowed,
+        )
+
+
+def _compile_registry_templates(registry: Any) -> HostMessageResolver:
+    return compile_host_message_templates(registry.host_message_templates)
 
 
 def _select_locale_text(value: Any, locale: str, default_locale: str) -> str:
@@ -227,39 +281,15 @@ def _select_locale_text(value: Any, locale: str, default_locale: str) -> str:
     )
 
 
-def _render_template_text(
-    template: str,
-    *,
-    variables: Mapping[str, Any],
-    allowed_variables: list[Any],
-) -> str | None:
+def _compile_segments(template: str, *, allowed: frozenset[str]) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a template into (literal, placeholder) pairs, or None if it is unsafe to render."""
+
+    segments: list[tuple[str, str | None]] = []
     try:
-        required_fields = _collect_required_fields(template, allowed_variables=allowed_variables)
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+            if field_name is not None and (conversion is not None or format_spec or field_name not in allowed):
+                return None
+            segments.append((literal, field_name))
     except ValueError:
         return None
-    missing_fields = [
-        field_name
-        for field_name in required_fields
-        if field_name not in variables or variables[field_name] is None
-    ]
-    if missing_fields:
-        return None
-    try:
-        return template.format_map({field: variables[field] for field in required_fields})
-    except (KeyError, ValueError):
-        return None
-
-
-def _collect_required_fields(template: str, *, allowed_variables: list[Any]) -> list[str]:
-    required_fields: list[str] = []
-    allowed = {item for item in allowed_variables if isinstance(item, str)}
-    for _, field_name, format_spec, conversion in _FORMATTER.parse(template):
-        if field_name is None:
-            continue
-        if conversion is not None or format_spec:
-            raise ValueError("format conversion and format specifiers are not supported")
-        if field_name not in allowed:
-            raise ValueError(f"unsupported placeholder: {field_name}")
-        if field_name not in required_fields:
-            required_fields.append(field_name)
-    return required_fields
+    return tuple(segments)
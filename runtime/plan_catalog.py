@@ -0,0 +1,299 @@
+"""Persistent catalog of plan directories under `plan/`.
+
+Plan lookups (by id, by topic key, registry backfill and reconciliation) used
+to iterate `plan_root` and parse every plan's front matter. The catalog keeps
+one entry per plan directory with the identity fields those lookups need,
+persisted under `state/cache/plan_catalog.json` and validated by stat
+signatures:
+
+- the `plan_root` directory signature guards the listing, so plans created,
+  archived or renamed by any writer trigger a rescan;
+- each entry carries its metadata file signature, checked with one `stat`
+  per plan on load, so only plans whose `plan.md` / `tasks.md` changed are
+  re-parsed and lookups afterwards are dictionary reads.
+
+`create_plan_scaffold`, `finalize_plan` and the registry refresh entries they
+touch through `refresh_plan_catalog_entry`. Like every runtime cache this is
+an optimization only: a missing or corrupted catalog is rebuilt from disk,
+and `advanced.cache_project: false` disables persistence.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import os
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+from ._yaml import load_front_matter
+from .cache import path_signature, read_cache_payload, runtime_cache_path, write_cache_payload
+from .models import RuntimeConfig
+
+PLAN_CATALOG_FILENAME = "plan_catalog.json"
+PLAN_CATALOG_SCHEMA_VERSION = "1"
+PLAN_METADATA_FILENAMES = ("plan.md", "tasks.md")
+_FRONT_MATTER_FIELDS = ("plan_id", "level", "lifecycle_state", "topic_key", "feature_key", "created_at")
+
+
+@dataclass(frozen=True)
+class PlanCatalogEntry:
+    """Identity fields of one plan directory, keyed by its metadata signature."""
+
+    dir_name: str
+    metadata_file: str
+    signature: tuple[int, ...]
+    valid: bool
+    plan_id: str = ""
+    title: str = ""
+    front_matter: Mapping[str, str] | None = None
+
+    @property
+    def metadata_created_at(self) -> str:
+        """Mirror `_path_created_at(metadata_path)` from the recorded mtime."""
+        seconds = self.signature[0] / 1_000_000_000 if self.signature else 0
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=0).isoformat()
+
+    def field(self, key: str) -> str:
+        return str((self.front_matter or {}).get(key) or "")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "metadata_file": self.metadata_file,
+            "signature": list(self.signature),
+            "valid": self.valid,
+            "plan_id": self.plan_id,
+            "title": self.title,
+            "front_matter": dict(self.front_matter or {}),
+        }
+
+    @classmethod
+    def from_dict(cls, dir_name: str, data: Mapping[str, Any]) -> Optional["PlanCatalogEntry"]:
+        signature = data.get("signature")
+        front_matter = data.get("front_matter")
+        if not isinstance(signature, list) or not isinstance(front_matter, Mapping):
+            return None
+        return cls(
+            dir_name=dir_name,
+            metadata_file=str(data.get("metadata_file") or ""),
+            signature=tuple(int(item) for item in signature),
+            valid=bool(data.get("valid")),
+            plan_id=str(data.get("plan_id") or ""),
+            title=str(data.get("title") or ""),
+            front_matter={str(key): str(value) for key, value in front_matter.items()},
+        )
+
+
+class PlanCatalog:
+    """Validated view of `plan_root`; lookups are dictionary reads."""
+
+    def __init__(self, config: RuntimeConfig, path: Path | None, payload: Mapping[str, Any] | None) -> None:
+        self.config = config
+        self._path = path
+        payload = payload or {}
+        raw_entries = payload.get("entries")
+        self._root_signature = payload.get("root_signature")
+        self._entries: dict[str, PlanCatalogEntry] = {}
+        if isinstance(raw_entries, Mapping):
+            for dir_name, data in raw_entries.items():
+                entry = PlanCatalogEntry.from_dict(str(dir_name), data) if isinstance(data, Mapping) else None
+                if entry is not None:
+                    self._entries[entry.dir_name] = entry
+        self._indexes: dict[str, dict[str, tuple[str, ...]]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, config: RuntimeConfig) -> "PlanCatalog":
+        path = runtime_cache_path(config, PLAN_CATALOG_FILENAME)
+        catalog = cls(config, path, read_cache_payload(path, schema_version=PLAN_CATALOG_SCHEMA_VERSION))
+        catalog._validate_listing()
+        catalog.save()
+        return catalog
+
+    def entries(self) -> tuple[PlanCatalogEntry, ...]:
+        """Return valid plan entries sorted by directory name."""
+        return tuple(self._entries[name] for name in sorted(self._entries) if self._entries[name].valid)
+
+    def entry(self, dir_name: str) -> PlanCatalogEntry | None:
+        """Return the revalidated entry for one plan directory, if any."""
+        return self._refresh(dir_name)
+
+    def plan_dir(self, dir_name: str) -> Path:
+        return self.config.plan_root / dir_name
+
+    def dirs_for_plan_id(self, plan_id: str) -> tuple[Path, ...]:
+        return self._lookup("plan_id", lambda entry: entry.plan_id, plan_id)
+
+    def plan_dirs_by_id(self) -> dict[str, Path]:
+        """Map each plan id to its first plan dir, from the already validated entries."""
+        plan_dirs: dict[str, Path] = {}
+        for entry in self.entries():
+            plan_dirs.setdefault(entry.plan_id, self.plan_dir(entry.dir_name))
+        return plan_dirs
+
+    def lookup(self, name: str, key: Callable[[PlanCatalogEntry], str], value: str) -> tuple[Path, ...]:
+        """Return plan dirs whose `key(entry)` equals `value`, via a cached index.
+
+        Hits are revalidated, so an entry edited in place since the last scan
+        is re-read before it is returned.
+        """
+        return self._lookup(name, key, value)
+
+    def refresh_entry(self, dir_name: str) -> PlanCatalogEntry | None:
+        self._indexes.clear()
+        return self._refresh(dir_name)
+
+    def save(self) -> None:
+        if self._path is None or not self._dirty:
+            return
+        write_cache_payload(
+            self._path,
+            {
+                "schema_version": PLAN_CATALOG_SCHEMA_VERSION,
+                "root_signature": self._root_signature,
+                "entries": {name: entry.to_dict() for name, entry in sorted(self._entries.items())},
+            },
+        )
+        self._dirty = False
+
+    def _lookup(self, name: str, key: Callable[[PlanCatalogEntry], str], value: str) -> tuple[Path, ...]:
+        index = self._indexes.get(name)
+        if index is None:
+            grouped: dict[str, list[str]] = {}
+            for entry in self.entries():
+                grouped.setdefault(key(entry), []).append(entry.dir_name)
+            index = {item: tuple(names) for item, names in grouped.items()}
+            self._indexes[name] = index
+        matches: list[Path] = []
+        for dir_name in index.get(value, ()):
+            entry = self._refresh(dir_name)
+            if entry is not None and entry.valid and key(entry) == value:
+                matches.append(self.plan_dir(dir_name))
+        return tuple(matches)
+
+    def _validate_listing(self) -> None:
+        root_signature = path_signature(self.config.plan_root)
+        if root_signature == self._root_signature:
+            names = list(self._entries)
+        else:
+            names = []
+            if root_signature is not None:
+                try:
+                    with os.scandir(self.config.plan_root) as iterator:
+                        names = [item.name for item in iterator if _is_plan_dir(item)]
+                except OSError:
+                    names = []
+            self._root_signature = root_signature
+            listed = set(names)
+            self._entries = {name: entry for name, entry in self._entries.items() if name in listed}
+            self._indexes.clear()
+            self._dirty = True
+        for name in sorted(names):
+            self._refresh(name)
+
+    def _refresh(self, dir_name: str) -> PlanCatalogEntry | None:
+        plan_dir = self.plan_dir(dir_name)
+        current = self._entries.get(dir_name)
+        metadata_path, signature = _metadata_file_signature(plan_dir)
+        if metadata_path is None or signature is None:
+            if not plan_dir.is_dir():
+                if current is not None:
+                    self._forget(dir_name)
+                return None
+            # Remember directories without metadata so a later `plan.md` is
+            # noticed by the per-entry stat even if the listing is unchanged.
+            entry = PlanCatalogEntry(dir_name=dir_name, metadata_file="", signature=(), valid=False)
+        elif current is not None and current.metadata_file == metadata_path.name and list(current.signature) == signature:
+            return current
+        else:
+            entry = _parse_entry(dir_name, metadata_path, signature)
+        if entry != current:
+            self._entries[dir_name] = entry
+            self._indexes.clear()
+            self._dirty = True
+        return entry
+
+    def _forget(self, dir_name: str) -> None:
+        self._entries.pop(dir_name, None)
+        self._indexes.clear()
+        self._dirty = True
+
+
+def load_plan_catalog(config: RuntimeConfig) -> PlanCatalog:
+    """Load the catalog, revalidating the listing and every metadata signature."""
+    return PlanCatalog.load(config)
+
+
+def refresh_plan_catalog_entry(config: RuntimeConfig, plan_dir: Path) -> None:
+    """Re-read (or drop) one plan directory after a writer touched it."""
+    if plan_dir.parent != config.plan_root:
+        return
+    catalog = load_plan_catalog(config)
+    catalog.refresh_entry(plan_dir.name)
+    catalog.save()
+
+
+def _is_plan_dir(item: os.DirEntry[str]) -> bool:
+    try:
+        return item.is_dir()
+    except OSError:
+        return False
+
+
+def _metadata_file_signature(plan_dir: Path) -> tuple[Path | None, list[int] | None]:
+    for filename in PLAN_METADATA_FILENAMES:
+        candidate = plan_dir / filename
+        try:
+            stat = os.stat(candidate)
+        except OSError:
+            continue
+        if os.path.isfile(candidate):
+            return candidate, [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+    return None, None
+
+
+def _parse_entry(dir_name: str, metadata_path: Path, signature: list[int]) -> PlanCatalogEntry:
+    invalid = PlanCatalogEntry(
+        dir_name=dir_name,
+        metadata_file=metadata_path.name,
+        signature=tuple(signature),
+        valid=False,
+    )
+    try:
+        raw_text = metadata_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return invalid
+    plan_document = load_front_matter(raw_text)
+    if plan_document is None:
+        return invalid
+    metadata, body = plan_document
+    # Keep only truthy values: every reader applies `metadata.get(key) or default`.
+    front_matter = {key: str(metadata.get(key)) for key in _FRONT_MATTER_FIELDS if metadata.get(key)}
+    return PlanCatalogEntry(
+        dir_name=dir_name,
+        metadata_file=metadata_path.name,
+        signature=tuple(signature),
+        valid=True,
+        plan_id=str(metadata.get("plan_id") or dir_name),
+        title=_extract_title(body),
+        front_matter=front_matter,
+    )
+
+
+def _extract_title(body: str) -> str:
+    for line in body.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("# "):
+            return stripped[2:].strip()
+    return ""
+
+
+__all__ = [
+    "PLAN_CATALOG_FILENAME",
+    "PLAN_CATALOG_SCHEMA_VERSION",
+    "PLAN_METADATA_FILENAMES",
+    "PlanCatalog",
+    "PlanCatalogEntry",
+    "load_plan_catalog",
+    "refresh_plan_catalog_entry",
+]
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
 from pathlib import Path
 import re
 from tempfile import NamedTemporaryFile
-from typing import Any, Mapping, Sequence
+from typing import Any, Iterator, Mapping, Sequence
 
-from ._yaml import YamlParseError, load_yaml
+from ._yaml import YamlParseError, load_front_matter, load_yaml
+from .locking import PLAN_REGISTRY_LOCK, workspace_lock
 from .models import PlanArtifact, RuntimeConfig
+from .plan_catalog import PlanCatalog, PlanCatalogEntry, load_plan_catalog
 from .state import StateStore, iso_now
 
 REGISTRY_FILENAME = "_registry.yaml"
@@ -23,7 +27,6 @@ REGISTRY_PRIORITY_FALLBACK = "p2"
 
 _SUPPORTED_PLAN_LEVELS = {"light", "standard", "full"}
 _SUPPORTED_LIFECYCLE_STATES = {"active", "ready_for_verify", "archived"}
-_FRONT_MATTER_RE = re.compile(r"\A---\n(?P<front>.*?)\n---\n(?P<body>.*)\Z", re.DOTALL)
 _TITLE_PREFIX_RE = re.compile(
     r"^(?:任务清单|技术设计|变更提案|Task List|Technical Design|Change Proposal)\s*[:：]\s*",
     re.IGNORECASE,
@@ -108,38 +111,195 @@ def inspect_plan_registry(
     request_text: str = "",
 ) -> dict[str, Any]:
     """Build a host-facing inspect contract for the plan registry."""
-    read_result = read_plan_registry(
+    with plan_registry_session(
         config,
-        reconcile=True,
-        refresh_advice=True,
         request_text=request_text,
         create_if_missing=True,
         backfill_if_missing=True,
-    )
+    ) as session:
+        return session.inspect(plan_id=plan_id)
+
+
+class PlanRegistrySession:
+    """One reconciled in-memory view of `_registry.yaml`.
+
+    Opened by `plan_registry_session()`: the registry is read, reconciled and
+    advice-refreshed once, `current_plan` is read once, and inspect, recommend,
+    entry, priority-note and confirm-priority queries are all served from the
+    same payload. The registry is written back at most once, when the session
+    closes and only if loading or a mutation changed it.
+    """
+
+    def __init__(
+        self,
+        config: RuntimeConfig,
+        *,
+        payload: dict[str, Any],
+        drift_notice: Mapping[str, tuple[str, ...]],
+        current_plan: PlanArtifact | None,
+        dirty: bool,
+    ) -> None:
+        self.config = config
+        self.payload = payload
+        self.drift_notice = dict(drift_notice)
+        self.current_plan = current_plan
+        self._dirty = dirty
+
+    @property
+    def read_result(self) -> PlanRegistryReadResult:
+        return PlanRegistryReadResult(payload=self.payload, drift_notice=self.drift_notice)
+
+    def entry(self, plan_id: str) -> PlanRegistryEntryResult:
+        return PlanRegistryEntryResult(
+            entry=_entry_by_plan_id(self.payload.get("plans") or (), plan_id),
+            drift_notice=tuple(self.drift_notice.get(plan_id) or ()),
+        )
+
+    def recommendations(self) -> tuple[PlanRegistryRecommendation, ...]:
+        return _recommendations_from_payload(self.payload, current_plan=self.current_plan)
+
+    def priority_note(self, plan_id: str, *, language: str) -> str | None:
+        return _priority_note_for_entry(self.entry(plan_id).entry, language=language)
+
+    def inspect(self, *, plan_id: str | None = None) -> dict[str, Any]:
+        selected_entry = None
+        if plan_id is not None:
+            selected_entry = self.entry(plan_id).entry
+            if selected_entry is None:
+                raise PlanRegistryError(f"Unknown plan_id: {plan_id}")
+
+        current_plan = self.current_plan
+        return {
+            "status": "ready",
+            "registry_path": registry_relative_path(self.config),
+            "current_plan": current_plan.to_dict() if current_plan is not None else None,
+            "registry": _clone_registry(self.payload),
+            "drift_notice": {key: list(value) for key, value in self.drift_notice.items()},
+            "recommendations": [item.to_dict() for item in self.recommendations()],
+            "selected_plan": selected_entry,
+            "execution_truth": {
+                "current_plan_is_machine_truth": True,
+                "registry_is_observe_only": True,
+            },
+        }
+
+    def confirm_priority(self, *, plan_id: str, priority: str, note: str | None = None) -> Mapping[str, Any]:
+        """Record a user-confirmed final priority in the session payload."""
+        normalized_priority = _normalize_priority_value(priority) or REGISTRY_PRIORITY_FALLBACK
+        entry = _entry_by_plan_id(self.payload.get("plans") or (), plan_id)
+        if entry is None:
+            artifact = _artifact_by_plan_id(config=self.config, plan_id=plan_id)
+            if artifact is None:
+                raise PlanRegistryError(f"Unknown plan_id: {plan_id}")
+            entry = _build_entry(
+                artifact=artifact,
+                config=self.config,
+                existing_entries=tuple(self.payload.get("plans") or ()),
+                request_text=artifact.summary,
+                existing_entry=None,
+                source="runtime_backfill",
+                current_plan=self.current_plan,
+            )
+        entry = _clone_entry(entry)
+        governance = _normalize_governance(entry.get("governance"))
+        governance["priority"] = normalized_priority
+        governance["priority_source"] = "user_confirmed"
+        governance["priority_confirmed_at"] = iso_now()
+        if note is not None:
+            governance["note"] = str(note)
+        entry["governance"] = governance
+        entry["meta"] = _normalize_meta(entry.get("meta"), source=str(entry.get("meta", {}).get("source") or "runtime_auto"))
+        entry["meta"]["updated_at"] = iso_now()
+        self.payload["plans"] = _replace_entry(self.payload.get("plans") or (), entry)
+        self._dirty = True
+        return entry
+
+    def commit(self) -> bool:
+        """Write the registry back if the session changed it; return whether it did."""
+        if not self._dirty:
+            return False
+        _write_registry(registry_path(self.config), self.payload)
+        self._dirty = False
+        return True
+
+
+@contextmanager
+def plan_registry_session(
+    config: RuntimeConfig,
+    *,
+    request_text: str = "",
+    reconcile: bool = True,
+    refresh_advice: bool = True,
+    create_if_missing: bool = False,
+    backfill_if_missing: bool = False,
+) -> Iterator[PlanRegistrySession]:
+    """Hold the registry lock around one load/reconcile and a single write-back."""
+    may_write = create_if_missing or reconcile or refresh_advice
+    lock = workspace_lock(config, PLAN_REGISTRY_LOCK) if may_write else nullcontext()
+    try:
+        with lock:
+            session = _open_registry_session(
+                config,
+                request_text=request_text,
+                reconcile=reconcile,
+                refresh_advice=refresh_advice,
+                create_if_missing=create_if_missing,
+                backfill_if_missing=backfill_if_missing,
+            )
+            try:
+                yield session
+            finally:
+                # Observe-only reconcile results are persisted even when a
+                # query fails, as the separate read calls used to do.
+                session.commit()
+    except (OSError, YamlParseError, ValueError) as exc:
+        raise PlanRegistryError(str(exc)) from exc
+
+
+def _open_registry_session(
+    config: RuntimeConfig,
+    *,
+    request_text: str,
+    reconcile: bool,
+    refresh_advice: bool,
+    create_if_missing: bool,
+    backfill_if_missing: bool,
+) -> PlanRegistrySession:
+    path = registry_path(config)
     current_plan = StateStore(config).get_current_plan()
-    recommendations = recommend_plan_candidates(
-        config=config,
-        request_text=request_text,
+    dirty = False
+    if path.exists():
+        payload = _read_registry(path)
+    else:
+        payload = _empty_registry()
+        if create_if_missing:
+            if backfill_if_missing:
+                payload, _ = _backfill_missing_entries(
+                    payload,
+                    config=config,
+                    request_text=request_text,
+                    current_plan=current_plan,
+                )
+            dirty = True
+    drift_notice: dict[str, tuple[str, ...]] = {}
+    if reconcile:
+        payload, drift_notice, reconcile_changed = _reconcile_snapshot_fields(payload, config=config)
+        dirty = dirty or reconcile_changed
+    if refresh_advice:
+        payload, refresh_changed = _refresh_advice_fields(
+            payload,
+            config=config,
+            request_text=request_text,
+            current_plan=current_plan,
+        )
+        dirty = dirty or refresh_changed
+    return PlanRegistrySession(
+        config,
+        payload=payload,
+        drift_notice=drift_notice,
+        current_plan=current_plan,
+        dirty=dirty,
     )
-    selected_entry = None
-    if plan_id is not None:
-        selected_entry = _entry_by_plan_id(read_result.payload.get("plans") or (), plan_id)
-        if selected_entry is None:
-            raise PlanRegistryError(f"Unknown plan_id: {plan_id}")
-
-    return {
-        "status": "ready",
-        "registry_path": registry_relative_path(config),
-        "current_plan": current_plan.to_dict() if current_plan is not None else None,
-        "registry": _clone_registry(read_result.payload),
-        "drift_notice": {key: list(value) for key, value in read_result.drift_notice.items()},
-        "recommendations": [item.to_dict() for item in recommendations],
-        "selected_plan": selected_entry,
-        "execution_truth": {
-            "current_plan_is_machine_truth": True,
-            "registry_is_observe_only": True,
-        },
-    }
 
 
 def registry_path(config: RuntimeConfig) -> Path:
@@ -162,31 +322,47 @@ def read_plan_registry(
     backfill_if_missing: bool = False,
 ) -> PlanRegistryReadResult:
     """Read the registry and optionally reconcile deterministic fields."""
+    # Plain reads never write, so only the mutating variants serialize with
+    # concurrent sessions on the registry lock.
+    may_write = create_if_missing or reconcile or refresh_advice
+    lock = workspace_lock(config, PLAN_REGISTRY_LOCK) if may_write else nullcontext()
     try:
-        path = registry_path(config)
-        if not path.exists():
-            payload = _empty_registry()
-            if create_if_missing:
-                if backfill_if_missing:
-                    payload, _ = _backfill_missing_entries(payload, config=config, request_text=request_text)
+        with lock:
+            path = registry_path(config)
+            current_plan = StateStore(config).get_current_plan() if may_write else None
+            if not path.exists():
+                payload = _empty_registry()
+                if create_if_missing:
+                    if backfill_if_missing:
+                        payload, _ = _backfill_missing_entries(
+                            payload,
+                            config=config,
+                            request_text=request_text,
+                            current_plan=current_plan,
+                        )
+                    _write_registry(path, payload)
+                return PlanRegistryReadResult(payload=payload, drift_notice={})
+
+            payload = _read_registry(path)
+            drift_notice: dict[str, tuple[str, ...]] = {}
+            changed = False
+
+            if reconcile:
+                payload, drift_notice, reconcile_changed = _reconcile_snapshot_fields(payload, config=config)
+                changed = changed or reconcile_changed
+            if refresh_advice:
+                payload, refresh_changed = _refresh_advice_fields(
+                    payload,
+                    config=config,
+                    request_text=request_text,
+                    current_plan=current_plan,
+                )
+                changed = changed or refresh_changed
+
+            if changed:
                 _write_registry(path, payload)
-            return PlanRegistryReadResult(payload=payload, drift_notice={})
 
-        payload = _read_registry(path)
-        drift_notice: dict[str, tuple[str, ...]] = {}
-        changed = False
-
-        if reconcile:
-            payload, drift_notice, reconcile_changed = _reconcile_snapshot_fields(payload, config=config)
-            changed = changed or reconcile_changed
-        if refresh_advice:
-            payload, refresh_changed = _refresh_advice_fields(payload, config=config, request_text=request_text)
-            changed = changed or refresh_changed
-
-        if changed:
-            _write_registry(path, payload)
-
-        return PlanRegistryReadResult(payload=payload, drift_notice=drift_notice)
+            return PlanRegistryReadResult(payload=payload, drift_notice=drift_notice)
     except (OSError, YamlParseError, ValueError) as exc:
         raise PlanRegistryError(str(exc)) from exc
 
@@ -200,23 +376,25 @@ def upsert_plan_entry(
 ) -> Mapping[str, Any]:
     """Upsert one plan entry after create/finalize-adjacent events."""
     try:
-        read_result = read_plan_registry(
-            config,
-            create_if_missing=True,
-            backfill_if_missing=True,
-        )
-        payload = _clone_registry(read_result.payload)
-        entry = _build_entry(
-            artifact=artifact,
-            config=config,
-            existing_entries=tuple(payload.get("plans") or ()),
-            request_text=request_text,
-            existing_entry=_entry_by_plan_id(payload.get("plans") or (), artifact.plan_id),
-            source=source,
-        )
-        payload["plans"] = _replace_entry(payload.get("plans") or (), entry)
-        _write_registry(registry_path(config), payload)
-        return entry
+        with workspace_lock(config, PLAN_REGISTRY_LOCK):
+            read_result = read_plan_registry(
+                config,
+                create_if_missing=True,
+                backfill_if_missing=True,
+            )
+            payload = _clone_registry(read_result.payload)
+            entry = _build_entry(
+                artifact=artifact,
+                config=config,
+                existing_entries=tuple(payload.get("plans") or ()),
+                request_text=request_text,
+                existing_entry=_entry_by_plan_id(payload.get("plans") or (), artifact.plan_id),
+                source=source,
+                current_plan=StateStore(config).get_current_plan(),
+            )
+            payload["plans"] = _replace_entry(payload.get("plans") or (), entry)
+            _write_registry(registry_path(config), payload)
+            return entry
     except (OSError, YamlParseError, ValueError) as exc:
         raise PlanRegistryError(str(exc)) from exc
 
@@ -224,17 +402,18 @@ def upsert_plan_entry(
 def remove_plan_entry(*, config: RuntimeConfig, plan_id: str) -> bool:
     """Remove one active entry after finalize succeeds."""
     try:
-        path = registry_path(config)
-        if not path.exists():
-            return False
-        payload = _read_registry(path)
-        plans = list(payload.get("plans") or ())
-        filtered = [entry for entry in plans if str(entry.get("plan_id") or "") != plan_id]
-        if len(filtered) == len(plans):
-            return False
-        payload["plans"] = filtered
-        _write_registry(path, payload)
-        return True
+        with workspace_lock(config, PLAN_REGISTRY_LOCK):
+            path = registry_path(config)
+            if not path.exists():
+                return False
+            payload = _read_registry(path)
+            plans = list(payload.get("plans") or ())
+            filtered = [entry for entry in plans if str(entry.get("plan_id") or "") != plan_id]
+            if len(filtered) == len(plans):
+                return False
+            payload["plans"] = filtered
+            _write_registry(path, payload)
+            return True
     except (OSError, YamlParseError, ValueError) as exc:
         raise PlanRegistryError(str(exc)) from exc
 
@@ -269,44 +448,13 @@ def confirm_plan_priority(
     note: str | None = None,
 ) -> Mapping[str, Any]:
     """Persist a user-confirmed final priority without changing advice."""
-    normalized_priority = _normalize_priority_value(priority) or REGISTRY_PRIORITY_FALLBACK
-    try:
-        path = registry_path(config)
-        read_result = read_plan_registry(
-            config,
-            create_if_missing=True,
-            backfill_if_missing=True,
-            reconcile=True,
-        )
-        payload = _clone_registry(read_result.payload)
-        entry = _entry_by_plan_id(payload.get("plans") or (), plan_id)
-        if entry is None:
-            artifact = _artifact_by_plan_id(config=config, plan_id=plan_id)
-            if artifact is None:
-                raise PlanRegistryError(f"Unknown plan_id: {plan_id}")
-            entry = _build_entry(
-                artifact=artifact,
-                config=config,
-                existing_entries=tuple(payload.get("plans") or ()),
-                request_text=artifact.summary,
-                existing_entry=None,
-                source="runtime_backfill",
-            )
-        entry = _clone_entry(entry)
-        governance = _normalize_governance(entry.get("governance"))
-        governance["priority"] = normalized_priority
-        governance["priority_source"] = "user_confirmed"
-        governance["priority_confirmed_at"] = iso_now()
-        if note is not None:
-            governance["note"] = str(note)
-        entry["governance"] = governance
-        entry["meta"] = _normalize_meta(entry.get("meta"), source=str(entry.get("meta", {}).get("source") or "runtime_auto"))
-        entry["meta"]["updated_at"] = iso_now()
-        payload["plans"] = _replace_entry(payload.get("plans") or (), entry)
-        _write_registry(path, payload)
-        return entry
-    except (OSError, YamlParseError, ValueError) as exc:
-        raise PlanRegistryError(str(exc)) from exc
+    with plan_registry_session(
+        config,
+        create_if_missing=True,
+        backfill_if_missing=True,
+        refresh_advice=False,
+    ) as session:
+        return session.confirm_priority(plan_id=plan_id, priority=priority, note=note)
 
 
 def recommend_plan_candidates(
@@ -315,18 +463,42 @@ def recommend_plan_candidates(
     request_text: str = "",
 ) -> tuple[PlanRegistryRecommendation, ...]:
     """Return read-only plan ranking suggestions with explanations."""
-    read_result = read_plan_registry(
-        config,
-        reconcile=True,
-        refresh_advice=True,
-        request_text=request_text,
-        create_if_missing=False,
-        backfill_if_missing=False,
-    )
-    current_plan = StateStore(config).get_current_plan()
-    recommendations: list[PlanRegistryRecommendation] = []
+    with plan_registry_session(config, request_text=request_text) as session:
+        return session.recommendations()
+
 
-    for entry in read_result.payload.get("plans") or ():
+def priority_note_for_plan(*, config: RuntimeConfig, plan_id: str, language: str) -> str | None:
+    """Render a user-facing priority hint line for output summaries."""
+    with plan_registry_session(config, refresh_advice=False) as session:
+        return session.priority_note(plan_id, language=language)
+
+
+def _priority_note_for_entry(entry: Mapping[str, Any] | None, *, language: str) -> str | None:
+    if entry is None:
+        return None
+    governance = _normalize_governance(entry.get("governance"))
+    advice = _normalize_advice(entry.get("advice"))
+    confirmed_priority = str(governance.get("priority") or "").strip()
+    if governance.get("priority_source") == "user_confirmed" and confirmed_priority:
+        if language == "en-US":
+            return f"Priority: {confirmed_priority} (user confirmed)"
+        return f"优先级: {confirmed_priority}（用户已确认）"
+
+    suggested_priority = str(advice.get("suggested_priority") or "").strip()
+    if suggested_priority:
+        if language == "en-US":
+            return f"Priority: suggested {suggested_priority} (pending user confirmation)"
+        return f"优先级: 建议 {suggested_priority}（待用户确认）"
+    return None
+
+
+def _recommendations_from_payload(
+    payload: Mapping[str, Any],
+    *,
+    current_plan: PlanArtifact | None,
+) -> tuple[PlanRegistryRecommendation, ...]:
+    recommendations: list[PlanRegistryRecommendation] = []
+    for entry in payload.get("plans") or ():
         plan_id = str(entry.get("plan_id") or "")
         snapshot = _normalize_snapshot(entry.get("snapshot"))
         governance = _normalize_governance(entry.get("governance"))
@@ -379,27 +551,6 @@ def recommend_plan_candidates(
     return tuple(sorted(recommendations, key=_recommendation_sort_key))
 
 
-def priority_note_for_plan(*, config: RuntimeConfig, plan_id: str, language: str) -> str | None:
-    """Render a user-facing priority hint line for output summaries."""
-    result = get_plan_entry(config=config, plan_id=plan_id, reconcile=True, refresh_advice=False)
-    if result.entry is None:
-        return None
-    governance = _normalize_governance(result.entry.get("governance"))
-    advice = _normalize_advice(result.entry.get("advice"))
-    confirmed_priority = str(governance.get("priority") or "").strip()
-    if governance.get("priority_source") == "user_confirmed" and confirmed_priority:
-        if language == "en-US":
-            return f"Priority: {confirmed_priority} (user confirmed)"
-        return f"优先级: {confirmed_priority}（用户已确认）"
-
-    suggested_priority = str(advice.get("suggested_priority") or "").strip()
-    if suggested_priority:
-        if language == "en-US":
-            return f"Priority: suggested {suggested_priority} (pending user confirmation)"
-        return f"优先级: 建议 {suggested_priority}（待用户确认）"
-    return None
-
-
 def _recommendation_sort_key(item: PlanRegistryRecommendation) -> tuple[int, int, int, int, str]:
     current_rank = 0 if item.is_current_plan and item.status not in {"done", "archived"} else 1
     status_rank = 1 if item.status in {"blocked", "done", "archived"} else 0
@@ -602,6 +753,8 @@ def _build_entry(
     request_text: str,
     existing_entry: Mapping[str, Any] | None,
     source: str,
+    current_plan: PlanArtifact | None,
+    index: "_AdviceIndex | None" = None,
 ) -> dict[str, Any]:
     snapshot = _snapshot_from_artifact(artifact=artifact, config=config)
     governance = _normalize_governance(existing_entry.get("governance") if existing_entry else None)
@@ -611,8 +764,8 @@ def _build_entry(
             plan_id=artifact.plan_id,
             snapshot=snapshot,
             request_text=request_text,
-            existing_entries=existing_entries,
-            current_plan=StateStore(config).get_current_plan(),
+            index=index if index is not None else _AdviceIndex(existing_entries),
+            current_plan=current_plan,
         ),
     )
     meta = _normalize_meta(existing_entry.get("meta") if existing_entry else None, source=source)
@@ -651,17 +804,26 @@ def _reconcile_snapshot_fields(
     drift_notice: dict[str, tuple[str, ...]] = {}
     changed = False
     reconciled: list[dict[str, Any]] = []
+    catalog = load_plan_catalog(config)
+    # The catalog was just revalidated, so one identity map serves the pass.
+    plan_dirs = catalog.plan_dirs_by_id()
 
     for raw_entry in cloned.get("plans") or ():
         entry = _clone_entry(raw_entry)
         plan_id = str(entry.get("plan_id") or "")
         existing_snapshot = _normalize_snapshot(entry.get("snapshot"))
-        plan_dir = _resolve_plan_dir(config=config, plan_id=plan_id, snapshot=existing_snapshot)
+        plan_dir = _resolve_plan_dir(
+            config=config,
+            plan_id=plan_id,
+            snapshot=existing_snapshot,
+            catalog=catalog,
+            plan_dirs=plan_dirs,
+        )
         if plan_dir is None:
             reconciled.append(entry)
             continue
 
-        actual_snapshot = _load_plan_snapshot(plan_dir, config=config)
+        actual_snapshot = _load_plan_snapshot(plan_dir, config=config, catalog=catalog)
         if actual_snapshot is None:
             reconciled.append(entry)
             continue
@@ -689,9 +851,12 @@ def _refresh_advice_fields(
     *,
     config: RuntimeConfig,
     request_text: str,
+    current_plan: PlanArtifact | None,
 ) -> tuple[dict[str, Any], bool]:
     cloned = _clone_registry(payload)
-    current_plan = StateStore(config).get_current_plan()
+    # Advice only reads snapshots, which refresh never changes, so one index
+    # serves every entry of the pass.
+    index = _AdviceIndex(cloned.get("plans") or ())
     changed = False
     refreshed: list[dict[str, Any]] = []
 
@@ -706,7 +871,7 @@ def _refresh_advice_fields(
                 plan_id=plan_id,
                 snapshot=snapshot,
                 request_text=request_text,
-                existing_entries=tuple(cloned.get("plans") or ()),
+                index=index,
                 current_plan=current_plan,
             ),
         )
@@ -725,18 +890,20 @@ def _backfill_missing_entries(
     *,
     config: RuntimeConfig,
     request_text: str,
+    current_plan: PlanArtifact | None,
 ) -> tuple[dict[str, Any], bool]:
     cloned = _clone_registry(payload)
     known_plan_ids = {str(entry.get("plan_id") or "") for entry in cloned.get("plans") or ()}
+    index = _AdviceIndex(cloned.get("plans") or ())
     changed = False
 
-    if not config.plan_root.exists():
-        return cloned, changed
-
-    for plan_dir in sorted(config.plan_root.iterdir()):
-        if not plan_dir.is_dir():
+    catalog = load_plan_catalog(config)
+    for catalog_entry in catalog.entries():
+        # Known plans are skipped on their catalog identity without parsing.
+        revalidated = catalog.entry(catalog_entry.dir_name)
+        if revalidated is None or not revalidated.valid or revalidated.plan_id in known_plan_ids:
             continue
-        artifact = _artifact_from_plan_dir(plan_dir, config=config)
+        artifact = _artifact_from_plan_dir(catalog.plan_dir(revalidated.dir_name), config=config, catalog=catalog)
         if artifact is None or artifact.plan_id in known_plan_ids:
             continue
         entry = _build_entry(
@@ -746,8 +913,11 @@ def _backfill_missing_entries(
             request_text=request_text or artifact.summary,
             existing_entry=None,
             source="runtime_backfill",
+            current_plan=current_plan,
+            index=index,
         )
         cloned["plans"] = _replace_entry(cloned.get("plans") or (), entry)
+        index.add(entry)
         known_plan_ids.add(artifact.plan_id)
         changed = True
 
@@ -759,13 +929,13 @@ def _suggest_advice(
     plan_id: str,
     snapshot: Mapping[str, Any],
     request_text: str,
-    existing_entries: Sequence[Mapping[str, Any]],
+    index: "_AdviceIndex",
     current_plan: PlanArtifact | None,
 ) -> dict[str, Any]:
     reasons: list[str] = []
     normalized_request = _normalize_text(request_text)
 
-    if _has_duplicate_plan(plan_id=plan_id, snapshot=snapshot, existing_entries=existing_entries):
+    if index.has_duplicate(plan_id=plan_id, snapshot=snapshot):
         suggested_priority = "p3"
         reasons.append("与已有 active plan 主题接近，建议先复用或合并")
     elif _has_urgent_signal(normalized_request):
@@ -775,7 +945,7 @@ def _suggest_advice(
         suggested_priority = "p3"
         reasons.append("当前 active plan 未完成")
         reasons.append("新 plan 暂不建议直接抢占执行顺序")
-    elif _active_plan_count(existing_entries=existing_entries, excluding_plan_id=plan_id) >= 3:
+    elif index.active_count(excluding_plan_id=plan_id) >= 3:
         suggested_priority = "p3"
         reasons.append("当前活动 plan 较多，建议先收口存量")
     else:
@@ -811,24 +981,51 @@ def _advice_identity(advice: Mapping[str, Any]) -> tuple[str | None, str, tuple[
     )
 
 
-def _has_duplicate_plan(
-    *,
-    plan_id: str,
-    snapshot: Mapping[str, Any],
-    existing_entries: Sequence[Mapping[str, Any]],
-) -> bool:
-    topic_key = str(snapshot.get("topic_key") or "").strip()
-    title = _normalize_text(str(snapshot.get("title") or ""))
-    for entry in existing_entries:
-        existing_plan_id = str(entry.get("plan_id") or "")
-        if not existing_plan_id or existing_plan_id == plan_id:
-            continue
-        existing_snapshot = _normalize_snapshot(entry.get("snapshot"))
-        if topic_key and topic_key == str(existing_snapshot.get("topic_key") or "").strip():
-            return True
-        if title and title == _normalize_text(str(existing_snapshot.get("title") or "")):
+class _AdviceIndex:
+    """Topic-key / title hash maps and active counts over registry entries.
+
+    Built once per pass so duplicate detection and the active-plan count are
+    dictionary reads instead of a rescan of every entry per plan.
+    """
+
+    def __init__(self, entries: Sequence[Mapping[str, Any]] = ()) -> None:
+        self._topic_keys: dict[str, set[str]] = {}
+        self._titles: dict[str, set[str]] = {}
+        self._active: Counter[str] = Counter()
+        self._active_total = 0
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: Mapping[str, Any]) -> None:
+        plan_id = str(entry.get("plan_id") or "")
+        if not plan_id:
+            return
+        snapshot = _normalize_snapshot(entry.get("snapshot"))
+        topic_key = str(snapshot.get("topic_key") or "").strip()
+        if topic_key:
+            self._topic_keys.setdefault(topic_key, set()).add(plan_id)
+        title = _normalize_text(str(snapshot.get("title") or ""))
+        if title:
+            self._titles.setdefault(title, set()).add(plan_id)
+        if snapshot.get("lifecycle_state") != "archived":
+            self._active[plan_id] += 1
+            self._active_total += 1
+
+    def has_duplicate(self, *, plan_id: str, snapshot: Mapping[str, Any]) -> bool:
+        topic_key = str(snapshot.get("topic_key") or "").strip()
+        if topic_key and _has_other_plan(self._topic_keys.get(topic_key), plan_id):
             return True
-    return False
+        title = _normalize_text(str(snapshot.get("title") or ""))
+        return bool(title) and _has_other_plan(self._titles.get(title), plan_id)
+
+    def active_count(self, *, excluding_plan_id: str) -> int:
+        return self._active_total - self._active[excluding_plan_id]
+
+
+def _has_other_plan(plan_ids: set[str] | None, plan_id: str) -> bool:
+    if not plan_ids:
+        return False
+    return len(plan_ids) > 1 or plan_id not in plan_ids
 
 
 def _has_urgent_signal(normalized_request: str) -> bool:
@@ -837,30 +1034,19 @@ def _has_urgent_signal(normalized_request: str) -> bool:
     return any(pattern.search(normalized_request) is not None for pattern in _URGENT_PATTERNS)
 
 
-def _active_plan_count(*, existing_entries: Sequence[Mapping[str, Any]], excluding_plan_id: str) -> int:
-    count = 0
-    for entry in existing_entries:
-        plan_id = str(entry.get("plan_id") or "")
-        if not plan_id or plan_id == excluding_plan_id:
-            continue
-        snapshot = _normalize_snapshot(entry.get("snapshot"))
-        if snapshot.get("lifecycle_state") == "archived":
-            continue
-        count += 1
-    return count
-
-
 def _resolve_plan_dir(
     *,
     config: RuntimeConfig,
     plan_id: str,
     snapshot: Mapping[str, Any],
+    catalog: PlanCatalog | None = None,
+    plan_dirs: Mapping[str, Path] | None = None,
 ) -> Path | None:
     declared_path = str(snapshot.get("path") or "").strip()
     if declared_path:
         candidate = config.workspace_root / declared_path
         if candidate.exists() and candidate.is_dir():
-            identity = _load_plan_identity(candidate)
+            identity = _plan_identity(candidate, config=config, catalog=catalog)
             if identity == plan_id:
                 return candidate
 
@@ -868,33 +1054,36 @@ def _resolve_plan_dir(
     if default_candidate.exists() and default_candidate.is_dir():
         return default_candidate
 
+    if plan_dirs is not None:
+        return plan_dirs.get(plan_id)
     if not config.plan_root.exists():
         return None
-    for plan_dir in config.plan_root.iterdir():
-        if not plan_dir.is_dir():
-            continue
-        if _load_plan_identity(plan_dir) == plan_id:
-            return plan_dir
-    return None
+    catalog = catalog if catalog is not None else load_plan_catalog(config)
+    matches = catalog.dirs_for_plan_id(plan_id)
+    return matches[0] if matches else None
 
 
 def _artifact_by_plan_id(*, config: RuntimeConfig, plan_id: str) -> PlanArtifact | None:
-    for plan_dir in sorted(config.plan_root.iterdir()) if config.plan_root.exists() else ():
-        if not plan_dir.is_dir():
-            continue
-        artifact = _artifact_from_plan_dir(plan_dir, config=config)
+    catalog = load_plan_catalog(config)
+    for plan_dir in catalog.dirs_for_plan_id(plan_id):
+        artifact = _artifact_from_plan_dir(plan_dir, config=config, catalog=catalog)
         if artifact is not None and artifact.plan_id == plan_id:
             return artifact
     return None
 
 
-def _artifact_from_plan_dir(plan_dir: Path, *, config: RuntimeConfig) -> PlanArtifact | None:
+def _artifact_from_plan_dir(
+    plan_dir: Path,
+    *,
+    config: RuntimeConfig,
+    catalog: PlanCatalog | None = None,
+) -> PlanArtifact | None:
     plan_document = _load_plan_document(plan_dir)
     if plan_document is None:
         return None
     metadata_path, metadata, body = plan_document
     plan_id = str(metadata.get("plan_id") or plan_dir.name)
-    snapshot = _load_plan_snapshot(plan_dir, config=config)
+    snapshot = _load_plan_snapshot(plan_dir, config=config, catalog=catalog)
     if snapshot is None:
         return None
     title = str(snapshot.get("title") or plan_id)
@@ -912,7 +1101,17 @@ def _artifact_from_plan_dir(plan_dir: Path, *, config: RuntimeConfig) -> PlanArt
     )
 
 
-def _load_plan_snapshot(plan_dir: Path, *, config: RuntimeConfig) -> dict[str, Any] | None:
+def _load_plan_snapshot(
+    plan_dir: Path,
+    *,
+    config: RuntimeConfig,
+    catalog: PlanCatalog | None = None,
+) -> dict[str, Any] | None:
+    if catalog is not None and plan_dir.parent == config.plan_root:
+        catalog_entry = catalog.entry(plan_dir.name)
+        if catalog_entry is None or not catalog_entry.valid:
+            return None
+        return _snapshot_from_catalog_entry(catalog_entry, plan_dir=plan_dir, config=config)
     plan_document = _load_plan_document(plan_dir)
     if plan_document is None:
         return None
@@ -936,18 +1135,43 @@ def _load_plan_snapshot(plan_dir: Path, *, config: RuntimeConfig) -> dict[str, A
     }
 
 
+def _snapshot_from_catalog_entry(entry: PlanCatalogEntry, *, plan_dir: Path, config: RuntimeConfig) -> dict[str, Any]:
+    # Same derivation as the parsing branch of `_load_plan_snapshot`, fed by
+    # the catalog's cached front matter instead of re-reading the document.
+    title = _normalize_title(entry.title or entry.plan_id)
+    level = entry.field("level") or ("light" if entry.metadata_file == "plan.md" else "standard")
+    if level not in _SUPPORTED_PLAN_LEVELS:
+        level = "standard"
+    lifecycle_state = entry.field("lifecycle_state") or "active"
+    if lifecycle_state not in _SUPPORTED_LIFECYCLE_STATES:
+        lifecycle_state = "active"
+    return {
+        "path": str(plan_dir.relative_to(config.workspace_root)),
+        "title": title,
+        "level": level,
+        "topic_key": entry.field("topic_key") or entry.field("feature_key") or _slugify(title),
+        "lifecycle_state": lifecycle_state,
+        "created_at": entry.field("created_at") or entry.metadata_created_at,
+    }
+
+
 def _load_plan_document(plan_dir: Path) -> tuple[Path, Mapping[str, Any], str] | None:
     metadata_path = _pick_metadata_file(plan_dir)
     if metadata_path is None:
         return None
     raw_text = metadata_path.read_text(encoding="utf-8")
-    match = _FRONT_MATTER_RE.match(raw_text)
-    if match is None:
-        return None
-    metadata = load_yaml(match.group("front"))
-    if not isinstance(metadata, Mapping):
+    plan_document = load_front_matter(raw_text)
+    if plan_document is None:
         return None
-    return metadata_path, metadata, match.group("body")
+    metadata, body = plan_document
+    return metadata_path, metadata, body
+
+
+def _plan_identity(plan_dir: Path, *, config: RuntimeConfig, catalog: PlanCatalog | None) -> str | None:
+    if catalog is not None and plan_dir.parent == config.plan_root:
+        catalog_entry = catalog.entry(plan_dir.name)
+        return catalog_entry.plan_id if catalog_entry is not None and catalog_entry.valid else None
+    return _load_plan_identity(plan_dir)
 
 
 def _load_plan_identity(plan_dir: Path) -> str | None:
@@ -6,16 +6,16 @@ from datetime import datetime, timezone
 from hashlib import sha1
 from pathlib import Path
 import re
-from typing import Iterable, List, Mapping, Sequence
+from typing import Iterable, List, Sequence
 
-from ._yaml import YamlParseError, load_yaml
+from ._yaml import load_front_matter
 from .decision import option_by_id
 from .knowledge_sync import render_knowledge_sync_front_matter
 from .models import DecisionState, PlanArtifact, RuntimeConfig
+from .plan_catalog import PlanCatalogEntry, load_plan_catalog, refresh_plan_catalog_entry
 from .plan_registry import PlanRegistryError, upsert_plan_entry
 from .state import iso_now
 
-_FRONT_MATTER_RE = re.compile(r"\A---\n(?P<front>.*?)\n---\n(?P<body>.*)\Z", re.DOTALL)
 _PLAN_REFERENCE_RE = re.compile(r"(?P<plan_id>\d{8}_[a-z0-9][a-z0-9_.-]*)", re.IGNORECASE)
 _EXPLICIT_NEW_PLAN_PATTERNS = (
     re.compile(r"\bnew\s+plan\b", re.IGNORECASE),
@@ -123,6 +123,7 @@ def create_plan_scaffold(
         created_at=iso_now(),
         topic_key=resolved_topic_key,
     )
+    refresh_plan_catalog_entry(config, plan_dir)
     try:
         upsert_plan_entry(
             config=config,
@@ -219,20 +220,17 @@ def find_plan_by_request_reference(request_text: str, *, config: RuntimeConfig)
 
 
 def find_plan_by_topic_key(topic_key: str, *, config: RuntimeConfig) -> PlanArtifact | None:
-    matches: list[PlanArtifact] = []
-    plan_root = config.plan_root
-    if not plan_root.exists():
+    if not config.plan_root.exists():
         return None
-    for plan_dir in sorted(plan_root.iterdir()):
-        artifact = load_plan_artifact(plan_dir, config=config)
-        if artifact is None:
-            continue
-        candidate_topic_key = artifact.topic_key or derive_topic_key(artifact.title)
-        if candidate_topic_key == topic_key:
-            matches.append(artifact)
-            if len(matches) > 1:
-                return None
-    return matches[0] if len(matches) == 1 else None
+    matches = load_plan_catalog(config).lookup("scaffold_topic_key", _catalog_topic_key, topic_key)
+    if len(matches) != 1:
+        return None
+    return load_plan_artifact(matches[0], config=config)
+
+
+def _catalog_topic_key(entry: PlanCatalogEntry) -> str:
+    # Mirrors `load_plan_artifact(...).topic_key` without parsing the plan.
+    return entry.field("topic_key") or entry.field("feature_key") or derive_topic_key(entry.title or entry.plan_id)
 
 
 def load_plan_artifact(plan_dir: Path, *, config: RuntimeConfig) -> PlanArtifact | None:
@@ -243,9 +241,10 @@ def load_plan_artifact(plan_dir: Path, *, config: RuntimeConfig) -> PlanArtifact
     if metadata_path is None:
         return None
 
-    metadata, body = _load_plan_metadata(metadata_path)
-    if metadata is None:
+    plan_document = load_front_matter(metadata_path.read_text(encoding="utf-8"))
+    if plan_document is None:
         return None
+    metadata, body = plan_document
 
     plan_id = str(metadata.get("plan_id") or plan_dir.name)
     level = str(metadata.get("level") or ("light" if metadata_path.name == "plan.md" else "standard"))
@@ -417,22 +416,6 @@ def _pick_metadata_file(plan_dir: Path) -> Path | None:
     return None
 
 
-def _load_plan_metadata(metadata_path: Path) -> tuple[Mapping[str, object] | None, str]:
-    raw_text = metadata_path.read_text(encoding="utf-8")
-    match = _FRONT_MATTER_RE.match(raw_text)
-    if match is None:
-        return None, raw_text
-    front_matter = match.group("front")
-    body = match.group("body")
-    try:
-        metadata = load_yaml(front_matter)
-    except YamlParseError:
-        return None, body
-    if not isinstance(metadata, Mapping):
-        return None, body
-    return metadata, body
-
-
 def _collect_plan_files(plan_dir: Path) -> list[Path]:
     collected: list[Path] = []
     for child in sorted(plan_dir.iterdir()):
@@ -1,14 +1,35 @@
-"""Replay writer for Sopify runtime."""
+"""Replay writer for Sopify runtime.
+
+Each session directory keeps the append-only `events.jsonl` next to an offset
+index sidecar: `events.idx` holds one 8-byte start offset per event and
+`events.index.json` records how many bytes of the log are indexed plus what
+the last `render_timeline` call wrote. The index is caught up lazily by
+scanning only the bytes appended since, so paging and tailing the timeline
+never parse earlier events, and re-rendering appends only the new sections.
+Read APIs (`load_events`, `event_count`, `page_events`, ...) therefore create
+the sidecars too, not only writes.
+
+Replay retention (`runtime/replay_retention.py`) may compact an idle session
+to `events.jsonl.gz`; the next write to that session restores the log first.
+It may also rotate a large live log into numbered `events.NNNN.jsonl.gz`
+segments; readers chain those segments ahead of `events.jsonl`, and the index
+caches their event count keyed by the segments' stat signatures.
+"""
 
 from __future__ import annotations
 
+from array import array
+import gzip
+from itertools import islice
 import json
 from pathlib import Path
 import re
 from tempfile import NamedTemporaryFile
-from typing import Any, Iterable, Mapping, Optional
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
+from .cache import path_signature, read_cache_payload, write_cache_payload
 from .develop_quality import DEVELOP_REVIEW_STAGES, extract_develop_quality_context, extract_develop_quality_result
+from .locking import REPLAY_LOCK, workspace_lock
 from .models import DecisionCheckpoint, DecisionOption, DecisionState, PlanArtifact, ReplayEvent, RouteDecision, RunState, RuntimeConfig
 
 _SENSITIVE_PATTERNS = (
@@ -16,6 +37,16 @@ _SENSITIVE_PATTERNS = (
     re.compile(r"(?i)\bBearer\s+[A-Za-z0-9._\-+/=]+"),
 )
 
+REPLAY_EVENTS_FILENAME = "events.jsonl"
+REPLAY_COMPACTED_EVENTS_FILENAME = "events.jsonl.gz"
+REPLAY_INDEX_FILENAME = "events.index.json"
+REPLAY_OFFSETS_FILENAME = "events.idx"
+REPLAY_SEGMENT_PATTERN = re.compile(r"^events\.(\d{4,})\.jsonl\.gz$")
+REPLAY_INDEX_SCHEMA_VERSION = "1"
+_OFFSET_TYPECODE = "q"
+_OFFSET_BYTES = array(_OFFSET_TYPECODE).itemsize
+_HIGHLIGHTS_HEADING = "\n## Highlights\n"
+
 
 class ReplayWriter:
     """Append-only replay session writer."""
@@ -25,44 +56,161 @@ class ReplayWriter:
 
     def ensure_session(self, run_id: str) -> Path:
         session_dir = self.config.replay_root / run_id
-        session_dir.mkdir(parents=True, exist_ok=True)
         events_path = session_dir / "events.jsonl"
         session_path = session_dir / "session.md"
         breakdown_path = session_dir / "breakdown.md"
-        if not events_path.exists():
-            events_path.write_text("", encoding="utf-8")
-        if not session_path.exists():
-            session_path.write_text("# Session\n", encoding="utf-8")
-        if not breakdown_path.exists():
-            breakdown_path.write_text("# Breakdown\n", encoding="utf-8")
+        with workspace_lock(self.config, REPLAY_LOCK):
+            session_dir.mkdir(parents=True, exist_ok=True)
+            if not events_path.exists():
+                _restore_compacted_events(session_dir)
+            if not events_path.exists():
+                events_path.write_text("", encoding="utf-8")
+            if not session_path.exists():
+                session_path.write_text("# Session\n", encoding="utf-8")
+            if not breakdown_path.exists():
+                breakdown_path.write_text("# Breakdown\n", encoding="utf-8")
         return session_dir
 
     def append_event(self, run_id: str, event: ReplayEvent) -> Path:
-        session_dir = self.ensure_session(run_id)
-        events_path = session_dir / "events.jsonl"
         payload = event.to_dict()
         payload["key_output"] = _redact_text(payload["key_output"])
         payload["decision_reason"] = _redact_text(payload["decision_reason"])
         payload["risk"] = _redact_text(payload["risk"])
         payload["highlights"] = [_redact_text(str(item)) for item in payload.get("highlights", ())]
-        with events_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        # Held across the append so a retention pass never rotates or
+        # compacts the log between `ensure_session` and the write.
+        with workspace_lock(self.config, REPLAY_LOCK):
+            session_dir = self.ensure_session(run_id)
+            with (session_dir / "events.jsonl").open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
         return session_dir
 
     def load_events(self, run_id: str) -> list[ReplayEvent]:
-        """Load the persisted replay timeline for re-rendering session documents."""
+        """Load the persisted replay timeline for re-rendering session documents.
+
+        Like `event_count` and `page_events`, this catches up (and on first use
+        creates) the `events.idx` / `events.index.json` sidecars.
+        """
+        return list(self.iter_events(run_id))
+
+    def iter_events(self, run_id: str, *, start: int = 0, stop: Optional[int] = None) -> Iterator[ReplayEvent]:
+        """Stream events `[start, stop)` of the timeline without reading earlier lines.
+
+        An open-ended read also yields a final line that is complete JSON but
+        not yet newline-terminated; it is indexed once the newline lands.
+        """
         session_dir = self.ensure_session(run_id)
-        events_path = session_dir / "events.jsonl"
-        events: list[ReplayEvent] = []
-        for raw_line in events_path.read_text(encoding="utf-8").splitlines():
-            line = raw_line.strip()
-            if not line:
-                continue
-            payload = json.loads(line)
-            if not isinstance(payload, Mapping):
-                continue
-            events.append(ReplayEvent.from_dict(payload))
-        return events
+        index = _ReplayIndex(session_dir)
+        start = max(start, 0)
+        archived = index.archived_count()
+        if start < archived:
+            archived_stop = archived if stop is None else min(stop, archived)
+            for line in islice(_iter_segment_lines(index.segment_paths()), start, archived_stop):
+                payload = json.loads(line)
+                if isinstance(payload, Mapping):
+                    yield ReplayEvent.from_dict(payload)
+        if stop is not None and stop <= archived:
+            return
+        live_start = max(start - archived, 0)
+        span = index.span(live_start, None if stop is None else stop - archived)
+        if span is not None:
+            first_offset, remaining = span
+            with index.events_path.open("rb") as handle:
+                # Events are contiguous lines, so one seek reaches the whole span.
+                handle.seek(first_offset)
+                while remaining:
+                    raw_line = handle.readline()
+                    if not raw_line:
+                        break
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    remaining -= 1
+                    payload = json.loads(line)
+                    if isinstance(payload, Mapping):
+                        yield ReplayEvent.from_dict(payload)
+        if stop is None and live_start <= index.sync():
+            payload = index.unterminated_payload()
+            if isinstance(payload, Mapping):
+                yield ReplayEvent.from_dict(payload)
+
+    def event_count(self, run_id: str) -> int:
+        return _ReplayIndex(self.ensure_session(run_id)).total()
+
+    def page_events(self, run_id: str, *, start: int = 0, limit: int = 50) -> list[ReplayEvent]:
+        """Return one page of the timeline, oldest first."""
+        return list(self.iter_events(run_id, start=max(start, 0), stop=max(start, 0) + max(limit, 0)))
+
+    def tail_events(self, run_id: str, count: int = 20) -> list[ReplayEvent]:
+        """Return the latest `count` events, oldest first."""
+        count = max(count, 0)
+        total = self.event_count(run_id)
+        events = list(self.iter_events(run_id, start=max(total - count, 0)))
+        # An unterminated last event is read but not counted by the index.
+        return events[max(len(events) - count, 0):]
+
+    def render_timeline(
+        self,
+        run_id: str,
+        *,
+        run_state: Optional[RunState],
+        route: RouteDecision,
+        plan_artifact: Optional[PlanArtifact],
+    ) -> Path:
+        """Render the documents for the whole persisted timeline.
+
+        When both documents are still exactly what the previous call wrote, only
+        events appended since are rendered: their breakdown sections are
+        appended and their timeline/highlight lines spliced into `session.md`.
+        Anything else (first render, `render_documents` output, manual edits)
+        falls back to one streaming pass over `events.jsonl`.
+        """
+        session_dir = self.ensure_session(run_id)
+        index = _ReplayIndex(session_dir)
+        total = index.total()
+        session_path = session_dir / "session.md"
+        breakdown_path = session_dir / "breakdown.md"
+        header = _render_session_header(run_state, route, plan_artifact)
+        rendered = index.rendered_state(session_path=session_path, breakdown_path=breakdown_path)
+
+        if rendered is not None and 0 < rendered["events"] <= total:
+            done = rendered["events"]
+            old_session = session_path.read_bytes()
+            timeline_end = rendered["header_bytes"] + rendered["timeline_bytes"]
+            highlights_start = timeline_end + len(_HIGHLIGHTS_HEADING.encode("utf-8"))
+            timeline = old_session[rendered["header_bytes"]:timeline_end].decode("utf-8")
+            highlights = old_session[highlights_start:highlights_start + rendered["highlights_bytes"]].decode("utf-8")
+            sections: list[str] = []
+            for number, event in enumerate(self.iter_events(run_id, start=done), start=done + 1):
+                timeline += _render_timeline_line(event)
+                highlights += _render_highlight_lines(event)
+                sections.append(_render_breakdown_section(number, event))
+            if sections:
+                with breakdown_path.open("a", encoding="utf-8") as handle:
+                    handle.write("".join(sections))
+            rendered_events = done + len(sections)
+        else:
+            timeline = ""
+            highlights = ""
+            sections = []
+            for number, event in enumerate(self.iter_events(run_id), start=1):
+                timeline += _render_timeline_line(event)
+                highlights += _render_highlight_lines(event)
+                sections.append(_render_breakdown_section(number, event))
+            self._write_atomic(breakdown_path, _join_breakdown_sections(sections))
+            rendered_events = len(sections)
+
+        self._write_atomic(session_path, _join_session_markdown(header, timeline, highlights))
+        index.record_render(
+            # May include an unterminated last event that `total` does not count yet.
+            events=rendered_events,
+            header_bytes=len(header.encode("utf-8")),
+            timeline_bytes=len(timeline.encode("utf-8")),
+            highlights_bytes=len(highlights.encode("utf-8")),
+            session_path=session_path,
+            breakdown_path=breakdown_path,
+        )
+        return session_dir
 
     def render_documents(
         self,
@@ -83,6 +231,7 @@ class ReplayWriter:
             session_dir / "breakdown.md",
             _render_breakdown_markdown(events_list),
         )
+        _ReplayIndex(session_dir).forget_render()
         return session_dir
 
     def _write_atomic(self, path: Path, content: str) -> None:
@@ -92,6 +241,191 @@ class ReplayWriter:
         temp_path.replace(path)
 
 
+class _ReplayIndex:
+    """Offset index sidecar of one session's `events.jsonl`."""
+
+    def __init__(self, session_dir: Path) -> None:
+        self.session_dir = session_dir
+        self.events_path = session_dir / "events.jsonl"
+        self.offsets_path = session_dir / REPLAY_OFFSETS_FILENAME
+        self.state_path = session_dir / REPLAY_INDEX_FILENAME
+        self._state = read_cache_payload(self.state_path, schema_version=REPLAY_INDEX_SCHEMA_VERSION) or {}
+
+    def sync(self) -> int:
+        """Index complete lines appended since the last sync; return the event count."""
+        try:
+            stat = self.events_path.stat()
+        except OSError:
+            return 0
+        indexed_bytes = _int_field(self._state, "indexed_bytes")
+        count = _int_field(self._state, "events")
+        if (
+            self._state.get("inode") != stat.st_ino
+            or indexed_bytes > stat.st_size
+            or _file_size(self.offsets_path) != count * _OFFSET_BYTES
+        ):
+            # Rewritten or truncated log, or a torn sidecar: index from scratch.
+            # The rotated-segment count describes other files and survives.
+            indexed_bytes = 0
+            count = 0
+            self._state = {key: self._state[key] for key in ("segments", "archived_events") if key in self._state}
+        if indexed_bytes == stat.st_size and "inode" in self._state:
+            return count
+
+        new_offsets = array(_OFFSET_TYPECODE)
+        position = indexed_bytes
+        with self.events_path.open("rb") as handle:
+            handle.seek(indexed_bytes)
+            for raw_line in handle:
+                if not raw_line.endswith(b"\n"):
+                    # A line still being written is indexed on a later sync.
+                    break
+                if raw_line.strip():
+                    new_offsets.append(position)
+                position += len(raw_line)
+        try:
+            with self.offsets_path.open("ab" if count else "wb") as handle:
+                new_offsets.tofile(handle)
+        except OSError:
+            return count + len(new_offsets)
+        count += len(new_offsets)
+        self._state.update(
+            {
+                "schema_version": REPLAY_INDEX_SCHEMA_VERSION,
+                "inode": stat.st_ino,
+                "indexed_bytes": position,
+                "events": count,
+            }
+        )
+        self._state.setdefault("rendered", None)
+        write_cache_payload(self.state_path, self._state)
+        return count
+
+    def unterminated_payload(self) -> Any:
+        """Parse the final line when it is complete JSON still missing its newline."""
+        try:
+            with self.events_path.open("rb") as handle:
+                handle.seek(_int_field(self._state, "indexed_bytes"))
+                tail = handle.read()
+        except OSError:
+            return None
+        if b"\n" in tail or not tail.strip():
+            return None
+        try:
+            return json.loads(tail)
+        except ValueError:
+            # Still being written; it shows up once complete.
+            return None
+
+    def total(self) -> int:
+        """Return the event count of the rotated segments plus the live log."""
+        return self.archived_count() + self.sync()
+
+    def segment_paths(self) -> list[Path]:
+        """Rotated segments of this session, oldest first."""
+        segments: list[tuple[int, Path]] = []
+        try:
+            entries = list(self.session_dir.iterdir())
+        except OSError:
+            return []
+        for entry in entries:
+            match = REPLAY_SEGMENT_PATTERN.match(entry.name)
+            if match is not None:
+                segments.append((int(match.group(1)), entry))
+        return [path for _, path in sorted(segments)]
+
+    def archived_count(self) -> int:
+        """Return how many events live in rotated segments, counting them once per change."""
+        segments = self.segment_paths()
+        if not segments:
+            return 0
+        signature = [[path.name, path_signature(path)] for path in segments]
+        if self._state.get("segments") == signature:
+            return _int_field(self._state, "archived_events")
+        count = sum(1 for _ in _iter_segment_lines(segments))
+        self._state.update(
+            {
+                "schema_version": REPLAY_INDEX_SCHEMA_VERSION,
+                "segments": signature,
+                "archived_events": count,
+            }
+        )
+        write_cache_payload(self.state_path, self._state)
+        return count
+
+    def span(self, start: int, stop: Optional[int]) -> Optional[tuple[int, int]]:
+        """Return the byte offset of live event `start` and the number of events up to `stop`."""
+        count = self.sync()
+        stop = count if stop is None else min(stop, count)
+        start = max(start, 0)
+        if start >= stop:
+            return None
+        offsets = array(_OFFSET_TYPECODE)
+        try:
+            with self.offsets_path.open("rb") as handle:
+                handle.seek(start * _OFFSET_BYTES)
+                offsets.fromfile(handle, 1)
+        except (OSError, EOFError):
+            return None
+        return (offsets[0], stop - start)
+
+    def rendered_state(self, *, session_path: Path, breakdown_path: Path) -> Optional[dict[str, int]]:
+        rendered = self._state.get("rendered")
+        if not isinstance(rendered, Mapping):
+            return None
+        if rendered.get("session") != path_signature(session_path) or rendered.get("breakdown") != path_signature(breakdown_path):
+            return None
+        return {key: _int_field(rendered, key) for key in ("events", "header_bytes", "timeline_bytes", "highlights_bytes")}
+
+    def record_render(self, *, events: int, session_path: Path, breakdown_path: Path, **spans: int) -> None:
+        self._state["rendered"] = {
+            "events": events,
+            **spans,
+            "session": path_signature(session_path),
+            "breakdown": path_signature(breakdown_path),
+        }
+        write_cache_payload(self.state_path, self._state)
+
+    def forget_render(self) -> None:
+        if self._state.get("rendered") is not None:
+            self._state["rendered"] = None
+            write_cache_payload(self.state_path, self._state)
+
+
+def _iter_segment_lines(segments: Iterable[Path]) -> Iterator[bytes]:
+    for segment in segments:
+        with gzip.open(segment, "rb") as handle:
+            for raw_line in handle:
+                line = raw_line.strip()
+                if line:
+                    yield line
+
+
+def _restore_compacted_events(session_dir: Path) -> None:
+    compacted_path = session_dir / REPLAY_COMPACTED_EVENTS_FILENAME
+    if not compacted_path.exists():
+        return
+    with gzip.open(compacted_path, "rb") as source:
+        with NamedTemporaryFile("wb", delete=False, dir=session_dir) as handle:
+            while chunk := source.read(64 * 1024):
+                handle.write(chunk)
+            temp_path = Path(handle.name)
+    temp_path.replace(session_dir / REPLAY_EVENTS_FILENAME)
+    compacted_path.unlink()
+
+
+def _int_field(payload: Mapping[str, Any], key: str) -> int:
+    value = payload.get(key)
+    return value if isinstance(value, int) and value >= 0 else 0
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return -1
+
+
 def _redact_text(text: str) -> str:
     redacted = text
     for pattern in _SENSITIVE_PATTERNS:
@@ -104,6 +438,18 @@ def _render_session_markdown(
     route: RouteDecision,
     plan_artifact: Optional[PlanArtifact],
     events: list[ReplayEvent],
+) -> str:
+    return _join_session_markdown(
+        _render_session_header(run_state, route, plan_artifact),
+        "".join(_render_timeline_line(event) for event in events),
+        "".join(_render_highlight_lines(event) for event in events),
+    )
+
+
+def _render_session_header(
+    run_state: Optional[RunState],
+    route: RouteDecision,
+    plan_artifact: Optional[PlanArtifact],
 ) -> str:
     lines = ["# Session", ""]
     lines.append(f"- route: {route.route_name}")
@@ -115,39 +461,54 @@ def _render_session_markdown(
         lines.append(f"- plan: {plan_artifact.path}")
     lines.append("")
     lines.append("## Timeline")
-    for event in events:
-        lines.append(f"- {event.ts} | {event.phase} | {event.intent} | {event.result}")
-    if events:
-        lines.append("")
-        lines.append("## Highlights")
-        for event in events:
-            lines.append(f"- {event.phase}: {_redact_text(event.key_output)}")
-            for highlight in event.highlights:
-                lines.append(f"- {event.phase}: {_redact_text(highlight)}")
-    lines.append("")
     return "\n".join(lines) + "\n"
 
 
+def _render_timeline_line(event: ReplayEvent) -> str:
+    return f"- {event.ts} | {event.phase} | {event.intent} | {event.result}\n"
+
+
+def _render_highlight_lines(event: ReplayEvent) -> str:
+    lines = [f"- {event.phase}: {_redact_text(event.key_output)}"]
+    for highlight in event.highlights:
+        lines.append(f"- {event.phase}: {_redact_text(highlight)}")
+    return "\n".join(lines) + "\n"
+
+
+def _join_session_markdown(header: str, timeline: str, highlights: str) -> str:
+    # The highlights heading only appears once there is at least one event.
+    if not timeline:
+        return header + "\n"
+    return header + timeline + _HIGHLIGHTS_HEADING + highlights + "\n"
+
+
 def _render_breakdown_markdown(events: list[ReplayEvent]) -> str:
-    lines = ["# Breakdown", ""]
-    if not events:
-        lines.append("- No events recorded yet.")
-        return "\n".join(lines) + "\n"
-    for index, event in enumerate(events, start=1):
-        lines.append(f"## {index}. {event.phase}")
-        lines.append(f"- 目标: {event.intent}")
-        lines.append(f"- 动作: {event.action}")
-        lines.append(f"- 摘要: {_redact_text(event.key_output)}")
-        lines.append(f"- 原因: {_redact_text(event.decision_reason)}")
-        lines.append(f"- 结果: {event.result}")
-        if event.alternatives:
-            lines.append(f"- 备选: {', '.join(event.alternatives)}")
-        if event.highlights:
-            for highlight in event.highlights:
-                lines.append(f"- 说明: {_redact_text(highlight)}")
-        if event.risk:
-            lines.append(f"- 风险: {_redact_text(event.risk)}")
-        lines.append("")
+    return _join_breakdown_sections(
+        [_render_breakdown_section(number, event) for number, event in enumerate(events, start=1)]
+    )
+
+
+def _join_breakdown_sections(sections: list[str]) -> str:
+    if not sections:
+        return "# Breakdown\n\n- No events recorded yet.\n"
+    return "# Breakdown\n\n" + "".join(sections)
+
+
+def _render_breakdown_section(number: int, event: ReplayEvent) -> str:
+    lines = [f"## {number}. {event.phase}"]
+    lines.append(f"- 目标: {event.intent}")
+    lines.append(f"- 动作: {event.action}")
+    lines.append(f"- 摘要: {_redact_text(event.key_output)}")
+    lines.append(f"- 原因: {_redact_text(event.decision_reason)}")
+    lines.append(f"- 结果: {event.result}")
+    if event.alternatives:
+        lines.append(f"- 备选: {', '.join(event.alternatives)}")
+    if event.highlights:
+        for highlight in event.highlights:
+            lines.append(f"- 说明: {_redact_text(highlight)}")
+    if event.risk:
+        lines.append(f"- 风险: {_redact_text(event.risk)}")
+    lines.append("")
     return "\n".join(lines) + "\n"
 
 
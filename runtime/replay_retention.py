@@ -0,0 +1,377 @@
+"""Age, count and byte budgets for `<plan.directory>/replay/sessions/`.
+
+Replay sessions are append-only and were never pruned, so long-lived
+workspaces accumulated thousands of small files. One retention pass, in order:
+
+- removes sessions idle for more than `replay.max_age_days`, and idle
+  sessions that never recorded an event;
+- evicts the oldest sessions beyond `replay.max_sessions`;
+- compacts sessions idle for `replay.compact_after_days` to a single
+  `events.jsonl.gz`, dropping `session.md`, `breakdown.md` and the offset
+  index, which `ReplayWriter` regenerates if the run is resumed;
+- rotates an active `events.jsonl` above `replay.rotate_mb` into a numbered
+  gzip segment (`events.0001.jsonl.gz`, ...) so the live log starts small;
+  `ReplayWriter` reads the segments ahead of the live log, so the timeline
+  is unchanged;
+- evicts the oldest sessions while the total exceeds `replay.max_total_mb`.
+
+Sessions of runs still referenced by global or session `current_run` /
+`current_handoff` state are never removed, however old. The newest session and
+sessions touched within the last day are never evicted for the count or byte
+budgets. A budget of 0 disables it.
+`maybe_apply_replay_retention` runs the pass at gate startup, under the
+`replay` workspace lock that `ReplayWriter` also holds, at most once per
+`RETENTION_INTERVAL_SECONDS` and persists the report that `sopify status`
+shows next to a dry-run preview of the next pass.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import gzip
+import os
+from pathlib import Path
+import shutil
+from tempfile import NamedTemporaryFile
+import time
+from typing import Any, Optional
+
+from .cache import read_cache_payload, write_cache_payload
+from .models import RuntimeConfig
+from .replay import (
+    REPLAY_COMPACTED_EVENTS_FILENAME,
+    REPLAY_EVENTS_FILENAME,
+    REPLAY_INDEX_FILENAME,
+    REPLAY_OFFSETS_FILENAME,
+)
+from .state import active_run_ids
+
+RETENTION_STAMP_FILENAME = "retention.json"
+RETENTION_STAMP_SCHEMA_VERSION = "1"
+RETENTION_INTERVAL_SECONDS = 6 * 60 * 60
+# Regenerated by `ReplayWriter` from the event log when a run resumes.
+REGENERABLE_FILENAMES = ("session.md", "breakdown.md", REPLAY_INDEX_FILENAME, REPLAY_OFFSETS_FILENAME)
+_RECENT_ACTIVITY_GRACE_SECONDS = 24 * 60 * 60
+_SECONDS_PER_DAY = 24 * 60 * 60
+_BYTES_PER_MB = 1024 * 1024
+_COPY_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ReplayRetentionReport:
+    """Outcome of one retention pass; `dry_run` reports what would happen."""
+
+    applied_at: str
+    dry_run: bool
+    sessions: int
+    total_bytes: int
+    removed: tuple[str, ...] = ()
+    compacted: tuple[str, ...] = ()
+    rotated: tuple[str, ...] = ()
+    reclaimed_bytes: int = 0
+    over_budget: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "applied_at": self.applied_at,
+            "dry_run": self.dry_run,
+            "sessions": self.sessions,
+            "total_bytes": self.total_bytes,
+            "removed": list(self.removed),
+            "compacted": list(self.compacted),
+            "rotated": list(self.rotated),
+            "reclaimed_bytes": self.reclaimed_bytes,
+            "over_budget": self.over_budget,
+        }
+
+
+@dataclass
+class _SessionUsage:
+    path: Path
+    last_activity: float
+    total_bytes: int
+    events_bytes: int
+    compacted: bool
+    # Compacted log or rotated segments: event data that lives outside events.jsonl.
+    archived: bool
+    regenerable: list[str] = field(default_factory=list)
+
+
+def apply_replay_retention(
+    config: RuntimeConfig,
+    *,
+    now: Optional[float] = None,
+    dry_run: bool = False,
+) -> ReplayRetentionReport:
+    """Apply the configured replay budgets and return what changed."""
+    now = time.time() if now is None else now
+    applied_at = datetime.fromtimestamp(now, timezone.utc).replace(microsecond=0).isoformat()
+    sessions = sorted(_scan_sessions(config.replay_root), key=lambda usage: usage.last_activity, reverse=True)
+    # A paused run keeps its whole replay history until it is finished or replaced.
+    active = active_run_ids(config)
+    removed: list[str] = []
+    compacted: list[str] = []
+    rotated: list[str] = []
+    reclaimed = 0
+
+    def remove(usage: _SessionUsage) -> None:
+        nonlocal reclaimed
+        if not dry_run:
+            shutil.rmtree(usage.path, ignore_errors=True)
+        removed.append(usage.path.name)
+        reclaimed += usage.total_bytes
+
+    max_age = config.replay_max_age_days * _SECONDS_PER_DAY
+    compact_age = config.replay_compact_after_days * _SECONDS_PER_DAY
+    kept: list[_SessionUsage] = []
+    for position, usage in enumerate(sessions):
+        idle = now - usage.last_activity
+        if usage.path.name in active:
+            kept.append(usage)
+        elif max_age and position > 0 and idle > max_age:
+            remove(usage)
+        elif compact_age and idle > compact_age and not usage.events_bytes and not usage.archived:
+            # An idle session that never recorded an event has nothing to replay.
+            remove(usage)
+        else:
+            kept.append(usage)
+
+    def evictable() -> list[_SessionUsage]:
+        return [
+            usage
+            for position, usage in enumerate(kept)
+            if position > 0
+            and now - usage.last_activity > _RECENT_ACTIVITY_GRACE_SECONDS
+            and usage.path.name not in active
+        ]
+
+    if config.replay_max_sessions:
+        candidates = evictable()
+        while len(kept) > config.replay_max_sessions and candidates:
+            victim = candidates.pop()
+            kept.remove(victim)
+            remove(victim)
+
+    rotate_bytes = config.replay_rotate_mb * _BYTES_PER_MB
+    for usage in kept:
+        before = usage.total_bytes
+        if compact_age and now - usage.last_activity > compact_age:
+            if usage.events_bytes or usage.regenerable:
+                if not dry_run:
+                    _compact_session(usage)
+                compacted.append(usage.path.name)
+        elif rotate_bytes and usage.events_bytes > rotate_bytes:
+            if not dry_run:
+                _rotate_events(usage)
+            rotated.append(usage.path.name)
+        if not dry_run:
+            usage.total_bytes = _directory_bytes(usage.path)
+        reclaimed += max(before - usage.total_bytes, 0)
+
+    max_total = config.replay_max_total_mb * _BYTES_PER_MB
+    total_bytes = sum(usage.total_bytes for usage in kept)
+    if max_total:
+        candidates = evictable()
+        while total_bytes > max_total and candidates:
+            victim = candidates.pop()
+            kept.remove(victim)
+            remove(victim)
+            total_bytes -= victim.total_bytes
+
+    over_budget = bool(
+        (config.replay_max_sessions and len(kept) > config.replay_max_sessions)
+        or (max_total and total_bytes > max_total)
+    )
+    return ReplayRetentionReport(
+        applied_at=applied_at,
+        dry_run=dry_run,
+        sessions=len(kept),
+        total_bytes=total_bytes,
+        removed=tuple(sorted(removed)),
+        compacted=tuple(sorted(compacted)),
+        rotated=tuple(sorted(rotated)),
+        reclaimed_bytes=reclaimed,
+        over_budget=over_budget,
+    )
+
+
+def maybe_apply_replay_retention(config: RuntimeConfig, *, now: Optional[float] = None) -> Optional[ReplayRetentionReport]:
+    """Run `apply_replay_retention` unless a pass with the same budgets ran recently."""
+    if not config.replay_root.is_dir():
+        return None
+    now = time.time() if now is None else now
+    stamp_path = replay_retention_stamp_path(config)
+    stamp = read_cache_payload(stamp_path, schema_version=RETENTION_STAMP_SCHEMA_VERSION)
+    if stamp is not None and stamp.get("budgets") == _budgets(config):
+        last_run = stamp.get("ran_at")
+        if isinstance(last_run, (int, float)) and 0 <= now - last_run < RETENTION_INTERVAL_SECONDS:
+            return None
+    report = apply_replay_retention(config, now=now)
+    write_cache_payload(
+        stamp_path,
+        {
+            "schema_version": RETENTION_STAMP_SCHEMA_VERSION,
+            "ran_at": now,
+            "budgets": _budgets(config),
+            "report": report.to_dict(),
+        },
+    )
+    return report
+
+
+def inspect_replay_retention(config: RuntimeConfig) -> dict[str, Any]:
+    """Status view: current usage, budgets, the last pass and a preview of the next."""
+    sessions = _scan_sessions(config.replay_root)
+    preview = apply_replay_retention(config, dry_run=True)
+    stamp = read_cache_payload(replay_retention_stamp_path(config), schema_version=RETENTION_STAMP_SCHEMA_VERSION)
+    last_report = stamp.get("report") if stamp is not None else None
+    return {
+        "sessions": len(sessions),
+        "total_bytes": sum(usage.total_bytes for usage in sessions),
+        "compacted_sessions": sum(1 for usage in sessions if usage.compacted),
+        "budgets": _budgets(config),
+        "last_retention": last_report if isinstance(last_report, dict) else None,
+        "pending": {
+            "remove": len(preview.removed),
+            "compact": len(preview.compacted),
+            "rotate": len(preview.rotated),
+            "over_budget": preview.over_budget,
+        },
+    }
+
+
+def replay_retention_stamp_path(config: RuntimeConfig) -> Path:
+    return config.replay_root.parent / RETENTION_STAMP_FILENAME
+
+
+def _budgets(config: RuntimeConfig) -> dict[str, int]:
+    return {
+        "max_age_days": config.replay_max_age_days,
+        "max_sessions": config.replay_max_sessions,
+        "max_total_mb": config.replay_max_total_mb,
+        "compact_after_days": config.replay_compact_after_days,
+        "rotate_mb": config.replay_rotate_mb,
+    }
+
+
+def _scan_sessions(replay_root: Path) -> list[_SessionUsage]:
+    try:
+        entries = [entry for entry in os.scandir(replay_root) if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+    sessions: list[_SessionUsage] = []
+    for entry in entries:
+        session_dir = Path(entry.path)
+        last_activity = 0.0
+        total_bytes = 0
+        events_bytes = 0
+        compacted = False
+        archived = False
+        regenerable: list[str] = []
+        try:
+            children = list(os.scandir(session_dir))
+            if not children:
+                # Directory mtime moves on every unlink, so it only stands in
+                # for activity when the session holds no files at all.
+                last_activity = entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            continue
+        for child in children:
+            try:
+                stat = child.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            last_activity = max(last_activity, stat.st_mtime)
+            total_bytes += stat.st_size
+            if child.name == REPLAY_EVENTS_FILENAME:
+                events_bytes = stat.st_size
+            elif child.name == REPLAY_COMPACTED_EVENTS_FILENAME:
+                compacted = True
+                archived = True
+            elif child.name.startswith("events.") and child.name.endswith(".jsonl.gz"):
+                archived = True
+            elif child.name in REGENERABLE_FILENAMES:
+                regenerable.append(child.name)
+        sessions.append(
+            _SessionUsage(
+                path=session_dir,
+                last_activity=last_activity,
+                total_bytes=total_bytes,
+                events_bytes=events_bytes,
+                compacted=compacted,
+                archived=archived,
+                regenerable=regenerable,
+            )
+        )
+    return sessions
+
+
+def _compact_session(usage: _SessionUsage) -> None:
+    session_dir = usage.path
+    events_path = session_dir / REPLAY_EVENTS_FILENAME
+    compacted_path = session_dir / REPLAY_COMPACTED_EVENTS_FILENAME
+    if usage.events_bytes:
+        with NamedTemporaryFile("wb", delete=False, dir=session_dir) as raw_handle:
+            with gzip.GzipFile(fileobj=raw_handle, mode="wb", mtime=0) as handle:
+                if compacted_path.exists():
+                    # A log restored and appended to after an earlier compaction.
+                    with gzip.open(compacted_path, "rb") as previous:
+                        shutil.copyfileobj(previous, handle, _COPY_CHUNK_BYTES)
+                with events_path.open("rb") as source:
+                    shutil.copyfileobj(source, handle, _COPY_CHUNK_BYTES)
+            temp_path = Path(raw_handle.name)
+        temp_path.replace(compacted_path)
+        # Keep the session's idle age; the compacted file is not new activity.
+        os.utime(compacted_path, (usage.last_activity, usage.last_activity))
+    events_path.unlink(missing_ok=True)
+    for name in REGENERABLE_FILENAMES:
+        (session_dir / name).unlink(missing_ok=True)
+
+
+def _rotate_events(usage: _SessionUsage) -> None:
+    session_dir = usage.path
+    sequence = 1
+    while (session_dir / _segment_name(sequence)).exists():
+        sequence += 1
+    # Renaming first keeps concurrent appends either in the segment or in the
+    # fresh log `ReplayWriter.ensure_session` creates on the next write.
+    pending_path = session_dir / f"events.{sequence:04d}.jsonl"
+    (session_dir / REPLAY_EVENTS_FILENAME).replace(pending_path)
+    with NamedTemporaryFile("wb", delete=False, dir=session_dir) as raw_handle:
+        with gzip.GzipFile(fileobj=raw_handle, mode="wb", mtime=0) as handle:
+            with pending_path.open("rb") as source:
+                shutil.copyfileobj(source, handle, _COPY_CHUNK_BYTES)
+        temp_path = Path(raw_handle.name)
+    temp_path.replace(session_dir / _segment_name(sequence))
+    os.utime(session_dir / _segment_name(sequence), (usage.last_activity, usage.last_activity))
+    pending_path.unlink()
+    (session_dir / REPLAY_EVENTS_FILENAME).touch(exist_ok=True)
+
+
+def _segment_name(sequence: int) -> str:
+    return f"events.{sequence:04d}.jsonl.gz"
+
+
+def _directory_bytes(path: Path) -> int:
+    total = 0
+    try:
+        children = list(os.scandir(path))
+    except OSError:
+        return 0
+    for child in children:
+        try:
+            total += child.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+__all__ = [
+    "RETENTION_INTERVAL_SECONDS",
+    "ReplayRetentionReport",
+    "apply_replay_retention",
+    "inspect_replay_retention",
+    "maybe_apply_replay_retention",
+    "replay_retention_stamp_path",
+]
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
-from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Mapping
 
-from .decision_tables import load_default_decision_tables
+from .contract_registry import ContractRegistry, get_contract_registry, thaw_contract
 from .deterministic_guard import DeterministicGuardResult
 
 
@@ -45,7 +44,7 @@ class ResolutionActionProfile:
             "preserved_identity": list(self.preserved_identity),
             "terminality": self.terminality,
             "state_mutators": {key: list(values) for key, values in self.state_mutators.items()},
-            "handoff_protocol": dict(self.handoff_protocol),
+            "handoff_protocol": thaw_contract(self.handoff_protocol),
             "effect_reason_code": self.effect_reason_code,
             "notes": list(self.notes),
         }
@@ -80,22 +79,33 @@ class ResolutionPlanner:
 def supports_resolution_planner(required_host_action: str) -> bool:
     """Return whether the current host action participates in signal resolution."""
 
-    registry = _load_resolution_registry()
     normalized = str(required_host_action or "").strip()
-    return normalized in registry["signal_rows_by_action"]
+    return normalized in get_contract_registry().signal_rows_by_action
 
 
 def build_resolution_planner(
     guard: DeterministicGuardResult,
 ) -> ResolutionPlanner:
-    """Build a V1 resolution-action catalog from frozen decision tables."""
+    """Build a V1 resolution-action catalog from frozen decision tables.
+
+    Planners depend only on the required host action and are shared read-only
+    for the lifetime of the contract registry.
+    """
 
     if guard.truth_status != "stable" or not guard.resolution_enabled:
         raise ResolutionPlannerError("Resolution planner requires a stable deterministic guard")
 
     required_host_action = str(guard.required_host_action or "").strip()
-    registry = _load_resolution_registry()
-    signal_rows = registry["signal_rows_by_action"].get(required_host_action, ())
+    registry = get_contract_registry()
+    planners: dict[str, ResolutionPlanner] = registry.derived("resolution_planners", lambda _registry: {})
+    planner = planners.get(required_host_action)
+    if planner is None:
+        planner = planners[required_host_action] = _plan_required_host_action(registry, required_host_action)
+    return planner
+
+
+def _plan_required_host_action(registry: ContractRegistry, required_host_action: str) -> ResolutionPlanner:
+    signal_rows = registry.signal_rows_by_action.get(required_host_action, ())
     if not signal_rows:
         raise ResolutionPlannerError(
             f"No signal-priority rows defined for required_host_action={required_host_action!r}"
@@ -112,7 +122,7 @@ def build_resolution_planner(
             continue
         seen_actions.add(resolved_action)
         standard_resolved_actions.append(resolved_action)
-        effect_row = registry["side_effect_rows_by_key"].get((required_host_action, resolved_action))
+        effect_row = registry.side_effect_rows_by_key.get((required_host_action, resolved_action))
         if effect_row is None:
             blocked_resolved_actions.append(resolved_action)
             profiles.append(
@@ -142,11 +152,8 @@ def build_resolution_planner(
                 forbidden_state_effects=tuple(effect_row["forbidden_state_effects"]),
                 preserved_identity=tuple(effect_row["preserved_identity"]),
                 terminality=str(effect_row["terminality"]),
-                state_mutators={
-                    key: tuple(values)
-                    for key, values in effect_row["state_mutators"].items()
-                },
-                handoff_protocol=deepcopy(effect_row["handoff_protocol"]),
+                state_mutators=effect_row["state_mutators"],
+                handoff_protocol=effect_row["handoff_protocol"],
                 effect_reason_code=str(effect_row["reason_code"]),
             )
         )
@@ -158,59 +165,26 @@ def build_resolution_planner(
         supported_resolved_actions=tuple(supported_resolved_actions),
         blocked_resolved_actions=tuple(blocked_resolved_actions),
         profiles=tuple(profiles),
-        default_no_candidate_recovery=deepcopy(
-            registry["failure_recovery_by_key"][("resolution_failure", required_host_action)]
+        default_no_candidate_recovery=_recovery_summary(
+            registry.failure_recovery_by_key[("resolution_failure", required_host_action)]
         ),
-        default_effect_contract_recovery=deepcopy(
-            registry["failure_recovery_by_key"][("effect_contract_invalid", required_host_action)]
+        default_effect_contract_recovery=_recovery_summary(
+            registry.failure_recovery_by_key[("effect_contract_invalid", required_host_action)]
         ),
     )
 
 
-@lru_cache(maxsize=1)
-def _load_resolution_registry() -> dict[str, Any]:
-    tables = load_default_decision_tables()
-
-    signal_rows_by_action: dict[str, list[dict[str, Any]]] = {}
-    for row in tables["signal_priority_table"]["rows"]:
-        for required_host_action in row["enabled_checkpoint_kinds"]:
-            signal_rows_by_action.setdefault(required_host_action, []).append(
-                {
-                    "signal_id": row["signal_id"],
-                    "target_slot": row["target_slot"],
-                    "winner_action": row["winner_action"],
-                    "fallback_on_conflict": row["fallback_on_conflict"],
-                    "reason_code": row["reason_code"],
-                }
+def _recovery_summary(row: Mapping[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            key: row[key]
+            for key in (
+                "fallback_action",
+                "prompt_mode",
+                "retry_policy",
+                "reason_code",
+                "unresolved_outcome_family",
+                "counts_toward_streak",
             )
-
-    side_effect_rows_by_key = {
-        (row["checkpoint_kind"], row["resolved_action"]): {
-            "forbidden_state_effects": tuple(row["forbidden_state_effects"]),
-            "preserved_identity": tuple(row["preserved_identity"]),
-            "state_mutators": {
-                key: tuple(values) for key, values in row["state_mutators"].items()
-            },
-            "handoff_protocol": deepcopy(row["handoff_protocol"]),
-            "terminality": row["terminality"],
-            "reason_code": row["reason_code"],
-        }
-        for row in tables["side_effect_mapping_table"]["rows"]
-    }
-
-    failure_recovery_by_key = {
-        (row["primary_failure_type"], row["required_host_action"]): {
-            "fallback_action": row["fallback_action"],
-            "prompt_mode": row["prompt_mode"],
-            "retry_policy": row["retry_policy"],
-            "reason_code": row["reason_code"],
-            "unresolved_outcome_family": row["unresolved_outcome_family"],
-            "counts_toward_streak": row["counts_toward_streak"],
         }
-        for row in tables["failure_recovery_table"]["rows"]
-    }
-    return {
-        "signal_rows_by_action": signal_rows_by_action,
-        "side_effect_rows_by_key": side_effect_rows_by_key,
-        "failure_recovery_by_key": failure_recovery_by_key,
-    }
+    )
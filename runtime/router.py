@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from typing import Iterable
+from typing import Callable, Iterable, Mapping
 
 from .clarification import has_submitted_clarification, parse_clarification_response
 from .context_snapshot import ContextResolvedSnapshot, resolve_context_snapshot, snapshot_state_conflict_artifacts
@@ -251,6 +252,85 @@ _EXECUTION_CONFIRM_REVISION_PATTERNS = (
     re.compile(r"(风险|任务|范围|scope|task|plan|方案).*(更具体|更清楚|再具体一点|再细一点)", re.IGNORECASE),
 )
 _LIGHT_EDIT_HINTS = ("readme", "注释", "comment", "typo", "文案", "assert", "断言", "路径说明")
+_FULL_PLAN_LEVEL_HINTS = ("架构", "system", "plugin", "adapter")
+
+
+def _combine_patterns(patterns: Iterable[re.Pattern[str]]) -> re.Pattern[str]:
+    """Fold a same-flag pattern family into one alternation scanned once per search."""
+    patterns = tuple(patterns)
+    flags = {pattern.flags for pattern in patterns}
+    if len(flags) != 1:
+        raise ValueError("Combined router patterns must share regex flags")
+    return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns), flags.pop())
+
+
+_PLAN_MATERIALIZATION_META_DEBUG_RE = _combine_patterns(_PLAN_MATERIALIZATION_META_DEBUG_PATTERNS)
+_EXPLAIN_ONLY_NO_CHANGE_RE = _combine_patterns(_EXPLAIN_ONLY_NO_CHANGE_PATTERNS)
+_EXPLAIN_ONLY_SIGNAL_RE = _combine_patterns(_EXPLAIN_ONLY_SIGNAL_PATTERNS)
+_EXPLAIN_ONLY_META_DEBUG_RE = _combine_patterns(_EXPLAIN_ONLY_META_DEBUG_PATTERNS)
+_EXPLAIN_ONLY_REFERENTIAL_RE = _combine_patterns(_EXPLAIN_ONLY_REFERENTIAL_PATTERNS)
+_EXPLICIT_PLAN_PACKAGE_RE = _combine_patterns(_EXPLICIT_PLAN_PACKAGE_PATTERNS)
+_PLAN_META_REVIEW_RE = _combine_patterns(_PLAN_META_REVIEW_PATTERNS)
+_PLAN_META_REVIEW_EDIT_RE = _combine_patterns(_PLAN_META_REVIEW_EDIT_PATTERNS)
+_ACTIVE_PLAN_META_REVIEW_ANCHORS_RE = _combine_patterns(_ACTIVE_PLAN_META_REVIEW_ANCHORS)
+_PLAN_META_REVIEW_ANCHORS_RE = _combine_patterns(_PLAN_META_REVIEW_ANCHORS)
+_ANALYZE_CHALLENGE_A4_DECISION_RE = _combine_patterns(_ANALYZE_CHALLENGE_A4_DECISION_PATTERNS)
+_EXECUTION_CONFIRM_PLAN_FEEDBACK_RE = _combine_patterns(_EXECUTION_CONFIRM_PLAN_FEEDBACK_PATTERNS)
+_EXECUTION_CONFIRM_REVISION_RE = _combine_patterns(_EXECUTION_CONFIRM_REVISION_PATTERNS)
+_ANALYZE_CHALLENGE_TRIGGER_RES = tuple(
+    (label, _combine_patterns(patterns)) for label, patterns in _ANALYZE_CHALLENGE_TRIGGER_PATTERNS
+)
+
+
+class _KeywordFamilyMatcher:
+    """Substring keyword families compiled once into one alternation each.
+
+    `families(text)` folds the text a single time and reports every family
+    with at least one keyword occurring in it, with the same semantics as
+    `any(fold(keyword) in fold(text) for keyword in family)`.
+    """
+
+    def __init__(self, families: Mapping[str, Iterable[str]], *, fold: Callable[[str], str]) -> None:
+        self._fold = fold
+        self._patterns = tuple(
+            (name, re.compile("|".join(re.escape(keyword) for keyword in sorted({fold(k) for k in keywords}, key=len, reverse=True))))
+            for name, keywords in families.items()
+        )
+
+    def families(self, text: str) -> frozenset[str]:
+        folded = self._fold(text)
+        return frozenset(name for name, pattern in self._patterns if pattern.search(folded) is not None)
+
+
+_REQUEST_KEYWORDS = _KeywordFamilyMatcher(
+    {
+        "replay": _REPLAY_KEYWORDS,
+        "action": _ACTION_KEYWORDS,
+        "architecture": _ARCHITECTURE_KEYWORDS,
+        "light_edit": _LIGHT_EDIT_HINTS,
+        "full_plan_level": _FULL_PLAN_LEVEL_HINTS,
+        "long_term_contract": _LONG_TERM_CONTRACT_HINTS,
+    },
+    fold=str.lower,
+)
+_FRAGMENT_CUES = _KeywordFamilyMatcher(
+    {
+        "review": _ACTIVE_PLAN_META_REVIEW_CUES,
+        "edit": _ACTIVE_PLAN_FOLLOWUP_EDIT_CUES,
+    },
+    fold=str.casefold,
+)
+
+
+@lru_cache(maxsize=256)
+def request_keyword_families(text: str) -> frozenset[str]:
+    """Return every request keyword family matched by `text`, computed once per text."""
+    return _REQUEST_KEYWORDS.families(text)
+
+
+@lru_cache(maxsize=256)
+def _fragment_cue_families(fragment: str) -> frozenset[str]:
+    return _FRAGMENT_CUES.families(fragment)
 
 
 @dataclass(frozen=True)
@@ -366,7 +446,7 @@ class Router:
             if pending_decision is not None:
                 return self._with_capture(pending_decision)
 
-        if _contains_intent(text, _REPLAY_KEYWORDS):
+        if "replay" in request_keyword_families(text):
             return RouteDecision(
                 route_name="replay",
                 request_text=text,
@@ -954,15 +1034,15 @@ def _classify_pending_execution_confirm(
 
 
 def _estimate_complexity(text: str) -> _ComplexitySignal:
-    lowered = text.lower()
+    families = request_keyword_families(text)
     file_refs = len(_FILE_REF_RE.findall(text))
-    has_arch = any(keyword.lower() in lowered for keyword in _ARCHITECTURE_KEYWORDS)
-    has_action = any(keyword.lower() in lowered for keyword in _ACTION_KEYWORDS)
+    has_arch = "architecture" in families
+    has_action = "action" in families
 
-    if has_action and any(token in lowered for token in _LIGHT_EDIT_HINTS):
+    if has_action and "light_edit" in families:
         return _ComplexitySignal("simple", "Detected a bounded docs/tests wording tweak", None)
     if has_arch or file_refs > 5:
-        plan_level = "full" if has_arch and any(token in lowered for token in ("架构", "system", "plugin", "adapter")) else "standard"
+        plan_level = "full" if has_arch and "full_plan_level" in families else "standard"
         return _ComplexitySignal("complex", "Detected architecture-scale or broad change intent", plan_level)
     if has_action and 3 <= file_refs <= 5:
         return _ComplexitySignal("medium", "Detected multi-file but bounded implementation request", "light")
@@ -1019,7 +1099,7 @@ def _classify_plan_materialization_meta_debug(
     *,
     skills: Iterable[SkillMeta],
 ) -> RouteDecision | None:
-    if not any(pattern.search(text) is not None for pattern in _PLAN_MATERIALIZATION_META_DEBUG_PATTERNS):
+    if _PLAN_MATERIALIZATION_META_DEBUG_RE.search(text) is None:
         return None
     return RouteDecision(
         route_name="consult",
@@ -1043,17 +1123,16 @@ def detect_explain_only_consult_override(
     normalized = text.strip()
     if not normalized or command is not None:
         return None
-    lowered = normalized.lower()
-    if any(keyword.lower() in lowered for keyword in _ACTION_KEYWORDS):
+    if "action" in request_keyword_families(normalized):
         return None
 
-    has_no_change = any(pattern.search(normalized) is not None for pattern in _EXPLAIN_ONLY_NO_CHANGE_PATTERNS)
-    has_explain_signal = any(pattern.search(normalized) is not None for pattern in _EXPLAIN_ONLY_SIGNAL_PATTERNS)
+    has_no_change = _EXPLAIN_ONLY_NO_CHANGE_RE.search(normalized) is not None
+    has_explain_signal = _EXPLAIN_ONLY_SIGNAL_RE.search(normalized) is not None
     if not (has_no_change and has_explain_signal):
         return None
 
-    has_meta_debug_context = any(pattern.search(normalized) is not None for pattern in _EXPLAIN_ONLY_META_DEBUG_PATTERNS)
-    has_referential_signal = any(pattern.search(normalized) is not None for pattern in _EXPLAIN_ONLY_REFERENTIAL_PATTERNS)
+    has_meta_debug_context = _EXPLAIN_ONLY_META_DEBUG_RE.search(normalized) is not None
+    has_referential_signal = _EXPLAIN_ONLY_REFERENTIAL_RE.search(normalized) is not None
     has_recent_runtime_context = any(
         value is not None
         for value in (current_run, current_plan, current_plan_proposal, last_route)
@@ -1074,7 +1153,7 @@ def _is_consultation(text: str) -> bool:
     normalized = text.strip().lower()
     if not normalized:
         return True
-    if any(keyword.lower() in normalized for keyword in _ACTION_KEYWORDS):
+    if "action" in request_keyword_families(normalized):
         return False
     if text.endswith("?") or text.endswith("？"):
         return True
@@ -1104,7 +1183,7 @@ def _request_explicitly_materializes_plan(request_text: str, *, config: RuntimeC
         return False
     if request_explicitly_wants_new_plan(request_text):
         return True
-    return any(pattern.search(request_text) is not None for pattern in _EXPLICIT_PLAN_PACKAGE_PATTERNS)
+    return _EXPLICIT_PLAN_PACKAGE_RE.search(request_text) is not None
 
 
 def _has_tradeoff_or_contract_split(text: str) -> bool:
@@ -1114,23 +1193,23 @@ def _has_tradeoff_or_contract_split(text: str) -> bool:
     split_signal = "还是" in text or "二选一" in text or "vs" in lowered or " or " in lowered
     if not split_signal:
         return False
-    return any(token in lowered for token in _LONG_TERM_CONTRACT_HINTS)
+    return "long_term_contract" in request_keyword_families(text)
 
 
 def _looks_like_plan_meta_review(text: str, *, current_plan) -> bool:
     if not text.strip():
         return False
-    if not any(pattern.search(text) is not None for pattern in _PLAN_META_REVIEW_PATTERNS):
+    if _PLAN_META_REVIEW_RE.search(text) is None:
         return False
-    if any(pattern.search(text) is not None for pattern in _PLAN_META_REVIEW_EDIT_PATTERNS):
+    if _PLAN_META_REVIEW_EDIT_RE.search(text) is not None:
         return False
     if current_plan is not None:
         if _active_plan_meta_review_has_followup_edit(text):
             return False
-        return any(pattern.search(text) is not None for pattern in _ACTIVE_PLAN_META_REVIEW_ANCHORS)
+        return _ACTIVE_PLAN_META_REVIEW_ANCHORS_RE.search(text) is not None
     if _is_protected_plan_asset_request(text):
         return True
-    return any(pattern.search(text) is not None for pattern in _PLAN_META_REVIEW_ANCHORS)
+    return _PLAN_META_REVIEW_ANCHORS_RE.search(text) is not None
 
 
 def _active_plan_meta_review_has_followup_edit(text: str) -> bool:
@@ -1138,9 +1217,9 @@ def _active_plan_meta_review_has_followup_edit(text: str) -> bool:
     review_seen = False
     edit_seen = False
     for fragment in fragments:
-        lowered = fragment.casefold()
-        has_review = any(cue.casefold() in lowered for cue in _ACTIVE_PLAN_META_REVIEW_CUES)
-        has_edit = any(cue.casefold() in lowered for cue in _ACTIVE_PLAN_FOLLOWUP_EDIT_CUES)
+        cues = _fragment_cue_families(fragment)
+        has_review = "review" in cues
+        has_edit = "edit" in cues
         if has_review and has_edit:
             return True
         if (review_seen and has_edit) or (edit_seen and has_review):
@@ -1177,10 +1256,10 @@ def _match_analyze_challenge_label(text: str) -> str | None:
     normalized = text.strip()
     if not normalized:
         return None
-    for label, patterns in _ANALYZE_CHALLENGE_TRIGGER_PATTERNS:
-        if not any(pattern.search(normalized) is not None for pattern in patterns):
+    for label, patterns in _ANALYZE_CHALLENGE_TRIGGER_RES:
+        if patterns.search(normalized) is None:
             continue
-        if label == "A4" and not any(pattern.search(normalized) is not None for pattern in _ANALYZE_CHALLENGE_A4_DECISION_PATTERNS):
+        if label == "A4" and _ANALYZE_CHALLENGE_A4_DECISION_RE.search(normalized) is None:
             continue
         return label
     return None
@@ -1198,9 +1277,9 @@ def _looks_like_execution_confirm_feedback(text: str, *, current_plan) -> bool:
     if _is_consultation(normalized):
         return False
 
-    if any(pattern.search(normalized) is not None for pattern in _EXECUTION_CONFIRM_PLAN_FEEDBACK_PATTERNS):
+    if _EXECUTION_CONFIRM_PLAN_FEEDBACK_RE.search(normalized) is not None:
         return True
-    if any(pattern.search(normalized) is not None for pattern in _EXECUTION_CONFIRM_REVISION_PATTERNS):
+    if _EXECUTION_CONFIRM_REVISION_RE.search(normalized) is not None:
         return True
 
     if current_plan is None:
@@ -1214,11 +1293,6 @@ def _looks_like_execution_confirm_feedback(text: str, *, current_plan) -> bool:
     return False
 
 
-def _contains_intent(text: str, keywords: Iterable[str]) -> bool:
-    lowered = text.lower()
-    return any(keyword.lower() in lowered for keyword in keywords)
-
-
 def _normalize(text: str) -> str:
     return " ".join(text.strip().lower().split())
 
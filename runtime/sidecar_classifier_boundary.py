@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
-from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Mapping
 
-from .decision_tables import load_default_decision_tables
+from .contract_registry import ContractRegistry, get_contract_registry
 from .deterministic_guard import DeterministicGuardResult
 from .resolution_planner import ResolutionPlanner
 
@@ -98,7 +97,7 @@ def supports_sidecar_classifier_boundary(required_host_action: str) -> bool:
     """Return whether the current action has semantic candidate rows in the table."""
 
     normalized = str(required_host_action or "").strip()
-    return normalized in _load_sidecar_registry()["semantic_rows_by_action"]
+    return normalized in _semantic_rows_by_action()
 
 
 def build_sidecar_classifier_boundary(
@@ -118,8 +117,7 @@ def build_sidecar_classifier_boundary(
             "Sidecar classifier boundary requires matching guard/planner required_host_action"
         )
 
-    registry = _load_sidecar_registry()
-    rows = registry["semantic_rows_by_action"].get(required_host_action, ())
+    rows = _semantic_rows_by_action().get(required_host_action, ())
     candidate_signals: list[SidecarCandidateSignal] = []
     for row in rows:
         evidence_tier_cap = str(row["evidence_tier_cap"] or "").strip()
@@ -178,28 +176,29 @@ def build_sidecar_classifier_boundary(
     )
 
 
-@lru_cache(maxsize=1)
-def _load_sidecar_registry() -> dict[str, Any]:
-    tables = load_default_decision_tables()
+def _semantic_rows_by_action() -> Mapping[str, tuple[Mapping[str, Any], ...]]:
+    return get_contract_registry().derived("sidecar_semantic_rows_by_action", _index_semantic_rows)
 
-    semantic_rows_by_action: dict[str, list[dict[str, Any]]] = {}
-    for row in tables["signal_priority_table"]["rows"]:
+
+def _index_semantic_rows(registry: ContractRegistry) -> Mapping[str, tuple[Mapping[str, Any], ...]]:
+    semantic_rows_by_action: dict[str, list[Mapping[str, Any]]] = {}
+    for row in registry.decision_tables["signal_priority_table"]["rows"]:
         if SEMANTIC_SIGNAL_ORIGIN not in row["allowed_origins"]:
             continue
         evidence_caps = row.get("origin_evidence_cap", {})
         evidence_tier_cap = str(evidence_caps.get(SEMANTIC_SIGNAL_ORIGIN) or "").strip()
         for required_host_action in row["enabled_checkpoint_kinds"]:
             semantic_rows_by_action.setdefault(required_host_action, []).append(
-                {
-                    "signal_id": row["signal_id"],
-                    "target_slot": row["target_slot"],
-                    "winner_action": row["winner_action"],
-                    "fallback_on_conflict": row["fallback_on_conflict"],
-                    "reason_code": row["reason_code"],
-                    "evidence_tier_cap": evidence_tier_cap,
-                }
+                MappingProxyType(
+                    {
+                        "signal_id": row["signal_id"],
+                        "target_slot": row["target_slot"],
+                        "winner_action": row["winner_action"],
+                        "fallback_on_conflict": row["fallback_on_conflict"],
+                        "reason_code": row["reason_code"],
+                        "evidence_tier_cap": evidence_tier_cap,
+                    }
+                )
             )
 
-    return {
-        "semantic_rows_by_action": deepcopy(semantic_rows_by_action),
-    }
+    return MappingProxyType({action: tuple(rows) for action, rows in semantic_rows_by_action.items()})
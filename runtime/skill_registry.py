@@ -4,15 +4,18 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Dict, Iterable, Mapping, Optional, Sequence
-import re
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence
 
-from ._yaml import load_yaml
+from ._yaml import load_yaml, split_front_matter
 from .builtin_catalog import load_builtin_skills
+from .cache import path_signature, read_cache_payload, runtime_cache_path, write_cache_payload
 from .models import RuntimeConfig, SkillMeta
 from .skill_schema import SkillManifestError, normalize_skill_manifest
 
-_FRONT_MATTER_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+SKILL_FILENAME = "SKILL.md"
+SKILL_MANIFEST_FILENAME = "skill.yaml"
+SKILL_INDEX_FILENAME = "skill_index.json"
+SKILL_INDEX_SCHEMA_VERSION = "1"
 
 
 class SkillRegistry:
@@ -25,21 +28,24 @@ class SkillRegistry:
         repo_root: Path | None = None,
         user_home: Path | None = None,
         host_name: str | None = None,
+        index_path: Path | None = None,
     ) -> None:
         self.config = config
         self.repo_root = repo_root or Path(__file__).resolve().parent.parent
         self.user_home = user_home or Path.home()
         self.host_name = (host_name or os.environ.get("SOPIFY_HOST_NAME") or os.environ.get("SOPIFY_HOST") or "codex").strip().lower()
+        self.index_path = index_path if index_path is not None else runtime_cache_path(config, SKILL_INDEX_FILENAME)
 
     def discover(self) -> tuple[SkillMeta, ...]:
         discovered: Dict[str, SkillMeta] = {}
         for skill in load_builtin_skills(repo_root=self.repo_root, language=self.config.language):
             discovered[skill.skill_id] = skill
 
+        index = _SkillIndex.load(self.index_path)
         for root, source in self._search_roots():
             if not root.exists():
                 continue
-            for skill in self._discover_under_root(root, source):
+            for skill in self._discover_under_root(root, source, index):
                 existing = discovered.get(skill.skill_id)
                 if existing is None:
                     discovered[skill.skill_id] = skill
@@ -47,6 +53,7 @@ class SkillRegistry:
                 # External skills may only replace builtin ids through an explicit manifest opt-in.
                 if existing.source == "builtin" and _should_override_builtin(skill):
                     discovered[skill.skill_id] = skill
+        index.save()
         return tuple(discovered.values())
 
     def _search_roots(self) -> list[tuple[Path, str]]:
@@ -69,17 +76,26 @@ class SkillRegistry:
         ]
         return [*workspace_roots, *user_roots]
 
-    def _discover_under_root(self, root: Path, source: str) -> Iterable[SkillMeta]:
-        for skill_file in sorted(root.rglob("SKILL.md")):
-            skill = self._read_skill(skill_file, source)
+    def _discover_under_root(self, root: Path, source: str, index: "_SkillIndex") -> Iterable[SkillMeta]:
+        for skill_file in index.skill_files_under(root):
+            sources = index.skill_sources(skill_file)
+            if sources is None:
+                continue
+            skill = self._read_skill(skill_file, source, sources=sources)
             if skill is not None:
                 yield skill
 
-    def _read_skill(self, skill_file: Path, source: str) -> Optional[SkillMeta]:
-        text = skill_file.read_text(encoding="utf-8")
-        front_matter = _parse_front_matter(text)
+    def _read_skill(
+        self,
+        skill_file: Path,
+        source: str,
+        *,
+        sources: tuple[dict[str, object], dict[str, object]] | None = None,
+    ) -> Optional[SkillMeta]:
+        if sources is None:
+            sources = _load_skill_sources(skill_file)
+        front_matter, raw_manifest = sources
         skill_dir = skill_file.parent
-        raw_manifest = _load_manifest(skill_dir / "skill.yaml")
         try:
             manifest = normalize_skill_manifest(raw_manifest)
         except SkillManifestError:
@@ -131,11 +147,124 @@ class SkillRegistry:
         )
 
 
+class _SkillIndex:
+    """Persisted directory listings and parsed skill sources keyed by stat signature.
+
+    A directory whose signature is unchanged reuses its cached listing, so a
+    steady-state discovery costs one `stat` per directory and per skill file
+    instead of a full `rglob` plus re-parsing every `SKILL.md` / `skill.yaml`.
+    Only entries visited by the current discovery are written back, which
+    prunes removed skills and roots.
+    """
+
+    def __init__(self, path: Path | None, payload: Mapping[str, Any] | None) -> None:
+        self._path = path
+        payload = payload or {}
+        directories = payload.get("directories")
+        skills = payload.get("skills")
+        self._cached_directories: Mapping[str, Any] = directories if isinstance(directories, Mapping) else {}
+        self._cached_skills: Mapping[str, Any] = skills if isinstance(skills, Mapping) else {}
+        self._directories: dict[str, Any] = {}
+        self._skills: dict[str, Any] = {}
+
+    @classmethod
+    def load(cls, path: Path | None) -> "_SkillIndex":
+        return cls(path, read_cache_payload(path, schema_version=SKILL_INDEX_SCHEMA_VERSION))
+
+    def skill_files_under(self, root: Path) -> list[Path]:
+        # Mirrors `sorted(root.rglob("SKILL.md"))`: symlinked sub-directories
+        # are not followed, only the root itself may be a link.
+        found: list[Path] = []
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            listing = self._directory_listing(directory)
+            if listing is None:
+                continue
+            subdirs, has_skill_file = listing
+            if has_skill_file:
+                found.append(directory / SKILL_FILENAME)
+            pending.extend(directory / name for name in subdirs)
+        return sorted(found)
+
+    def skill_sources(self, skill_file: Path) -> tuple[dict[str, object], dict[str, object]] | None:
+        key = str(skill_file)
+        signature = path_signature(skill_file)
+        if signature is None:
+            return None
+        manifest_signature = path_signature(skill_file.parent / SKILL_MANIFEST_FILENAME)
+        cached = self._cached_skills.get(key)
+        if (
+            isinstance(cached, Mapping)
+            and cached.get("signature") == signature
+            and cached.get("manifest_signature") == manifest_signature
+            and isinstance(cached.get("front_matter"), dict)
+            and isinstance(cached.get("raw_manifest"), dict)
+        ):
+            self._skills[key] = cached
+            return cached["front_matter"], cached["raw_manifest"]
+        front_matter, raw_manifest = _load_skill_sources(skill_file)
+        self._skills[key] = {
+            "signature": signature,
+            "manifest_signature": manifest_signature,
+            "front_matter": front_matter,
+            "raw_manifest": raw_manifest,
+        }
+        return front_matter, raw_manifest
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        if self._directories == self._cached_directories and self._skills == self._cached_skills:
+            return
+        write_cache_payload(
+            self._path,
+            {
+                "schema_version": SKILL_INDEX_SCHEMA_VERSION,
+                "directories": self._directories,
+                "skills": self._skills,
+            },
+        )
+
+    def _directory_listing(self, directory: Path) -> tuple[list[str], bool] | None:
+        key = str(directory)
+        signature = path_signature(directory)
+        if signature is None:
+            return None
+        cached = self._cached_directories.get(key)
+        if isinstance(cached, Mapping) and cached.get("signature") == signature and isinstance(cached.get("subdirs"), list):
+            self._directories[key] = cached
+            return list(cached["subdirs"]), bool(cached.get("has_skill_file"))
+        subdirs: list[str] = []
+        has_skill_file = False
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.name == SKILL_FILENAME and entry.is_file():
+                            has_skill_file = True
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable, replaced by a file, vanished or a symlink loop: skip it.
+            return None
+        subdirs.sort()
+        self._directories[key] = {"signature": signature, "subdirs": subdirs, "has_skill_file": has_skill_file}
+        return subdirs, has_skill_file
+
+
+def _load_skill_sources(skill_file: Path) -> tuple[dict[str, object], dict[str, object]]:
+    text = skill_file.read_text(encoding="utf-8")
+    return _parse_front_matter(text), _load_manifest(skill_file.parent / SKILL_MANIFEST_FILENAME)
+
+
 def _parse_front_matter(text: str) -> dict[str, object]:
-    match = _FRONT_MATTER_RE.match(text)
-    if not match:
+    parts = split_front_matter(text)
+    if parts is None:
         return {}
-    data = load_yaml(match.group(1))
+    data = load_yaml(parts[0])
     return data if isinstance(data, dict) else {}
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager, nullcontext
 from dataclasses import replace
 from datetime import datetime, time, timedelta, timezone
 from hashlib import sha1
@@ -9,11 +10,9 @@ import json
 from pathlib import Path
 import re
 import shutil
-from tempfile import NamedTemporaryFile
-from typing import Any, Mapping, Optional
+from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
 
 from .checkpoint_request import CheckpointRequestError, validate_develop_resume_context
-from .handoff import read_runtime_handoff
 from .models import (
     ClarificationState,
     DecisionState,
@@ -25,6 +24,8 @@ from .models import (
     RuntimeConfig,
     RuntimeHandoff,
 )
+from .locking import GLOBAL_STATE_LOCK, workspace_lock
+from .state_backend import SESSIONS_DIRNAME, STATE_FILENAMES, StateBackend, StateSignature, open_state_backend
 from .state_invariants import (
     InvariantViolationError,
     stamp_handoff_resolution_id,
@@ -34,8 +35,15 @@ from .state_invariants import (
     validate_resolution_id,
 )
 
-SESSIONS_DIRNAME = "sessions"
 _SAFE_SESSION_ID_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+_StateModel = TypeVar("_StateModel")
+_STATE_SNAPSHOT_MAX_ENTRIES = 256
+# Parsed state files shared by every store of this process, keyed by backend and
+# path and revalidated by one backend signature per read, so the gate reuses what
+# the engine just parsed. Models are frozen, so handing the same object to several
+# readers is safe.
+_payload_snapshots: dict[tuple[str, Path], tuple[StateSignature, Any, Optional[str]]] = {}
+_model_snapshots: dict[tuple[str, Path], tuple[StateSignature, Callable[..., Any], bool, Any]] = {}
 
 
 class StateStore:
@@ -53,6 +61,7 @@ class StateStore:
         self.current_handoff_path = self.root / "current_handoff.json"
         self.current_clarification_path = self.root / "current_clarification.json"
         self.current_decision_path = self.root / "current_decision.json"
+        self.backend = open_state_backend(config)
 
     def ensure(self) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
@@ -65,8 +74,7 @@ class StateStore:
         return str(path.relative_to(self.config.workspace_root))
 
     def get_current_run(self) -> Optional[RunState]:
-        payload = self._read_json(self.current_run_path)
-        return RunState.from_dict(payload) if payload else None
+        return self._read_model(self.current_run_path, RunState.from_dict)
 
     def set_current_run(self, run_state: RunState) -> None:
         self.ensure()
@@ -95,11 +103,10 @@ class StateStore:
         self._write_json(self.current_run_path, payload)
 
     def clear_current_run(self) -> None:
-        self.current_run_path.unlink(missing_ok=True)
+        self._unlink(self.current_run_path)
 
     def get_last_route(self) -> Optional[RouteDecision]:
-        payload = self._read_json(self.last_route_path)
-        return RouteDecision.from_dict(payload) if payload else None
+        return self._read_model(self.last_route_path, RouteDecision.from_dict)
 
     def set_last_route(self, decision: RouteDecision) -> None:
         self.ensure()
@@ -111,30 +118,27 @@ class StateStore:
         self._write_json(self.last_route_path, payload)
 
     def get_current_plan(self) -> Optional[PlanArtifact]:
-        payload = self._read_json(self.current_plan_path)
-        return PlanArtifact.from_dict(payload) if payload else None
+        return self._read_model(self.current_plan_path, PlanArtifact.from_dict)
 
     def set_current_plan(self, artifact: PlanArtifact) -> None:
         self.ensure()
         self._write_json(self.current_plan_path, artifact.to_dict())
 
     def clear_current_plan(self) -> None:
-        self.current_plan_path.unlink(missing_ok=True)
+        self._unlink(self.current_plan_path)
 
     def get_current_plan_proposal(self) -> Optional[PlanProposalState]:
-        payload = self._read_json(self.current_plan_proposal_path)
-        return PlanProposalState.from_dict(payload) if payload else None
+        return self._read_model(self.current_plan_proposal_path, PlanProposalState.from_dict)
 
     def set_current_plan_proposal(self, proposal_state: PlanProposalState) -> None:
         self.ensure()
         self._write_json(self.current_plan_proposal_path, proposal_state.to_dict())
 
     def clear_current_plan_proposal(self) -> None:
-        self.current_plan_proposal_path.unlink(missing_ok=True)
+        self._unlink(self.current_plan_proposal_path)
 
     def get_current_clarification(self) -> Optional[ClarificationState]:
-        payload = self._read_json(self.current_clarification_path)
-        return ClarificationState.from_dict(payload) if payload else None
+        return self._read_model(self.current_clarification_path, ClarificationState.from_dict)
 
     def set_current_clarification(self, clarification_state: ClarificationState) -> None:
         self.ensure()
@@ -158,25 +162,25 @@ class StateStore:
         response_message: str = "",
     ) -> Optional[ClarificationState]:
         """Persist host-collected clarification answers without rewriting the whole flow."""
-        current = self.get_current_clarification()
-        if current is None:
-            return None
-        updated = current.with_response(
-            response_text=response_text,
-            response_fields=response_fields,
-            response_source=response_source,
-            response_message=response_message,
-            submitted_at=iso_now(),
-        )
-        self.set_current_clarification(updated)
+        with self.transaction():
+            current = self.get_current_clarification()
+            if current is None:
+                return None
+            updated = current.with_response(
+                response_text=response_text,
+                response_fields=response_fields,
+                response_source=response_source,
+                response_message=response_message,
+                submitted_at=iso_now(),
+            )
+            self.set_current_clarification(updated)
         return updated
 
     def clear_current_clarification(self) -> None:
-        self.current_clarification_path.unlink(missing_ok=True)
+        self._unlink(self.current_clarification_path)
 
     def get_current_decision(self) -> Optional[DecisionState]:
-        payload = self._read_json(self.current_decision_path)
-        return DecisionState.from_dict(payload) if payload else None
+        return self._read_model(self.current_decision_path, DecisionState.from_dict)
 
     def set_current_decision(self, decision_state: DecisionState) -> None:
         self.ensure()
@@ -193,18 +197,19 @@ class StateStore:
 
     def set_current_decision_submission(self, submission: DecisionSubmission) -> Optional[DecisionState]:
         """Persist host-collected decision answers without rewriting the whole state file."""
-        current = self.get_current_decision()
-        if current is None:
-            return None
-        updated = current.with_submission(submission)
-        self.set_current_decision(updated)
+        with self.transaction():
+            current = self.get_current_decision()
+            if current is None:
+                return None
+            updated = current.with_submission(submission)
+            self.set_current_decision(updated)
         return updated
 
     def clear_current_decision(self) -> None:
-        self.current_decision_path.unlink(missing_ok=True)
+        self._unlink(self.current_decision_path)
 
     def get_current_handoff(self) -> Optional[RuntimeHandoff]:
-        return read_runtime_handoff(self.current_handoff_path)
+        return self._read_model(self.current_handoff_path, RuntimeHandoff.from_dict, require_mapping=True)
 
     def set_current_handoff(self, handoff: RuntimeHandoff) -> None:
         self.ensure()
@@ -252,62 +257,159 @@ class StateStore:
             resolution_id=normalized_resolution_id,
             truth_kind=normalized_truth_kind,
         )
-        self.set_current_run(stamped_run_state)
-        self.set_current_handoff(stamped_handoff)
+        with self.transaction():
+            self.set_current_run(stamped_run_state)
+            self.set_current_handoff(stamped_handoff)
         return stamped_run_state, stamped_handoff
 
     def clear_current_handoff(self) -> None:
-        self.current_handoff_path.unlink(missing_ok=True)
+        self._unlink(self.current_handoff_path)
 
     def has_active_flow(self) -> bool:
         current_run = self.get_current_run()
         return current_run is not None and current_run.is_active
 
     def reset_active_flow(self) -> None:
-        self.clear_current_run()
-        self.clear_current_plan()
-        self.clear_current_plan_proposal()
-        self.clear_current_handoff()
-        self.clear_current_clarification()
-        self.clear_current_decision()
+        with self.transaction():
+            self.clear_current_run()
+            self.clear_current_plan()
+            self.clear_current_plan_proposal()
+            self.clear_current_handoff()
+            self.clear_current_clarification()
+            self.clear_current_decision()
 
     def update_active_run(self, *, stage: Optional[str] = None, status: Optional[str] = None) -> Optional[RunState]:
-        current = self.get_current_run()
-        if current is None:
-            return None
-        updated = RunState(
-            run_id=current.run_id,
-            status=status or current.status,
-            stage=stage or current.stage,
-            route_name=current.route_name,
-            title=current.title,
-            created_at=current.created_at,
-            updated_at=iso_now(),
-            plan_id=current.plan_id,
-            plan_path=current.plan_path,
-            execution_gate=current.execution_gate,
-            request_excerpt=current.request_excerpt,
-            request_sha1=current.request_sha1,
-            owner_session_id=current.owner_session_id,
-            owner_host=current.owner_host,
-            owner_run_id=current.owner_run_id,
-            resolution_id=current.resolution_id,
-        )
-        self.set_current_run(updated)
+        with self.transaction():
+            current = self.get_current_run()
+            if current is None:
+                return None
+            updated = RunState(
+                run_id=current.run_id,
+                status=status or current.status,
+                stage=stage or current.stage,
+                route_name=current.route_name,
+                title=current.title,
+                created_at=current.created_at,
+                updated_at=iso_now(),
+                plan_id=current.plan_id,
+                plan_path=current.plan_path,
+                execution_gate=current.execution_gate,
+                request_excerpt=current.request_excerpt,
+                request_sha1=current.request_sha1,
+                owner_session_id=current.owner_session_id,
+                owner_host=current.owner_host,
+                owner_run_id=current.owner_run_id,
+                resolution_id=current.resolution_id,
+            )
+            self.set_current_run(updated)
         return updated
 
-    def _read_json(self, path: Path) -> Optional[dict[str, Any]]:
-        if not path.exists():
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Serialize and group every state write inside the block.
+
+        Global-scope writers hold the workspace state lock so concurrent host
+        sessions cannot interleave read-modify-write sequences; the sqlite
+        backend additionally commits the block as one transaction.
+        """
+        lock = workspace_lock(self.config, GLOBAL_STATE_LOCK) if self.session_id is None else nullcontext()
+        with lock, self.backend.transaction():
+            yield
+
+    def export_json(self) -> tuple[str, ...]:
+        """Mirror backend-held state to the JSON layout hosts read directly."""
+        return self.backend.export_json()
+
+    def close(self) -> None:
+        """Release the backend connection; later reads reopen it lazily."""
+        self.backend.close()
+
+    def prefetch(self) -> None:
+        """Warm every state file of this scope with a single backend scan."""
+        for path, signature in self.backend.scan(self.root, STATE_FILENAMES).items():
+            self._load_payload(path, signature)
+
+    def read_state_payload(self, path: Path) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+        """Return `(payload, error)` for a state file without raising on bad JSON."""
+        signature = self.backend.signature(path)
+        if signature is None:
+            self._forget(path)
+            return (None, None)
+        payload, error = self._load_payload(path, signature)
+        if error is not None:
+            return (None, error)
+        return (payload, None)
+
+    def _read_model(
+        self,
+        path: Path,
+        factory: Callable[[dict[str, Any]], _StateModel],
+        *,
+        require_mapping: bool = False,
+    ) -> Optional[_StateModel]:
+        signature = self.backend.signature(path)
+        if signature is None:
+            self._forget(path)
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        key = (self.backend.name, path)
+        cached = _model_snapshots.get(key)
+        if cached is not None and cached[:3] == (signature, factory, require_mapping):
+            return cached[3]
+        payload, error = self._load_payload(path, signature)
+        if error == "invalid_json":
+            # Keep the historical contract: callers outside the snapshot
+            # resolver see the decode error instead of a silent `None`.
+            payload = json.loads(self.backend.read_text(path))
+        if require_mapping and not isinstance(payload, dict):
+            model = None
+        else:
+            model = factory(payload) if payload else None
+        _remember_snapshot(_model_snapshots, key, (signature, factory, require_mapping, model))
+        return model
+
+    def _load_payload(self, path: Path, signature: StateSignature) -> tuple[Any, Optional[str]]:
+        key = (self.backend.name, path)
+        cached = _payload_snapshots.get(key)
+        if cached is not None and cached[0] == signature:
+            return (cached[1], cached[2])
+        try:
+            payload: Any = json.loads(self.backend.read_text(path))
+            error = None if isinstance(payload, dict) else "invalid_payload_shape"
+        except FileNotFoundError:
+            self._forget(path)
+            return (None, None)
+        except (OSError, ValueError):
+            payload, error = None, "invalid_json"
+        _remember_snapshot(_payload_snapshots, key, (signature, payload, error))
+        _model_snapshots.pop(key, None)
+        return (payload, error)
+
+    def _forget(self, path: Path) -> None:
+        key = (self.backend.name, path)
+        _payload_snapshots.pop(key, None)
+        _model_snapshots.pop(key, None)
+
+    def _unlink(self, path: Path) -> None:
+        if self.backend.signature(path) is None:
+            # Nothing to delete: skip the lock so read-only paths stay side-effect free.
+            self._forget(path)
+            return
+        with self.transaction():
+            self.backend.delete(path)
+        self._forget(path)
 
     def _write_json(self, path: Path, payload: dict[str, Any]) -> None:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with NamedTemporaryFile("w", delete=False, dir=path.parent, encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2, sort_keys=True)
-            handle.write("\n")
-            temp_path = Path(handle.name)
-        temp_path.replace(path)
+        text = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
+        with self.transaction():
+            self.backend.write_text(path, text)
+        self._forget(path)
+
+
+def _remember_snapshot(snapshots: dict[tuple[str, Path], Any], key: tuple[str, Path], value: Any) -> None:
+    snapshots.pop(key, None)
+    snapshots[key] = value
+    while len(snapshots) > _STATE_SNAPSHOT_MAX_ENTRIES:
+        snapshots.pop(next(iter(snapshots)))
 
 
 def iso_now() -> str:
@@ -437,18 +539,47 @@ def cleanup_expired_session_state(
         return ()
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    backend = open_state_backend(config)
     removed: list[str] = []
-    for session_dir in sessions_root.iterdir():
-        if not session_dir.is_dir():
-            continue
-        updated_at = _session_dir_updated_at(session_dir)
-        if updated_at is None or updated_at >= cutoff:
-            continue
-        shutil.rmtree(session_dir, ignore_errors=True)
-        removed.append(str(session_dir.relative_to(config.workspace_root)))
+    try:
+        for session_dir in sessions_root.iterdir():
+            if not session_dir.is_dir():
+                continue
+            updated_at = _session_dir_updated_at(session_dir, backend=backend)
+            if updated_at is None or updated_at >= cutoff:
+                continue
+            backend.delete_prefix(session_dir)
+            shutil.rmtree(session_dir, ignore_errors=True)
+            removed.append(str(session_dir.relative_to(config.workspace_root)))
+    finally:
+        backend.close()
     return tuple(sorted(removed))
 
 
+def active_run_ids(config: RuntimeConfig) -> frozenset[str]:
+    """Return run ids referenced by global and session `current_run` or `current_handoff` state."""
+    roots = [config.state_dir]
+    try:
+        roots.extend(path for path in (config.state_dir / SESSIONS_DIRNAME).iterdir() if path.is_dir())
+    except OSError:
+        pass
+    backend = open_state_backend(config)
+    run_ids: set[str] = set()
+    try:
+        for root in roots:
+            for name in ("current_run.json", "current_handoff.json"):
+                try:
+                    payload = json.loads(backend.read_text(root / name))
+                except (OSError, json.JSONDecodeError):
+                    continue
+                run_id = str(payload.get("run_id") or "").strip() if isinstance(payload, dict) else ""
+                if run_id:
+                    run_ids.add(run_id)
+    finally:
+        backend.close()
+    return frozenset(run_ids)
+
+
 def normalize_session_id(session_id: str | None) -> str | None:
     """Validate session IDs before using them as state directory names."""
     normalized = str(session_id or "").strip()
@@ -463,10 +594,15 @@ def normalize_session_id(session_id: str | None) -> str | None:
     return normalized or None
 
 
-def _session_dir_updated_at(session_dir: Path) -> datetime | None:
+def _session_dir_updated_at(session_dir: Path, *, backend: StateBackend) -> datetime | None:
+    # Read through the backend: with sqlite and no JSON export, `last_route.json`
+    # only exists in the database and the session directory mtime never moves.
     last_route_path = session_dir / "last_route.json"
-    payload = _read_json_file(last_route_path)
-    updated_at = str(payload.get("updated_at") or "").strip() if payload else ""
+    try:
+        payload = json.loads(backend.read_text(last_route_path))
+    except (OSError, json.JSONDecodeError):
+        payload = None
+    updated_at = str(payload.get("updated_at") or "").strip() if isinstance(payload, dict) else ""
     if updated_at:
         parsed = _parse_iso_datetime(updated_at)
         if parsed is not None:
@@ -490,13 +626,3 @@ def _parse_iso_datetime(raw: str) -> datetime | None:
     if parsed.tzinfo is None:
         return parsed.replace(tzinfo=timezone.utc)
     return parsed.astimezone(timezone.utc)
-
-
-def _read_json_file(path: Path) -> Optional[dict[str, Any]]:
-    if not path.exists():
-        return None
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
-        return None
-    return payload if isinstance(payload, dict) else None
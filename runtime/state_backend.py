@@ -0,0 +1,423 @@
+"""Storage backends behind `StateStore`.
+
+`json` keeps the historical layout: one atomically replaced JSON file per
+state kind. `sqlite` stores the same documents in a single WAL-mode database
+under `state/`, so paired writes (run + handoff, active-flow resets) commit in
+one transaction and concurrent sessions do not churn temp files. Hosts and
+helper scripts still read the JSON layout directly, so the sqlite backend
+mirrors committed documents back to their files unless
+`advanced.state_json_export` is disabled; `export_json()` rebuilds the mirror
+on demand either way.
+
+Both backends address documents by their JSON file path and expose a
+`(revision, size, inode)`-style signature so `StateStore` can revalidate its
+parse memo without reading the document again, plus per-document update
+times (file mtimes, or an `updated_at` column in sqlite) for callers such as
+the daily summary that report when state last changed.
+
+A new sqlite database is seeded from the existing JSON layout, so switching a
+workspace from `json` to `sqlite` keeps its active run, plan and handoff.
+Connections are closed explicitly by `StateStore.close()` or, for every
+backend opened by the current thread, by `close_state_backends()` at gate and
+runtime teardown.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import sqlite3
+from tempfile import NamedTemporaryFile
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+import weakref
+
+from .models import RuntimeConfig
+
+STATE_BACKEND_JSON = "json"
+STATE_BACKEND_SQLITE = "sqlite"
+STATE_DATABASE_FILENAME = "state.sqlite3"
+SESSIONS_DIRNAME = "sessions"
+STATE_FILENAMES = (
+    "current_run.json",
+    "last_route.json",
+    "current_plan.json",
+    "current_plan_proposal.json",
+    "current_handoff.json",
+    "current_clarification.json",
+    "current_decision.json",
+)
+_SQLITE_BUSY_TIMEOUT_MS = 5000
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_documents (
+    revision INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    updated_at REAL
+)
+"""
+_SQLITE_META_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+"""
+_SQLITE_JSON_SEEDED_KEY = "json_layout_seeded"
+
+StateSignature = tuple[int, int, int]
+
+
+class JsonStateBackend:
+    """One JSON file per state document, written via temp file + `replace`."""
+
+    name = STATE_BACKEND_JSON
+
+    def __init__(self, config: RuntimeConfig) -> None:
+        self.config = config
+
+    def signature(self, path: Path) -> Optional[StateSignature]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def scan(self, root: Path, names: Iterable[str]) -> dict[Path, StateSignature]:
+        wanted = set(names)
+        signatures: dict[Path, StateSignature] = {}
+        try:
+            with os.scandir(root) as iterator:
+                entries = [entry for entry in iterator if entry.name in wanted]
+        except OSError:
+            return signatures
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            signatures[root / entry.name] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return signatures
+
+    def updated_times(self, root: Path, names: Iterable[str]) -> dict[Path, float]:
+        """Return the last update time (epoch seconds) of each stored document among `names`."""
+
+        return {path: signature[0] / 1_000_000_000 for path, signature in self.scan(root, names).items()}
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding="utf-8")
+
+    def write_text(self, path: Path, text: str) -> None:
+        _write_file_atomically(path, text)
+
+    def delete(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def delete_prefix(self, root: Path) -> None:
+        # Session directories are removed by the caller; nothing else to drop.
+        return None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        yield
+
+    def export_json(self) -> tuple[str, ...]:
+        return ()
+
+    def close(self) -> None:
+        return None
+
+
+class SqliteStateBackend:
+    """All state documents of a workspace in one WAL-mode SQLite database."""
+
+    name = STATE_BACKEND_SQLITE
+
+    def __init__(self, config: RuntimeConfig) -> None:
+        self.config = config
+        self.database_path = config.state_dir / STATE_DATABASE_FILENAME
+        self.json_export = config.state_json_export
+        self._connection: Optional[sqlite3.Connection] = None
+        self._transaction_depth = 0
+        self._thread_id: Optional[int] = None
+        self._pending_exports: dict[Path, Optional[str]] = {}
+        # Until the first write creates (and seeds) the database, the JSON layout is the truth.
+        self._json_layout = JsonStateBackend(config)
+
+    def signature(self, path: Path) -> Optional[StateSignature]:
+        if not self._database_exists():
+            return self._json_layout.signature(path)
+        row = self._fetchone(
+            "SELECT revision, length(payload), updated_at FROM state_documents WHERE path = ?",
+            (self._key(path),),
+        )
+        if row is None:
+            return None
+        return _sqlite_signature(row[0], row[1], row[2])
+
+    def scan(self, root: Path, names: Iterable[str]) -> dict[Path, StateSignature]:
+        if not self._database_exists():
+            return self._json_layout.scan(root, names)
+        keys = {self._key(root / name): root / name for name in names}
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        rows = self._fetchall(
+            f"SELECT path, revision, length(payload), updated_at FROM state_documents WHERE path IN ({placeholders})",
+            tuple(keys),
+        )
+        return {keys[str(row[0])]: _sqlite_signature(row[1], row[2], row[3]) for row in rows}
+
+    def updated_times(self, root: Path, names: Iterable[str]) -> dict[Path, float]:
+        """Return the last update time (epoch seconds) of each stored document among `names`."""
+
+        if not self._database_exists():
+            return self._json_layout.updated_times(root, names)
+        keys = {self._key(root / name): root / name for name in names}
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" for _ in keys)
+        rows = self._fetchall(
+            f"SELECT path, updated_at FROM state_documents WHERE path IN ({placeholders}) AND updated_at IS NOT NULL",
+            tuple(keys),
+        )
+        return {keys[str(row[0])]: float(row[1]) for row in rows}
+
+    def read_text(self, path: Path) -> str:
+        if not self._database_exists():
+            return self._json_layout.read_text(path)
+        row = self._fetchone("SELECT payload FROM state_documents WHERE path = ?", (self._key(path),))
+        if row is None:
+            raise FileNotFoundError(str(path))
+        return str(row[0])
+
+    def write_text(self, path: Path, text: str) -> None:
+        with self.transaction():
+            self._connect().execute(
+                "INSERT OR REPLACE INTO state_documents (path, payload, updated_at) VALUES (?, ?, ?)",
+                (self._key(path), text, time.time()),
+            )
+            self._pending_exports[path] = text
+
+    def delete(self, path: Path) -> None:
+        with self.transaction():
+            self._connect().execute("DELETE FROM state_documents WHERE path = ?", (self._key(path),))
+            self._pending_exports[path] = None
+
+    def delete_prefix(self, root: Path) -> None:
+        if not self._database_exists():
+            return
+        prefix = self._key(root).rstrip("/") + "/"
+        with self.transaction():
+            self._connect().execute(
+                "DELETE FROM state_documents WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one `BEGIN IMMEDIATE` transaction; nests by depth."""
+
+        connection = self._connect()
+        if self._transaction_depth == 0:
+            connection.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                connection.execute("ROLLBACK")
+                self._pending_exports.clear()
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            connection.execute("COMMIT")
+            pending, self._pending_exports = self._pending_exports, {}
+            if self.json_export:
+                _export_documents(pending.items())
+
+    def export_json(self) -> tuple[str, ...]:
+        """Write every stored document to its JSON path; return the written paths."""
+
+        rows = self._fetchall("SELECT path, payload FROM state_documents ORDER BY path", ())
+        documents = [(self.config.state_dir / str(row[0]), str(row[1])) for row in rows]
+        _export_documents(documents)
+        return tuple(str(path.relative_to(self.config.workspace_root)) for path, _ in documents)
+
+    def close(self) -> None:
+        if self._connection is not None and self._transaction_depth == 0:
+            self._connection.close()
+            self._connection = None
+            _OPEN_SQLITE_BACKENDS.discard(self)
+
+    def _key(self, path: Path) -> str:
+        return path.relative_to(self.config.state_dir).as_posix()
+
+    def _database_exists(self) -> bool:
+        return self._connection is not None or self.database_path.exists()
+
+    def _fetchone(self, sql: str, parameters: tuple[object, ...]) -> Optional[tuple[object, ...]]:
+        return self._connect().execute(sql, parameters).fetchone()
+
+    def _fetchall(self, sql: str, parameters: tuple[object, ...]) -> list[tuple[object, ...]]:
+        if not self._database_exists():
+            return []
+        return self._connect().execute(sql, parameters).fetchall()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.database_path),
+                timeout=_SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,
+            )
+            connection.execute(f"PRAGMA busy_timeout = {_SQLITE_BUSY_TIMEOUT_MS}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(_SQLITE_SCHEMA)
+            connection.execute(_SQLITE_META_SCHEMA)
+            self._ensure_updated_at_column(connection)
+            # Checked on every open: a process may see the file another one
+            # just created, and an interrupted seed must be retried.
+            if not self._json_layout_seeded(connection):
+                self._seed_from_json_layout(connection)
+            self._connection = connection
+            self._thread_id = threading.get_ident()
+            _OPEN_SQLITE_BACKENDS.add(self)
+        return self._connection
+
+    def _seed_from_json_layout(self, connection: sqlite3.Connection) -> None:
+        """Import the JSON state files once, in one transaction, into the database."""
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # A concurrent process may have seeded the same database first.
+            if not self._json_layout_seeded(connection):
+                connection.executemany(
+                    "INSERT OR IGNORE INTO state_documents (path, payload, updated_at) VALUES (?, ?, ?)",
+                    [
+                        (self._key(path), text, updated_at)
+                        for path, text, updated_at in _iter_json_layout_documents(self.config.state_dir)
+                    ],
+                )
+                connection.execute(
+                    "INSERT INTO state_meta (key, value) VALUES (?, ?)",
+                    (_SQLITE_JSON_SEEDED_KEY, "1"),
+                )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _ensure_updated_at_column(self, connection: sqlite3.Connection) -> None:
+        """Add `updated_at` to databases created before it existed."""
+
+        columns = {str(row[1]) for row in connection.execute("PRAGMA table_info(state_documents)")}
+        if "updated_at" in columns:
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {str(row[1]) for row in connection.execute("PRAGMA table_info(state_documents)")}
+            if "updated_at" not in columns:
+                connection.execute("ALTER TABLE state_documents ADD COLUMN updated_at REAL")
+                # The database file mtime is the best bound for rows written before the column.
+                connection.execute(
+                    "UPDATE state_documents SET updated_at = ? WHERE updated_at IS NULL",
+                    (self.database_path.stat().st_mtime,),
+                )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    @staticmethod
+    def _json_layout_seeded(connection: sqlite3.Connection) -> bool:
+        return connection.execute("SELECT 1 FROM state_meta WHERE key = ?", (_SQLITE_JSON_SEEDED_KEY,)).fetchone() is not None
+
+    def __del__(self) -> None:  # pragma: no cover - interpreter shutdown ordering
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+StateBackend = JsonStateBackend | SqliteStateBackend
+
+_OPEN_SQLITE_BACKENDS: "weakref.WeakSet[SqliteStateBackend]" = weakref.WeakSet()
+
+
+def _sqlite_signature(revision: object, size: object, updated_at: object) -> StateSignature:
+    # AUTOINCREMENT never reuses a revision within one database; the write time
+    # keeps signatures apart when the database file is deleted and recreated.
+    return (int(revision), int(size), int(float(updated_at or 0) * 1_000_000_000))
+
+
+def close_state_backends() -> None:
+    """Close the sqlite connections opened by this thread outside a transaction."""
+
+    thread_id = threading.get_ident()
+    for backend in list(_OPEN_SQLITE_BACKENDS):
+        if backend._thread_id == thread_id:
+            backend.close()
+
+
+def open_state_backend(config: RuntimeConfig) -> StateBackend:
+    """Return the backend selected by `advanced.state_backend`."""
+
+    if config.state_backend == STATE_BACKEND_SQLITE:
+        return SqliteStateBackend(config)
+    if config.state_backend == STATE_BACKEND_JSON:
+        return JsonStateBackend(config)
+    raise ValueError(f"Unsupported state backend: {config.state_backend}")
+
+
+def _iter_json_layout_documents(state_dir: Path) -> Iterator[tuple[Path, str, float]]:
+    roots = [state_dir]
+    try:
+        with os.scandir(state_dir / SESSIONS_DIRNAME) as iterator:
+            roots.extend(Path(entry.path) for entry in iterator if entry.is_dir())
+    except OSError:
+        pass
+    for root in roots:
+        for name in STATE_FILENAMES:
+            path = root / name
+            try:
+                text = path.read_text(encoding="utf-8")
+                updated_at = path.stat().st_mtime
+            except (OSError, UnicodeDecodeError):
+                continue
+            yield (path, text, updated_at)
+
+
+def _export_documents(documents: Iterable[tuple[Path, Optional[str]]]) -> None:
+    for path, text in documents:
+        if text is None:
+            path.unlink(missing_ok=True)
+        else:
+            _write_file_atomically(path, text)
+
+
+def _write_file_atomically(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile("w", delete=False, dir=path.parent, encoding="utf-8") as handle:
+        handle.write(text)
+        temp_path = Path(handle.name)
+    temp_path.replace(path)
+
+
+__all__ = [
+    "SESSIONS_DIRNAME",
+    "STATE_BACKEND_JSON",
+    "STATE_BACKEND_SQLITE",
+    "STATE_DATABASE_FILENAME",
+    "STATE_FILENAMES",
+    "JsonStateBackend",
+    "SqliteStateBackend",
+    "StateBackend",
+    "StateSignature",
+    "close_state_backends",
+    "open_state_backend",
+]
@@ -0,0 +1,197 @@
+"""Opt-in per-stage span recording for one runtime turn.
+
+Tracing is off unless `SOPIFY_RUNTIME_TIMINGS=1` or `SOPIFY_TRACE_FILE=<path>`
+is set, so the default turn only pays one context-variable lookup per stage.
+When enabled, `enter_runtime_gate` (or a direct `run_runtime` call) opens a
+trace session; stage spans are measured with `perf_counter_ns`, surfaced as
+`timings` in `RuntimeResult` and the gate `observability` block, and, when
+`SOPIFY_TRACE_FILE` is set, dumped as Chrome trace JSON (`chrome://tracing`,
+Perfetto) when the outermost session closes.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+import threading
+import time
+from typing import Any, Iterator, Mapping, Optional
+
+TIMINGS_ENV = "SOPIFY_RUNTIME_TIMINGS"
+TRACE_FILE_ENV = "SOPIFY_TRACE_FILE"
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """One closed span, relative to the owning recorder's origin."""
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start_ms": round(self.start_ns / 1_000_000, 3),
+            "duration_ms": round(self.duration_ns / 1_000_000, 3),
+        }
+
+
+class SpanRecorder:
+    """Collect closed spans for one turn; safe to share across threads."""
+
+    def __init__(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self._spans: list[SpanRecord] = []
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._close(name, started)
+
+    def begin(self, name: str) -> tuple[str, int]:
+        """Open a span that `end()` closes; for stages too long to indent."""
+
+        return (name, time.perf_counter_ns())
+
+    def end(self, token: tuple[str, int]) -> None:
+        self._close(token[0], token[1])
+
+    def spans(self) -> tuple[SpanRecord, ...]:
+        with self._guard:
+            return tuple(sorted(self._spans, key=lambda record: record.start_ns))
+
+    def timings(self) -> tuple[dict[str, Any], ...]:
+        return tuple(record.to_dict() for record in self.spans())
+
+    def chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": record.name,
+                    "cat": "sopify.runtime",
+                    "ph": "X",
+                    "ts": record.start_ns / 1000,
+                    "dur": record.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                }
+                for record in self.spans()
+            ],
+        }
+
+    def _close(self, name: str, started_ns: int) -> None:
+        record = SpanRecord(
+            name=name,
+            start_ns=started_ns - self.origin_ns,
+            duration_ns=time.perf_counter_ns() - started_ns,
+            thread_id=threading.get_ident(),
+        )
+        with self._guard:
+            self._spans.append(record)
+
+
+_ACTIVE: ContextVar[Optional[SpanRecorder]] = ContextVar("sopify_runtime_span_recorder", default=None)
+
+
+def tracing_enabled(environ: Mapping[str, str] | None = None) -> bool:
+    source = os.environ if environ is None else environ
+    if str(source.get(TRACE_FILE_ENV) or "").strip():
+        return True
+    return str(source.get(TIMINGS_ENV) or "").strip().lower() in _TRUTHY
+
+
+def active_recorder() -> Optional[SpanRecorder]:
+    return _ACTIVE.get()
+
+
+@contextmanager
+def trace_session(*, enabled: bool | None = None) -> Iterator[Optional[SpanRecorder]]:
+    """Open (or join) the turn's recorder; yields None when tracing is off."""
+
+    existing = _ACTIVE.get()
+    if existing is not None:
+        yield existing
+        return
+    if not (tracing_enabled() if enabled is None else enabled):
+        yield None
+        return
+    recorder = SpanRecorder()
+    token = _ACTIVE.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _ACTIVE.reset(token)
+        trace_file = str(os.environ.get(TRACE_FILE_ENV) or "").strip()
+        if trace_file:
+            try:
+                write_chrome_trace(Path(trace_file), recorder)
+            except OSError:
+                # Trace dumps are diagnostics; never fail the turn over them.
+                pass
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the block under the active recorder; a no-op without one."""
+
+    recorder = _ACTIVE.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.span(name):
+        yield
+
+
+def begin_span(name: str) -> Optional[tuple[str, int]]:
+    recorder = _ACTIVE.get()
+    return recorder.begin(name) if recorder is not None else None
+
+
+def end_span(token: Optional[tuple[str, int]]) -> None:
+    recorder = _ACTIVE.get()
+    if recorder is not None and token is not None:
+        recorder.end(token)
+
+
+def current_timings() -> tuple[dict[str, Any], ...]:
+    recorder = _ACTIVE.get()
+    return recorder.timings() if recorder is not None else ()
+
+
+def write_chrome_trace(path: Path, recorder: SpanRecorder) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile("w", delete=False, dir=path.parent, encoding="utf-8") as handle:
+        json.dump(recorder.chrome_trace(), handle, ensure_ascii=False)
+        handle.write("\n")
+        temp_path = Path(handle.name)
+    temp_path.replace(path)
+
+
+__all__ = [
+    "TIMINGS_ENV",
+    "TRACE_FILE_ENV",
+    "SpanRecord",
+    "SpanRecorder",
+    "active_recorder",
+    "begin_span",
+    "current_timings",
+    "end_span",
+    "span",
+    "trace_session",
+    "tracing_enabled",
+    "write_chrome_trace",
+]
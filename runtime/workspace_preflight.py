@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
 import re
 import subprocess
 import sys
+import tempfile
 from typing import Any, Iterator, Mapping
 
 try:
@@ -252,6 +254,18 @@ except ModuleNotFoundError as exc:
 _LEGACY_WORKSPACE_RUNTIME_GATE_ENTRY = "scripts/runtime_gate.py"
 _LEGACY_WORKSPACE_PREFERENCES_PRELOAD_ENTRY = "scripts/preferences_preload_runtime.py"
 
+PREFLIGHT_CACHE_ENV = "SOPIFY_PREFLIGHT_CACHE"
+_PREFLIGHT_CACHE_RELATIVE_PATH = Path("cache") / "workspace-preflight.json"
+_PREFLIGHT_CACHE_SCHEMA_VERSION = "1"
+_PREFLIGHT_CACHE_MAX_VERDICTS = 64
+_PREFLIGHT_CACHEABLE_STATES = {"READY", "NEWER_THAN_GLOBAL"}
+# For a ready workspace the helper still syncs the ignore policy when the
+# request authorizes workspace writes: `~go`, `~go plan`, `~go init`
+# (explicit_allow / explicit_confirm) and the empty installer request
+# (host_installer_default). Those verdicts depend on the request text, so they
+# always go through the helper; `~go exec` / `~go finalize` never write here.
+_PREFLIGHT_CACHE_BYPASS_REQUEST_RE = re.compile(r"^~go(?:$|\s(?!\s*(?:exec|finalize)(?:\s|$)))", re.IGNORECASE)
+
 
 class WorkspacePreflightError(RuntimeError):
     """Raised when workspace runtime preflight cannot complete safely."""
@@ -442,7 +456,11 @@ def preflight_workspace_runtime(
         raise WorkspacePreflightError(f"Payload manifest is missing helper_entry: {payload_manifest_file}")
     preflight_bundle_version = _workspace_selected_bundle_version(bundle_root)
     try:
-        resolve_payload_bundle_manifest_path(payload_root, payload_manifest, bundle_version=preflight_bundle_version)
+        preflight_bundle_manifest_path = resolve_payload_bundle_manifest_path(
+            payload_root,
+            payload_manifest,
+            bundle_version=preflight_bundle_version,
+        )
     except InstallError as exc:
         raise WorkspacePreflightError(str(exc)) from exc
     helper_path = _resolve_helper_path(payload_root=payload_root, helper_entry=helper_entry)
@@ -458,25 +476,52 @@ def preflight_workspace_runtime(
         command.extend(["--host-id", detected_host_id])
     if requested_root is not None:
         command.extend(["--requested-root", str(requested_root_path)])
-    completed, helper_argv_mode = _run_bootstrap_helper_with_compatibility(
-        helper_path=helper_path,
-        workspace_root=resolved_workspace_root,
-        command=command,
-        interaction_mode=interaction_mode,
+    cache_path = payload_root / _PREFLIGHT_CACHE_RELATIVE_PATH if _preflight_cache_enabled(request_text) else None
+    cache = _read_preflight_cache(cache_path)
+    # Past the write-authorizing requests above, the verdict of a ready
+    # workspace does not depend on the request text.
+    cache_key = _preflight_cache_key(_drop_cli_arg_pairs(command, {"--request"}))
+    cached_verdict = _cached_preflight_verdict(
+        cache,
+        cache_key,
+        payload_manifest=payload_manifest,
+        bundle_manifest_path=preflight_bundle_manifest_path,
     )
-    stdout = completed.stdout.strip()
-    try:
-        result = json.loads(stdout) if stdout else {}
-    except json.JSONDecodeError as exc:
-        detail = stdout or completed.stderr.strip()
-        raise WorkspacePreflightError(f"Workspace bootstrap returned invalid JSON: {detail}") from exc
-
-    if not isinstance(result, Mapping):
-        raise WorkspacePreflightError("Workspace bootstrap returned a non-object JSON payload")
-
-    if completed.returncode != 0 or str(result.get("action") or "").strip() == "failed":
-        message = str(result.get("message") or completed.stderr.strip() or stdout or "unknown bootstrap failure")
-        raise WorkspacePreflightError(f"Workspace preflight failed: {message}")
+    if cached_verdict is not None:
+        result, helper_argv_mode = cached_verdict
+    else:
+        completed, helper_argv_mode = _run_remembered_bootstrap_helper(
+            cache,
+            helper_path=helper_path,
+            workspace_root=resolved_workspace_root,
+            command=command,
+            interaction_mode=interaction_mode,
+        )
+        stdout = completed.stdout.strip()
+        try:
+            result = json.loads(stdout) if stdout else {}
+        except json.JSONDecodeError as exc:
+            detail = stdout or completed.stderr.strip()
+            raise WorkspacePreflightError(f"Workspace bootstrap returned invalid JSON: {detail}") from exc
+
+        if not isinstance(result, Mapping):
+            raise WorkspacePreflightError("Workspace bootstrap returned a non-object JSON payload")
+
+        if completed.returncode != 0 or str(result.get("action") or "").strip() == "failed":
+            message = str(result.get("message") or completed.stderr.strip() or stdout or "unknown bootstrap failure")
+            raise WorkspacePreflightError(f"Workspace preflight failed: {message}")
+        _remember_preflight_verdict(
+            cache,
+            cache_key,
+            result=result,
+            helper_argv_mode=helper_argv_mode,
+            payload_manifest=payload_manifest,
+            payload_manifest_file=payload_manifest_file,
+            helper_path=helper_path,
+            bundle_manifest_path=preflight_bundle_manifest_path,
+            workspace_bundle_root=bundle_root,
+        )
+    _write_preflight_cache(cache_path, cache)
     payload = dict(result)
     annotate_outcome_payload(payload, message_hint=str(payload.get("message") or ""))
     # Root disambiguation must stay purely about picking a directory. If the
@@ -512,6 +557,8 @@ def preflight_workspace_runtime(
                 payload.setdefault("preferences_preload_entry", preferences_preload_entry)
     payload.setdefault("helper_path", str(helper_path))
     payload.setdefault("helper_argv_mode", helper_argv_mode)
+    if cached_verdict is not None:
+        payload["verdict_cache"] = "hit"
     if detected_host_id:
         payload.setdefault("host_id", detected_host_id)
     return payload
@@ -856,13 +903,268 @@ def _selected_bundle_manifest_path(
         raise WorkspacePreflightError(str(exc)) from exc
 
 
-def _run_bootstrap_helper_with_compatibility(
+def _preflight_cache_enabled(request_text: str) -> bool:
+    if (os.environ.get(PREFLIGHT_CACHE_ENV) or "").strip().lower() in {"0", "off", "false", "no"}:
+        return False
+    text = str(request_text or "").strip()
+    return bool(text) and _PREFLIGHT_CACHE_BYPASS_REQUEST_RE.match(text) is None
+
+
+def _preflight_cache_key(command: list[str]) -> str:
+    return hashlib.sha256(json.dumps(command, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _read_preflight_cache(path: Path | None) -> dict[str, Any] | None:
+    """Load the payload-local preflight cache; None disables caching for this call."""
+
+    if path is None:
+        return None
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get("schema_version") != _PREFLIGHT_CACHE_SCHEMA_VERSION:
+        cache = {"schema_version": _PREFLIGHT_CACHE_SCHEMA_VERSION}
+    if not isinstance(cache.get("verdicts"), dict):
+        cache["verdicts"] = {}
+    if not isinstance(cache.get("helpers"), dict):
+        cache["helpers"] = {}
+    cache["dirty"] = False
+    return cache
+
+
+def _write_preflight_cache(path: Path | None, cache: dict[str, Any] | None) -> None:
+    """Atomically persist a changed cache; failures only cost the next helper run."""
+
+    if path is None or cache is None or not cache.pop("dirty", False):
+        return
+    temp_path: str | None = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", delete=False) as handle:
+            temp_path = handle.name
+            json.dump(cache, handle, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_path, path)
+        temp_path = None
+    except OSError:
+        pass
+    finally:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def _stat_signature(path: Path) -> list[int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+def _path_kind(path: Path) -> str | None:
+    if path.is_dir():
+        return "dir"
+    if path.is_file():
+        return "file"
+    return None
+
+
+def _file_sha256(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _preflight_verdict_fingerprint(
+    *,
+    payload_manifest: Mapping[str, Any],
+    bundle_manifest_path: Path,
+    signature_paths: list[str],
+    presence_paths: list[str],
+) -> dict[str, Any]:
+    return {
+        "payload_version": [
+            str(payload_manifest.get(field) or "")
+            for field in ("payload_version", "bundle_version", "active_version", "generated_at")
+        ],
+        "bundle_manifest_sha256": _file_sha256(bundle_manifest_path),
+        "signatures": {path: _stat_signature(Path(path)) for path in signature_paths},
+        "presence": {path: _path_kind(Path(path)) for path in presence_paths},
+    }
+
+
+def _cached_preflight_verdict(
+    cache: Mapping[str, Any] | None,
+    cache_key: str,
+    *,
+    payload_manifest: Mapping[str, Any],
+    bundle_manifest_path: Path,
+) -> tuple[dict[str, Any], str] | None:
+    """Return the stored helper verdict when none of its inputs changed since it was recorded."""
+
+    if cache is None:
+        return None
+    entry = cache["verdicts"].get(cache_key)
+    if not isinstance(entry, Mapping):
+        return None
+    fingerprint = entry.get("fingerprint")
+    result = entry.get("result")
+    if not isinstance(fingerprint, Mapping) or not isinstance(result, Mapping):
+        return None
+    current = _preflight_verdict_fingerprint(
+        payload_manifest=payload_manifest,
+        bundle_manifest_path=bundle_manifest_path,
+        signature_paths=list(dict(fingerprint.get("signatures") or {})),
+        presence_paths=list(dict(fingerprint.get("presence") or {})),
+    )
+    if current != fingerprint:
+        return None
+    return (dict(result), str(entry.get("helper_argv_mode") or "contract_v2"))
+
+
+def _remember_preflight_verdict(
+    cache: dict[str, Any] | None,
+    cache_key: str,
+    *,
+    result: Mapping[str, Any],
+    helper_argv_mode: str,
+    payload_manifest: Mapping[str, Any],
+    payload_manifest_file: Path,
+    helper_path: Path,
+    bundle_manifest_path: Path,
+    workspace_bundle_root: Path,
+) -> None:
+    """Record a healthy, write-free verdict keyed on the files the helper decided it from."""
+
+    if cache is None:
+        return
+    verdicts = cache["verdicts"]
+    if verdicts.pop(cache_key, None) is not None:
+        cache["dirty"] = True
+    if str(result.get("action") or "").strip() != "skipped":
+        return
+    if str(result.get("state") or "").strip() not in _PREFLIGHT_CACHEABLE_STATES:
+        return
+
+    # Stub markers: the workspace-local one and the (possibly ancestor) one the helper selected.
+    signature_paths = {
+        str(payload_manifest_file),
+        str(helper_path),
+        str(workspace_bundle_root / "manifest.json"),
+    }
+    result_bundle_root = str(result.get("bundle_root") or "").strip()
+    if result_bundle_root:
+        signature_paths.add(str(Path(result_bundle_root) / "manifest.json"))
+    ignore_target = str(result.get("ignore_target") or "").strip()
+    if ignore_target:
+        signature_paths.add(ignore_target)
+    # Git-ness decides the ignore policy; only presence matters, `.git` itself churns on every command.
+    activation_root = str(result.get("activation_root") or workspace_bundle_root.parent)
+    verdicts[cache_key] = {
+        "fingerprint": _preflight_verdict_fingerprint(
+            payload_manifest=payload_manifest,
+            bundle_manifest_path=bundle_manifest_path,
+            signature_paths=sorted(signature_paths),
+            presence_paths=[str(Path(activation_root) / ".git")],
+        ),
+        "result": dict(result),
+        "helper_argv_mode": helper_argv_mode,
+    }
+    while len(verdicts) > _PREFLIGHT_CACHE_MAX_VERDICTS:
+        verdicts.pop(next(iter(verdicts)))
+    cache["dirty"] = True
+
+
+def _run_remembered_bootstrap_helper(
+    cache: dict[str, Any] | None,
     *,
     helper_path: Path,
     workspace_root: Path,
     command: list[str],
     interaction_mode: str | None,
 ) -> tuple[subprocess.CompletedProcess[str], str]:
+    """Run the helper with the argv contract it was last found to accept for this flag set."""
+
+    helper_record: dict[str, Any] | None = None
+    flags_key = " ".join(sorted(command[2::2]))
+    if cache is not None:
+        helper_signature = _stat_signature(helper_path)
+        helper_record = cache["helpers"].get(str(helper_path))
+        if not isinstance(helper_record, dict) or helper_record.get("signature") != helper_signature:
+            helper_record = {"signature": helper_signature, "argv_modes": {}}
+            cache["helpers"][str(helper_path)] = helper_record
+            cache["dirty"] = True
+        remembered = helper_record["argv_modes"].get(flags_key)
+        if isinstance(remembered, Mapping):
+            replayed = _replay_helper_argv_mode(
+                remembered,
+                helper_path=helper_path,
+                workspace_root=workspace_root,
+                command=command,
+                interaction_mode=interaction_mode,
+            )
+            if replayed is not None:
+                return replayed
+            del helper_record["argv_modes"][flags_key]
+            cache["dirty"] = True
+
+    completed, helper_argv_mode, unsupported_args = _run_bootstrap_helper_with_compatibility(
+        helper_path=helper_path,
+        workspace_root=workspace_root,
+        command=command,
+        interaction_mode=interaction_mode,
+    )
+    # Contract v2 is tried first anyway; only the legacy downgrades are worth remembering.
+    if helper_record is not None and helper_argv_mode != "contract_v2" and not _looks_like_legacy_argparse_error(completed):
+        helper_record["argv_modes"][flags_key] = {
+            "argv_mode": helper_argv_mode,
+            "unsupported_args": sorted(unsupported_args),
+        }
+        cache["dirty"] = True
+    return (completed, helper_argv_mode)
+
+
+def _replay_helper_argv_mode(
+    remembered: Mapping[str, Any],
+    *,
+    helper_path: Path,
+    workspace_root: Path,
+    command: list[str],
+    interaction_mode: str | None,
+) -> tuple[subprocess.CompletedProcess[str], str] | None:
+    helper_argv_mode = str(remembered.get("argv_mode") or "")
+    unsupported_args = {str(item) for item in remembered.get("unsupported_args") or ()}
+    if interaction_mode == "non_interactive" and "--interaction-mode" in unsupported_args:
+        # Re-run discovery so the fail-closed refusal stays in one place.
+        return None
+    if helper_argv_mode == "legacy_fallback":
+        replay_command = [sys.executable, str(helper_path), "--workspace-root", str(workspace_root)]
+    elif helper_argv_mode == "legacy_request_preserved":
+        replay_command = _drop_cli_arg_pairs(command, unsupported_args)
+    else:
+        return None
+    completed = subprocess.run(
+        replay_command,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if _looks_like_legacy_argparse_error(completed):
+        return None
+    return (completed, helper_argv_mode)
+
+
+def _run_bootstrap_helper_with_compatibility(
+    *,
+    helper_path: Path,
+    workspace_root: Path,
+    command: list[str],
+    interaction_mode: str | None,
+) -> tuple[subprocess.CompletedProcess[str], str, set[str]]:
     completed = subprocess.run(
         command,
         capture_output=True,
@@ -870,7 +1172,7 @@ def _run_bootstrap_helper_with_compatibility(
         check=False,
     )
     if not _looks_like_legacy_argparse_error(completed):
-        return (completed, "contract_v2")
+        return (completed, "contract_v2", set())
 
     if interaction_mode == "non_interactive" and _stderr_mentions_unrecognized_argument(completed, "--interaction-mode"):
         # Non-interactive first-write protection must not silently degrade to a
@@ -893,9 +1195,9 @@ def _run_bootstrap_helper_with_compatibility(
             check=False,
         )
         if not _looks_like_legacy_argparse_error(request_preserving_completed):
-            return (request_preserving_completed, "legacy_request_preserved")
+            return (request_preserving_completed, "legacy_request_preserved", unsupported_args)
         if not _stderr_mentions_unrecognized_argument(request_preserving_completed, "--request"):
-            return (request_preserving_completed, "legacy_request_preserved")
+            return (request_preserving_completed, "legacy_request_preserved", unsupported_args)
 
     legacy_command = [sys.executable, str(helper_path), "--workspace-root", str(workspace_root)]
     legacy_completed = subprocess.run(
@@ -904,7 +1206,7 @@ def _run_bootstrap_helper_with_compatibility(
         text=True,
         check=False,
     )
-    return (legacy_completed, "legacy_fallback")
+    return (legacy_completed, "legacy_fallback", set(command[4::2]))
 
 
 def _looks_like_legacy_argparse_error(completed: subprocess.CompletedProcess[str]) -> bool:
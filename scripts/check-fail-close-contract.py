@@ -25,7 +25,7 @@ from runtime.failure_recovery import (
     load_failure_recovery_case_matrix,
     load_failure_recovery_table,
 )
-from runtime.message_templates import render_host_message
+from runtime.message_templates import compile_host_message_templates, render_host_message
 
 DEFAULT_CASE_MATRIX_PATH = REPO_ROOT / "tests" / "fixtures" / "fail_close_case_matrix.yaml"
 DEFAULT_PYTEST_ENTRY_PATH = REPO_ROOT / "tests" / "pytest_entries" / "fail_close_contract_entry.py"
@@ -132,7 +132,7 @@ def _load_contract_assets(
 
         tables = load_decision_tables(args.asset, schema_path=args.schema)
     else:
-        tables = load_default_decision_tables(schema_path=args.schema)
+        tables = load_default_decision_tables(schema_path=args.schema, compiled=False)
 
     if args.recovery_asset:
         recovery_table = load_failure_recovery_table(
@@ -144,6 +144,7 @@ def _load_contract_assets(
         recovery_table = load_default_failure_recovery_table(
             schema_path=args.recovery_schema,
             decision_tables_path=args.asset,
+            compiled=False,
         )
 
     case_matrix = load_failure_recovery_case_matrix(
@@ -162,6 +163,7 @@ def _validate_legacy_recovery_snapshot_consistency(args: argparse.Namespace) ->
     )
     embedded_recovery_table = load_default_failure_recovery_table(
         schema_path=args.recovery_schema,
+        compiled=False,
     )
     assert_failure_recovery_tables_consistent(
         embedded_recovery_table,
@@ -209,6 +211,7 @@ def _validate_host_message_template_rendering(tables: dict[str, object]) -> int:
     if not isinstance(templates, list) or not templates:
         raise FailureRecoveryError("decision_tables.host_message_templates.templates must be a non-empty list")
 
+    resolver = compile_host_message_templates(template_contract)
     rendered_count = 0
     default_locale = str(template_contract.get("default_locale", "zh-CN"))
     for entry in templates:
@@ -226,7 +229,7 @@ def _validate_host_message_template_rendering(tables: dict[str, object]) -> int:
                 prompt_mode=str(prompt_mode),
                 variables=_TEMPLATE_SMOKE_VARIABLES,
                 locale=default_locale,
-                templates=template_contract,
+                templates=resolver,
             )
             if not isinstance(result.get("text"), str) or not str(result["text"]).strip():
                 raise FailureRecoveryError("Host message template render produced an empty message")
@@ -237,7 +240,7 @@ def _validate_host_message_template_rendering(tables: dict[str, object]) -> int:
         prompt_mode="reask_confirm_execute",
         variables=_TEMPLATE_SMOKE_VARIABLES,
         locale=default_locale,
-        templates=template_contract,
+        templates=resolver,
     )
     if not isinstance(fallback_result.get("text"), str) or not str(fallback_result["text"]).strip():
         raise FailureRecoveryError("Prompt-mode fallback render produced an empty message")
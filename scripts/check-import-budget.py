@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure cold imports of runtime entry modules and enforce the import budget."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import re
+import subprocess
+import sys
+from typing import Any, Mapping, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# `import time: self [us] | cumulative | imported package`
+_IMPORTTIME_LINE_RE = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected JSON object in {path}")
+    return data
+
+
+def measure_cold_import(modules: Sequence[str]) -> tuple[float, frozenset[str]]:
+    """Import `modules` in a fresh interpreter; return (cumulative ms, imported module names)."""
+
+    statement = f"import sys; sys.path.insert(0, {str(REPO_ROOT)!r}); " + "; ".join(f"import {name}" for name in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=REPO_ROOT,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{completed.stderr.strip()}")
+    total_us = 0
+    imported: set[str] = set()
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE_RE.match(line)
+        if match is None:
+            continue
+        imported.add(match.group(4))
+        # Top-level rows (one leading space) carry the cumulative cost of each statement.
+        if len(match.group(3)) == 1:
+            total_us += int(match.group(2))
+    return total_us / 1000.0, frozenset(imported)
+
+
+def run_import_budget(budget: Mapping[str, Any], *, repeat: int) -> tuple[dict[str, Any], list[str]]:
+    """Return the report and the budget violations; timings are the min over `repeat` runs."""
+
+    calibration_modules = tuple(budget.get("calibration_modules") or ())
+    calibration_ms = min(measure_cold_import(calibration_modules)[0] for _ in range(repeat)) if calibration_modules else 0.0
+    baseline_calibration = float(budget.get("calibration_ms") or 0.0)
+    scale = calibration_ms / baseline_calibration if calibration_ms > 0 and baseline_calibration > 0 else 1.0
+    scale = max(scale, 1.0)
+
+    report: dict[str, Any] = {"calibration_ms": round(calibration_ms, 3), "scale": round(scale, 3), "results": {}}
+    violations: list[str] = []
+    for module, entry in sorted(dict(budget.get("modules") or {}).items()):
+        timings: list[float] = []
+        imported: frozenset[str] = frozenset()
+        for _ in range(repeat):
+            elapsed_ms, imported = measure_cold_import((module,))
+            timings.append(elapsed_ms)
+        min_ms = min(timings)
+        max_ms = float(entry.get("max_ms") or 0.0) * scale
+        forbidden = sorted(name for name in entry.get("forbidden") or () if name in imported)
+        report["results"][module] = {
+            "min_ms": round(min_ms, 3),
+            "allowed_ms": round(max_ms, 3),
+            "modules": len(imported),
+            "forbidden_imported": forbidden,
+        }
+        if max_ms and min_ms > max_ms:
+            violations.append(f"{module}: cold import {min_ms:.1f}ms > budget {max_ms:.1f}ms (calibrated x{scale:.2f})")
+        if forbidden:
+            violations.append(f"{module}: eagerly imports {', '.join(forbidden)}")
+    return report, violations
+
+
+def _render_summary(report: Mapping[str, Any], violations: Sequence[str]) -> str:
+    lines = [
+        "Runtime import budget report:",
+        f"  calibration_ms: {float(report.get('calibration_ms', 0.0)):.3f} (scale x{float(report.get('scale', 1.0)):.2f})",
+    ]
+    for module, result in sorted(dict(report.get("results") or {}).items()):
+        lines.append(
+            f"  {module}: min={float(result['min_ms']):.1f}ms allowed={float(result['allowed_ms']):.1f}ms "
+            f"modules={int(result['modules'])}"
+        )
+    if violations:
+        lines.append("  budget: FAILED")
+        lines.extend([f"  - {item}" for item in violations])
+    else:
+        lines.append("  budget: PASSED")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Enforce the cold-import budget of runtime entry modules.")
+    parser.add_argument(
+        "--budget",
+        default=str(REPO_ROOT / "benchmarks" / "import_budget.json"),
+        help="Path to the import budget JSON.",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module; the minimum is compared.")
+    args = parser.parse_args(argv)
+
+    budget = _load_json(Path(args.budget).resolve())
+    report, violations = run_import_budget(budget, repeat=max(args.repeat, 1))
+    print(_render_summary(report, violations))
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Run offline per-turn runtime micro-benchmarks and enforce a regression budget."""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.config import clear_runtime_config_cache, load_runtime_config
+from runtime.context_snapshot import resolve_context_snapshot
+from runtime.gate import enter_runtime_gate
+from runtime.kb import bootstrap_kb
+from runtime.models import ReplayEvent, RouteDecision, RuntimeConfig
+from runtime.plan_scaffold import create_plan_scaffold
+from runtime.replay import ReplayWriter
+from runtime.router import Router
+from runtime.skill_registry import SkillRegistry
+from runtime.state import StateStore, iso_now
+
+BENCH_SCHEMA_VERSION = "1"
+_SESSION_ID = "bench-session"
+_ROUTER_REQUESTS = (
+    "~go plan 补 runtime gate 骨架",
+    "修复 README 里的 typo",
+    "重构 runtime engine 的 plugin adapter 分层，顺便统一 handoff contract",
+    "为什么这次又路由成 plan_proposal_pending？先别改代码，解释下原因",
+    "review the implementation of the replay writer",
+    "这个方案的风险还有什么问题？",
+    "把 runtime/router.py 和 runtime/engine.py 里的重复逻辑抽出来",
+    "继续",
+)
+_GATE_REQUEST = "解释下 runtime gate 是做什么的？"
+
+
+def _load_json(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected JSON object in {path}")
+    return data
+
+
+def _write_skill(root: Path, skill_id: str) -> None:
+    skill_dir = root / skill_id
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {skill_id}\ndescription: synthetic benchmark skill {skill_id}\n---\n\n# {skill_id}\n",
+        encoding="utf-8",
+    )
+    (skill_dir / "skill.yaml").write_text(f"id: {skill_id}\nmode: advisory\n", encoding="utf-8")
+
+
+def build_workspace(root: Path, scenario: Mapping[str, Any]) -> RuntimeConfig:
+    """Materialize a synthetic workspace sized by one scenario definition."""
+
+    root.mkdir(parents=True, exist_ok=True)
+    config = load_runtime_config(root)
+    bootstrap_kb(config)
+    for index in range(int(scenario.get("plans", 0))):
+        create_plan_scaffold(
+            f"benchmark plan {index}: 调整 runtime 模块 {index} 的边界",
+            config=config,
+            level="standard" if index % 2 else "light",
+        )
+    for index in range(int(scenario.get("skills", 0))):
+        _write_skill(root / "skills", f"bench-skill-{index:03d}")
+    for index in range(int(scenario.get("sessions", 0))):
+        StateStore(config, session_id=f"bench-{index:03d}").set_last_route(
+            RouteDecision(route_name="consult", request_text=f"session {index}", reason="benchmark seed")
+        )
+    writer = ReplayWriter(config)
+    for index in range(int(scenario.get("replay_sessions", 0))):
+        for step in range(int(scenario.get("replay_events", 5))):
+            writer.append_event(
+                f"bench-run-{index:03d}",
+                ReplayEvent(
+                    ts=iso_now(),
+                    phase="develop",
+                    intent=f"step {step}",
+                    action="edit",
+                    key_output=f"synthetic output {step}",
+                    decision_reason="benchmark seed",
+                    result="success",
+                ),
+            )
+    return config
+
+
+def _bench_router_classify(config: RuntimeConfig, home: Path) -> Callable[[], None]:
+    store = StateStore(config, session_id=_SESSION_ID)
+    global_store = StateStore(config)
+    skills = SkillRegistry(config, user_home=home).discover()
+    snapshot = resolve_context_snapshot(config=config, review_store=store, global_store=global_store)
+    router = Router(config, state_store=store, global_state_store=global_store)
+
+    def run() -> None:
+        for request in _ROUTER_REQUESTS:
+            router.classify(request, skills=skills, snapshot=snapshot)
+
+    return run
+
+
+def _bench_resolve_context_snapshot(config: RuntimeConfig, home: Path) -> Callable[[], None]:
+    def run() -> None:
+        resolve_context_snapshot(
+            config=config,
+            review_store=StateStore(config, session_id=_SESSION_ID),
+            global_store=StateStore(config),
+        )
+
+    return run
+
+
+def _bench_skill_registry_discover(config: RuntimeConfig, home: Path) -> Callable[[], None]:
+    def run() -> None:
+        SkillRegistry(config, user_home=home).discover()
+
+    return run
+
+
+def _bench_bootstrap_kb(config: RuntimeConfig, home: Path) -> Callable[[], None]:
+    def run() -> None:
+        bootstrap_kb(config)
+
+    return run
+
+
+def _bench_enter_runtime_gate(config: RuntimeConfig, home: Path) -> Callable[[], None]:
+    def run() -> None:
+        enter_runtime_gate(
+            _GATE_REQUEST,
+            workspace_root=config.workspace_root,
+            session_id=_SESSION_ID,
+            user_home=home,
+        )
+
+    return run
+
+
+BENCHMARKS: dict[str, Callable[[RuntimeConfig, Path], Callable[[], None]]] = {
+    "router_classify": _bench_router_classify,
+    "resolve_context_snapshot": _bench_resolve_context_snapshot,
+    "skill_registry_discover": _bench_skill_registry_discover,
+    "bootstrap_kb": _bench_bootstrap_kb,
+    "enter_runtime_gate": _bench_enter_runtime_gate,
+}
+
+
+def _calibration_workload() -> None:
+    # Fixed CPU-bound work used to normalize timings across machines.
+    payload = [{"id": index, "name": f"item-{index}", "tags": [str(index % 7)] * 4} for index in range(2000)]
+    json.loads(json.dumps(payload))
+    sorted(payload, key=lambda item: (item["tags"][0], -item["id"]))
+
+
+def measure(fn: Callable[[], None], *, repeat: int, warmup: int = 1) -> dict[str, float]:
+    """Time `fn` with `perf_counter`; return min/median/max in milliseconds."""
+
+    for _ in range(warmup):
+        fn()
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "max_ms": round(max(samples), 4),
+    }
+
+
+@contextmanager
+def _isolated_environment() -> Iterator[None]:
+    # Keep developer-specific host/session overrides out of the measurements.
+    saved = {key: os.environ.pop(key) for key in list(os.environ) if key.startswith("SOPIFY_")}
+    try:
+        yield
+    finally:
+        os.environ.update(saved)
+
+
+def run_benchmarks(
+    scenarios: Sequence[Mapping[str, Any]],
+    *,
+    repeat: int,
+    only: Sequence[str] = (),
+) -> dict[str, Any]:
+    selected = [name for name in BENCHMARKS if not only or name in only]
+    results: dict[str, dict[str, float]] = {}
+    with _isolated_environment(), tempfile.TemporaryDirectory(prefix="sopify-bench-") as temp_dir:
+        for scenario in scenarios:
+            scenario_id = str(scenario["id"])
+            workspace = Path(temp_dir) / scenario_id
+            home = Path(temp_dir) / f"{scenario_id}-home"
+            home.mkdir(parents=True, exist_ok=True)
+            clear_runtime_config_cache()
+            config = build_workspace(workspace, scenario)
+            for name in selected:
+                results[f"{scenario_id}.{name}"] = measure(BENCHMARKS[name](config, home), repeat=repeat)
+    return {
+        "schema_version": BENCH_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "calibration_ms": measure(_calibration_workload, repeat=max(repeat, 5))["median_ms"],
+        "results": results,
+    }
+
+
+def apply_regression_budget(
+    *,
+    report: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    budget: Mapping[str, Any],
+) -> list[str]:
+    """Compare calibration-normalized medians against the committed baseline."""
+
+    violations: list[str] = []
+    max_ratio = float(budget.get("max_regression_ratio", 1.5))
+    min_delta_ms = float(budget.get("min_regression_ms", 1.0))
+    overrides = dict(budget.get("benchmarks") or {})
+    baseline_results = dict(baseline.get("results") or {})
+    baseline_calibration = float(baseline.get("calibration_ms") or 0.0)
+    current_calibration = float(report.get("calibration_ms") or 0.0)
+    scale = current_calibration / baseline_calibration if baseline_calibration > 0 and current_calibration > 0 else 1.0
+
+    for key, current in dict(report.get("results") or {}).items():
+        reference = baseline_results.get(key)
+        if not isinstance(reference, Mapping):
+            continue
+        allowed_ratio = float(dict(overrides.get(key.split(".", 1)[-1]) or {}).get("max_regression_ratio", max_ratio))
+        expected_ms = float(reference.get("median_ms", 0.0)) * scale
+        current_ms = float(current.get("median_ms", 0.0))
+        if current_ms > expected_ms * allowed_ratio and current_ms - expected_ms > min_delta_ms:
+            violations.append(
+                f"{key}: median={current_ms:.3f}ms > {allowed_ratio:.2f}x baseline={expected_ms:.3f}ms (calibrated)"
+            )
+    return violations
+
+
+def _render_summary(report: Mapping[str, Any], violations: Sequence[str]) -> str:
+    lines = [
+        "Runtime benchmark report:",
+        f"  calibration_ms: {float(report.get('calibration_ms', 0.0)):.3f}",
+    ]
+    for key, result in sorted(dict(report.get("results") or {}).items()):
+        lines.append(f"  {key}: median={float(result['median_ms']):.3f}ms min={float(result['min_ms']):.3f}ms")
+    if violations:
+        lines.append("  budget: FAILED")
+        lines.extend([f"  - {item}" for item in violations])
+    else:
+        lines.append("  budget: PASSED")
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run runtime micro-benchmarks and enforce the regression budget.")
+    parser.add_argument(
+        "--baseline",
+        default=str(REPO_ROOT / "benchmarks" / "runtime_bench_baseline.json"),
+        help="Path to the committed baseline JSON (scenarios + reference timings).",
+    )
+    parser.add_argument(
+        "--budget",
+        default=str(REPO_ROOT / "benchmarks" / "runtime_bench_budget.json"),
+        help="Path to the regression budget JSON.",
+    )
+    parser.add_argument(
+        "--report",
+        default=str(REPO_ROOT / "benchmarks" / "runtime_bench_report.json"),
+        help="Path to write the benchmark report JSON.",
+    )
+    parser.add_argument("--repeat", type=int, default=7, help="Timed repetitions per benchmark.")
+    parser.add_argument("--only", action="append", default=[], choices=sorted(BENCHMARKS), help="Run only this benchmark.")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Rewrite the baseline timings from this run instead of enforcing the budget.",
+    )
+    args = parser.parse_args(argv)
+
+    baseline_path = Path(args.baseline).resolve()
+    budget_path = Path(args.budget).resolve()
+    report_path = Path(args.report).resolve()
+
+    baseline = _load_json(baseline_path)
+    budget = _load_json(budget_path)
+    report = run_benchmarks(tuple(baseline.get("scenarios") or ()), repeat=max(args.repeat, 1), only=args.only)
+
+    if args.update_baseline:
+        updated = dict(baseline)
+        updated["calibration_ms"] = report["calibration_ms"]
+        updated["python"] = report["python"]
+        updated["results"] = {**dict(baseline.get("results") or {}), **report["results"]}
+        baseline_path.write_text(json.dumps(updated, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        violations: list[str] = []
+    else:
+        violations = apply_regression_budget(report=report, baseline=baseline, budget=budget)
+    report["violations"] = list(violations)
+    report["budget_passed"] = not violations
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(_render_summary(report, violations))
+    print(f"  report: {report_path}")
+    if args.update_baseline:
+        print(f"  baseline updated: {baseline_path}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Generate runtime/decision_tables_compiled.py from the frozen contract assets."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from pprint import pformat
+import sys
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.decision_tables import (  # noqa: E402
+    DEFAULT_DECISION_TABLES_PATH,
+    DecisionTableError,
+    decision_tables_source_hash,
+    load_decision_tables,
+    relativize_source_paths,
+)
+
+_HEADER = '''"""Pre-validated default decision tables.
+
+Generated by `scripts/generate-decision-tables.py`; do not edit. Source paths
+are relative to the runtime package. `runtime.decision_tables` ignores this
+module once `SOURCE_HASH` no longer matches the contract sources.
+"""
+
+# fmt: off
+'''
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate the pre-validated decision table artifact.")
+    parser.add_argument(
+        "--output",
+        default="runtime/decision_tables_compiled.py",
+        help="Output path, relative to the repository root.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    output_path = (REPO_ROOT / args.output).resolve()
+
+    try:
+        tables = load_decision_tables(DEFAULT_DECISION_TABLES_PATH)
+    except DecisionTableError as exc:
+        raise SystemExit(f"{DEFAULT_DECISION_TABLES_PATH}: {exc}") from exc
+
+    body = pformat(relativize_source_paths(tables), indent=1, width=120, sort_dicts=False)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(
+        f"{_HEADER}SOURCE_HASH = {decision_tables_source_hash()!r}\n\nTABLES = {body}\n",
+        encoding="utf-8",
+    )
+    print(output_path)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
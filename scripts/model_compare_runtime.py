@@ -20,22 +20,34 @@
 - 降级原因使用统一英文 reason code，避免中英文文档口径漂移
 
 说明：
-- 网络调用通过 `model_caller` 回调注入，模块本身不耦合具体 SDK。
+- 网络调用通过 `model_caller` 回调注入，模块本身不耦合具体 SDK；
+  `async def` 的 caller 直接在事件循环里并发，同步 caller 退回线程池。
 - 该实现优先可测试、可读性与契约稳定性，而非极限性能。
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 import hashlib
+import inspect
 import json
+import mmap
 import os
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
 from pathlib import Path
+import sys
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from runtime.context_index import WorkspaceContextIndex, walk_workspace_files
+
 
 # =========================
 # 固定预算（执行层硬约束）
@@ -51,6 +63,13 @@ EXTRACT_SNIPPETS_PER_FILE = 2
 EXTRACT_CONTEXT_WINDOW = 80
 MAX_FACTS = 8
 
+# 无索引时的扫描流水线：I/O 线程数、预读窗口、墙钟预算与 mmap 探测阈值。
+EXTRACT_SCAN_WORKERS = 8
+EXTRACT_SCAN_PREFETCH = EXTRACT_SCAN_WORKERS * 4
+EXTRACT_SCAN_BUDGET_SEC = 3.0
+EXTRACT_MMAP_MIN_BYTES = 64 * 1024
+_TEXT_SNIFF_BYTES = 2048
+
 # 统一 reason code（文档与运行时共享语义）。
 REASON_FEATURE_DISABLED = "FEATURE_DISABLED"
 REASON_NO_ENABLED_CANDIDATES = "NO_ENABLED_CANDIDATES"
@@ -103,6 +122,8 @@ class Candidate:
     api_key_env: str = ""
     api_key: str = ""
     is_default: bool = False
+    # 单候选截止时间（秒，从 fan-out 开始计）；0 表示沿用全局 timeout_sec。
+    timeout_sec: int = 0
 
     @property
     def is_external(self) -> bool:
@@ -197,9 +218,13 @@ class CompareRuntimeOutput:
         return payload
 
 
-# model_caller 约定：输入 (candidate, payload, timeout_sec) -> str 或 dict
+# model_caller 约定：输入 (candidate, payload, timeout_sec) -> str 或 dict；
+# 也可以是 `async def`，返回值约定相同。
 ModelCaller = Callable[[Candidate, Mapping[str, Any], int], Any]
 
+# 流式回调：每个候选得到最终结果（success/error/timeout/cancelled）时按完成顺序触发。
+ResultCallback = Callable[[NormalizedResult], None]
+
 
 # =========================
 # 正则与文本工具
@@ -313,6 +338,7 @@ def build_candidates(
                 api_key_env=candidate.api_key_env,
                 api_key=key,
                 is_default=False,
+                timeout_sec=_safe_int(item.get("timeout_sec"), 0),
             )
         )
 
@@ -337,14 +363,94 @@ def _is_probably_text(path: Path, max_bytes: int = 512 * 1024) -> bool:
         return False
 
 
-def _iter_workspace_files(workspace_root: Path) -> Iterable[Path]:
-    """遍历工作区文件，跳过常见噪声目录。"""
-    ignored_dirs = {".git", "node_modules", ".venv", "dist", "build", "coverage", "__pycache__"}
-    for path in workspace_root.rglob("*"):
-        if any(part in ignored_dirs for part in path.parts):
-            continue
-        if _is_probably_text(path):
-            yield path
+def _iter_workspace_files(workspace_root: Path, *, stats: Optional[Dict[str, Any]] = None) -> Iterable[Path]:
+    """按目录名顺序遍历候选文件：`os.scandir` + 目录级剪枝（噪声目录与 `.gitignore`）。
+
+    只按大小预筛；二进制判定交给 `_probe_keyword_hits` 在读取时完成。
+    """
+    root = workspace_root.resolve()
+    for rel_path, _signature in walk_workspace_files(root, stats=stats):
+        yield root / rel_path
+
+
+def _keyword_probe_pattern(keywords: Sequence[str]) -> Optional[re.Pattern[bytes]]:
+    """把关键词编译成一个字节级正则，ASCII 忽略大小写，与 `line.lower()` 匹配口径一致。"""
+    parts = [re.escape(keyword.encode("utf-8")) for keyword in keywords if keyword]
+    if not parts:
+        return None
+    return re.compile(b"|".join(parts), re.IGNORECASE)
+
+
+def _probe_keyword_hits(path: Path, probe: re.Pattern[bytes], keywords: Sequence[str]) -> List[int]:
+    """先在原始字节上探测关键词，命中后才解码分行；大文件走 mmap，避免整块读入。"""
+    try:
+        with path.open("rb") as stream:
+            head = stream.read(_TEXT_SNIFF_BYTES)
+            if b"\x00" in head:
+                return []
+            if os.fstat(stream.fileno()).st_size >= EXTRACT_MMAP_MIN_BYTES:
+                with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    if probe.search(mapped) is None:
+                        return []
+                    data = mapped[:]
+            else:
+                data = head + stream.read()
+                if probe.search(data) is None:
+                    return []
+    except (OSError, ValueError):
+        return []
+    return _find_keyword_hits(data.decode("utf-8", errors="ignore").splitlines(), keywords)
+
+
+def _scan_keyword_files(
+    workspace_root: Path,
+    keywords: Sequence[str],
+    *,
+    limit: int,
+    exclude: Iterable[Path],
+    budget_sec: float = EXTRACT_SCAN_BUDGET_SEC,
+) -> Tuple[List[Tuple[Path, List[int]]], Dict[str, Any]]:
+    """无索引时的关键词检索：遍历顺序产出、线程池并发探测、墙钟预算内返回已有结果。
+
+    结果按遍历顺序确认（与串行扫描一致）；预算耗尽时返回 best-so-far，并在统计里标记。
+    """
+    started = time.monotonic()
+    deadline = started + budget_sec
+    stats: Dict[str, Any] = {"mode": "scan", "dirs": 0, "files": 0, "probed": 0, "budget_exhausted": False}
+    found: List[Tuple[Path, List[int]]] = []
+    probe = _keyword_probe_pattern(keywords)
+    excluded = set(exclude)
+    if probe is not None and limit > 0:
+        files = iter(_iter_workspace_files(workspace_root, stats=stats))
+        pending: deque[Tuple[Path, Any]] = deque()
+        walk_done = False
+        executor = ThreadPoolExecutor(max_workers=EXTRACT_SCAN_WORKERS)
+        try:
+            while len(found) < limit:
+                while not walk_done and len(pending) < EXTRACT_SCAN_PREFETCH and time.monotonic() < deadline:
+                    path = next(files, None)
+                    if path is None:
+                        walk_done = True
+                    elif path not in excluded:
+                        pending.append((path, executor.submit(_probe_keyword_hits, path, probe, keywords)))
+                if not pending:
+                    stats["budget_exhausted"] = not walk_done
+                    break
+                path, future = pending[0]
+                try:
+                    hits = future.result(timeout=max(deadline - time.monotonic(), 0))
+                except FuturesTimeoutError:
+                    stats["budget_exhausted"] = True
+                    break
+                pending.popleft()
+                stats["probed"] += 1
+                if hits:
+                    found.append((path, hits))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    stats["hits"] = len(found)
+    stats["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+    return found, stats
 
 
 def _extract_keywords(question: str) -> List[str]:
@@ -478,18 +584,24 @@ def extract_context_pack(
         file_priority.setdefault(hint_path, (1, "question_path"))
 
     # Step 1.3：关键词检索补充文件，直到触达探索上限。
+    # 已初始化的工作区走持久化倒排索引（只重建变更文件），否则退回并发扫描。
+    keyword_hits: Dict[Path, List[int]] = {}
+    scan_stats: Dict[str, Any] = {"mode": "none"}
     if len(file_priority) < EXTRACT_MAX_FILES and keywords:
-        for file_path in _iter_workspace_files(workspace_root):
-            if file_path in file_priority:
-                continue
-            lines = _read_file_lines(file_path)
-            if not lines:
-                continue
-            hits = _find_keyword_hits(lines, keywords)
-            if hits:
-                file_priority[file_path] = (2, "keyword_search")
-            if len(file_priority) >= EXTRACT_MAX_FILES:
-                break
+        limit = EXTRACT_MAX_FILES - len(file_priority)
+        index = WorkspaceContextIndex.for_workspace(workspace_root)
+        if index is not None:
+            started = time.monotonic()
+            scan_stats = {"mode": "index", **index.refresh()}
+            found = index.search(keywords, limit=limit, exclude=file_priority)
+            index.save()
+            scan_stats["hits"] = len(found)
+            scan_stats["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        else:
+            found, scan_stats = _scan_keyword_files(workspace_root, keywords, limit=limit, exclude=file_priority)
+        for file_path, hits in found:
+            file_priority[file_path] = (2, "keyword_search")
+            keyword_hits[file_path] = hits
 
     # Step 1.4：针对每个候选文件提取最多 2 段片段。
     for file_path, (priority, source) in sorted(file_priority.items(), key=lambda item: item[1][0]):
@@ -497,7 +609,7 @@ def extract_context_pack(
         if not lines:
             continue
 
-        hits = _find_keyword_hits(lines, keywords)
+        hits = keyword_hits.get(file_path) or _find_keyword_hits(lines, keywords)
         if not hits:
             # 没命中关键词时，仍保留文件头部附近 1 段，保证显式文件不会丢失。
             hits = [1]
@@ -510,7 +622,7 @@ def extract_context_pack(
     for snippet in snippets[:MAX_FACTS]:
         facts.append(f"{snippet.path}:{snippet.start_line}-{snippet.end_line} (source={snippet.source})")
 
-    return ContextPack(facts=facts, snippets=snippets, meta={})
+    return ContextPack(facts=facts, snippets=snippets, meta={"scan": scan_stats})
 
 
 def _redact_text(text: str) -> Tuple[str, int]:
@@ -745,19 +857,46 @@ def _normalize_answer(raw_response: Any) -> str:
     return str(raw_response)
 
 
-def _call_one_candidate(
+async def _call_one_candidate(
     *,
     candidate: Candidate,
     payload: Mapping[str, Any],
     timeout_sec: int,
+    deadline: float,
     model_caller: ModelCaller,
     payload_signature: str,
+    semaphore: asyncio.Semaphore,
+    executor: Optional[ThreadPoolExecutor],
 ) -> NormalizedResult:
-    """调用单个候选并归一化结果。"""
-    started = time.monotonic()
-    try:
-        response = model_caller(candidate, payload, timeout_sec)
-        answer = _normalize_answer(response)
+    """在截止时间内调用单个候选并归一化结果；超时只放弃等待，不阻塞 fan-out 返回。"""
+    async with semaphore:
+        started = time.monotonic()
+        remaining = deadline - started
+        try:
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+            if executor is None:
+                response = await asyncio.wait_for(model_caller(candidate, payload, timeout_sec), remaining)
+            else:
+                call = asyncio.get_running_loop().run_in_executor(executor, model_caller, candidate, payload, timeout_sec)
+                response = await asyncio.wait_for(call, remaining)
+            answer = _normalize_answer(response)
+        except asyncio.TimeoutError:
+            return NormalizedResult(
+                candidate_id=candidate.id,
+                status="timeout",
+                latency_ms=timeout_sec * 1000,
+                error="request timeout",
+                payload_signature=payload_signature,
+            )
+        except Exception as exc:  # noqa: BLE001 - 运行时容错需要吞并单模型失败
+            return NormalizedResult(
+                candidate_id=candidate.id,
+                status="error",
+                latency_ms=int((time.monotonic() - started) * 1000),
+                error=str(exc),
+                payload_signature=payload_signature,
+            )
         return NormalizedResult(
             candidate_id=candidate.id,
             status="success",
@@ -765,95 +904,128 @@ def _call_one_candidate(
             answer=answer,
             payload_signature=payload_signature,
         )
-    except Exception as exc:  # noqa: BLE001 - 运行时容错需要吞并单模型失败
-        return NormalizedResult(
-            candidate_id=candidate.id,
-            status="error",
-            latency_ms=int((time.monotonic() - started) * 1000),
-            error=str(exc),
-            payload_signature=payload_signature,
-        )
 
 
-def fanout_call(
+def _is_async_caller(model_caller: ModelCaller) -> bool:
+    return inspect.iscoroutinefunction(model_caller) or inspect.iscoroutinefunction(
+        getattr(model_caller, "__call__", None)
+    )
+
+
+async def fanout_call_async(
     *,
     candidates: Sequence[Candidate],
     payload: Mapping[str, Any],
     timeout_sec: int,
     max_parallel: int,
     model_caller: ModelCaller,
+    min_successes: Optional[int] = None,
+    on_result: Optional[ResultCallback] = None,
 ) -> List[NormalizedResult]:
-    """阶段 5：并发调用候选。
+    """阶段 5（asyncio 实现）：并发调用候选。
 
     设计细节：
     - 至少 1 个模型失败不影响其他模型。
-    - 到达总超时后，未完成任务标记为 timeout。
+    - 每个候选按自身截止时间（`Candidate.timeout_sec`，缺省为全局）标记 timeout。
+    - 达到 `min_successes` 个成功结果后立即返回，其余候选标记为 cancelled。
+    - 同步 caller 的超时线程不再被等待，fan-out 按截止时间返回。
     """
     if not candidates:
         return []
 
     signature = _payload_signature(payload)
-
-    if len(candidates) == 1:
-        return [
-            _call_one_candidate(
-                candidate=candidates[0],
-                payload=payload,
-                timeout_sec=timeout_sec,
-                model_caller=model_caller,
-                payload_signature=signature,
-            )
-        ]
-
     workers = max(1, min(max_parallel, len(candidates)))
+    semaphore = asyncio.Semaphore(workers)
+    executor = None if _is_async_caller(model_caller) else ThreadPoolExecutor(max_workers=workers)
+    started = time.monotonic()
     results_by_id: Dict[str, NormalizedResult] = {}
+    success_count = 0
 
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        future_map = {
-            executor.submit(
-                _call_one_candidate,
+    tasks = {
+        asyncio.ensure_future(
+            _call_one_candidate(
                 candidate=candidate,
                 payload=payload,
-                timeout_sec=timeout_sec,
+                timeout_sec=candidate.timeout_sec or timeout_sec,
+                deadline=started + (candidate.timeout_sec or timeout_sec),
                 model_caller=model_caller,
                 payload_signature=signature,
-            ): candidate
-            for candidate in candidates
-        }
-
-        try:
-            for future in as_completed(future_map, timeout=timeout_sec):
-                candidate = future_map[future]
-                try:
-                    results_by_id[candidate.id] = future.result()
-                except Exception as exc:  # noqa: BLE001
-                    results_by_id[candidate.id] = NormalizedResult(
-                        candidate_id=candidate.id,
-                        status="error",
-                        latency_ms=timeout_sec * 1000,
-                        error=str(exc),
+                semaphore=semaphore,
+                executor=executor,
+            )
+        ): candidate
+        for candidate in candidates
+    }
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda item: candidates.index(tasks[item])):
+                result = task.result()
+                results_by_id[result.candidate_id] = result
+                if result.status == "success":
+                    success_count += 1
+                if on_result is not None:
+                    on_result(result)
+            if pending and min_successes and success_count >= min_successes:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                latency_ms = int((time.monotonic() - started) * 1000)
+                for task in sorted(pending, key=lambda item: candidates.index(tasks[item])):
+                    result = NormalizedResult(
+                        candidate_id=tasks[task].id,
+                        status="cancelled",
+                        latency_ms=latency_ms,
+                        error=f"cancelled after {success_count} successful results",
                         payload_signature=signature,
                     )
-        except FuturesTimeoutError:
-            # 整体超时后，剩余 future 统一补 timeout 状态。
-            pass
-
-        for future, candidate in future_map.items():
-            if candidate.id in results_by_id:
-                continue
-            future.cancel()
-            results_by_id[candidate.id] = NormalizedResult(
-                candidate_id=candidate.id,
-                status="timeout",
-                latency_ms=timeout_sec * 1000,
-                error="request timeout",
-                payload_signature=signature,
-            )
+                    results_by_id[result.candidate_id] = result
+                    if on_result is not None:
+                        on_result(result)
+                pending = set()
+    finally:
+        for task in pending:
+            task.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # 输出顺序与输入候选顺序一致，方便上层映射 A/B/C。
     return [results_by_id[candidate.id] for candidate in candidates]
 
 
+def fanout_call(
+    *,
+    candidates: Sequence[Candidate],
+    payload: Mapping[str, Any],
+    timeout_sec: int,
+    max_parallel: int,
+    model_caller: ModelCaller,
+    min_successes: Optional[int] = None,
+    on_result: Optional[ResultCallback] = None,
+) -> List[NormalizedResult]:
+    """阶段 5：并发调用候选（同步入口，语义见 `fanout_call_async`）。"""
+    if not candidates:
+        return []
+
+    fanout = fanout_call_async(
+        candidates=candidates,
+        payload=payload,
+        timeout_sec=timeout_sec,
+        max_parallel=max_parallel,
+        model_caller=model_caller,
+        min_successes=min_successes,
+        on_result=on_result,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(fanout)
+    # 调用方自身已在事件循环里：换一个线程跑独立的循环，避免嵌套 run。
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, fanout).result()
+
+
 def _metadata_from_pack(*, context_bridge: bool, pack: Optional[ContextPack]) -> Dict[str, Any]:
     """统一生成强制元信息字段。"""
     if pack is None:
@@ -894,8 +1066,13 @@ def run_model_compare_runtime(
     explicit_files: Optional[Sequence[str]] = None,
     explicit_snippets: Optional[Sequence[Mapping[str, Any]]] = None,
     env: Optional[Mapping[str, str]] = None,
+    min_successes: Optional[int] = None,
+    on_result: Optional[ResultCallback] = None,
 ) -> CompareRuntimeOutput:
-    """主入口：执行完整 compare 运行时链路。"""
+    """主入口：执行完整 compare 运行时链路。
+
+    `min_successes` 达到后提前返回、取消其余候选；`on_result` 随结果到达逐个回调。
+    """
 
     # ========== Step 0：配置与候选准备 ==========
     config = load_runtime_config(multi_model_config)
@@ -970,6 +1147,8 @@ def run_model_compare_runtime(
         timeout_sec=config.timeout_sec,
         max_parallel=config.max_parallel,
         model_caller=model_caller,
+        min_successes=min_successes,
+        on_result=on_result,
     )
 
     metadata = _metadata_from_pack(context_bridge=config.context_bridge, pack=context_pack)
@@ -1001,12 +1180,14 @@ __all__ = [
     "ContextPack",
     "ModelCaller",
     "NormalizedResult",
+    "ResultCallback",
     "RuntimeConfig",
     "build_candidates",
     "build_context_pack",
     "build_shared_payload",
     "extract_context_pack",
     "fanout_call",
+    "fanout_call_async",
     "load_runtime_config",
     "make_default_candidate",
     "redact_context_pack",
@@ -18,7 +18,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from runtime.config import ConfigError, load_runtime_config
-from runtime.plan_registry import PlanRegistryError, confirm_plan_priority, inspect_plan_registry
+from runtime.plan_registry import PlanRegistryError, inspect_plan_registry, plan_registry_session
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -84,13 +84,11 @@ def main(argv: list[str] | None = None) -> int:
 
 
 def _confirm_priority(*, config, plan_id: str, priority: str, note: str | None) -> dict[str, object]:
-    confirmed = confirm_plan_priority(
-        config=config,
-        plan_id=plan_id,
-        priority=priority,
-        note=note,
-    )
-    inspected = inspect_plan_registry(config=config, plan_id=plan_id)
+    # Confirm and re-inspect against one reconciled registry view so the
+    # registry is read, reconciled and written back once.
+    with plan_registry_session(config, create_if_missing=True, backfill_if_missing=True) as session:
+        confirmed = session.confirm_priority(plan_id=plan_id, priority=priority, note=note)
+        inspected = session.inspect(plan_id=plan_id)
     governance = dict(confirmed.get("governance") or {})
     return {
         "status": "written",
@@ -58,10 +58,22 @@ PY
   rm -f "$tmp"
 }
 
+check_decision_tables_artifact_drift() {
+  local tmp
+  tmp="$(mktemp)"
+  python3 "$ROOT_DIR/scripts/generate-decision-tables.py" --output "$tmp" >/dev/null
+  if ! diff -u "$ROOT_DIR/runtime/decision_tables_compiled.py" "$tmp"; then
+    rm -f "$tmp"
+    return 1
+  fi
+  rm -f "$tmp"
+}
+
 run_step "Sync skills" bash "$ROOT_DIR/scripts/sync-skills.sh"
 run_step "Check skills sync" bash "$ROOT_DIR/scripts/check-skills-sync.sh"
 run_step "Check version consistency" bash "$ROOT_DIR/scripts/check-version-consistency.sh"
 run_step "Check builtin catalog drift" check_builtin_catalog_drift
+run_step "Check decision table artifact drift" check_decision_tables_artifact_drift
 run_step "Check fail-close contract" python3 "$ROOT_DIR/scripts/check-fail-close-contract.py"
 run_step "Check context checkpoints" python3 "$ROOT_DIR/scripts/check-context-checkpoints.py" repo --root "$ROOT_DIR"
 run_step "Run runtime unit tests" python3 -m unittest discover "$ROOT_DIR/tests" -v
@@ -5,15 +5,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
+import socket
 import sys
+from typing import Any
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from runtime.gate import enter_runtime_gate
-from runtime.gate_output import render_gate_text
+# Mirrors runtime.gate_daemon. The client path stays stdlib-only so a warm
+# daemon answer never pays for importing the runtime package.
+DAEMON_PROTOCOL_VERSION = "1"
+DAEMON_SOCKET_ENV = "SOPIFY_GATE_DAEMON_SOCKET"
+DAEMON_CONNECT_TIMEOUT_SECONDS = 0.5
+DAEMON_RESPONSE_TIMEOUT_SECONDS = 300.0
+# The daemon runs with its own cwd, so relative paths must be anchored here.
+_DAEMON_PATH_ARGUMENTS = ("global_config_path", "payload_manifest_path", "activation_root", "payload_root", "requested_root")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -83,29 +92,135 @@ def build_parser() -> argparse.ArgumentParser:
         default="json",
         help="Render the gate contract as JSON or a terminal-friendly text view. Defaults to json.",
     )
+    enter.add_argument(
+        "--daemon-socket",
+        default=os.environ.get(DAEMON_SOCKET_ENV) or None,
+        help=f"Optional warm gate daemon socket. Falls back to in-process execution when unreachable. Defaults to ${DAEMON_SOCKET_ENV}.",
+    )
+
+    serve = subparsers.add_parser("serve", help="Keep the runtime gate resident and serve JSON-lines requests.")
+    transport = serve.add_mutually_exclusive_group(required=True)
+    transport.add_argument(
+        "--socket",
+        default=None,
+        help="Unix socket path to listen on.",
+    )
+    transport.add_argument(
+        "--stdio",
+        action="store_true",
+        help="Serve requests from stdin and write responses to stdout.",
+    )
+    serve.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Optional number of idle seconds after which the socket daemon exits.",
+    )
     return parser
 
 
+def _forwarded_environment() -> dict[str, str]:
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith("SOPIFY_") and key != DAEMON_SOCKET_ENV
+    }
+
+
+def _enter_via_daemon(socket_path: str, *, request: str, arguments: dict[str, Any]) -> dict[str, Any] | None:
+    """Ask a warm daemon for the gate contract; return None to run in-process.
+
+    Only a refused connection or a `fallback` answer falls back; both happen
+    before the daemon touches the workspace.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    daemon_arguments = dict(arguments)
+    for name in _DAEMON_PATH_ARGUMENTS:
+        if daemon_arguments.get(name):
+            daemon_arguments[name] = os.path.abspath(os.path.expanduser(str(daemon_arguments[name])))
+    message = {
+        "protocol_version": DAEMON_PROTOCOL_VERSION,
+        "command": "enter",
+        "request": request,
+        "arguments": daemon_arguments,
+        "env": _forwarded_environment(),
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.settimeout(DAEMON_CONNECT_TIMEOUT_SECONDS)
+            client.connect(socket_path)
+        except OSError:
+            return None
+        # From here on the daemon may already be running the turn, so any
+        # failure is surfaced instead of re-running the gate in-process.
+        try:
+            client.settimeout(DAEMON_RESPONSE_TIMEOUT_SECONDS)
+            client.sendall((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+            with client.makefile("r", encoding="utf-8") as reader:
+                line = reader.readline()
+            response = json.loads(line)
+        except (OSError, ValueError) as exc:
+            return _daemon_error_contract(arguments, f"Runtime gate daemon did not answer: {exc}")
+    if not isinstance(response, dict):
+        return _daemon_error_contract(arguments, "Runtime gate daemon returned an invalid response")
+    status = response.get("status")
+    if status == "fallback":
+        return None
+    contract = response.get("contract")
+    if status == "ok" and isinstance(contract, dict):
+        return contract
+    return _daemon_error_contract(arguments, str(response.get("message") or f"Runtime gate daemon returned status {status!r}"))
+
+
+def _daemon_error_contract(arguments: dict[str, Any], message: str) -> dict[str, Any]:
+    # Same shape as every other gate error; gate_contract imports no runtime code.
+    from runtime.gate_contract import base_gate_contract
+
+    contract = base_gate_contract(str(arguments.get("workspace_root") or ""))
+    contract.update({"error_code": "runtime_gate_daemon_error", "message": message})
+    return contract
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from runtime.gate_daemon import serve_stdio, serve_unix_socket
+
+    if args.stdio:
+        return serve_stdio()
+    return serve_unix_socket(args.socket, idle_timeout=args.idle_timeout)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.command == "serve":
+        return _serve(args)
     if args.command != "enter":
         raise ValueError(f"Unsupported command: {args.command}")
 
-    payload = enter_runtime_gate(
-        args.request,
-        workspace_root=Path(args.workspace_root).resolve(),
-        global_config_path=args.global_config_path,
-        payload_manifest_path=args.payload_manifest_path,
-        activation_root=args.activation_root,
-        interaction_mode=args.interaction_mode,
-        payload_root=args.payload_root,
-        host_id=args.host_id,
-        requested_root=args.requested_root,
-        session_id=args.session_id,
-        write_receipt=not args.no_receipt,
-    )
+    arguments: dict[str, Any] = {
+        "workspace_root": str(Path(args.workspace_root).resolve()),
+        "global_config_path": args.global_config_path,
+        "payload_manifest_path": args.payload_manifest_path,
+        "activation_root": args.activation_root,
+        "interaction_mode": args.interaction_mode,
+        "payload_root": args.payload_root,
+        "host_id": args.host_id,
+        "requested_root": args.requested_root,
+        "session_id": args.session_id,
+        "write_receipt": not args.no_receipt,
+    }
+    payload = None
+    if args.daemon_socket:
+        payload = _enter_via_daemon(args.daemon_socket, request=args.request, arguments=arguments)
+    if payload is None:
+        from runtime.gate import enter_runtime_gate
+
+        payload = enter_runtime_gate(args.request, **arguments)
     if args.format == "text":
+        from runtime.gate_output import render_gate_text
+
         print(render_gate_text(payload))
     else:
         print(json.dumps(payload, ensure_ascii=False, indent=2))
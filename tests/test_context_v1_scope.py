@@ -595,17 +595,11 @@ class ResolutionPlannerTests(unittest.TestCase):
             asset_path.write_text(mutated_asset, encoding="utf-8")
 
             with patch(
-                "runtime.resolution_planner.load_default_decision_tables",
+                "runtime.contract_registry.default_decision_tables_view",
                 side_effect=lambda: load_decision_tables(asset_path),
             ):
-                import runtime.resolution_planner as resolution_planner
-
-                resolution_planner._load_resolution_registry.cache_clear()
-                try:
-                    with self.assertRaisesRegex(DecisionTableError, r"exceed current V1 scope"):
-                        build_resolution_planner(guard)
-                finally:
-                    resolution_planner._load_resolution_registry.cache_clear()
+                with self.assertRaisesRegex(DecisionTableError, r"exceed current V1 scope"):
+                    build_resolution_planner(guard)
 
 
 class SidecarClassifierBoundaryTests(unittest.TestCase):
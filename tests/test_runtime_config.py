@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from tests.runtime_test_support import *
+from runtime.config import clear_runtime_config_cache
+from runtime._yaml import load_front_matter, split_front_matter
 
 
 class RuntimeConfigTests(unittest.TestCase):
@@ -39,6 +41,20 @@ class RuntimeConfigTests(unittest.TestCase):
             with self.assertRaises(ConfigError):
                 load_runtime_config(workspace)
 
+    def test_replay_retention_budgets_are_validated(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config_path = workspace / "sopify.config.yaml"
+            config_path.write_text("replay:\n  max_sessions: 0\n  rotate_mb: 4\n", encoding="utf-8")
+            config = load_runtime_config(workspace)
+            self.assertEqual(config.replay_max_sessions, 0)
+            self.assertEqual(config.replay_rotate_mb, 4)
+            self.assertEqual(config.replay_max_age_days, 30)
+
+            config_path.write_text("replay:\n  max_sessions: -1\n", encoding="utf-8")
+            with self.assertRaises(ConfigError):
+                load_runtime_config(workspace)
+
     def test_brand_auto_prefers_package_name_over_directory(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -47,7 +63,58 @@ class RuntimeConfigTests(unittest.TestCase):
             self.assertEqual(config.brand, "sample-workspace-ai")
 
 
+class RuntimeConfigCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_runtime_config_cache()
+
+    def test_unchanged_config_files_reuse_the_cached_instance(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / "sopify.config.yaml").write_text("language: en-US\n", encoding="utf-8")
+            first = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+            with mock.patch("runtime.config._load_config_file") as load_file:
+                second = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+            load_file.assert_not_called()
+            self.assertIs(first, second)
+
+    def test_config_cache_invalidates_when_project_or_brand_sources_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            project_path = workspace / "sopify.config.yaml"
+            project_path.write_text("language: en-US\n", encoding="utf-8")
+            first = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+
+            project_path.write_text("language: zh-CN\nplan:\n  level: light\n", encoding="utf-8")
+            second = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+            self.assertEqual(first.language, "en-US")
+            self.assertEqual(second.language, "zh-CN")
+            self.assertEqual(second.plan_level, "light")
+
+            (workspace / "package.json").write_text('{"name":"renamed-workspace"}', encoding="utf-8")
+            third = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+            self.assertEqual(third.brand, "renamed-workspace-ai")
+
+    def test_run_runtime_uses_injected_config_without_reloading(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = load_runtime_config(workspace, global_config_path=workspace / "missing.yaml")
+            with mock.patch("runtime.engine.load_runtime_config") as load_config:
+                result = run_runtime("解释一下 runtime gate", workspace_root=workspace, user_home=workspace / "home", config=config)
+            load_config.assert_not_called()
+            self.assertEqual(result.route.route_name, "consult")
+
+            with self.assertRaises(ValueError):
+                run_runtime("解释一下 runtime gate", workspace_root=workspace / "other", config=config)
+
+
 class YamlLoaderTests(unittest.TestCase):
     def test_quoted_list_item_with_colon_is_parsed_as_string(self) -> None:
         payload = load_yaml('triggers:\n  - "~compare"\n  - "compare:"\n')
         self.assertEqual(payload["triggers"], ["~compare", "compare:"])
+
+    def test_front_matter_helpers_split_and_reject_unusable_headers(self) -> None:
+        self.assertEqual(split_front_matter("--- \nname: demo\n---\n\n# Demo\n"), ("name: demo", "\n# Demo\n"))
+        self.assertIsNone(split_front_matter("# No header\n"))
+        self.assertEqual(load_front_matter("---\nplan_id: demo\n---\nbody\n"), ({"plan_id": "demo"}, "body\n"))
+        self.assertIsNone(load_front_matter("---\n- just\n- a list\n---\nbody\n"))
+        self.assertIsNone(load_front_matter("---\nkey: [unsupported\n  bad: indent\n---\nbody\n"))
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from tests.runtime_test_support import *
+import runtime.context_index as context_index_module
+from runtime.context_index import CONTEXT_INDEX_FILENAME, WorkspaceContextIndex
+from scripts.model_compare_runtime import _scan_keyword_files, extract_context_pack
+
+
+class WorkspaceContextIndexTests(unittest.TestCase):
+    def test_index_prunes_ignored_dirs_and_reindexes_only_changed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / ".gitignore").write_text("generated/\n*.log\n", encoding="utf-8")
+            (workspace / "src").mkdir()
+            (workspace / "src" / "router.py").write_text("import os\n\n\ndef classify_request():\n    return 'RouteDecision'\n", encoding="utf-8")
+            (workspace / "src" / "notes.md").write_text("# Notes\nclassify_request is the entry\n", encoding="utf-8")
+            (workspace / "src" / "trace.log").write_text("classify_request\n", encoding="utf-8")
+            (workspace / "generated").mkdir()
+            (workspace / "generated" / "copy.py").write_text("def classify_request():\n    pass\n", encoding="utf-8")
+            (workspace / "node_modules").mkdir()
+            (workspace / "node_modules" / "dep.js").write_text("classify_request()\n", encoding="utf-8")
+            cache_path = workspace / ".sopify-skills" / "state" / "cache" / CONTEXT_INDEX_FILENAME
+
+            index = WorkspaceContextIndex(workspace, cache_path=cache_path)
+            stats = index.refresh()
+            self.assertEqual(stats["indexed"], 3)
+            self.assertTrue(index.save())
+            results = index.search(["Classify"], limit=8)
+            self.assertEqual(
+                [(path.relative_to(workspace.resolve()).as_posix(), lines) for path, lines in results],
+                [("src/notes.md", [2]), ("src/router.py", [4])],
+            )
+
+            (workspace / "src" / "notes.md").write_text("# Notes\nnothing relevant\n", encoding="utf-8")
+            reloaded = WorkspaceContextIndex(workspace, cache_path=cache_path)
+            with mock.patch("runtime.context_index._index_file", wraps=context_index_module._index_file) as index_file:
+                stats = reloaded.refresh()
+            self.assertEqual(index_file.call_count, 1)
+            self.assertEqual(stats["indexed"], 1)
+            self.assertEqual(
+                [path.name for path, _ in reloaded.search(["classify"], limit=8)],
+                ["router.py"],
+            )
+
+    def test_extract_context_pack_uses_persisted_index_in_bootstrapped_workspace(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / ".sopify-skills").mkdir()
+            (workspace / "service.py").write_text("class PaymentGateway:\n    pass\n", encoding="utf-8")
+
+            pack = extract_context_pack("PaymentGateway 怎么实现", workspace_root=workspace)
+
+            self.assertEqual([Path(snippet.path).name for snippet in pack.snippets], ["service.py"])
+            self.assertTrue((workspace / ".sopify-skills" / "state" / "cache" / CONTEXT_INDEX_FILENAME).exists())
+            with mock.patch("scripts.model_compare_runtime._iter_workspace_files", side_effect=AssertionError("scan")):
+                pack = extract_context_pack("PaymentGateway 怎么实现", workspace_root=workspace)
+            self.assertEqual(len(pack.snippets), 1)
+
+    def test_scan_without_index_probes_in_parallel_and_respects_the_budget(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            for index in range(12):
+                (workspace / f"module_{index:02d}.py").write_text(f"value = {index}\n", encoding="utf-8")
+            (workspace / "large.txt").write_text("filler line\n" * 8000 + "Uses the LedgerSync adapter\n", encoding="utf-8")
+            (workspace / "module_05.py").write_text("# ledgersync entry\nvalue = 5\n", encoding="utf-8")
+            (workspace / "blob.bin").write_bytes(b"\x00LedgerSync")
+
+            pack = extract_context_pack("LedgerSync 在哪里", workspace_root=workspace)
+            scan = pack.meta["scan"]
+            self.assertEqual(scan["mode"], "scan")
+            self.assertEqual(scan["hits"], 2)
+            self.assertFalse(scan["budget_exhausted"])
+            self.assertEqual(
+                [(Path(snippet.path).name, snippet.start_line) for snippet in pack.snippets],
+                [("large.txt", 8001 - 80), ("module_05.py", 1)],
+            )
+            self.assertFalse((workspace / ".sopify-skills").exists())
+
+            found, stats = _scan_keyword_files(workspace, ["LedgerSync"], limit=8, exclude=(), budget_sec=0)
+            self.assertEqual(found, [])
+            self.assertTrue(stats["budget_exhausted"])
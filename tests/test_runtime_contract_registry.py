@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from tests.runtime_test_support import *
+
+from runtime.contract_registry import get_contract_registry, thaw_contract
+from runtime.decision_tables import load_default_decision_tables
+from runtime.deterministic_guard import CHECKPOINT_ONLY, evaluate_deterministic_guard
+from runtime.message_templates import render_host_message
+from runtime.resolution_planner import build_resolution_planner
+
+
+class ContractRegistryTests(unittest.TestCase):
+    def test_registry_shares_frozen_views_and_lookup_indexes(self) -> None:
+        registry = get_contract_registry()
+
+        self.assertIs(get_contract_registry(), registry)
+        self.assertIsInstance(registry.decision_tables, MappingProxyType)
+        self.assertEqual(thaw_contract(registry.decision_tables), load_default_decision_tables())
+        with self.assertRaises(TypeError):
+            registry.host_message_templates["default_locale"] = "en-US"  # type: ignore[index]
+        self.assertIsInstance(registry.signal_rows_by_action["confirm_execute"], tuple)
+        self.assertEqual(
+            registry.failure_recovery_by_key[("resolution_failure", "confirm_execute")]["prompt_mode"],
+            load_default_decision_tables()["failure_recovery_table"]["rows_by_key"][
+                ("resolution_failure", "confirm_execute")
+            ]["prompt_mode"],
+        )
+        for reason_code, rows in registry.templates_by_reason_code.items():
+            self.assertTrue(all(row["match_value"] == reason_code for row in rows))
+
+    def test_planner_is_built_once_and_default_render_matches_explicit_templates(self) -> None:
+        guard = evaluate_deterministic_guard(
+            allowed_response_mode=CHECKPOINT_ONLY,
+            required_host_action="confirm_execute",
+            checkpoint_request={"checkpoint_id": "exec-1", "checkpoint_kind": "execution_confirm"},
+        )
+        planner = build_resolution_planner(guard)
+
+        self.assertIs(build_resolution_planner(guard), planner)
+        json.dumps(planner.to_dict())
+
+        reason_code = planner.default_effect_contract_recovery["reason_code"]
+        prompt_mode = planner.default_effect_contract_recovery["prompt_mode"]
+        templates = thaw_contract(get_contract_registry().host_message_templates)
+        for locale in ("zh-CN", "en-US"):
+            self.assertEqual(
+                render_host_message(reason_code=reason_code, prompt_mode=prompt_mode, locale=locale),
+                render_host_message(reason_code=reason_code, prompt_mode=prompt_mode, locale=locale, templates=templates),
+            )
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from tests.runtime_test_support import *
 
+import runtime.decision_tables as decision_tables_module
 from runtime.decision_tables import (
     DEFAULT_DECISION_TABLES_PATH,
     DEFAULT_DECISION_TABLES_SCHEMA_PATH,
     DecisionTableError,
+    default_decision_tables_view,
     load_decision_tables,
     load_default_decision_tables,
 )
@@ -371,3 +373,27 @@ best_proven_resume_target:
         )
         self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
         self.assertIn(str(DEFAULT_DECISION_TABLES_SCHEMA_PATH.resolve()), result.stdout)
+
+    def test_compiled_artifact_matches_full_validation_and_falls_back_on_hash_drift(self) -> None:
+        full = load_default_decision_tables(compiled=False)
+        with mock.patch.object(decision_tables_module, "_default_tables_memo", None):
+            with mock.patch(
+                "runtime.decision_tables.load_decision_tables",
+                side_effect=AssertionError("full validation"),
+            ):
+                compiled = load_default_decision_tables()
+                self.assertIsNot(load_default_decision_tables(), compiled)
+                self.assertIs(default_decision_tables_view(), default_decision_tables_view())
+            self.assertEqual(compiled, full)
+
+        with mock.patch.object(decision_tables_module, "_default_tables_memo", None):
+            with mock.patch(
+                "runtime.decision_tables.decision_tables_source_hash",
+                return_value="sha256:stale",
+            ), mock.patch(
+                "runtime.decision_tables.load_decision_tables",
+                wraps=load_decision_tables,
+            ) as full_load:
+                self.assertEqual(load_default_decision_tables(), full)
+                load_default_decision_tables()
+            self.assertEqual(full_load.call_count, 1)
@@ -7,6 +7,23 @@ from runtime.engine import _advance_planning_route, _handle_execution_confirm, _
 
 
 class EngineIntegrationTests(unittest.TestCase):
+    def test_run_runtime_reports_stage_timings_only_when_enabled(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+
+            untraced = run_runtime("~compare runtime 选型", workspace_root=workspace, user_home=workspace / "home")
+            self.assertEqual(untraced.timings, ())
+            self.assertEqual(untraced.to_dict()["timings"], [])
+
+            with mock.patch.dict(os.environ, {"SOPIFY_RUNTIME_TIMINGS": "1"}):
+                traced = run_runtime("~compare runtime 选型", workspace_root=workspace, user_home=workspace / "home")
+
+            stage_names = [timing["name"] for timing in traced.timings]
+            self.assertEqual(stage_names[0], "config_load")
+            for stage in ("kb_bootstrap", "skill_discovery", "snapshot_resolve", "route_classify", "handler", "handoff_build"):
+                self.assertIn(stage, stage_names)
+            self.assertTrue(all(timing["duration_ms"] >= 0 for timing in traced.timings))
+
     def test_session_review_state_is_isolated_between_sessions(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -2715,6 +2732,51 @@ class EngineIntegrationTests(unittest.TestCase):
             self.assertEqual(persisted["revision"], 2)
             self.assertEqual(persisted["summary_key"], second_payload["summary_key"])
 
+    def test_summary_route_reuses_unchanged_source_facts_on_same_day_rerun(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            _init_git_workspace(workspace)
+            module_file = workspace / "tool.py"
+            module_file.write_text("def initial():\n    return 1\n", encoding="utf-8")
+            _run_git(workspace, "add", "tool.py")
+            _run_git(workspace, "commit", "-m", "initial tool")
+            module_file.write_text("def initial():\n    return 1\n\n\ndef added_today():\n    return 2\n", encoding="utf-8")
+            run_runtime("~go plan 补 runtime 骨架", workspace_root=workspace, user_home=workspace / "home")
+
+            first = run_runtime("~summary", workspace_root=workspace, user_home=workspace / "home")
+            day = local_day_now()
+            sidecar = workspace / ".sopify-skills" / "replay" / "daily" / day[:7] / day / "summary_sources.json"
+            self.assertTrue(sidecar.is_file())
+
+            with mock.patch(
+                "runtime.daily_summary.GitFacade.day_log",
+                side_effect=AssertionError("HEAD unchanged"),
+            ), mock.patch(
+                "runtime.daily_summary.GitFacade.diff_texts",
+                side_effect=AssertionError("diff fingerprint unchanged"),
+            ), mock.patch(
+                "runtime.daily_summary._scan_session_events",
+                side_effect=AssertionError("replay already matched"),
+            ), mock.patch(
+                "runtime.daily_summary._DocumentFacts.from_text",
+                side_effect=AssertionError("plan documents unchanged"),
+            ):
+                second = run_runtime("~summary", workspace_root=workspace, user_home=workspace / "home")
+
+            first_payload = first.skill_result["summary"]
+            second_payload = second.skill_result["summary"]
+            self.assertEqual(second_payload["revision"], 2)
+            self.assertEqual(second_payload["facts"]["code_changes"], first_payload["facts"]["code_changes"])
+            self.assertEqual(second_payload["facts"]["next_steps"], first_payload["facts"]["next_steps"])
+            self.assertIn("added_today", json.dumps(second_payload["facts"]["code_changes"], ensure_ascii=False))
+
+            tasks_path = next((workspace / ".sopify-skills" / "plan").rglob("tasks.md"))
+            tasks_path.write_text("# 任务清单\n\n- [ ] 新增的待办任务\n", encoding="utf-8")
+            third = run_runtime("~summary", workspace_root=workspace, user_home=workspace / "home")
+
+            next_steps = [item["summary"] for item in third.skill_result["summary"]["facts"]["next_steps"]]
+            self.assertIn("新增的待办任务", next_steps)
+
     def test_summary_route_rebuilds_invalid_existing_summary_in_place(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -2741,7 +2803,7 @@ class EngineIntegrationTests(unittest.TestCase):
             workspace = Path(temp_dir)
             run_runtime("~go plan 补 runtime 骨架", workspace_root=workspace, user_home=workspace / "home")
 
-            with mock.patch("runtime.daily_summary.subprocess.run", side_effect=FileNotFoundError("git")):
+            with mock.patch("runtime.git_facade.subprocess.Popen", side_effect=FileNotFoundError("git")):
                 result = run_runtime("~summary", workspace_root=workspace, user_home=workspace / "home")
 
             summary_payload = result.skill_result["summary"]
@@ -2815,6 +2877,22 @@ class EngineIntegrationTests(unittest.TestCase):
             self.assertEqual(issue["evidence_refs"], [current_run_ref])
             self.assertEqual(next_step["evidence_refs"], [current_run_ref])
 
+    def test_summary_route_lists_state_refs_from_sqlite_backend_without_json_export(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / "sopify.config.yaml").write_text(
+                "plan:\n  directory: .runtime\nadvanced:\n  state_backend: sqlite\n  state_json_export: false\n",
+                encoding="utf-8",
+            )
+            run_runtime("~go plan add summary route", workspace_root=workspace, user_home=workspace / "home")
+            self.assertFalse((workspace / ".runtime" / "state" / "current_run.json").exists())
+
+            result = run_runtime("~summary", workspace_root=workspace, user_home=workspace / "home")
+
+            source_refs = result.skill_result["summary"]["source_refs"]
+            self.assertIn(".runtime/state/current_run.json", [entry["path"] for entry in source_refs["state_files"]])
+            self.assertEqual([entry["path"] for entry in source_refs["handoff_files"]], [".runtime/state/current_handoff.json"])
+
     def test_summary_route_render_matches_persisted_artifacts(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from tests.runtime_test_support import *
 
+from copy import deepcopy
+
 from runtime.decision_tables import DEFAULT_DECISION_TABLES_PATH, load_default_decision_tables
 from runtime.failure_recovery import (
     DEFAULT_FAILURE_RECOVERY_SCHEMA_PATH,
@@ -161,6 +163,17 @@ class FailureRecoveryTests(unittest.TestCase):
         self.assertEqual(Path(table["decision_tables_source_path"]), DEFAULT_DECISION_TABLES_PATH.resolve())
         self.assertEqual(len(table["rows"]), 20)
 
+    def test_default_failure_recovery_table_copies_only_its_subtable(self) -> None:
+        with mock.patch(
+            "runtime.failure_recovery.deepcopy",
+            wraps=deepcopy,
+        ) as copy_spy:
+            table = load_default_failure_recovery_table()
+        self.assertEqual(copy_spy.call_count, 1)
+        self.assertNotIn("signal_priority_table", copy_spy.call_args.args[0])
+        table["rows"].clear()
+        self.assertEqual(len(load_default_failure_recovery_table()["rows"]), 20)
+
     def test_legacy_standalone_recovery_asset_can_still_load_explicitly(self) -> None:
         table = load_failure_recovery_table(LEGACY_FAILURE_RECOVERY_TABLE_PATH)
         self.assertEqual(Path(table["source_path"]), LEGACY_FAILURE_RECOVERY_TABLE_PATH.resolve())
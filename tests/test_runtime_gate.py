@@ -6,10 +6,12 @@ import os
 from pathlib import Path
 import re
 import shutil
+import socket
 from types import SimpleNamespace
 import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -27,6 +29,7 @@ from runtime.gate import (
     NORMAL_RUNTIME_FOLLOWUP,
     enter_runtime_gate,
 )
+from runtime.gate_daemon import DAEMON_PROTOCOL_VERSION, GateDaemon, forwarded_environment, serve_unix_socket
 from installer.hosts.claude import CLAUDE_ADAPTER
 from installer.hosts.codex import CODEX_ADAPTER
 from installer.outcome_contract import annotate_outcome_payload, render_outcome_summary
@@ -310,6 +313,25 @@ def _write_gate_receipt_fixture(
 
 
 class RuntimeGateTests(unittest.TestCase):
+    def test_gate_cold_import_defers_route_specific_modules(self) -> None:
+        budget = json.loads((REPO_ROOT / "benchmarks" / "import_budget.json").read_text(encoding="utf-8"))
+        forbidden = budget["modules"]["runtime.gate"]["forbidden"]
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import json, sys; import runtime.gate; print(json.dumps(sorted(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT,
+        )
+        loaded = set(json.loads(completed.stdout))
+
+        self.assertTrue(forbidden)
+        self.assertEqual(sorted(name for name in forbidden if name in loaded), [])
+
     def test_workspace_preflight_fallback_keeps_outcome_contract_in_sync(self) -> None:
         standalone_module = _load_module_without_repo_installer(
             REPO_ROOT / "runtime" / "workspace_preflight.py",
@@ -386,6 +408,47 @@ class RuntimeGateTests(unittest.TestCase):
             self.assertEqual(result["preflight"]["helper_argv_mode"], "legacy_fallback")
             self.assertEqual(result["preflight"]["reason_code"], "WORKSPACE_BUNDLE_READY")
 
+    def test_preflight_reuses_ready_verdict_and_remembered_helper_argv_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_root = Path(temp_dir)
+            workspace = temp_root / "workspace"
+            workspace.mkdir(parents=True, exist_ok=True)
+            payload_manifest_path = _write_legacy_payload_manifest_for_gate(home_root=temp_root / "home")
+
+            def preflight(request_text: str) -> tuple[dict[str, object], int]:
+                with patch("runtime.workspace_preflight.subprocess.run", wraps=subprocess.run) as run_helper:
+                    result = preflight_workspace_runtime(
+                        workspace,
+                        request_text=request_text,
+                        payload_manifest_path=payload_manifest_path,
+                        user_home=temp_root / "home",
+                    )
+                return (dict(result), run_helper.call_count)
+
+            with patch.dict(os.environ, {"SOPIFY_PREFLIGHT_CACHE": ""}):
+                first, first_runs = preflight("解释一下 runtime gate")
+                cached, cached_runs = preflight("~go exec")
+                # Write-authorizing requests may sync the ignore policy, so they never hit.
+                planned, planned_runs = preflight("~go plan 补 runtime gate 骨架")
+                (workspace / ".sopify-runtime").mkdir()
+                (workspace / ".sopify-runtime" / "manifest.json").write_text("{}\n", encoding="utf-8")
+                refreshed, refreshed_runs = preflight("解释一下 runtime gate")
+            with patch.dict(os.environ, {"SOPIFY_PREFLIGHT_CACHE": "0"}):
+                _disabled, disabled_runs = preflight("解释一下 runtime gate")
+
+            self.assertEqual(first_runs, 3)
+            self.assertNotIn("verdict_cache", first)
+            self.assertEqual(cached_runs, 0)
+            self.assertEqual(cached["verdict_cache"], "hit")
+            self.assertEqual(cached["helper_argv_mode"], "legacy_fallback")
+            self.assertEqual({key: value for key, value in cached.items() if key != "verdict_cache"}, first)
+            self.assertGreater(planned_runs, 0)
+            self.assertNotIn("verdict_cache", planned)
+            self.assertEqual(refreshed_runs, 1)
+            self.assertEqual(refreshed["helper_argv_mode"], "legacy_fallback")
+            self.assertNotIn("verdict_cache", refreshed)
+            self.assertEqual(disabled_runs, 3)
+
     def test_gate_preflight_skips_first_write_for_non_explicit_request(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_root = Path(temp_dir)
@@ -1929,6 +1992,9 @@ class RuntimeGateTests(unittest.TestCase):
                 user_home=workspace / "home",
             )
             self.assertEqual(first["status"], "ready")
+            registry_lock = first["observability"]["locks"]["plan_registry"]
+            self.assertGreaterEqual(registry_lock["acquired"], 1)
+            self.assertEqual(registry_lock["timeouts"], 0)
             session_id = first["session_id"]
 
             result = enter_runtime_gate(
@@ -1946,6 +2012,48 @@ class RuntimeGateTests(unittest.TestCase):
             self.assertEqual(result["observability"]["runtime_route_name"], "summary")
             self.assertIn("补 runtime gate 骨架", result["observability"]["persisted_handoff"]["request_excerpt"])
 
+    def test_gate_records_stage_timings_and_chrome_trace_when_enabled(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            untraced = enter_runtime_gate(
+                "~go plan 补 runtime gate 骨架",
+                workspace_root=workspace,
+                user_home=workspace / "home",
+            )
+            self.assertNotIn("timings", untraced["observability"])
+
+            trace_path = workspace / "trace" / "gate.json"
+            with patch.dict(os.environ, {"SOPIFY_TRACE_FILE": str(trace_path)}):
+                result = enter_runtime_gate(
+                    "~go plan 补 runtime gate 骨架",
+                    workspace_root=workspace,
+                    session_id=untraced["session_id"],
+                    user_home=workspace / "home",
+                )
+
+            self.assertEqual(result["status"], "ready")
+            stage_names = [timing["name"] for timing in result["observability"]["timings"]]
+            for stage in (
+                "preflight",
+                "config_load",
+                "kb_bootstrap",
+                "skill_discovery",
+                "snapshot_resolve",
+                "route_classify",
+                "handler",
+                "handoff_build",
+                "receipt_write",
+            ):
+                self.assertIn(stage, stage_names)
+            receipt = json.loads(Path(result["receipt_path"]).read_text(encoding="utf-8"))
+            receipt_stages = {timing["name"] for timing in receipt["observability"]["timings"]}
+            self.assertIn("handoff_build", receipt_stages)
+            self.assertNotIn("receipt_write", receipt_stages)
+            trace = json.loads(trace_path.read_text(encoding="utf-8"))
+            events = {event["name"]: event for event in trace["traceEvents"]}
+            self.assertEqual(events["route_classify"]["ph"], "X")
+            self.assertGreaterEqual(events["handler"]["dur"], 0)
+
     def test_gate_reports_previous_receipt_diagnostics(self) -> None:
         scenarios = (
             ("request_sha1_mismatch", "旧请求", "clarification_pending", False, True),
@@ -2079,6 +2187,24 @@ class RuntimeGateTests(unittest.TestCase):
                 result["observability"].get("cleaned_session_dirs", []),
             )
 
+    def test_gate_records_replay_retention_failure_without_failing_the_turn(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+
+            with patch("runtime.replay_retention.maybe_apply_replay_retention", side_effect=OSError("No space left on device")) as retention:
+                result = enter_runtime_gate(
+                    "重构数据库层",
+                    workspace_root=workspace,
+                    user_home=workspace / "home",
+                )
+
+            retention.assert_called_once()
+            self.assertEqual(result["status"], "ready")
+            self.assertEqual(
+                result["observability"]["housekeeping_notes"],
+                ["Replay retention skipped: No space left on device"],
+            )
+
     def test_gate_fail_closes_when_handoff_is_missing(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -2473,5 +2599,193 @@ class RuntimeGateTests(unittest.TestCase):
         self.assertIn("fail_closed_missing_handoff", scenario_ids)
 
 
+
+class RuntimeGateDaemonTests(unittest.TestCase):
+    def _enter_message(self, workspace: Path, request: str, **overrides: object) -> dict[str, object]:
+        message: dict[str, object] = {
+            "protocol_version": DAEMON_PROTOCOL_VERSION,
+            "command": "enter",
+            "request": request,
+            "arguments": {"workspace_root": str(workspace), "session_id": "daemon-session"},
+            "env": forwarded_environment(),
+        }
+        message.update(overrides)
+        return message
+
+    def test_daemon_enter_matches_in_process_gate_contract(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            subprocess.run(["git", "init", str(workspace)], capture_output=True, text=True, check=True)
+            daemon = GateDaemon()
+
+            response = daemon.handle(self._enter_message(workspace, "~go plan 补 runtime gate 骨架"))
+
+            self.assertEqual(response["status"], "ok")
+            contract = response["contract"]
+            self.assertEqual(contract["status"], "ready")
+            self.assertEqual(contract["allowed_response_mode"], NORMAL_RUNTIME_FOLLOWUP)
+            self.assertEqual(contract["session_id"], "daemon-session")
+            self.assertEqual(daemon.served_requests, 1)
+
+    def test_daemon_requests_fallback_when_client_environment_differs(self) -> None:
+        calls: list[str] = []
+        daemon = GateDaemon(enter_gate=lambda request, **_: calls.append(request) or {}, environ={"SOPIFY_HOST_NAME": "codex"})
+
+        response = daemon.handle(self._enter_message(Path("/tmp"), "demo", env={"SOPIFY_HOST_NAME": "claude"}))
+        self.assertEqual(response["status"], "fallback")
+        self.assertEqual(response["reason"], "environment_mismatch")
+
+        response = daemon.handle(self._enter_message(Path("/tmp"), "demo", protocol_version="0"))
+        self.assertEqual(response["status"], "fallback")
+        self.assertEqual(response["reason"], "protocol_version_mismatch")
+        self.assertEqual(calls, [])
+
+    def test_daemon_rejects_relative_workspace_and_unknown_arguments(self) -> None:
+        daemon = GateDaemon(enter_gate=lambda request, **_: {}, environ={})
+
+        relative = daemon.handle(self._enter_message(Path("."), "demo", env={}))
+        unknown = daemon.handle(
+            self._enter_message(Path("/tmp"), "demo", env={}, arguments={"workspace_root": "/tmp", "user_home": "/tmp"})
+        )
+
+        self.assertEqual(relative["status"], "error")
+        self.assertEqual(unknown["status"], "error")
+        self.assertIn("user_home", unknown["message"])
+
+    def test_daemon_reports_gate_failure_as_error_instead_of_fallback(self) -> None:
+        def failing_gate(request: str, **_: object) -> dict[str, object]:
+            raise RuntimeError("handoff write failed")
+
+        daemon = GateDaemon(enter_gate=failing_gate, environ={})
+
+        response = daemon.handle(self._enter_message(Path("/tmp"), "demo", env={}))
+
+        self.assertEqual(response["status"], "error")
+        self.assertIn("handoff write failed", response["message"])
+        self.assertEqual(daemon.served_requests, 1)
+
+    def test_serve_unix_socket_refuses_non_socket_and_live_socket_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            regular_file = Path(temp_dir) / "gate.sock"
+            regular_file.write_text("keep me", encoding="utf-8")
+
+            with self.assertRaises(OSError):
+                serve_unix_socket(regular_file, GateDaemon(environ={}), idle_timeout=1)
+            self.assertEqual(regular_file.read_text(encoding="utf-8"), "keep me")
+
+            socket_path = Path(temp_dir) / "live.sock"
+            server = self._start_daemon_thread(socket_path, GateDaemon(environ={}))
+            try:
+                self.assertEqual(socket_path.stat().st_mode & 0o777, 0o600)
+                with self.assertRaises(OSError):
+                    serve_unix_socket(socket_path, GateDaemon(environ={}), idle_timeout=1)
+                self.assertTrue(socket_path.exists())
+            finally:
+                self._stop_daemon_thread(socket_path, server)
+
+    def test_runtime_gate_cli_surfaces_daemon_gate_failure_without_rerunning(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir) / "workspace"
+            workspace.mkdir()
+            subprocess.run(["git", "init", str(workspace)], capture_output=True, text=True, check=True)
+            socket_path = Path(temp_dir) / "gate.sock"
+
+            def failing_gate(request: str, **_: object) -> dict[str, object]:
+                raise RuntimeError("handoff write failed")
+
+            server = self._start_daemon_thread(socket_path, GateDaemon(enter_gate=failing_gate))
+            try:
+                completed = self._run_cli_via_daemon(workspace, socket_path)
+            finally:
+                self._stop_daemon_thread(socket_path, server)
+
+            payload = json.loads(completed.stdout)
+            self.assertEqual(completed.returncode, 1)
+            self.assertEqual(payload["status"], "error")
+            self.assertEqual(payload["error_code"], "runtime_gate_daemon_error")
+            self.assertIn("handoff write failed", payload["message"])
+            self.assertFalse((workspace / ".sopify-skills").exists())
+            in_process_error = enter_runtime_gate("", workspace_root=workspace, write_receipt=False)
+            self.assertEqual(in_process_error["status"], "error")
+            self.assertEqual(set(payload), set(in_process_error))
+
+    def _start_daemon_thread(self, socket_path: Path, daemon: GateDaemon) -> threading.Thread:
+        server = threading.Thread(target=serve_unix_socket, args=(socket_path, daemon), kwargs={"idle_timeout": 30})
+        server.start()
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            threading.Event().wait(0.05)
+        return server
+
+    def _stop_daemon_thread(self, socket_path: Path, server: threading.Thread) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(socket_path))
+            client.sendall((json.dumps({"protocol_version": DAEMON_PROTOCOL_VERSION, "command": "shutdown"}) + "\n").encode("utf-8"))
+            client.recv(4096)
+        server.join(timeout=10)
+
+    def _run_cli_via_daemon(self, workspace: Path, socket_path: Path) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [
+                sys.executable,
+                str(REPO_ROOT / "scripts" / "runtime_gate.py"),
+                "enter",
+                "--workspace-root",
+                str(workspace),
+                "--request",
+                "~go plan 补 runtime gate 骨架",
+                "--daemon-socket",
+                str(socket_path),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+    def test_runtime_gate_cli_uses_warm_daemon_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir) / "workspace"
+            workspace.mkdir()
+            subprocess.run(["git", "init", str(workspace)], capture_output=True, text=True, check=True)
+            socket_path = Path(temp_dir) / "gate.sock"
+            daemon = GateDaemon()
+            server = self._start_daemon_thread(socket_path, daemon)
+            try:
+                completed = self._run_cli_via_daemon(workspace, socket_path)
+            finally:
+                self._stop_daemon_thread(socket_path, server)
+
+            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            self.assertEqual(json.loads(completed.stdout)["status"], "ready")
+            self.assertEqual(daemon.served_requests, 1)
+            self.assertFalse(socket_path.exists())
+
+    def test_runtime_gate_cli_falls_back_in_process_when_daemon_is_unreachable(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            subprocess.run(["git", "init", str(workspace)], capture_output=True, text=True, check=True)
+
+            completed = subprocess.run(
+                [
+                    sys.executable,
+                    str(REPO_ROOT / "scripts" / "runtime_gate.py"),
+                    "enter",
+                    "--workspace-root",
+                    str(workspace),
+                    "--request",
+                    "~go plan 补 runtime gate 骨架",
+                    "--daemon-socket",
+                    str(workspace / "missing.sock"),
+                ],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+
+            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            self.assertEqual(json.loads(completed.stdout)["status"], "ready")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from tests.runtime_test_support import *
+import runtime.git_facade as git_facade_module
+from runtime.git_facade import GitFacade
+
+
+class GitFacadeTests(unittest.TestCase):
+    def test_status_log_and_batched_diffs_use_one_process_each(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            _init_git_workspace(workspace)
+            (workspace / "alpha.py").write_text("def alpha():\n    return 1\n", encoding="utf-8")
+            (workspace / "with space.py").write_text("class Spaced:\n    pass\n", encoding="utf-8")
+            (workspace / "old_name.md").write_text("# Old\n", encoding="utf-8")
+            _run_git(workspace, "add", ".")
+            _run_git(workspace, "commit", "-m", "initial files")
+            (workspace / "alpha.py").write_text("def alpha():\n    return 1\n\n\ndef staged_helper():\n    return 2\n", encoding="utf-8")
+            _run_git(workspace, "add", "alpha.py")
+            (workspace / "alpha.py").write_text(
+                "def alpha():\n    return 1\n\n\ndef staged_helper():\n    return 2\n\n\ndef unstaged_helper():\n    return 3\n",
+                encoding="utf-8",
+            )
+            (workspace / "with space.py").write_text("class Spaced:\n    pass\n\n\nclass Renamed:\n    pass\n", encoding="utf-8")
+            _run_git(workspace, "mv", "old_name.md", "new_name.md")
+            (workspace / "notes.txt").write_text("draft\n", encoding="utf-8")
+
+            git = GitFacade(workspace)
+            with mock.patch(
+                "runtime.git_facade.subprocess.Popen",
+                wraps=git_facade_module.subprocess.Popen,
+            ) as popen:
+                status = git.status()
+                commits = git.day_log(since_iso="2000-01-01T00:00:00+00:00", until_iso="2037-12-31T00:00:00+00:00")
+                diffs = git.diff_texts(["alpha.py", "with space.py"])
+
+            self.assertEqual(popen.call_count, 4)
+            assert status is not None
+            self.assertEqual(len(status.head), 40)
+            self.assertEqual(status.entries["alpha.py"].change_type, "modified")
+            self.assertTrue(status.entries["alpha.py"].diff_key)
+            self.assertEqual(status.entries["new_name.md"].change_type, "modified")
+            self.assertNotIn("old_name.md", status.entries)
+            self.assertEqual(status.entries["notes.txt"].change_type, "untracked")
+            self.assertEqual(status.entries["notes.txt"].diff_key, "")
+
+            self.assertEqual([commit.title for commit in commits], ["initial files"])
+            self.assertEqual(set(commits[0].files), {"alpha.py", "old_name.md", "with space.py"})
+
+            self.assertIn("+def staged_helper", diffs["alpha.py"])
+            self.assertIn("+def unstaged_helper", diffs["alpha.py"])
+            self.assertNotIn("Renamed", diffs["alpha.py"])
+            self.assertIn("+class Renamed", diffs["with space.py"])
+
+    def test_status_is_none_outside_a_work_tree_or_without_git(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+
+            self.assertIsNone(GitFacade(workspace).status())
+            with mock.patch("runtime.git_facade.subprocess.Popen", side_effect=FileNotFoundError("git")):
+                self.assertIsNone(GitFacade(workspace).status())
+                self.assertEqual(GitFacade(workspace).day_log(since_iso="a", until_iso="b"), [])
+
@@ -97,6 +97,26 @@ class KnowledgeBaseBootstrapTests(unittest.TestCase):
             self.assertEqual(second.files, ())
             self.assertEqual(project_path.read_text(encoding="utf-8"), "# custom\n")
 
+    def test_bootstrap_stamp_skips_unchanged_workspace_and_revalidates_inputs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / "package.json").write_text('{"name":"sample-app"}', encoding="utf-8")
+            config = load_runtime_config(workspace)
+
+            bootstrap_kb(config)
+            self.assertTrue((config.state_dir / "cache" / "kb_bootstrap.json").is_file())
+            with mock.patch("runtime.kb.render_blueprint_index", side_effect=AssertionError("stamp should short-circuit")):
+                steady = bootstrap_kb(config)
+            self.assertEqual(steady.files, (".sopify-skills/blueprint/README.md",))
+
+            blueprint_root = workspace / ".sopify-skills" / "blueprint"
+            (blueprint_root / "skill-standards-refactor.md").write_text("# Skill 标准对齐蓝图\n", encoding="utf-8")
+            refreshed = bootstrap_kb(config)
+
+            self.assertEqual(refreshed.files, steady.files)
+            readme = (blueprint_root / "README.md").read_text(encoding="utf-8")
+            self.assertIn("[Skill 标准对齐蓝图](./skill-standards-refactor.md)", readme)
+
     def test_blueprint_index_uses_history_index_for_latest_archive_hint(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
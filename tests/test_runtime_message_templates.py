@@ -4,8 +4,10 @@ import copy
 
 from tests.runtime_test_support import *
 
+import runtime.message_templates as message_templates_module
 from runtime.message_templates import (
     MESSAGE_TEMPLATE_RENDER_FAILED,
+    compile_host_message_templates,
     load_default_host_message_templates,
     render_host_message,
 )
@@ -64,3 +66,62 @@ class MessageTemplatesTests(unittest.TestCase):
         self.assertEqual(result["source_kind"], "safe_fallback")
         self.assertEqual(result["render_events"], [MESSAGE_TEMPLATE_RENDER_FAILED])
         self.assertIn("暂时不能安全继续", result["text"])
+
+    def test_compiled_resolver_prefers_longest_prefix_and_renders_without_reparsing(self) -> None:
+        templates = load_default_host_message_templates()
+        templates["templates"].extend(
+            [
+                {
+                    "match_kind": "reason_code_family_prefix",
+                    "match_value": "smoke.family",
+                    "prompt_modes": ["request_state_recovery"],
+                    "locales": {"zh-CN": "短前缀", "en-US": "short"},
+                },
+                {
+                    "match_kind": "reason_code_family_prefix",
+                    "match_value": "smoke.family.deep",
+                    "prompt_modes": ["request_state_recovery"],
+                    "locales": {"zh-CN": "{{长前缀}} {required_host_action_label}", "en-US": "long"},
+                },
+                {
+                    "match_kind": "exact_reason_code",
+                    "match_value": "smoke.exact",
+                    "prompt_modes": ["request_state_recovery"],
+                    "locales": {"zh-CN": "{required_host_action_label!r}", "en-US": "exact"},
+                },
+            ]
+        )
+        resolver = compile_host_message_templates(templates)
+        render_host_message(
+            reason_code="smoke.family.deep.case",
+            prompt_mode="request_state_recovery",
+            templates=resolver,
+        )
+
+        with mock.patch.object(message_templates_module._FORMATTER, "parse", side_effect=AssertionError("reparsed")):
+            result = render_host_message(
+                reason_code="smoke.family.deep.case",
+                prompt_mode="request_state_recovery",
+                variables={"required_host_action_label": "执行确认"},
+                templates=resolver,
+            )
+            converted = render_host_message(
+                reason_code="smoke.exact",
+                prompt_mode="request_state_recovery",
+                variables={"required_host_action_label": "执行确认", "escape_hatch_hint": "恢复"},
+                templates=resolver,
+            )
+
+        self.assertEqual(result["text"], "{长前缀} 执行确认")
+        self.assertEqual(result["match_value"], "smoke.family.deep")
+        self.assertEqual(converted["render_events"], [MESSAGE_TEMPLATE_RENDER_FAILED])
+        self.assertEqual(converted["source_kind"], "prompt_mode_fallback")
+        self.assertEqual(
+            converted,
+            render_host_message(
+                reason_code="smoke.exact",
+                prompt_mode="request_state_recovery",
+                variables={"required_host_action_label": "执行确认", "escape_hatch_hint": "恢复"},
+                templates=templates,
+            ),
+        )
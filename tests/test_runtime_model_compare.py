@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from tests.runtime_test_support import *
+from scripts.model_compare_runtime import Candidate, fanout_call
+
+
+def _candidates(*ids: str, timeouts: dict[str, int] | None = None) -> list[Candidate]:
+    return [
+        Candidate(id=candidate_id, provider="test", model=candidate_id, timeout_sec=(timeouts or {}).get(candidate_id, 0))
+        for candidate_id in ids
+    ]
+
+
+class ModelCompareFanoutTests(unittest.TestCase):
+    def test_async_callers_stream_results_and_cancel_stragglers(self) -> None:
+        delays = {"fast": 0.01, "slow": 0.05, "straggler": 30}
+
+        async def caller(candidate, payload, timeout_sec):
+            await asyncio.sleep(delays[candidate.id])
+            return {"answer": f"{candidate.id}:{payload['question']}"}
+
+        streamed: list[tuple[str, str]] = []
+        started = time.monotonic()
+        results = fanout_call(
+            candidates=_candidates("straggler", "slow", "fast"),
+            payload={"question": "q"},
+            timeout_sec=60,
+            max_parallel=3,
+            model_caller=caller,
+            min_successes=2,
+            on_result=lambda result: streamed.append((result.candidate_id, result.status)),
+        )
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(streamed, [("fast", "success"), ("slow", "success"), ("straggler", "cancelled")])
+        self.assertEqual([result.candidate_id for result in results], ["straggler", "slow", "fast"])
+        self.assertEqual(results[2].answer, "fast:q")
+        self.assertIn("cancelled after 2", results[0].error)
+
+    def test_sync_caller_timeout_does_not_wait_for_the_thread(self) -> None:
+        release = threading.Event()
+
+        def caller(candidate, payload, timeout_sec):
+            if candidate.id == "hung":
+                release.wait(30)
+            if candidate.id == "broken":
+                raise RuntimeError("boom")
+            return "done"
+
+        started = time.monotonic()
+        try:
+            results = fanout_call(
+                candidates=_candidates("hung", "ok", "broken", timeouts={"hung": 1}),
+                payload={},
+                timeout_sec=30,
+                max_parallel=3,
+                model_caller=caller,
+            )
+        finally:
+            release.set()
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual([result.status for result in results], ["timeout", "success", "error"])
+        self.assertEqual(results[0].latency_ms, 1000)
+        self.assertEqual(results[2].error, "boom")
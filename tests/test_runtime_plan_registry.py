@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from tests.runtime_test_support import *
+import runtime.plan_registry as plan_registry_module
 
 
 class PlanRegistryTests(unittest.TestCase):
@@ -162,6 +163,70 @@ class PlanRegistryTests(unittest.TestCase):
             self.assertEqual(payload["status"], "ready")
             self.assertEqual(before, after)
 
+    def test_inspect_plan_registry_reconciles_once_and_writes_back_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = load_runtime_config(workspace)
+            artifact = create_plan_scaffold("实现 runtime skeleton", config=config, level="standard")
+            create_plan_scaffold("修复登录错误提示", config=config, level="light")
+            registry_file = workspace / registry_relative_path(config)
+            registry_file.write_text(registry_file.read_text(encoding="utf-8").replace("实现 runtime skeleton", "旧标题"), encoding="utf-8")
+
+            with mock.patch(
+                "runtime.plan_registry._reconcile_snapshot_fields",
+                wraps=plan_registry_module._reconcile_snapshot_fields,
+            ) as reconcile, mock.patch(
+                "runtime.plan_registry._write_registry",
+                wraps=plan_registry_module._write_registry,
+            ) as write_registry, mock.patch(
+                "runtime.plan_registry.StateStore",
+                wraps=plan_registry_module.StateStore,
+            ) as state_store:
+                payload = inspect_plan_registry(config=config, plan_id=artifact.plan_id)
+
+            self.assertEqual(reconcile.call_count, 1)
+            self.assertEqual(write_registry.call_count, 1)
+            self.assertEqual(state_store.call_count, 1)
+            self.assertIn(artifact.plan_id, payload["drift_notice"])
+            self.assertEqual(len(payload["recommendations"]), 2)
+            self.assertIn("实现 runtime skeleton", registry_file.read_text(encoding="utf-8"))
+
+    def test_refresh_advice_detects_duplicates_and_active_load_in_one_indexed_pass(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = load_runtime_config(Path(temp_dir))
+            plans = [
+                {
+                    "plan_id": f"plan-{index:03d}",
+                    "snapshot": {
+                        "title": f"Plan {index}",
+                        "topic_key": f"topic-{index}",
+                        "lifecycle_state": "archived" if index % 2 else "active",
+                    },
+                    "meta": {},
+                }
+                for index in range(200)
+            ]
+            plans[1]["snapshot"]["topic_key"] = "topic-0"
+            plans[3]["snapshot"]["title"] = "  PLAN   2 "
+
+            with mock.patch(
+                "runtime.plan_registry._normalize_snapshot",
+                wraps=plan_registry_module._normalize_snapshot,
+            ) as normalize_snapshot:
+                payload, changed = plan_registry_module._refresh_advice_fields(
+                    {"plans": plans},
+                    config=config,
+                    request_text="",
+                    current_plan=None,
+                )
+
+            self.assertTrue(changed)
+            self.assertLessEqual(normalize_snapshot.call_count, 4 * len(plans))
+            reasons = {entry["plan_id"]: entry["advice"]["suggested_reason"] for entry in payload["plans"]}
+            for plan_id in ("plan-000", "plan-001", "plan-002", "plan-003"):
+                self.assertIn("与已有 active plan 主题接近，建议先复用或合并", reasons[plan_id])
+            self.assertIn("当前活动 plan 较多，建议先收口存量", reasons["plan-004"])
+
     def test_runtime_output_shows_suggested_priority_and_registry_change(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from tests.runtime_test_support import *
+from runtime.plan_scaffold import find_plan_by_topic_key
 
 
 class PlanScaffoldTests(unittest.TestCase):
@@ -73,6 +74,29 @@ class PlanScaffoldTests(unittest.TestCase):
             self.assertEqual(artifact.topic_key, "runtime")
             self.assertIn("feature_key: runtime", tasks_text)
 
+    def test_find_plan_by_topic_key_uses_stat_validated_plan_catalog(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = load_runtime_config(workspace)
+
+            runtime_plan = create_plan_scaffold("补 runtime 骨架", config=config, level="standard")
+            login_plan = create_plan_scaffold("修复登录错误提示", config=config, level="light")
+            self.assertTrue((config.state_dir / "cache" / "plan_catalog.json").is_file())
+
+            with mock.patch("runtime.plan_catalog._parse_entry", side_effect=AssertionError("unchanged plans must not be re-parsed")):
+                found = find_plan_by_topic_key("runtime", config=config)
+            self.assertEqual(found.plan_id, runtime_plan.plan_id)
+
+            login_path = workspace / login_plan.path / "plan.md"
+            login_path.write_text(
+                login_path.read_text(encoding="utf-8").replace(f"feature_key: {login_plan.topic_key}", "feature_key: runtime"),
+                encoding="utf-8",
+            )
+            self.assertIsNone(find_plan_by_topic_key("runtime", config=config))
+
+            create_plan_scaffold("整理 deploy 文档", config=config, level="light", topic_key="deploy-docs")
+            self.assertIsNotNone(find_plan_by_topic_key("deploy-docs", config=config))
+
     def test_explicit_new_plan_patterns_ignore_ambiguous_other_plan_phrase(self) -> None:
         self.assertFalse(request_explicitly_wants_new_plan("分析这个方案和其他 plan 的差异"))
         self.assertTrue(request_explicitly_wants_new_plan("请新建一个 plan 处理这个问题"))
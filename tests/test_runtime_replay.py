@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from tests.runtime_test_support import *
+from dataclasses import replace
+import time
+
+from runtime.replay_retention import apply_replay_retention, inspect_replay_retention, maybe_apply_replay_retention
 
 
 class ReplayWriterTests(unittest.TestCase):
@@ -134,3 +138,230 @@ class ReplayWriterTests(unittest.TestCase):
             breakdown_text = (config.replay_root / "run-quality" / "breakdown.md").read_text(encoding="utf-8")
             self.assertIn("<REDACTED>", session_text)
             self.assertIn("<REDACTED>", breakdown_text)
+
+    def test_render_timeline_appends_only_new_sections_and_pages_via_offset_index(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = load_runtime_config(workspace)
+            writer = ReplayWriter(config)
+            route = RouteDecision(route_name="resume_active", request_text="继续", reason="test")
+            events = [
+                ReplayEvent(
+                    ts=f"2026-01-01T00:00:0{index}+00:00",
+                    phase="develop",
+                    intent=f"task {index}",
+                    action="develop:quality_loop",
+                    key_output=f"output {index}",
+                    decision_reason="token=secret",
+                    result="passed",
+                )
+                for index in range(4)
+            ]
+            for event in events[:3]:
+                writer.append_event("run-stream", event)
+            session_dir = writer.render_timeline("run-stream", run_state=None, route=route, plan_artifact=None)
+            self.assertTrue((session_dir / "events.idx").exists())
+            self.assertTrue((session_dir / "events.index.json").exists())
+
+            writer.append_event("run-stream", events[3])
+            with mock.patch("runtime.replay.ReplayEvent.from_dict", wraps=ReplayEvent.from_dict) as from_dict:
+                writer.render_timeline("run-stream", run_state=None, route=route, plan_artifact=None)
+            self.assertEqual(from_dict.call_count, 1)
+
+            session_text = (session_dir / "session.md").read_text(encoding="utf-8")
+            breakdown_text = (session_dir / "breakdown.md").read_text(encoding="utf-8")
+            self.assertEqual(session_text.count("| develop | task"), 4)
+            self.assertIn("## 4. develop", breakdown_text)
+            self.assertEqual(breakdown_text.count("<REDACTED>"), 4)
+
+            writer.render_documents("run-stream", run_state=None, route=route, plan_artifact=None, events=events[:1])
+            writer.render_timeline("run-stream", run_state=None, route=route, plan_artifact=None)
+            self.assertIn("## 4. develop", (session_dir / "breakdown.md").read_text(encoding="utf-8"))
+
+            self.assertEqual(writer.event_count("run-stream"), 4)
+            self.assertEqual([event.intent for event in writer.page_events("run-stream", start=1, limit=2)], ["task 1", "task 2"])
+            self.assertEqual([event.intent for event in writer.tail_events("run-stream", 2)], ["task 2", "task 3"])
+
+    def test_load_events_includes_complete_event_missing_its_trailing_newline(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = load_runtime_config(workspace)
+            writer = ReplayWriter(config)
+            route = RouteDecision(route_name="resume_active", request_text="继续", reason="test")
+            events = [
+                ReplayEvent(
+                    ts=iso_now(),
+                    phase="develop",
+                    intent=f"task {index}",
+                    action="develop:quality_loop",
+                    key_output="ok",
+                    decision_reason="ok",
+                    result="passed",
+                )
+                for index in range(2)
+            ]
+            writer.append_event("run-tail", events[0])
+            events_path = config.replay_root / "run-tail" / "events.jsonl"
+            with events_path.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(events[1].to_dict(), ensure_ascii=False))
+
+            self.assertEqual([event.intent for event in writer.load_events("run-tail")], ["task 0", "task 1"])
+            self.assertEqual([event.intent for event in writer.tail_events("run-tail", 1)], ["task 1"])
+            self.assertEqual(writer.event_count("run-tail"), 1)
+            session_dir = writer.render_timeline("run-tail", run_state=None, route=route, plan_artifact=None)
+            self.assertEqual((session_dir / "session.md").read_text(encoding="utf-8").count("| develop | task"), 2)
+
+            with events_path.open("a", encoding="utf-8") as handle:
+                handle.write("\n" + '{"ts": "partial')
+            self.assertEqual([event.intent for event in writer.load_events("run-tail")], ["task 0", "task 1"])
+            self.assertEqual(writer.event_count("run-tail"), 2)
+            writer.render_timeline("run-tail", run_state=None, route=route, plan_artifact=None)
+            self.assertEqual((session_dir / "session.md").read_text(encoding="utf-8").count("| develop | task"), 2)
+
+    def test_rotated_segments_stay_part_of_the_replay_timeline(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = replace(load_runtime_config(workspace), replay_rotate_mb=1)
+            writer = ReplayWriter(config)
+            route = RouteDecision(route_name="resume_active", request_text="继续", reason="test")
+            for index in range(700):
+                writer.append_event(
+                    "run-long",
+                    ReplayEvent(
+                        ts=iso_now(),
+                        phase="develop",
+                        intent=f"task {index}",
+                        action="develop:quality_loop",
+                        key_output="x" * 1600,
+                        decision_reason="ok",
+                        result="passed",
+                    ),
+                )
+            writer.render_timeline("run-long", run_state=None, route=route, plan_artifact=None)
+            before = writer.load_events("run-long")
+
+            report = apply_replay_retention(config)
+
+            session_dir = config.replay_root / "run-long"
+            self.assertEqual(report.rotated, ("run-long",))
+            self.assertTrue((session_dir / "events.0001.jsonl.gz").exists())
+            self.assertEqual(writer.load_events("run-long"), before)
+            self.assertEqual(writer.event_count("run-long"), 700)
+
+            writer.append_event(
+                "run-long",
+                ReplayEvent(
+                    ts=iso_now(),
+                    phase="develop",
+                    intent="task 700",
+                    action="develop:quality_loop",
+                    key_output="ok",
+                    decision_reason="ok",
+                    result="passed",
+                ),
+            )
+            writer.render_timeline("run-long", run_state=None, route=route, plan_artifact=None)
+            self.assertEqual(writer.event_count("run-long"), 701)
+            self.assertEqual([event.intent for event in writer.page_events("run-long", start=698, limit=3)], ["task 698", "task 699", "task 700"])
+            self.assertEqual((session_dir / "session.md").read_text(encoding="utf-8").count("| develop | task"), 701)
+
+    def test_replay_retention_keeps_sessions_of_paused_active_runs(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = replace(load_runtime_config(workspace), replay_max_age_days=30, replay_max_sessions=1)
+            writer = ReplayWriter(config)
+            now = time.time()
+            for run_id, idle_days in (("run-paused", 45), ("run-session", 45), ("run-stale", 45), ("run-new", 0)):
+                session_dir = writer.append_event(
+                    run_id,
+                    ReplayEvent(
+                        ts=iso_now(),
+                        phase="develop",
+                        intent=run_id,
+                        action="develop:quality_loop",
+                        key_output="ok",
+                        decision_reason="ok",
+                        result="passed",
+                    ),
+                )
+                stamp = now - idle_days * 86400
+                for path in session_dir.iterdir():
+                    os.utime(path, (stamp, stamp))
+            for store, run_id in ((StateStore(config), "run-paused"), (StateStore(config, session_id="host-a"), "run-session")):
+                store.ensure()
+                store.set_current_run(
+                    RunState(
+                        run_id=run_id,
+                        status="active",
+                        stage="plan_generated",
+                        route_name="workflow",
+                        title="Paused",
+                        created_at=iso_now(),
+                        updated_at=iso_now(),
+                    )
+                )
+
+            report = apply_replay_retention(config, now=now)
+
+            self.assertEqual(report.removed, ("run-stale",))
+            self.assertEqual([event.intent for event in writer.load_events("run-paused")], ["run-paused"])
+            self.assertEqual([event.intent for event in writer.load_events("run-session")], ["run-session"])
+
+    def test_replay_retention_compacts_rotates_and_evicts_within_budgets(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            config = replace(load_runtime_config(workspace), replay_max_sessions=2, replay_rotate_mb=1)
+            writer = ReplayWriter(config)
+            route = RouteDecision(route_name="resume_active", request_text="继续", reason="test")
+            now = time.time()
+            for run_id, idle_days in (("run-empty", 5), ("run-ancient", 40), ("run-idle", 5), ("run-old", 10), ("run-live", 0)):
+                session_dir = writer.ensure_session(run_id)
+                if run_id != "run-empty":
+                    writer.append_event(
+                        run_id,
+                        ReplayEvent(
+                            ts=iso_now(),
+                            phase="develop",
+                            intent=run_id,
+                            action="develop:quality_loop",
+                            key_output="ok",
+                            decision_reason="ok",
+                            result="passed",
+                        ),
+                    )
+                    writer.render_timeline(run_id, run_state=None, route=route, plan_artifact=None)
+                stamp = now - idle_days * 86400
+                for path in session_dir.iterdir():
+                    os.utime(path, (stamp, stamp))
+            with (config.replay_root / "run-live" / "events.jsonl").open("a", encoding="utf-8") as handle:
+                handle.write(("{}" + " " * 1024 + "\n") * 1100)
+
+            preview = apply_replay_retention(config, now=now, dry_run=True)
+            self.assertTrue((config.replay_root / "run-ancient").exists())
+            report = apply_replay_retention(config, now=now)
+
+            self.assertEqual(preview.removed, report.removed)
+            self.assertEqual(report.removed, ("run-ancient", "run-empty", "run-old"))
+            self.assertEqual(report.compacted, ("run-idle",))
+            self.assertEqual(report.rotated, ("run-live",))
+            self.assertEqual(report.sessions, 2)
+            self.assertFalse(report.over_budget)
+            self.assertEqual(
+                sorted(path.name for path in (config.replay_root / "run-idle").iterdir()),
+                ["events.jsonl.gz"],
+            )
+            live_dir = config.replay_root / "run-live"
+            self.assertTrue((live_dir / "events.0001.jsonl.gz").exists())
+            self.assertEqual((live_dir / "events.jsonl").stat().st_size, 0)
+
+            self.assertEqual([event.intent for event in writer.load_events("run-idle")], ["run-idle"])
+            self.assertFalse((config.replay_root / "run-idle" / "events.jsonl.gz").exists())
+
+            status = inspect_replay_retention(config)
+            self.assertEqual(status["sessions"], 2)
+            self.assertEqual(status["pending"]["remove"], 0)
+            self.assertIsNone(status["last_retention"])
+
+            self.assertIsNotNone(maybe_apply_replay_retention(config, now=now))
+            self.assertIsNone(maybe_apply_replay_retention(config, now=now + 60))
+            self.assertEqual(inspect_replay_retention(config)["last_retention"]["sessions"], 2)
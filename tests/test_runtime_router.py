@@ -1,9 +1,34 @@
 from __future__ import annotations
 
 from tests.runtime_test_support import *
+from runtime import router as router_module
+from runtime.router import request_keyword_families
 
 
 class RouterTests(unittest.TestCase):
+    def test_keyword_families_match_the_linear_substring_scan(self) -> None:
+        families = {
+            "replay": router_module._REPLAY_KEYWORDS,
+            "action": router_module._ACTION_KEYWORDS,
+            "architecture": router_module._ARCHITECTURE_KEYWORDS,
+            "light_edit": router_module._LIGHT_EDIT_HINTS,
+            "long_term_contract": router_module._LONG_TERM_CONTRACT_HINTS,
+        }
+        samples = [
+            "Why did we pick this? Review the implementation",
+            "修复 README 里的 typo",
+            "重构 runtime engine 的 plugin adapter",
+            "这个 SLO 策略还是按入口拆",
+            "只是问问：天气怎么样",
+            "",
+        ]
+        samples.extend(keyword.upper() for keywords in families.values() for keyword in keywords)
+        for text in samples:
+            lowered = text.lower()
+            expected = {name for name, keywords in families.items() if any(keyword.lower() in lowered for keyword in keywords)}
+            with self.subTest(text=text):
+                self.assertEqual(request_keyword_families(text) & set(families), expected)
+
     def test_route_classification_and_active_flow_intents(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
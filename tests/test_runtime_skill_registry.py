@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import shutil
+
 from tests.runtime_test_support import *
 
 
@@ -16,6 +18,58 @@ class SkillRegistryTests(unittest.TestCase):
             encoding="utf-8",
         )
 
+    def test_skill_registry_reuses_persisted_index_until_skill_sources_change(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            self._write_skill(workspace / "skills", skill_id="local-demo", description="first")
+            config = load_runtime_config(workspace)
+            first = SkillRegistry(config, user_home=workspace / "home").discover()
+            index_path = config.state_dir / "cache" / "skill_index.json"
+            self.assertTrue(index_path.exists())
+
+            with mock.patch("runtime.skill_registry._load_skill_sources") as load_sources:
+                second = SkillRegistry(config, user_home=workspace / "home").discover()
+            load_sources.assert_not_called()
+            self.assertEqual(first, second)
+
+            (workspace / "skills" / "local-demo" / "SKILL.md").write_text(
+                "---\nname: local-demo\ndescription: edited description\n---\n\n# local-demo\n",
+                encoding="utf-8",
+            )
+            self._write_skill(workspace / "skills" / "nested", skill_id="nested-demo", description="nested")
+            third = {skill.skill_id: skill for skill in SkillRegistry(config, user_home=workspace / "home").discover()}
+            self.assertEqual(third["local-demo"].description, "edited description")
+            self.assertIn("nested-demo", third)
+
+            shutil.rmtree(workspace / "skills" / "nested")
+            fourth = {skill.skill_id for skill in SkillRegistry(config, user_home=workspace / "home").discover()}
+            self.assertNotIn("nested-demo", fourth)
+            self.assertNotIn(str(workspace / "skills" / "nested"), index_path.read_text(encoding="utf-8"))
+
+    def test_skill_registry_skips_skill_roots_that_are_not_listable_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            self._write_skill(workspace / "skills", skill_id="local-demo", description="first")
+            config = load_runtime_config(workspace)
+            (workspace / "home" / ".claude").mkdir(parents=True)
+            (workspace / "home" / ".claude" / "skills").write_text("not a directory\n", encoding="utf-8")
+
+            discovered = {skill.skill_id for skill in SkillRegistry(config, user_home=workspace / "home").discover()}
+
+            self.assertIn("local-demo", discovered)
+
+    def test_skill_registry_skips_persisted_index_when_project_cache_is_disabled(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            (workspace / "sopify.config.yaml").write_text("advanced:\n  cache_project: false\n", encoding="utf-8")
+            self._write_skill(workspace / "skills", skill_id="local-demo", description="first")
+            config = load_runtime_config(workspace)
+
+            skills = SkillRegistry(config, user_home=workspace / "home").discover()
+
+            self.assertIn("local-demo", {skill.skill_id for skill in skills})
+            self.assertFalse((config.state_dir / "cache" / "skill_index.json").exists())
+
     def test_skill_registry_discovers_builtin_and_project_skills(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             workspace = Path(temp_dir)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
+
 from tests.runtime_test_support import *
 from runtime.context_snapshot import (
     _collect_pending_items,
@@ -7,6 +10,17 @@ from runtime.context_snapshot import (
     _provenance_status_for_reason,
     resolve_context_snapshot,
 )
+from runtime.locking import (
+    GLOBAL_STATE_LOCK,
+    PLAN_REGISTRY_LOCK,
+    StateLockTimeout,
+    lock_metrics_snapshot,
+    reset_lock_metrics,
+    workspace_lock,
+)
+from runtime.models import RuntimeConfig
+from runtime.state import cleanup_expired_session_state
+from runtime.state_backend import close_state_backends
 from runtime.state_invariants import validate_phase
 
 
@@ -229,6 +243,288 @@ class StateStoreInvariantTests(unittest.TestCase):
                 )
 
 
+class StateStoreMemoTests(unittest.TestCase):
+    def _run_state(self, run_id: str) -> RunState:
+        return RunState(
+            run_id=run_id,
+            status="active",
+            stage="plan_generated",
+            route_name="workflow",
+            title="Runtime",
+            created_at=iso_now(),
+            updated_at=iso_now(),
+        )
+
+    def test_unchanged_state_file_is_parsed_once_per_process(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = load_runtime_config(Path(temp_dir))
+            writer = StateStore(config)
+            writer.set_current_run(self._run_state("run-1"))
+            store = StateStore(config)
+
+            with mock.patch("runtime.state.json.loads", wraps=json.loads) as loads:
+                store.prefetch()
+                first = store.get_current_run()
+                second = store.get_current_run()
+                payload, error = store.read_state_payload(store.current_run_path)
+                # A store built later in the same process (as the gate does after
+                # the engine) reuses the parsed snapshot.
+                later = StateStore(config).get_current_run()
+
+            self.assertEqual(loads.call_count, 1)
+            self.assertIs(first, second)
+            self.assertIs(later, first)
+            self.assertEqual(first.run_id, "run-1")
+            self.assertIsNone(error)
+            self.assertEqual(payload["run_id"], "run-1")
+
+    def test_external_rewrite_and_removal_invalidate_memo(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = load_runtime_config(Path(temp_dir))
+            store = StateStore(config)
+            other = StateStore(config)
+            store.set_current_run(self._run_state("run-1"))
+            self.assertEqual(store.get_current_run().run_id, "run-1")
+
+            other.set_current_run(self._run_state("run-2"))
+            self.assertEqual(store.get_current_run().run_id, "run-2")
+
+            other.clear_current_run()
+            self.assertIsNone(store.get_current_run())
+
+            store.ensure()
+            store.current_run_path.write_text("{invalid json", encoding="utf-8")
+            self.assertEqual(store.read_state_payload(store.current_run_path), (None, "invalid_json"))
+            with self.assertRaises(ValueError):
+                store.get_current_run()
+
+
+class SqliteStateBackendTests(unittest.TestCase):
+    def _config(self, workspace: Path, *, export: bool = True) -> RuntimeConfig:
+        (workspace / "sopify.config.yaml").write_text(
+            f"advanced:\n  state_backend: sqlite\n  state_json_export: {'true' if export else 'false'}\n",
+            encoding="utf-8",
+        )
+        return load_runtime_config(workspace)
+
+    def _truth(self) -> tuple[RunState, RuntimeHandoff]:
+        run_state = RunState(
+            run_id="run-1",
+            status="active",
+            stage="plan_generated",
+            route_name="workflow",
+            title="Runtime",
+            created_at=iso_now(),
+            updated_at=iso_now(),
+        )
+        handoff = RuntimeHandoff(
+            schema_version="1",
+            route_name="workflow",
+            run_id="run-1",
+            handoff_kind="workflow",
+            required_host_action="review_or_execute_plan",
+        )
+        return run_state, handoff
+
+    def test_paired_truth_commits_to_database_and_mirrors_json(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = self._config(Path(temp_dir))
+            store = StateStore(config, session_id="session-a")
+            run_state, handoff = self._truth()
+
+            store.set_host_facing_truth(
+                run_state=run_state,
+                handoff=handoff,
+                resolution_id="resolution-1",
+                truth_kind=HOST_FACING_TRUTH_WRITE_KINDS[0],
+            )
+
+            self.assertTrue((config.state_dir / "state.sqlite3").exists())
+            reader = StateStore(config, session_id="session-a")
+            self.assertEqual(reader.get_current_run().resolution_id, "resolution-1")
+            self.assertEqual(reader.get_current_handoff().resolution_id, "resolution-1")
+            mirrored = json.loads(store.current_handoff_path.read_text(encoding="utf-8"))
+            self.assertEqual(mirrored["resolution_id"], "resolution-1")
+
+            store.reset_active_flow()
+            self.assertIsNone(reader.get_current_run())
+            self.assertFalse(store.current_run_path.exists())
+            self.assertFalse(store.current_handoff_path.exists())
+
+    def test_failed_transaction_rolls_back_and_export_is_on_demand(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = self._config(Path(temp_dir), export=False)
+            store = StateStore(config)
+            run_state, handoff = self._truth()
+
+            with self.assertRaises(RuntimeError):
+                with store.transaction():
+                    store.set_current_run(run_state)
+                    raise RuntimeError("interrupted")
+            self.assertIsNone(StateStore(config).get_current_run())
+
+            store.set_current_handoff(handoff)
+            self.assertFalse(store.current_handoff_path.exists())
+            self.assertEqual(
+                store.export_json(),
+                (str(store.current_handoff_path.relative_to(config.workspace_root)),),
+            )
+            self.assertEqual(
+                json.loads(store.current_handoff_path.read_text(encoding="utf-8"))["run_id"],
+                "run-1",
+            )
+
+
+    def test_expired_session_cleanup_reads_session_age_from_database(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = self._config(Path(temp_dir), export=False)
+            store = StateStore(config, session_id="session-a")
+            store.set_last_route(RouteDecision(route_name="workflow", request_text="x", reason="test"))
+            self.assertFalse(store.last_route_path.exists())
+            stale = store.root.stat().st_mtime - 30 * 24 * 3600
+            os.utime(store.root, (stale, stale))
+
+            self.assertEqual(cleanup_expired_session_state(config), ())
+            self.assertEqual(StateStore(config, session_id="session-a").get_last_route().route_name, "workflow")
+
+    def test_recreated_database_does_not_serve_stale_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = self._config(Path(temp_dir), export=False)
+            run_state, _ = self._truth()
+            store = StateStore(config)
+            store.set_current_run(run_state)
+            self.assertEqual(store.get_current_run().run_id, "run-1")
+            text = store.backend.read_text(store.current_run_path)
+            store.close()
+            for path in config.state_dir.glob(f"{store.backend.database_path.name}*"):
+                path.unlink()
+
+            # Another process recreates the database; revisions restart at 1.
+            recreated = StateStore(config).backend
+            recreated.write_text(store.current_run_path, text.replace("run-1", "run-2"))
+            recreated.close()
+            self.assertEqual(StateStore(config).get_current_run().run_id, "run-2")
+
+    def test_switching_from_json_seeds_database_from_existing_state(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            json_config = load_runtime_config(workspace)
+            run_state, handoff = self._truth()
+            StateStore(json_config).set_current_run(run_state)
+            StateStore(json_config, session_id="session-a").set_last_route(
+                RouteDecision(route_name="workflow", request_text="x", reason="test")
+            )
+
+            config = self._config(workspace, export=False)
+            store = StateStore(config)
+            self.assertEqual(store.get_current_run().run_id, "run-1")
+            store.set_current_handoff(handoff)
+            self.assertTrue((config.state_dir / "state.sqlite3").exists())
+            store.current_run_path.unlink()
+            (config.state_dir / "sessions" / "session-a" / "last_route.json").unlink()
+
+            reader = StateStore(config, session_id="session-a")
+            self.assertEqual(StateStore(config).get_current_run().run_id, "run-1")
+            self.assertEqual(reader.get_last_route().route_name, "workflow")
+            self.assertIsNotNone(store.backend._connection)
+            close_state_backends()
+            self.assertIsNone(store.backend._connection)
+            self.assertEqual(store.get_current_handoff().run_id, "run-1")
+            store.close()
+            self.assertIsNone(store.backend._connection)
+
+    def test_existing_unseeded_database_still_imports_json_state(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace = Path(temp_dir)
+            json_config = load_runtime_config(workspace)
+            run_state, _ = self._truth()
+            StateStore(json_config).set_current_run(run_state)
+
+            config = self._config(workspace, export=False)
+            # Left behind by a process that created the file but never committed its seed.
+            connection = sqlite3.connect(str(config.state_dir / "state.sqlite3"))
+            connection.execute(
+                "CREATE TABLE state_documents (revision INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT NOT NULL UNIQUE, payload TEXT NOT NULL)"
+            )
+            connection.execute("CREATE TABLE state_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.commit()
+            connection.close()
+
+            store = StateStore(config)
+            try:
+                self.assertEqual(store.get_current_run().run_id, "run-1")
+                # The pre-`updated_at` schema is migrated and seeded rows keep the file mtime.
+                self.assertEqual(
+                    store.backend.updated_times(config.state_dir, ("current_run.json",)),
+                    {store.current_run_path: store.current_run_path.stat().st_mtime},
+                )
+                store.current_run_path.unlink()
+                self.assertEqual(StateStore(config).get_current_run().run_id, "run-1")
+            finally:
+                close_state_backends()
+
+
+class WorkspaceLockTests(unittest.TestCase):
+    def setUp(self) -> None:
+        reset_lock_metrics()
+
+    def test_global_state_writes_hold_reentrant_lock_and_record_metrics(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = load_runtime_config(Path(temp_dir))
+            store = StateStore(config)
+            store.set_current_run(
+                RunState(
+                    run_id="run-1",
+                    status="active",
+                    stage="plan_generated",
+                    route_name="workflow",
+                    title="Runtime",
+                    created_at=iso_now(),
+                    updated_at=iso_now(),
+                )
+            )
+
+            updated = store.update_active_run(stage="executing")
+            StateStore(config, session_id="session-a").set_last_route(
+                RouteDecision(route_name="workflow", request_text="x", reason="test")
+            )
+
+            self.assertEqual(updated.stage, "executing")
+            metrics = lock_metrics_snapshot()
+            self.assertEqual(list(metrics), [GLOBAL_STATE_LOCK])
+            self.assertEqual(metrics[GLOBAL_STATE_LOCK]["acquired"], 2)
+            self.assertEqual(metrics[GLOBAL_STATE_LOCK]["contended"], 0)
+
+    def test_contended_lock_times_out_and_counts_contention(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = load_runtime_config(Path(temp_dir))
+            holding = threading.Event()
+            release = threading.Event()
+
+            def hold() -> None:
+                with workspace_lock(config, PLAN_REGISTRY_LOCK):
+                    holding.set()
+                    release.wait(5)
+
+            holder = threading.Thread(target=hold)
+            holder.start()
+            try:
+                self.assertTrue(holding.wait(5))
+                with self.assertRaises(StateLockTimeout):
+                    with workspace_lock(config, PLAN_REGISTRY_LOCK, timeout=0.05):
+                        pass
+            finally:
+                release.set()
+                holder.join(5)
+
+            with workspace_lock(config, PLAN_REGISTRY_LOCK):
+                pass
+            metrics = lock_metrics_snapshot()[PLAN_REGISTRY_LOCK]
+            self.assertEqual(metrics["timeouts"], 1)
+            self.assertEqual(metrics["acquired"], 2)
+            self.assertGreater(metrics["hold_ms"], 0)
+
+
 class ContextSnapshotTests(unittest.TestCase):
     def test_provenance_status_reason_classifier_is_stable(self) -> None:
         self.assertEqual(_provenance_status_for_reason("phase_missing"), "provenance_missing")